@@ -3,7 +3,6 @@ import typer
 import json
 import yaml
 import sys
-import subprocess
 from typing import Annotated, Optional, Any
 from dotenv import load_dotenv
 
@@ -15,7 +14,7 @@ from builder.pipeline.prompts.rust_codegen_prompt import generate_rust_codegen_p
 from builder.pipeline.prompts.python_codegen_prompt import generate_python_codegen_prompt
 from builder.pipeline.run_codegen import run_codegen
 from builder.pipeline.snapshot_write import write_snapshots
-from builder.pipeline.exceptions import BuilderError
+from builder.pipeline.exceptions import BuilderError, PhaseError
 
 app = typer.Typer(
     name="builder",
@@ -266,6 +265,107 @@ def doctor(
     )
 
 
+def _doctor_phase(ctx) -> None:
+    from builder.cli_doctor import run_doctor
+    try:
+        run_doctor(json_output=False, fix=False, fail_fast=False, allow_env_fail=True)
+    except SystemExit as e:
+        if e.code != 0:
+            typer.secho("⚠️  Doctor check failed. Continuing anyway...", fg=typer.colors.YELLOW)
+
+
+def _pipeline_phases(
+    exchange: str,
+    research_yaml: Path,
+    url: Optional[str],
+    update_snapshots: bool,
+    run_research: bool,
+    skip_cargo_check: bool,
+    run_doctor_check: bool = True,
+    group: str = "",
+) -> list:
+    """
+    Build the phase DAG for one exchange.
+
+    With `group` set, phase names are namespaced as "<group>/<phase>" so several
+    exchanges can share one DAG (see `pipeline-all`).
+
+    doctor ─┐
+    research ── scaffold ─┬─ rust_generate ── rust_cargo
+                          └─ python_generate ── python_lint
+
+    Rust and Python generation only share the research/scaffold inputs, so the
+    Python layer is generated while the Rust crate is linted and tested.
+    """
+    from builder.pipeline.phases import Phase
+
+    rust_snapshots = Path(f"builder/snapshots/{exchange.lower()}/rust")
+    python_snapshots = Path(f"builder/snapshots/{exchange.lower()}/python")
+    rust_dir = Path("nautilus-dinger/crates/adapters") / exchange
+    python_dir = Path("nautilus-dinger/nautilus_adapter/adapters") / exchange
+
+    def _research(ctx):
+        if run_research:
+            research_auto(exchange=exchange, docs_url=url, output=research_yaml)
+        else:
+            typer.echo(f"✅ Using existing research YAML: {research_yaml}")
+
+    def _scaffold(ctx):
+        scaffold(exchange=exchange, research_yaml=research_yaml)
+
+    def _generate(language: str, snapshots: Path):
+        def run(ctx):
+            if update_snapshots:
+                snapshot(research_yaml=research_yaml, language=language, snapshots=snapshots)
+            elif language == "rust":
+                generate(
+                    research_yaml=research_yaml,
+                    language="rust",
+                    snapshots=snapshots,
+                    skip_cargo_check=skip_cargo_check,
+                )
+            else:
+                generate(research_yaml=research_yaml, language=language, snapshots=snapshots)
+        return run
+
+    def _rust_cargo(ctx):
+        if not rust_dir.exists():
+            return
+        typer.echo("🦀 Running Cargo Clippy...")
+        ctx.run(["cargo", "clippy", "--fix", "--allow-dirty"], cwd=rust_dir, check=False)
+        typer.echo("🦀 Running Cargo Test...")
+        ctx.run(["cargo", "test"], cwd=rust_dir)
+
+    def _python_lint(ctx):
+        if not python_dir.exists():
+            return
+        typer.echo("🐍 Running Ruff Format/Check...")
+        ctx.run(["ruff", "format", "."], cwd=python_dir, check=False)
+        ctx.run(["ruff", "check", "--fix", "."], cwd=python_dir, check=False)
+        typer.echo("🐍 Running Pytest (Local)...")
+        # Exit code 5: no tests collected
+        code = ctx.run(["pytest", "."], cwd=python_dir, check=False)
+        if code not in (0, 5):
+            raise BuilderError(f"pytest exited with {code}")
+
+    def n(name: str) -> str:
+        return f"{group}/{name}" if group else name
+
+    phases = []
+    if run_doctor_check:
+        phases.append(Phase(n("doctor"), _doctor_phase, critical=False, group=group))
+    phases += [
+        Phase(n("research"), _research, group=group),
+        Phase(n("scaffold"), _scaffold, deps=(n("research"),), group=group),
+        Phase(n("rust_generate"), _generate("rust", rust_snapshots), deps=(n("scaffold"),), group=group),
+        # Lint/test results were advisory in the sequential pipeline; keep them so.
+        Phase(n("rust_cargo"), _rust_cargo, deps=(n("rust_generate"),), critical=False, group=group),
+        Phase(n("python_generate"), _generate("python", python_snapshots), deps=(n("scaffold"),), group=group),
+        Phase(n("python_lint"), _python_lint, deps=(n("python_generate"),), critical=False, group=group),
+    ]
+    return phases
+
+
 @app.command()
 def pipeline(
     exchange: Annotated[str, typer.Argument(help="Exchange name (e.g. Lighter, Nado)")],
@@ -275,21 +375,16 @@ def pipeline(
     research: Annotated[Optional[Path], typer.Option("--research", "-r", help="Use existing research YAML and skip auto research")] = None,
     reuse_research: Annotated[bool, typer.Option("--reuse-research", help="Reuse existing research YAML if present")] = False,
     skip_cargo_check: Annotated[bool, typer.Option("--skip-cargo-check", help="Skip Rust cargo check during codegen")] = False,
+    sequential: Annotated[bool, typer.Option("--sequential", help="Run phases one at a time (no overlap)")] = False,
 ):
     """
     Run the full end-to-end pipeline: Doctor -> Research -> Scaffold -> Generate (Rust & Python).
+
+    Independent phases run concurrently; output lines are prefixed with the phase name.
     """
-    try:
-        # Phase 0: Doctor
-        typer.secho(f"\n--- Phase 0: Doctor Check ---", fg=typer.colors.CYAN, bold=True)
-        from builder.cli_doctor import run_doctor
-        try:
-            run_doctor(json_output=False, fix=False, fail_fast=False, allow_env_fail=True)
-        except SystemExit as e:
-             if e.code != 0:
-                 typer.secho("⚠️  Doctor check failed. Continuing anyway...", fg=typer.colors.YELLOW)
+    from builder.pipeline.phases import Phase, format_phase_report, run_phases
 
-        # 1. Research
+    try:
         research_yaml = research or Path(f"builder/research/{exchange.lower()}.yaml")
         research_yaml.parent.mkdir(parents=True, exist_ok=True)
 
@@ -297,81 +392,154 @@ def pipeline(
             typer.secho(f"❌ Research file not found: {research_yaml}", fg=typer.colors.RED)
             sys.exit(1)
 
-        if reuse_research and research_yaml.exists():
-            typer.secho(f"\n--- Phase 1: Research (reuse) ---", fg=typer.colors.CYAN, bold=True)
-            typer.echo(f"✅ Using existing research YAML: {research_yaml}")
-        else:
-            typer.secho(f"\n--- Phase 1: Research ({exchange}) ---", fg=typer.colors.CYAN, bold=True)
-            research_auto(exchange=exchange, docs_url=url, output=research_yaml)
-        
-        # 2. Scaffold
-        typer.secho(f"\n--- Phase 2: Scaffolding ---", fg=typer.colors.CYAN, bold=True)
-        scaffold(exchange=exchange, research_yaml=research_yaml)
-        
-        # 3. Generate Rust
-        typer.secho(f"\n--- Phase 3: Generating Rust Core ---", fg=typer.colors.CYAN, bold=True)
-        rust_snapshots = Path(f"builder/snapshots/{exchange.lower()}/rust")
-        if update_snapshots:
-            snapshot(research_yaml=research_yaml, language="rust", snapshots=rust_snapshots)
-        else:
-            generate(
-                research_yaml=research_yaml,
-                language="rust",
-                snapshots=rust_snapshots,
-                skip_cargo_check=skip_cargo_check,
-            )
-        
-        # Rust Linting & Testing
-        rust_dir = Path("nautilus-dinger/crates/adapters") / exchange
-        if rust_dir.exists():
-            typer.echo("🦀 Running Cargo Clippy...")
-            try:
-                subprocess.run(["cargo", "clippy", "--fix", "--allow-dirty"], cwd=rust_dir, capture_output=True)
-                typer.echo("🦀 Running Cargo Test...")
-                subprocess.run(["cargo", "test"], cwd=rust_dir, capture_output=True)
-            except Exception as e:
-                typer.secho(f"⚠️  Rust linting/testing skipped: {e}", fg=typer.colors.YELLOW)
-
-        # 4. Generate Python
-        typer.secho(f"\n--- Phase 4: Generating Python Layer ---", fg=typer.colors.CYAN, bold=True)
-        python_snapshots = Path(f"builder/snapshots/{exchange.lower()}/python")
-        if update_snapshots:
-            snapshot(research_yaml=research_yaml, language="python", snapshots=python_snapshots)
-        else:
-            generate(research_yaml=research_yaml, language="python", snapshots=python_snapshots)
-
-        # Python Linting & Testing
-        python_dir = Path("nautilus-dinger/nautilus_adapter/adapters") / exchange
-        if python_dir.exists():
-            typer.echo("🐍 Running Ruff Format/Check...")
-            try:
-                subprocess.run(["ruff", "format", "."], cwd=python_dir, capture_output=True)
-                subprocess.run(["ruff", "check", "--fix", "."], cwd=python_dir, capture_output=True)
-                typer.echo("🐍 Running Pytest (Local)...")
-                subprocess.run(["pytest", "."], cwd=python_dir, capture_output=True)
-            except Exception as e:
-                typer.secho(f"⚠️  Python linting/testing skipped: {e}", fg=typer.colors.YELLOW)
-
-        # 5. Global Automated Tests
+        phases = _pipeline_phases(
+            exchange=exchange,
+            research_yaml=research_yaml,
+            url=url,
+            update_snapshots=update_snapshots,
+            run_research=not (reuse_research and research_yaml.exists()),
+            skip_cargo_check=skip_cargo_check,
+        )
+
         if run_tests:
-            typer.secho(f"\n--- Phase 5: Global Integration Testing ---", fg=typer.colors.CYAN, bold=True)
-            try:
+            def _integration(ctx):
                 import os
                 env = os.environ.copy()
                 env["PYTHONPATH"] = f".:{env.get('PYTHONPATH', '')}"
-                subprocess.run(["pytest", "builder/tests/"], check=True, env=env)
+                ctx.run(["pytest", "builder/tests/"], env=env)
                 typer.secho("✅ Integration tests passed!", fg=typer.colors.GREEN)
-            except subprocess.CalledProcessError:
-                typer.secho("❌ Integration tests failed.", fg=typer.colors.RED)
-                sys.exit(1)
-        
+
+            phases.append(Phase("integration", _integration, deps=tuple(p.name for p in phases)))
+
+        typer.secho(f"\n--- Pipeline ({exchange}) ---", fg=typer.colors.CYAN, bold=True)
+        try:
+            results = run_phases(phases, max_workers=1 if sequential else None)
+        except PhaseError as e:
+            typer.echo(format_phase_report(e.results))
+            typer.secho(f"❌ Pipeline failed: {e}", fg=typer.colors.RED)
+            sys.exit(1)
+
+        typer.echo(format_phase_report(results))
         typer.secho(f"\n✨ Pipeline complete for {exchange}! ✨", fg=typer.colors.GREEN, bold=True)
-        
+
     except Exception as e:
         typer.echo(f"ERROR: {e}", err=True)
         sys.exit(1)
 
 
+@app.command(name="pipeline-all")
+def pipeline_all(
+    research_dir: Annotated[Path, typer.Option("--research-dir", help="Directory of research YAML files")] = Path("builder/research"),
+    only: Annotated[Optional[list[str]], typer.Option("--only", help="Only build these exchanges (repeatable)")] = None,
+    exclude: Annotated[Optional[list[str]], typer.Option("--exclude", help="Skip these exchanges (repeatable)")] = None,
+    update_snapshots: Annotated[bool, typer.Option("--snapshot", "-s", help="Initialize or update snapshots")] = False,
+    skip_cargo_check: Annotated[bool, typer.Option("--skip-cargo-check", help="Skip Rust cargo check during codegen")] = False,
+    jobs: Annotated[int, typer.Option("--jobs", "-j", help="Max phases running at once across all exchanges")] = 4,
+    llm_concurrency: Annotated[int, typer.Option("--llm-concurrency", help="Max in-flight LLM requests across all exchanges (0 = unlimited)")] = 4,
+    report: Annotated[Optional[Path], typer.Option("--report", help="Write the consolidated report as JSON")] = None,
+):
+    """
+    Rebuild every exchange with research YAML in one bounded run.
+
+    All exchanges' phases share one worker pool, one LLM concurrency budget, the
+    on-disk LLM cache and the warm cargo target dirs. Research is always reused;
+    a failing exchange does not stop the others.
+    """
+    from builder.infra.llm import set_llm_concurrency
+    from builder.infra.yaml_loader import load_research
+    from builder.pipeline.phases import Phase, format_phase_report, run_phases
+
+    wanted = {x.lower() for x in only or []}
+    skipped = {x.lower() for x in exclude or []}
+
+    exchanges: list[tuple[str, Path]] = []
+    for research_yaml in sorted(research_dir.glob("*.yaml")):
+        try:
+            name = load_research(research_yaml).exchange_identity.exchange_name.replace(" ", "")
+        except Exception as e:
+            typer.secho(f"⚠️  Skipping {research_yaml}: {e}", fg=typer.colors.YELLOW)
+            continue
+        keys = {name.lower(), research_yaml.stem.lower()}
+        if (wanted and not keys & wanted) or keys & skipped:
+            continue
+        exchanges.append((name, research_yaml))
+
+    if not exchanges:
+        typer.secho(f"❌ No research YAML selected in {research_dir}", fg=typer.colors.RED)
+        sys.exit(1)
+
+    set_llm_concurrency(llm_concurrency)
+
+    phases = [Phase("doctor", _doctor_phase, critical=False)]
+    for name, research_yaml in exchanges:
+        phases += _pipeline_phases(
+            exchange=name,
+            research_yaml=research_yaml,
+            url=None,
+            update_snapshots=update_snapshots,
+            run_research=False,
+            skip_cargo_check=skip_cargo_check,
+            run_doctor_check=False,
+            group=name,
+        )
+
+    typer.secho(
+        f"\n--- Pipeline (all): {', '.join(n for n, _ in exchanges)} ---",
+        fg=typer.colors.CYAN, bold=True,
+    )
+    try:
+        results = run_phases(phases, max_workers=max(1, jobs))
+    except PhaseError as e:
+        results = e.results
+
+    summary = {}
+    for name, _ in exchanges:
+        group = [r for r in results.values() if r.group == name]
+        failed = [r.name.split("/", 1)[1] for r in group if r.status == "failed"]
+        fatal = any(r.status == "failed" and r.critical for r in group)
+        summary[name] = {
+            "status": "failed" if fatal else ("warnings" if failed else "ok"),
+            "seconds": round(sum(r.duration for r in group), 1),
+            "failed_phases": failed,
+        }
+
+    typer.echo(format_phase_report(results))
+    typer.echo("")
+    width = max(len(n) for n in summary)
+    for name, row in summary.items():
+        line = f"{name.ljust(width)}  {row['status'].ljust(8)}  {row['seconds']:7.1f}s"
+        if row["failed_phases"]:
+            line += f"  failed: {', '.join(row['failed_phases'])}"
+        typer.echo(line)
+
+    if report:
+        report.parent.mkdir(parents=True, exist_ok=True)
+        report.write_text(json.dumps(
+            {
+                "exchanges": summary,
+                "phases": [
+                    {
+                        "name": r.name,
+                        "group": r.group,
+                        "status": r.status,
+                        "seconds": round(r.duration, 3),
+                        "critical": r.critical,
+                        "error": r.error,
+                    }
+                    for r in results.values()
+                ],
+            },
+            indent=2,
+        ))
+        typer.echo(f"📝 Report written to {report}")
+
+    broken = [n for n, row in summary.items() if row["status"] == "failed"]
+    if broken:
+        typer.secho(f"❌ Failed exchanges: {', '.join(broken)}", fg=typer.colors.RED)
+        sys.exit(1)
+    typer.secho(f"\n✨ Pipeline complete for {len(summary)} exchanges! ✨", fg=typer.colors.GREEN, bold=True)
+
+
 def main():
     app()
 
@@ -3,10 +3,59 @@ import time
 import random
 import subprocess
 import json
+import threading
+from contextlib import contextmanager
 from pathlib import Path
+from typing import Optional
 from openai import OpenAI
 from .llm_cache import load_cache, save_cache
 
+# Process-wide cap on in-flight LLM requests, shared by every caller (per-file
+# generation, repair loops, batch runs over several exchanges).
+_llm_slots: Optional[threading.BoundedSemaphore] = None
+_llm_slots_configured = False
+_llm_slots_lock = threading.Lock()
+
+
+def llm_concurrency_from_env() -> int:
+    """
+    $LLM_MAX_CONCURRENCY, the single setting for LLM parallelism: it caps
+    in-flight requests process-wide and sizes the repair loop's worker pool.
+    Unset, invalid or 0 means unlimited.
+    """
+    try:
+        return max(0, int(os.getenv("LLM_MAX_CONCURRENCY", "0")))
+    except ValueError:
+        return 0
+
+
+def set_llm_concurrency(limit: Optional[int]) -> None:
+    """
+    Limit concurrent LLM requests across all threads. None or 0 means unlimited.
+    Defaults to $LLM_MAX_CONCURRENCY when never called.
+    """
+    global _llm_slots, _llm_slots_configured
+    with _llm_slots_lock:
+        _llm_slots = threading.BoundedSemaphore(limit) if limit else None
+        _llm_slots_configured = True
+
+
+@contextmanager
+def _llm_slot():
+    global _llm_slots, _llm_slots_configured
+    if not _llm_slots_configured:
+        with _llm_slots_lock:
+            if not _llm_slots_configured:
+                limit = llm_concurrency_from_env()
+                _llm_slots = threading.BoundedSemaphore(limit) if limit else None
+                _llm_slots_configured = True
+    slots = _llm_slots
+    if slots is None:
+        yield
+        return
+    with slots:
+        yield
+
 def _get_opencode_config():
     """
     Load key and model from ~/.config/opencode/opencode.json
@@ -98,13 +147,14 @@ def ask_llm(
                 f"DEBUG: opencode-cli model={model} timeout={timeout_seconds}s prompt_len={len(prompt)}",
                 flush=True,
             )
-        result = subprocess.run(
-            ["opencode", "run", "--model", model, "--format", "json"],
-            input=prompt,
-            capture_output=True,
-            text=True,
-            timeout=timeout_seconds,
-        )
+        with _llm_slot():
+            result = subprocess.run(
+                ["opencode", "run", "--model", model, "--format", "json"],
+                input=prompt,
+                capture_output=True,
+                text=True,
+                timeout=timeout_seconds,
+            )
         if result.returncode != 0:
             raise RuntimeError(f"opencode-cli failed: {result.stderr or result.stdout}")
         text_parts = []
@@ -174,7 +224,8 @@ def ask_llm(
 
     for attempt in range(retries + 1):
         try:
-            r = client.chat.completions.create(timeout=timeout_seconds, **completion_kwargs)
+            with _llm_slot():
+                r = client.chat.completions.create(timeout=timeout_seconds, **completion_kwargs)
             out = r.choices[0].message.content
             if debug:
                 print(f"DEBUG: LLM response received len={len(out)}", flush=True)
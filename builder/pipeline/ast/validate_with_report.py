@@ -1,18 +1,56 @@
+import hashlib
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Dict, Optional
+
 from builder.pipeline.ast.python_ast import validate_python_ast
 from builder.pipeline.ast.rust_ast import validate_rust_ast
 
+
+def _validate_one(path: str, code: str) -> bool:
+    try:
+        if path.endswith(".py"):
+            validate_python_ast(code, path)
+        elif path.endswith(".rs"):
+            validate_rust_ast(code, path)
+    except Exception:
+        return False
+    return True
+
+
+@dataclass
+class ValidationCache:
+    """
+    Memoizes per-file validation results by content hash.
+
+    Rust validation shells out to rustfmt/cargo, so re-checking unchanged files
+    dominates repair loops; with the cache only new content is ever validated.
+    """
+    results: Dict[str, bool] = field(default_factory=dict)
+
+    @staticmethod
+    def key(path: str, code: str) -> str:
+        return hashlib.sha256(f"{path}\0{code}".encode()).hexdigest()
+
+    def validate(self, path: str, code: str) -> bool:
+        k = self.key(path, code)
+        if k not in self.results:
+            self.results[k] = _validate_one(path, code)
+        return self.results[k]
+
+
 def validate_files_with_report(
     files: dict[str, str],
+    cache: Optional[ValidationCache] = None,
+    max_workers: int = 1,
 ) -> tuple[bool, list[str]]:
-    failed: list[str] = []
+    check = cache.validate if cache is not None else _validate_one
 
-    for path, code in files.items():
-        try:
-            if path.endswith(".py"):
-                validate_python_ast(code, path)
-            elif path.endswith(".rs"):
-                validate_rust_ast(code, path)
-        except Exception:
-            failed.append(path)
+    if max_workers > 1 and len(files) > 1:
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            results = list(pool.map(check, files.keys(), files.values()))
+    else:
+        results = [check(path, code) for path, code in files.items()]
 
+    failed = [path for path, ok in zip(files, results) if not ok]
     return (len(failed) == 0, failed)
@@ -12,3 +12,6 @@ class SnapshotMismatch(BuilderError):
 
 class CargoCheckError(BuilderError):
     pass
+
+class PhaseError(BuilderError):
+    pass
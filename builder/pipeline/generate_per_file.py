@@ -16,6 +16,7 @@ from builder.infra.llm import ask_llm
 from builder.infra.yaml_loader import load_research
 from builder.pipeline.ast.python_ast import validate_python_ast
 from builder.pipeline.ast.rust_ast import validate_rust_ast
+from builder.pipeline.research_slice import slice_research_json
 
 
 @dataclass
@@ -118,7 +119,7 @@ TEMPLATE (customize for {exchange_name}):
 {template_content}
 ```
 
-RESEARCH DATA:
+RESEARCH DATA (sections relevant to this file):
 ```json
 {research_json}
 ```
@@ -240,7 +241,6 @@ def generate_files_incremental(
     console = Console()
     spec = load_research(research_yaml)
     exchange_name = spec.exchange_identity.exchange_name
-    research_json = spec.model_dump_json(indent=2)
     
     # Determine file extension
     ext = ".rs" if language == "rust" else ".py"
@@ -292,7 +292,7 @@ def generate_files_incremental(
                 filename=filename,
                 template_content=template_content,
                 exchange_name=exchange_name,
-                research_json=research_json,
+                research_json=slice_research_json(spec, filename),
                 language=language,
             )
             
@@ -330,7 +330,6 @@ def retry_failed_files(
     
     state = FileGenState.load(state_file)
     spec = load_research(research_yaml)
-    research_json = spec.model_dump_json(indent=2)
     
     console = Console()
     console.print(f"[yellow]🔄 Retrying {len(state.failed_files)} failed files...[/yellow]")
@@ -345,7 +344,7 @@ def retry_failed_files(
             filename=filename,
             template_content=template_content,
             exchange_name=state.exchange_name,
-            research_json=research_json,
+            research_json=slice_research_json(spec, filename),
             language=state.language,
             max_retries=3,  # More retries for previously failed files
         )
@@ -0,0 +1,282 @@
+"""
+Dependency-aware phase executor for the end-to-end pipeline.
+
+Phases declare the phases they depend on; every phase whose dependencies have
+finished is started immediately on a worker thread, so independent work (e.g.
+Python generation and the Rust cargo gates) overlaps. Output written by a phase
+(print/typer/rich or a subprocess it starts) is prefixed with the phase name.
+A failing critical phase cancels everything in its group not yet started and
+terminates the group's running subprocesses; non-critical failures are
+reported but do not block their dependents. Groups let one DAG carry several
+independent pipelines (e.g. one per exchange) that fail independently.
+"""
+
+import io
+import subprocess
+import sys
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, Iterator, Optional, Sequence
+
+from builder.pipeline.exceptions import PhaseError
+
+
+_local = threading.local()
+
+
+class _PrefixedStream(io.TextIOBase):
+    """
+    Line-buffering stream proxy that prefixes lines with the current thread's phase.
+
+    Threads outside a phase write straight through. Deliberately not a TTY, so
+    rich falls back to plain output instead of fighting over live displays.
+    """
+
+    def __init__(self, target):
+        self._target = target
+        self._lock = threading.Lock()
+
+    def writable(self) -> bool:
+        return True
+
+    def isatty(self) -> bool:
+        return False
+
+    @property
+    def encoding(self):
+        return getattr(self._target, "encoding", "utf-8")
+
+    def write(self, s: str) -> int:
+        prefix = getattr(_local, "prefix", None)
+        if prefix is None:
+            with self._lock:
+                return self._target.write(s)
+
+        buf = getattr(_local, "buffer", "") + s
+        *lines, _local.buffer = buf.split("\n")
+        if lines:
+            with self._lock:
+                for line in lines:
+                    self._target.write(f"[{prefix}] {line}\n")
+                self._target.flush()
+        return len(s)
+
+    def flush(self) -> None:
+        prefix = getattr(_local, "prefix", None)
+        pending = getattr(_local, "buffer", "")
+        with self._lock:
+            if prefix is not None and pending:
+                self._target.write(f"[{prefix}] {pending}\n")
+                _local.buffer = ""
+            self._target.flush()
+
+
+@contextmanager
+def _prefixed_output() -> Iterator[None]:
+    old_out, old_err = sys.stdout, sys.stderr
+    sys.stdout, sys.stderr = _PrefixedStream(old_out), _PrefixedStream(old_err)
+    try:
+        yield
+    finally:
+        sys.stdout.flush()
+        sys.stderr.flush()
+        sys.stdout, sys.stderr = old_out, old_err
+
+
+@dataclass
+class PhaseContext:
+    """Handed to each phase; runs subprocesses so they can be cancelled."""
+    name: str
+    cancelled: threading.Event
+    _procs: list = field(default_factory=list)
+    _lock: threading.Lock = field(default_factory=threading.Lock)
+
+    def run(
+        self,
+        cmd: Sequence[str],
+        cwd: Optional[Path] = None,
+        env: Optional[dict] = None,
+        check: bool = True,
+    ) -> int:
+        """Run a command, streaming its combined output with the phase prefix."""
+        if self.cancelled.is_set():
+            raise PhaseError(f"{self.name}: cancelled before running {cmd[0]}")
+
+        proc = subprocess.Popen(
+            list(cmd),
+            cwd=cwd,
+            env=env,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            text=True,
+            bufsize=1,
+        )
+        with self._lock:
+            self._procs.append(proc)
+        try:
+            for line in proc.stdout:
+                print(line.rstrip("\n"))
+            code = proc.wait()
+        finally:
+            with self._lock:
+                self._procs.remove(proc)
+
+        if check and code != 0:
+            raise PhaseError(f"{' '.join(cmd)} exited with {code}")
+        return code
+
+    def terminate(self) -> None:
+        with self._lock:
+            for proc in self._procs:
+                proc.terminate()
+
+
+@dataclass
+class Phase:
+    name: str
+    run: Callable[[PhaseContext], None]
+    deps: tuple[str, ...] = ()
+    critical: bool = True
+    group: str = ""
+
+
+@dataclass
+class PhaseResult:
+    name: str
+    status: str  # "ok" | "failed" | "skipped" | "cancelled"
+    duration: float = 0.0
+    error: Optional[str] = None
+    critical: bool = True
+    group: str = ""
+
+
+def _check_graph(phases: Sequence[Phase]) -> None:
+    names = {p.name for p in phases}
+    if len(names) != len(phases):
+        raise ValueError("Duplicate phase names")
+    for p in phases:
+        missing = [d for d in p.deps if d not in names]
+        if missing:
+            raise ValueError(f"Phase '{p.name}' depends on unknown phase(s): {missing}")
+
+    # Kahn's algorithm, just to reject cycles up front.
+    indeg = {p.name: len(p.deps) for p in phases}
+    users = {p.name: [q.name for q in phases if p.name in q.deps] for p in phases}
+    ready = [n for n, d in indeg.items() if d == 0]
+    seen = 0
+    while ready:
+        n = ready.pop()
+        seen += 1
+        for u in users[n]:
+            indeg[u] -= 1
+            if indeg[u] == 0:
+                ready.append(u)
+    if seen != len(phases):
+        raise ValueError("Phase graph contains a cycle")
+
+
+def _execute(phase: Phase, ctx: PhaseContext) -> PhaseResult:
+    _local.prefix = phase.name
+    _local.buffer = ""
+    start = time.perf_counter()
+    status, error = "ok", None
+    try:
+        phase.run(ctx)
+    except SystemExit as e:
+        # CLI commands reused as phases report failure via sys.exit
+        if e.code not in (0, None):
+            status, error = "failed", f"exit code {e.code}"
+    except Exception as e:
+        status, error = "failed", str(e) or type(e).__name__
+    finally:
+        sys.stdout.flush()
+        sys.stderr.flush()
+        _local.prefix = None
+    return PhaseResult(
+        phase.name, status, time.perf_counter() - start, error, phase.critical, phase.group
+    )
+
+
+def run_phases(
+    phases: Sequence[Phase],
+    max_workers: Optional[int] = None,
+    cancel: Optional[threading.Event] = None,
+) -> dict[str, PhaseResult]:
+    """
+    Execute `phases` respecting dependencies, as concurrently as allowed.
+
+    `cancel` aborts every group (e.g. on Ctrl-C). Returns results in
+    declaration order. Raises PhaseError (with `.results`) if a critical phase
+    failed.
+    """
+    _check_graph(phases)
+    cancel = cancel or threading.Event()
+    group_cancel = {p.group: threading.Event() for p in phases}
+    pending = {p.name: p for p in phases}
+    results: dict[str, PhaseResult] = {}
+    running: dict[Future, tuple[Phase, PhaseContext]] = {}
+
+    with _prefixed_output(), ThreadPoolExecutor(max_workers=max_workers or len(phases) or 1) as pool:
+        while pending or running:
+            for name, phase in list(pending.items()):
+                if cancel.is_set() or group_cancel[phase.group].is_set():
+                    results[name] = PhaseResult(
+                        name, "cancelled", critical=phase.critical, group=phase.group
+                    )
+                    del pending[name]
+                    continue
+                deps = [results.get(d) for d in phase.deps]
+                if any(r is None for r in deps):
+                    continue
+                del pending[name]
+                if any(r.status in ("skipped", "cancelled") for r in deps):
+                    results[name] = PhaseResult(
+                        name, "skipped", critical=phase.critical, group=phase.group
+                    )
+                    continue
+                ctx = PhaseContext(name=name, cancelled=group_cancel[phase.group])
+                running[pool.submit(_execute, phase, ctx)] = (phase, ctx)
+
+            if not running:
+                continue
+
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for fut in done:
+                running.pop(fut)
+                result = fut.result()
+                results[result.name] = result
+                if result.status == "failed" and result.critical:
+                    group_cancel[result.group].set()
+                    for phase, ctx in running.values():
+                        if phase.group == result.group:
+                            ctx.terminate()
+            if cancel.is_set():
+                for _, ctx in running.values():
+                    ctx.cancelled.set()
+                    ctx.terminate()
+
+    ordered = {p.name: results[p.name] for p in phases}
+    failed = [r for r in ordered.values() if r.status == "failed" and r.critical]
+    if failed:
+        err = PhaseError(
+            "; ".join(f"{r.name}: {r.error}" for r in failed)
+        )
+        err.results = ordered
+        raise err
+    return ordered
+
+
+def format_phase_report(results: dict[str, PhaseResult]) -> str:
+    """Plain-text timing/status table for a finished run."""
+    width = max((len(n) for n in results), default=5)
+    lines = [f"{'phase'.ljust(width)}  status     seconds"]
+    for r in results.values():
+        line = f"{r.name.ljust(width)}  {r.status.ljust(9)}  {r.duration:7.1f}"
+        if r.error:
+            line += f"  ({r.error})"
+        lines.append(line)
+    return "\n".join(lines)
@@ -1,61 +1,270 @@
+"""
+Lightweight retrieval over venue API docs for prompt context.
+
+Markdown files are split into header-aware chunks at ingest time and stored in
+a persisted inverted index (`.rag_cache/index.json`). Queries are scored with
+BM25 against the postings, so only chunks that contain query terms are touched.
+The loaded index is cached in-process and reloaded only when the file changes,
+and re-ingesting a directory only re-chunks documents whose content changed.
+"""
+
+import hashlib
 import json
+import math
+import re
+from collections import Counter
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import List, Dict
+from typing import Dict, List, Optional
 
 RAG_CACHE_DIR = Path(".rag_cache")
 RAG_INDEX_FILE = RAG_CACHE_DIR / "index.json"
 
-def ingest_docs(docs_dir: Path) -> int:
+INDEX_VERSION = 2
+MAX_CHUNK_CHARS = 1500
+
+# BM25 parameters (standard Okapi defaults)
+BM25_K1 = 1.5
+BM25_B = 0.75
+
+_HEADER_RE = re.compile(r"^(#{1,6})\s+(.*?)\s*#*\s*$")
+_TOKEN_RE = re.compile(r"[a-z0-9_]+")
+
+
+def tokenize(text: str) -> List[str]:
+    return _TOKEN_RE.findall(text.lower())
+
+
+def _split_long(text: str, limit: int) -> List[str]:
+    """Split an oversized section on paragraph boundaries (hard-wrap as last resort)."""
+    if len(text) <= limit:
+        return [text]
+
+    pieces: List[str] = []
+    current = ""
+    for para in re.split(r"\n\s*\n", text):
+        while len(para) > limit:
+            if current:
+                pieces.append(current)
+                current = ""
+            pieces.append(para[:limit])
+            para = para[limit:]
+        if current and len(current) + len(para) + 2 > limit:
+            pieces.append(current)
+            current = para
+        else:
+            current = f"{current}\n\n{para}" if current else para
+    if current:
+        pieces.append(current)
+    return pieces
+
+
+def chunk_markdown(content: str, max_chars: int = MAX_CHUNK_CHARS) -> List[dict]:
+    """
+    Split markdown into chunks along headers.
+
+    Each chunk carries its heading path (e.g. "REST API > Orders > Cancel") so a
+    hit can be attributed to the section it came from. Code fences are respected
+    when looking for headers.
+    """
+    sections: List[tuple[str, List[str]]] = []
+    stack: List[str] = []
+    lines: List[str] = []
+    heading = ""
+    in_fence = False
+
+    for line in content.splitlines():
+        if line.lstrip().startswith("```"):
+            in_fence = not in_fence
+        match = None if in_fence else _HEADER_RE.match(line)
+        if match:
+            if lines:
+                sections.append((heading, lines))
+            level = len(match.group(1))
+            stack = stack[: level - 1] + [match.group(2)]
+            heading = " > ".join(stack)
+            lines = [line]
+        else:
+            lines.append(line)
+    if lines:
+        sections.append((heading, lines))
+
+    chunks = []
+    for heading, body in sections:
+        text = "\n".join(body).strip()
+        if not text:
+            continue
+        for piece in _split_long(text, max_chars):
+            chunks.append({"heading": heading, "content": piece})
+    return chunks
+
+
+@dataclass
+class RagIndex:
+    """Chunk store plus inverted index (term -> {chunk_id: term frequency})."""
+
+    docs: Dict[str, dict] = field(default_factory=dict)
+    chunks: Dict[str, dict] = field(default_factory=dict)
+    postings: Dict[str, Dict[str, int]] = field(default_factory=dict)
+    # Sum of chunk lengths, kept current by add/remove so search needs no scan
+    total_length: int = field(init=False, default=0)
+
+    def __post_init__(self) -> None:
+        self.total_length = sum(c["length"] for c in self.chunks.values())
+
+    @classmethod
+    def load(cls, path: Path) -> "RagIndex":
+        data = json.loads(path.read_text())
+        if not isinstance(data, dict) or data.get("version") != INDEX_VERSION:
+            # Legacy whole-document index: start over, next ingest rebuilds it.
+            return cls()
+        return cls(docs=data["docs"], chunks=data["chunks"], postings=data["postings"])
+
+    def save(self, path: Path) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        payload = {
+            "version": INDEX_VERSION,
+            "docs": self.docs,
+            "chunks": self.chunks,
+            "postings": self.postings,
+        }
+        tmp = path.with_suffix(".tmp")
+        tmp.write_text(json.dumps(payload))
+        tmp.replace(path)
+
+    def remove_doc(self, source: str) -> None:
+        doc = self.docs.pop(source, None)
+        if not doc:
+            return
+        for chunk_id in doc["chunk_ids"]:
+            chunk = self.chunks.pop(chunk_id, None)
+            if not chunk:
+                continue
+            self.total_length -= chunk["length"]
+            terms = chunk.get("terms") or tokenize(f"{chunk['heading']}\n{chunk['content']}")
+            for term in set(terms):
+                posting = self.postings.get(term)
+                if posting is None:
+                    continue
+                posting.pop(chunk_id, None)
+                if not posting:
+                    del self.postings[term]
+
+    def add_doc(self, source: str, filename: str, content: str, digest: str) -> None:
+        chunk_ids = []
+        for i, chunk in enumerate(chunk_markdown(content)):
+            chunk_id = f"{source}#{i}"
+            # Headings are indexed alongside the body so section titles match.
+            terms = Counter(tokenize(f"{chunk['heading']}\n{chunk['content']}"))
+            self.chunks[chunk_id] = {
+                "source": source,
+                "filename": filename,
+                "heading": chunk["heading"],
+                "content": chunk["content"],
+                "length": sum(terms.values()),
+                # Exactly the posting keys written below, so removal cannot miss any
+                "terms": sorted(terms),
+            }
+            self.total_length += self.chunks[chunk_id]["length"]
+            for term, tf in terms.items():
+                self.postings.setdefault(term, {})[chunk_id] = tf
+            chunk_ids.append(chunk_id)
+        self.docs[source] = {"sha256": digest, "chunk_ids": chunk_ids}
+
+    def search(self, query: str, k: int = 3) -> List[tuple[float, dict]]:
+        n = len(self.chunks)
+        if n == 0:
+            return []
+        avgdl = self.total_length / n or 1.0
+
+        scores: Dict[str, float] = {}
+        for term in set(tokenize(query)):
+            posting = self.postings.get(term)
+            if not posting:
+                continue
+            df = len(posting)
+            idf = math.log(1 + (n - df + 0.5) / (df + 0.5))
+            for chunk_id, tf in posting.items():
+                dl = self.chunks[chunk_id]["length"]
+                norm = tf + BM25_K1 * (1 - BM25_B + BM25_B * dl / avgdl)
+                scores[chunk_id] = scores.get(chunk_id, 0.0) + idf * tf * (BM25_K1 + 1) / norm
+
+        ranked = sorted(scores.items(), key=lambda x: x[1], reverse=True)[:k]
+        return [(score, self.chunks[chunk_id]) for chunk_id, score in ranked]
+
+
+# In-process cache: (mtime_ns, size) of the index file -> loaded index
+_INDEX_CACHE: Dict[Path, tuple[tuple[int, int], RagIndex]] = {}
+
+
+def _load_index(index_file: Path) -> Optional[RagIndex]:
+    try:
+        st = index_file.stat()
+    except FileNotFoundError:
+        _INDEX_CACHE.pop(index_file, None)
+        return None
+
+    stamp = (st.st_mtime_ns, st.st_size)
+    cached = _INDEX_CACHE.get(index_file)
+    if cached and cached[0] == stamp:
+        return cached[1]
+
+    index = RagIndex.load(index_file)
+    _INDEX_CACHE[index_file] = (stamp, index)
+    return index
+
+
+def ingest_docs(docs_dir: Path, index_file: Optional[Path] = None) -> int:
     """
-    Ingest markdown files from a directory into a simple JSON index.
+    Ingest markdown files from a directory into the chunked BM25 index.
+
+    Only documents whose content hash changed are re-chunked; documents that
+    disappeared from `docs_dir` are dropped. Returns the number of indexed
+    documents.
     """
     if not docs_dir.exists():
         raise FileNotFoundError(f"Docs directory not found: {docs_dir}")
-        
-    documents = []
-    
-    for path in docs_dir.rglob("*.md"):
+
+    index_file = index_file or RAG_INDEX_FILE
+    index = (_load_index(index_file) if index_file.exists() else None) or RagIndex()
+
+    seen = set()
+    changed = False
+    for path in sorted(docs_dir.rglob("*.md")):
+        source = str(path)
+        seen.add(source)
         content = path.read_text()
-        # Simple chunking by header could be added, for now just whole file
-        # or simplified sliding window if large.
-        
-        doc = {
-            "source": str(path),
-            "content": content,
-            "filename": path.name
-        }
-        documents.append(doc)
-        
-    RAG_CACHE_DIR.mkdir(parents=True, exist_ok=True)
-    RAG_INDEX_FILE.write_text(json.dumps(documents, indent=2))
-    return len(documents)
+        digest = hashlib.sha256(content.encode()).hexdigest()
+
+        if index.docs.get(source, {}).get("sha256") == digest:
+            continue
+        index.remove_doc(source)
+        index.add_doc(source, path.name, content, digest)
+        changed = True
 
-def retrieve_context(query: str, k: int = 3) -> str:
+    for source in [s for s in index.docs if s not in seen and Path(s).is_relative_to(docs_dir)]:
+        index.remove_doc(source)
+        changed = True
+
+    if changed or not index_file.exists():
+        index.save(index_file)
+        _INDEX_CACHE.pop(index_file, None)
+    return len(index.docs)
+
+
+def retrieve_context(query: str, k: int = 3, index_file: Optional[Path] = None) -> str:
     """
-    Retrieve relevant context for a query.
-    Note: For a production system this would use embeddings.
-    Here we use simple keyword matching or just return top K docs if small corpus.
-    Current implementation: Returns all docs/summaries as context (assuming small corpus)
-    or just a placeholder for future vector DB integration.
+    Retrieve the `k` most relevant doc chunks for a query, formatted for a prompt.
     """
-    if not RAG_INDEX_FILE.exists():
+    index = _load_index(index_file or RAG_INDEX_FILE)
+    if index is None:
         return ""
-        
-    docs = json.loads(RAG_INDEX_FILE.read_text())
-    
-    # Naive keyword search
-    hits = []
-    terms = query.lower().split()
-    
-    for doc in docs:
-        score = sum(1 for t in terms if t in doc["content"].lower())
-        if score > 0:
-            hits.append((score, doc))
-            
-    hits.sort(key=lambda x: x[0], reverse=True)
-    
+
     context = ""
-    for _, doc in hits[:k]:
-        context += f"\n--- Source: {doc['filename']} ---\n{doc['content'][:2000]}...\n"
-        
+    for _, chunk in index.search(query, k):
+        title = chunk["filename"]
+        if chunk["heading"]:
+            title += f" :: {chunk['heading']}"
+        context += f"\n--- Source: {title} ---\n{chunk['content']}\n"
+
     return context
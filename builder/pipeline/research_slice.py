@@ -0,0 +1,98 @@
+"""
+Per-file slicing of the research document for codegen prompts.
+
+Each template file only needs a few sections of `ExchangeResearch`
+(`http/signing.rs` has no use for WebSocket channel lists, `websocket/handler.rs`
+has no use for REST endpoints). Sending only the relevant slice keeps prompts
+small and makes the cache key for unrelated files independent of edits to
+sections they never see.
+"""
+
+from fnmatch import fnmatch
+from typing import Iterable
+
+from builder.pipeline.models import ExchangeResearch
+
+
+# Sections every prompt receives so the model always knows which venue it targets.
+ALWAYS_INCLUDED: tuple[str, ...] = ("exchange_identity",)
+
+# Ordered (pattern, sections) rules, first match wins. Patterns are matched with
+# fnmatch against the template path relative to the template root.
+FILE_SECTIONS: list[tuple[str, tuple[str, ...]]] = [
+    # ---- Rust crate (relative to src/) ----
+    ("common/consts.rs", ("rest_api", "websocket_public", "websocket_private", "instrument_metadata")),
+    ("common/credential.rs", ("authentication", "special_notes")),
+    ("common/enums.rs", ("market_coverage", "order_model")),
+    ("common/models.rs", ("instrument_metadata", "order_model")),
+    ("common/risk/*", ("rest_api", "order_model", "instrument_metadata")),
+    ("common/urls.rs", ("rest_api", "websocket_public", "websocket_private")),
+    ("common/*", ()),
+    ("config.rs", ("rest_api", "websocket_public", "websocket_private", "authentication")),
+    ("data/*", ("market_coverage", "websocket_public", "instrument_metadata")),
+    ("execution/*", ("rest_endpoints", "websocket_private", "order_model")),
+    ("error.rs", ("rest_api",)),
+    ("http/client.rs", ("rest_api", "authentication", "rest_endpoints", "special_notes")),
+    ("http/error.rs", ("rest_api",)),
+    ("http/models.rs", ("rest_endpoints", "order_model", "instrument_metadata")),
+    ("http/parse.rs", ("rest_endpoints", "order_model", "instrument_metadata")),
+    ("http/query.rs", ("rest_endpoints",)),
+    ("http/signing.rs", ("rest_api", "authentication", "special_notes")),
+    ("http/*", ()),
+    ("lib.rs", ("market_coverage",)),
+    ("python/enums.rs", ("order_model",)),
+    ("python/http.rs", ("rest_api", "rest_endpoints")),
+    ("python/urls.rs", ("rest_api", "websocket_public", "websocket_private")),
+    ("python/websocket.rs", ("websocket_public", "websocket_private")),
+    ("python/*", ()),
+    ("testing/*", ("websocket_public", "websocket_private")),
+    ("websocket/client.rs", ("websocket_public", "websocket_private", "authentication")),
+    ("websocket/enums.rs", ("websocket_public", "websocket_private")),
+    ("websocket/handler.rs", ("websocket_public", "websocket_private", "order_model")),
+    ("websocket/messages.rs", ("websocket_public", "websocket_private", "order_model")),
+    ("websocket/parse.rs", ("websocket_public", "websocket_private", "order_model", "instrument_metadata")),
+    ("websocket/*", ()),
+    # ---- Python adapter ----
+    ("__init__.py", ()),
+    ("config.py", ("rest_api", "websocket_public", "websocket_private", "authentication", "special_notes")),
+    ("constants.py", ("rest_api", "websocket_public", "websocket_private", "order_model")),
+    ("data.py", ("market_coverage", "websocket_public", "instrument_metadata")),
+    ("execution.py", ("authentication", "rest_endpoints", "websocket_private", "order_model", "special_notes")),
+    ("factories.py", ("authentication",)),
+    ("providers.py", ("market_coverage", "rest_endpoints", "instrument_metadata")),
+    ("risk.py", ("rest_api", "order_model", "instrument_metadata")),
+    ("tests/*", ("websocket_public", "websocket_private")),
+]
+
+
+def _normalize(filename: str) -> str:
+    path = filename.replace("\\", "/").lstrip("/")
+    if path.startswith("src/"):
+        path = path[len("src/"):]
+    return path
+
+
+def sections_for_file(filename: str) -> tuple[str, ...]:
+    """
+    Return the `ExchangeResearch` sections a template file needs.
+
+    Files without a matching rule receive the full document, so new templates
+    are never silently starved of research data.
+    """
+    path = _normalize(filename)
+    for pattern, sections in FILE_SECTIONS:
+        if fnmatch(path, pattern):
+            return ALWAYS_INCLUDED + tuple(s for s in sections if s not in ALWAYS_INCLUDED)
+    return tuple(ExchangeResearch.model_fields)
+
+
+def dump_research(spec: ExchangeResearch, sections: Iterable[str] | None = None) -> str:
+    """Serialize (a subset of) the research document as compact JSON."""
+    if sections is None:
+        return spec.model_dump_json()
+    return spec.model_dump_json(include=set(sections))
+
+
+def slice_research_json(spec: ExchangeResearch, filename: str) -> str:
+    """Compact JSON containing only the research sections `filename` needs."""
+    return dump_research(spec, sections_for_file(filename))
@@ -1,107 +1,130 @@
 import json
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional
+
 from builder.pipeline.entropy_state import FileEntropyState
-from builder.pipeline.ast.validate_with_report import validate_files_with_report
-from builder.infra.llm import ask_llm # Using established utility
+from builder.pipeline.ast.validate_with_report import ValidationCache, validate_files_with_report
+from builder.infra.llm import ask_llm, llm_concurrency_from_env # Using established utility
 from builder.pipeline.exceptions import CodegenFailure
 
 
+def _default_workers() -> int:
+    # Same knob as the global LLM cap; unlimited there still needs a finite pool
+    return llm_concurrency_from_env() or 4
+
+
+def _extract_content(raw: str, path: str) -> str:
+    """
+    Pull the file body out of an LLM response.
+
+    Prompts may ask for a JSON wrapper ({"content": ...}, {"code": ...} or
+    {filename: content}); anything that is not JSON is taken as the raw file.
+    """
+    try:
+        clean_resp = raw.replace("```json", "").replace("```", "").strip()
+        payload = json.loads(clean_resp)
+    except json.JSONDecodeError:
+        return raw
+
+    if isinstance(payload, str):
+        return payload
+    if not isinstance(payload, dict):
+        return raw
+    if "content" in payload:
+        return payload["content"]
+    if "code" in payload:
+        return payload["code"]
+    return payload.get(path, raw)
+
+
+def _regenerate_one(prompt: str, path: str, temperature: float) -> Optional[str]:
+    try:
+        raw = ask_llm(prompt, temperature=temperature, cache=True)
+    except Exception:
+        # LLM failure counts as a failed attempt for this round
+        return None
+    return _extract_content(raw, path)
+
+
 def regenerate_failed_files(
     initial_files: dict[str, str], # Starting point
-    prompts: dict[str, str], # Prompt *per file*? Or a strategy to get one?
+    prompts: dict[str, str], # Prompt *per file*
     max_rounds: int = 6,
+    max_workers: Optional[int] = None,
+    patience: int = 2,
+    cache: Optional[ValidationCache] = None,
 ) -> dict[str, str]:
     """
     Retry logic that selectively regenerates failed files.
-    
+
+    Each round regenerates the failed files concurrently and revalidates only
+    the files it touched; validation results are memoized by content hash so
+    identical LLM output is never re-checked. The loop gives up early once the
+    failure set has not shrunk for `patience` consecutive rounds.
+
     Args:
         initial_files: The initial set of generated files.
         prompts: A mapping of 'filename' -> 'prompt string' used to regenerate that specific file.
-                 If we can't easily generate per-file prompts, this strategy requires adjustment.
+        max_rounds: Upper bound on repair rounds.
+        max_workers: Concurrent LLM calls / validations (defaults to $LLM_MAX_CONCURRENCY, or 4 when unset).
+        patience: Rounds without progress tolerated before failing.
+        cache: Optional shared validation cache (e.g. across languages or runs).
     """
     entropy = FileEntropyState()
+    cache = cache if cache is not None else ValidationCache()
+    workers = max_workers or _default_workers()
     files = initial_files.copy()
-    
-    # First validation pass
-    ok, failed = validate_files_with_report(files)
+
+    # First validation pass covers everything once
+    ok, failed = validate_files_with_report(files, cache=cache, max_workers=workers)
     if ok:
         return files
-        
-    for path in failed:
+
+    failed_set = set(failed)
+    for path in failed_set:
         entropy.record_failure(path)
 
+    best = len(failed_set)
+    stalled = 0
+
     for _ in range(max_rounds):
-        # We only need to regenerate 'failed' files
-        current_failed = failed
-        
-        # If no failures, we are done
-        if not current_failed:
-            return files
+        # Files without a prompt cannot be repaired; they stay failed.
+        jobs = {
+            path: (prompts[path], entropy.temperature_for(path))
+            for path in sorted(failed_set)
+            if prompts.get(path)
+        }
+        if not jobs:
+            break
+
+        with ThreadPoolExecutor(max_workers=min(workers, len(jobs))) as pool:
+            futures = {
+                path: pool.submit(_regenerate_one, prompt, path, temp)
+                for path, (prompt, temp) in jobs.items()
+            }
+            regenerated = {path: fut.result() for path, fut in futures.items()}
+
+        touched = {path: content for path, content in regenerated.items() if content is not None}
+        files.update(touched)
 
-        for path in current_failed:
-            prompt = prompts.get(path)
-            if not prompt:
-                # If we don't have a specific prompt, we might skip or fail.
-                # Or warn and keep the broken file?
-                # For now, assuming prompts provided.
-                continue
-
-            temp = entropy.temperature_for(path)
-            
-            # Call LLM for single file
-            # We assume the prompt is engineered to return just the content or a JSON wrapper
-            try:
-                raw = ask_llm(prompt, temperature=temp, cache=True)
-                
-                # Adapting to likely output format. 
-                # If the prompt asks for JSON { "content": ... }
-                try:
-                    clean_resp = raw.replace("```json", "").replace("```", "").strip()
-                    payload = json.loads(clean_resp)
-                    if isinstance(payload, str):
-                        content = payload # Unexpected but possible
-                    elif "content" in payload:
-                        content = payload["content"]
-                    elif "code" in payload:
-                        content = payload["code"]
-                    else:
-                        # Fallback: maybe the whole response is the code? 
-                        # Or it's the dict structure { filename: content }
-                        content = payload.get(path, raw)
-                except json.JSONDecodeError:
-                    content = raw # Fallback to raw string
-
-                files[path] = content
-            except Exception:
-                # LLM failure or parse failure, count as failure
-                pass
-
-        # Re-validate locally (only the ones we touched + others)
-        # Actually validate ALL because interdependencies might exist? 
-        # AST is per-file, so checking all is fine.
-        ok, failed = validate_files_with_report(files)
-
-        if ok:
+        # Only touched files can have changed state; validate just those.
+        _, still_failed = validate_files_with_report(touched, cache=cache, max_workers=workers)
+        failed_set = (failed_set - set(touched)) | set(still_failed)
+
+        if not failed_set:
             return files
 
-        for path in failed:
+        for path in failed_set:
             entropy.record_failure(path)
-            # We don't pop() because we need the old file if we fail to regen?
-            # User snippet used pop(), so effectively removing broken files if they stay broken.
-            # "files.pop(path, None)" implies strictly discarding invalid.
-            # But we want to retry. "if path in files: continue" in user loop implies 
-            # they treat 'files' as the set of *valid* files?
-            # User loop:
-            # for path, prompt in prompt_by_file:
-            #   if path in files: continue (Skip valid)
-            #   ... generate ...
-            #   files[path] = content
-            # validate
-            # for path in failed: pop()
-            
-            # This logic means 'files' only holds valid files between rounds.
-            
-            files.pop(path, None)
+
+        if len(failed_set) < best:
+            best = len(failed_set)
+            stalled = 0
+        else:
+            stalled += 1
+            if stalled >= patience:
+                break
 
     raise CodegenFailure(
-        f"Failed files after retries: {failed}"
+        f"Failed files after retries: {sorted(failed_set)}"
     )
@@ -10,6 +10,7 @@ from builder.pipeline.generate_per_file import generate_files_incremental, FileG
 from builder.pipeline.snapshot import compare_snapshots
 from builder.pipeline.snapshot_write import write_snapshots
 from builder.pipeline.enforce_critical import enforce_critical_fields
+from builder.pipeline.research_slice import dump_research
 from builder.infra.yaml_loader import load_research
 from builder.pipeline.rust_cargo_check import run_cargo_check
 from builder.pipeline.exceptions import CodegenFailure, CriticalFieldError, SnapshotMismatch, CargoCheckError
@@ -55,9 +56,10 @@ def run_codegen(
             "rest_api": {"rest_base_url": rest_url},
             "websocket_public": {"ws_public_url": ws_public_url},
         }
-        spec_json = json.dumps(minimal, indent=2)
+        spec_json = json.dumps(minimal, separators=(",", ":"))
     else:
-        spec_json = spec.model_dump_json(indent=2)
+        # Compact serialization: indentation only costs prompt tokens.
+        spec_json = dump_research(spec)
 
     # ========== INCREMENTAL MODE (per-file generation) ==========
     if incremental:
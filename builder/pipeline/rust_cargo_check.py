@@ -5,6 +5,11 @@ from pathlib import Path
 
 from builder.pipeline.exceptions import CargoCheckError
 
+# The check crate always has the same manifest, so a persistent target dir lets
+# its dependencies compile once and stay warm across checks (and across the
+# exchanges of a `pipeline-all` run). Cargo's build lock serializes concurrent use.
+CHECK_TARGET_DIR = Path(os.getenv("BUILDER_CARGO_TARGET_DIR", "builder/.cargo_target"))
+
 
 def run_cargo_check(rust_files: dict[str, str], *, strict: bool = False) -> None:
     # Filter for .rs files only, just in case
@@ -111,6 +116,7 @@ futures = "0.3"
 
         try:
             env = os.environ.copy()
+            env.setdefault("CARGO_TARGET_DIR", str(CHECK_TARGET_DIR.resolve()))
             if strict:
                 extra_flags = "-D warnings -D missing_docs"
                 rustflags = env.get("RUSTFLAGS", "")
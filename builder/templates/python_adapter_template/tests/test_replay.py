@@ -1,16 +1,53 @@
+"""
+Replay recorded WebSocket tapes through the data client message handlers.
+
+Capture traffic with ``record_ws_tape=True`` on the client config and copy the
+tape into ``tests/tapes``; every tape there is replayed at max speed.
+"""
+import asyncio
+import functools
+from pathlib import Path
+from types import SimpleNamespace
+
 import pytest
-from tests.replay import replay_ws
-
-# This is a template. The generator should populate the class name and methods.
-def test_ws_replay():
-    # Example:
-    # client = MyExchangePrivateDataClient(...)
-    # events = []
-    # 
-    # client._handle_trade = lambda t: events.append(t)
-    # client._handle_account_state = lambda a: events.append(a)
-    # 
-    # replay_ws("tests/tapes/okx_ws_account.jsonl", client._on_ws_message)
-    # 
-    # assert len(events) == 3
-    pass
+
+from nautilus_adapter.adapters.{{EXCHANGE_NAME}}.data import {{EXCHANGE_NAME}}DataClient
+from nautilus_adapter.common.ws_tape import WsTapeRecorder, read_tape, replay_tape
+
+TAPES = sorted((Path(__file__).parent / "tapes").glob("*.jsonl*"))
+
+
+def _dispatch_stub(events: list) -> SimpleNamespace:
+    return SimpleNamespace(
+        _handle_trade=lambda msg: events.append(("trade", msg)),
+        _handle_quote=lambda msg: events.append(("quote", msg)),
+    )
+
+
+def test_ws_replay_dispatches_recorded_messages(tmp_path):
+    tape = WsTapeRecorder(tmp_path / "tape.jsonl.gz")
+    tape.record("public", {"type": "trade", "price": "1"}, ts_recv_ns=1)
+    tape.record("public", {"type": "ticker", "bid": "1"}, ts_recv_ns=2)
+    tape.close()
+
+    events: list = []
+    handler = functools.partial(
+        {{EXCHANGE_NAME}}DataClient._handle_ws_message,
+        _dispatch_stub(events),
+    )
+    stats = asyncio.run(replay_tape(tape.path, {"public": handler}, raise_errors=True))
+
+    assert stats.messages == 2
+    assert [kind for kind, _ in events] == ["trade", "quote"]
+
+
+@pytest.mark.parametrize("path", TAPES, ids=lambda p: p.name)
+def test_ws_replay_captured_tape(path):
+    events: list = []
+    handler = functools.partial(
+        {{EXCHANGE_NAME}}DataClient._handle_ws_message,
+        _dispatch_stub(events),
+    )
+    stats = asyncio.run(replay_tape(path, {"public": handler}, raise_errors=True))
+
+    assert stats.messages == sum(1 for r in read_tape(path) if r.stream == "public")
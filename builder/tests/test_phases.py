@@ -0,0 +1,56 @@
+import sys
+import threading
+
+import pytest
+
+from builder.pipeline.exceptions import PhaseError
+from builder.pipeline.phases import Phase, run_phases
+
+
+def test_independent_phases_overlap(capsys):
+    both_started = threading.Barrier(2, timeout=5)
+
+    def branch(ctx):
+        # Deadlocks (and times out) unless both branches run at the same time.
+        both_started.wait()
+        print(f"hello from {ctx.name}")
+
+    phases = [
+        Phase("root", lambda ctx: None),
+        Phase("left", branch, deps=("root",)),
+        Phase("right", branch, deps=("root",)),
+        Phase("join", lambda ctx: None, deps=("left", "right")),
+    ]
+    results = run_phases(phases)
+
+    assert [r.status for r in results.values()] == ["ok"] * 4
+    out = capsys.readouterr().out
+    assert "[left] hello from left" in out
+    assert "[right] hello from right" in out
+
+
+def test_critical_failure_cancels_dependents():
+    def boom(ctx):
+        raise RuntimeError("boom")
+
+    phases = [
+        Phase("lint", lambda ctx: sys.exit(1), critical=False),
+        Phase("gen", boom),
+        Phase("after", lambda ctx: None, deps=("gen",)),
+    ]
+    with pytest.raises(PhaseError) as exc:
+        run_phases(phases, max_workers=1)
+
+    results = exc.value.results
+    assert results["lint"].status == "failed"
+    assert results["gen"].status == "failed"
+    assert results["after"].status == "cancelled"
+
+
+def test_cycle_is_rejected():
+    phases = [
+        Phase("a", lambda ctx: None, deps=("b",)),
+        Phase("b", lambda ctx: None, deps=("a",)),
+    ]
+    with pytest.raises(ValueError):
+        run_phases(phases)
@@ -0,0 +1,81 @@
+from builder.pipeline.rag_ingest import RagIndex, chunk_markdown, ingest_docs, retrieve_context
+
+DOC = """# Venue API
+
+Intro text.
+
+## Orders
+
+### Cancel order
+
+DELETE /orders/{id} cancels a resting order by venue id.
+
+## WebSocket
+
+Subscribe to the orderbook channel for depth updates.
+"""
+
+
+def test_chunk_markdown_tracks_heading_path():
+    chunks = chunk_markdown(DOC)
+    headings = [c["heading"] for c in chunks]
+    assert "Venue API > Orders > Cancel order" in headings
+    assert "Venue API > WebSocket" in headings
+
+
+def test_retrieve_returns_matching_chunk(tmp_path):
+    docs = tmp_path / "docs"
+    docs.mkdir()
+    (docs / "api.md").write_text(DOC)
+    index_file = tmp_path / "index.json"
+
+    assert ingest_docs(docs, index_file=index_file) == 1
+    context = retrieve_context("cancel order", k=1, index_file=index_file)
+    assert "Cancel order" in context
+    assert "orderbook channel" not in context
+
+
+def test_reingest_only_updates_changed_docs(tmp_path):
+    docs = tmp_path / "docs"
+    docs.mkdir()
+    (docs / "a.md").write_text("# A\n\nalpha content")
+    (docs / "b.md").write_text("# B\n\nbeta content")
+    index_file = tmp_path / "index.json"
+    ingest_docs(docs, index_file=index_file)
+
+    stamp = index_file.stat().st_mtime_ns
+    ingest_docs(docs, index_file=index_file)
+    assert index_file.stat().st_mtime_ns == stamp
+
+    (docs / "b.md").write_text("# B\n\ngamma content")
+    (docs / "a.md").unlink()
+    assert ingest_docs(docs, index_file=index_file) == 1
+    assert retrieve_context("beta", index_file=index_file) == ""
+    assert "gamma" in retrieve_context("gamma", index_file=index_file)
+
+
+def test_removed_doc_leaves_no_heading_postings(tmp_path):
+    docs = tmp_path / "docs"
+    docs.mkdir()
+    # "Guide" reaches the index only through the chunk's heading path
+    (docs / "a.md").write_text("# Guide\n\n## Orders\n\nplace and cancel")
+    (docs / "b.md").write_text("# Fills\n\nguide to fill reports")
+    index_file = tmp_path / "index.json"
+    ingest_docs(docs, index_file=index_file)
+
+    (docs / "a.md").unlink()
+    ingest_docs(docs, index_file=index_file)
+    assert "fill reports" in retrieve_context("guide", index_file=index_file)
+
+
+def test_total_length_tracks_ingest_and_removal(tmp_path):
+    index = RagIndex()
+    index.add_doc("a.md", "a.md", DOC, "1")
+    index.add_doc("b.md", "b.md", "# B\n\nbeta content", "2")
+    assert index.total_length == sum(c["length"] for c in index.chunks.values())
+
+    index.remove_doc("a.md")
+    assert index.total_length == sum(c["length"] for c in index.chunks.values()) > 0
+
+    index.save(tmp_path / "index.json")
+    assert RagIndex.load(tmp_path / "index.json").total_length == index.total_length
@@ -0,0 +1,35 @@
+import json
+from pathlib import Path
+
+from builder.infra.yaml_loader import load_research
+from builder.pipeline.models import ExchangeResearch
+from builder.pipeline.research_slice import sections_for_file, slice_research_json
+
+RESEARCH_YAML = Path(__file__).resolve().parents[1] / "research" / "lighter.yaml"
+
+
+def test_sections_for_known_files():
+    signing = sections_for_file("http/signing.rs")
+    assert "authentication" in signing
+    assert "websocket_public" not in signing
+
+    handler = sections_for_file("src/websocket/handler.rs")
+    assert "websocket_public" in handler
+    assert "rest_endpoints" not in handler
+
+    # Every slice carries the venue identity.
+    assert sections_for_file("execution.py")[0] == "exchange_identity"
+
+
+def test_unknown_file_gets_full_document():
+    assert set(sections_for_file("brand_new/thing.rs")) == set(ExchangeResearch.model_fields)
+
+
+def test_slice_is_compact_json_subset():
+    spec = load_research(RESEARCH_YAML)
+    sliced = slice_research_json(spec, "http/signing.rs")
+
+    assert "\n" not in sliced
+    data = json.loads(sliced)
+    assert set(data) == set(sections_for_file("http/signing.rs"))
+    assert len(sliced) < len(spec.model_dump_json(indent=2))
@@ -0,0 +1,41 @@
+from unittest.mock import patch
+
+import pytest
+
+from builder.pipeline.ast.validate_with_report import ValidationCache
+from builder.pipeline.exceptions import CodegenFailure
+from builder.pipeline.retry_per_file import _default_workers, regenerate_failed_files
+
+
+@patch("builder.pipeline.retry_per_file.ask_llm")
+def test_repairs_only_failed_files(mock_ask_llm):
+    mock_ask_llm.return_value = "x = 1\n"
+    files = {"good.py": "y = 2\n", "bad.py": "def (:\n"}
+    cache = ValidationCache()
+
+    repaired = regenerate_failed_files(files, {"bad.py": "fix bad.py"}, cache=cache)
+
+    assert repaired == {"good.py": "y = 2\n", "bad.py": "x = 1\n"}
+    assert mock_ask_llm.call_count == 1
+    # good.py, broken bad.py and repaired bad.py: each content validated once
+    assert len(cache.results) == 3
+
+
+@patch("builder.pipeline.retry_per_file.ask_llm")
+def test_stops_when_failures_stop_shrinking(mock_ask_llm):
+    mock_ask_llm.return_value = "def (:\n"
+    files = {"bad.py": "def (:\n"}
+
+    with pytest.raises(CodegenFailure):
+        regenerate_failed_files(files, {"bad.py": "fix"}, max_rounds=6, patience=2)
+
+    assert mock_ask_llm.call_count == 2
+
+
+def test_worker_pool_follows_the_global_llm_cap(monkeypatch):
+    monkeypatch.setenv("LLM_MAX_CONCURRENCY", "2")
+    assert _default_workers() == 2
+    monkeypatch.setenv("LLM_MAX_CONCURRENCY", "0")
+    assert _default_workers() == 4
+    monkeypatch.delenv("LLM_MAX_CONCURRENCY")
+    assert _default_workers() == 4
@@ -0,0 +1,107 @@
+//! Lighter hot paths: Schnorr transaction signing, request building and
+//! REST/WebSocket parsing of production-shaped payloads from `benches/fixtures`.
+//!
+//! One iteration is one order or one message, except for the REST pages,
+//! which declare their row count so criterion reports a per-row cost.
+
+use std::hint::black_box;
+
+use criterion::{Criterion, Throughput, criterion_group, criterion_main};
+use lighter::common::json::{LighterPage, from_body};
+use lighter::common::models::LighterOrderResponse;
+use lighter::http::parse::{parse_info_response, parse_orderbook_response, parse_trades_response};
+use lighter::http::query::build_url;
+use lighter::http::signing::sign_schnorr_babyjubjub;
+use lighter::websocket::parse::{extract_channel, parse_ws_message};
+
+const INFO: &str = include_str!("fixtures/info.json");
+const ORDERBOOK: &str = include_str!("fixtures/orderbook.json");
+const TRADES: &str = include_str!("fixtures/trades.json");
+const ORDERS: &str = include_str!("fixtures/orders.json");
+const TX_CREATE_ORDER: &str = include_str!("fixtures/tx_create_order.json");
+const WS_ORDER_BOOK: &str = include_str!("fixtures/ws_order_book.json");
+const WS_TRADE: &str = include_str!("fixtures/ws_trade.json");
+
+fn rows(raw: &str, key: &str) -> u64 {
+    let value: serde_json::Value = serde_json::from_str(raw).unwrap();
+    value[key].as_array().map_or(0, |rows| rows.len() as u64)
+}
+
+fn bench_signing(c: &mut Criterion) {
+    let private_key = hex::encode([3u8; 32]);
+    let tx_info = TX_CREATE_ORDER.trim_end().as_bytes();
+    let mut group = c.benchmark_group("lighter.signing");
+    group.throughput(Throughput::Elements(1));
+
+    group.bench_function("sign_create_order_tx", |b| {
+        b.iter(|| sign_schnorr_babyjubjub(black_box(&private_key), black_box(tx_info)).unwrap())
+    });
+    group.finish();
+}
+
+fn bench_request(c: &mut Criterion) {
+    let mut group = c.benchmark_group("lighter.request");
+    group.throughput(Throughput::Elements(1));
+
+    group.bench_function("build_url_inactive_orders", |b| {
+        b.iter(|| {
+            build_url(
+                black_box("https://mainnet.zklighter.elliot.ai"),
+                "/api/v1/accountInactiveOrders",
+                black_box(&[
+                    ("account_index", "7"),
+                    ("market_id", "1"),
+                    ("start_at_ms", "1760000000000"),
+                    ("end_at_ms", "1760086400000"),
+                    ("limit", "100"),
+                ]),
+            )
+        })
+    });
+    group.finish();
+}
+
+fn bench_rest_parse(c: &mut Criterion) {
+    let mut group = c.benchmark_group("lighter.rest");
+
+    group.throughput(Throughput::Elements(rows(INFO, "markets")));
+    group
+        .bench_function("parse_info", |b| b.iter(|| parse_info_response(black_box(INFO)).unwrap()));
+
+    group.throughput(Throughput::Elements(1));
+    group.bench_function("parse_orderbook", |b| {
+        b.iter(|| parse_orderbook_response(black_box(ORDERBOOK)).unwrap())
+    });
+
+    group.throughput(Throughput::Elements(rows(TRADES, "trades")));
+    group.bench_function("parse_trades", |b| {
+        b.iter(|| parse_trades_response(black_box(TRADES)).unwrap())
+    });
+
+    group.throughput(Throughput::Elements(rows(ORDERS, "orders")));
+    group.bench_function("decode_orders", |b| {
+        b.iter(|| {
+            from_body::<LighterPage<LighterOrderResponse>>(black_box(ORDERS.as_bytes())).unwrap()
+        })
+    });
+    group.finish();
+}
+
+fn bench_ws_parse(c: &mut Criterion) {
+    let mut group = c.benchmark_group("lighter.ws");
+    group.throughput(Throughput::Elements(1));
+
+    for (name, frame) in [("order_book", WS_ORDER_BOOK), ("trade", WS_TRADE)] {
+        group.bench_function(name, |b| {
+            b.iter(|| {
+                let message = parse_ws_message(black_box(frame)).unwrap();
+                black_box(extract_channel(&message).is_some());
+                message
+            })
+        });
+    }
+    group.finish();
+}
+
+criterion_group!(benches, bench_signing, bench_request, bench_rest_parse, bench_ws_parse);
+criterion_main!(benches);
@@ -17,3 +17,18 @@ pub const MAX_RETRIES: u32 = 3;
 
 /// Delay between retries in seconds
 pub const RETRY_DELAY_SECS: f64 = 1.0;
+
+/// How long rows fetched for an id lookup are reused, in seconds
+pub const LOOKUP_CACHE_TTL_SECS: u64 = 5;
+
+/// Maximum number of rows held by a lookup cache
+pub const LOOKUP_CACHE_MAX_ENTRIES: usize = 10_000;
+
+/// Page size used when scanning fills for an id
+pub const FILL_LOOKUP_PAGE_SIZE: u32 = 100;
+
+/// Maximum number of pages scanned for a single fill lookup
+pub const FILL_LOOKUP_MAX_PAGES: usize = 10;
+
+/// How far back a fill lookup searches, in seconds
+pub const FILL_LOOKUP_WINDOW_SECS: u64 = 3_600;
@@ -0,0 +1,192 @@
+//! Typed response-body parsing.
+//!
+//! Bodies are deserialized straight into the response models in a single
+//! pass, without an intermediate `serde_json::Value` or a second attempt on a
+//! different shape. With the `simd-json` feature the body is parsed by
+//! simd-json instead.
+
+use std::borrow::Cow;
+use std::fmt;
+use std::marker::PhantomData;
+
+use serde::de::{self, DeserializeOwned, IgnoredAny, MapAccess, SeqAccess, Visitor};
+use serde::{Deserialize, Deserializer};
+
+/// Deserialize a complete response body.
+#[cfg(not(feature = "simd-json"))]
+pub fn from_body<T: DeserializeOwned>(body: &[u8]) -> anyhow::Result<T> {
+    Ok(serde_json::from_slice(body)?)
+}
+
+/// Deserialize a complete response body.
+#[cfg(feature = "simd-json")]
+pub fn from_body<T: DeserializeOwned>(body: &[u8]) -> anyhow::Result<T> {
+    // simd-json parses in place, so it needs its own mutable copy
+    let mut buf = body.to_vec();
+    Ok(simd_json::serde::from_slice(&mut buf)?)
+}
+
+/// Keys under which list endpoints wrap their rows.
+const ROW_KEYS: [&str; 5] = ["orders", "trades", "results", "result", "data"];
+
+/// A list response that is either a bare array or an object wrapping the rows
+/// under one of `ROW_KEYS`, with optional `next`/`prev` cursors.
+///
+/// The first row key holding an array supplies the rows; a row key holding
+/// anything else is skipped, and null counts as no rows. An object with no
+/// usable row key is an error rather than an empty page.
+#[derive(Debug, Clone)]
+pub struct LighterPage<T> {
+    pub rows: Vec<T>,
+    pub next: Option<String>,
+    pub prev: Option<String>,
+}
+
+impl<'de, T: Deserialize<'de>> Deserialize<'de> for LighterPage<T> {
+    fn deserialize<D: Deserializer<'de>>(deserializer: D) -> Result<Self, D::Error> {
+        deserializer.deserialize_any(PageVisitor(PhantomData))
+    }
+}
+
+struct PageVisitor<T>(PhantomData<T>);
+
+impl<'de, T: Deserialize<'de>> Visitor<'de> for PageVisitor<T> {
+    type Value = LighterPage<T>;
+
+    fn expecting(&self, f: &mut fmt::Formatter) -> fmt::Result {
+        f.write_str("an array of rows or an object wrapping one")
+    }
+
+    fn visit_seq<A: SeqAccess<'de>>(self, mut seq: A) -> Result<Self::Value, A::Error> {
+        let mut rows = Vec::with_capacity(seq.size_hint().unwrap_or(0));
+        while let Some(row) = seq.next_element()? {
+            rows.push(row);
+        }
+        Ok(LighterPage { rows, next: None, prev: None })
+    }
+
+    fn visit_map<A: MapAccess<'de>>(self, mut map: A) -> Result<Self::Value, A::Error> {
+        let mut page = LighterPage { rows: Vec::new(), next: None, prev: None };
+        let mut found_rows = false;
+        let mut null_rows = false;
+        while let Some(key) = map.next_key::<Cow<'de, str>>()? {
+            match key.as_ref() {
+                "next" => page.next = map.next_value()?,
+                "prev" => page.prev = map.next_value()?,
+                k if !found_rows && ROW_KEYS.contains(&k) => match map.next_value()? {
+                    RowsValue::Rows(rows) => {
+                        page.rows = rows;
+                        found_rows = true;
+                    }
+                    RowsValue::Null => null_rows = true,
+                    RowsValue::Other => {}
+                },
+                _ => {
+                    map.next_value::<IgnoredAny>()?;
+                }
+            }
+        }
+        if !found_rows && !null_rows {
+            return Err(de::Error::custom(format_args!("no row array under any of {ROW_KEYS:?}")));
+        }
+        Ok(page)
+    }
+}
+
+/// The value found under a row key.
+enum RowsValue<T> {
+    Rows(Vec<T>),
+    Null,
+    Other,
+}
+
+impl<'de, T: Deserialize<'de>> Deserialize<'de> for RowsValue<T> {
+    fn deserialize<D: Deserializer<'de>>(deserializer: D) -> Result<Self, D::Error> {
+        deserializer.deserialize_any(RowsValueVisitor(PhantomData))
+    }
+}
+
+struct RowsValueVisitor<T>(PhantomData<T>);
+
+impl<'de, T: Deserialize<'de>> Visitor<'de> for RowsValueVisitor<T> {
+    type Value = RowsValue<T>;
+
+    fn expecting(&self, f: &mut fmt::Formatter) -> fmt::Result {
+        f.write_str("an array of rows, or any value to skip")
+    }
+
+    fn visit_seq<A: SeqAccess<'de>>(self, mut seq: A) -> Result<Self::Value, A::Error> {
+        let mut rows = Vec::with_capacity(seq.size_hint().unwrap_or(0));
+        while let Some(row) = seq.next_element()? {
+            rows.push(row);
+        }
+        Ok(RowsValue::Rows(rows))
+    }
+
+    fn visit_unit<E: de::Error>(self) -> Result<Self::Value, E> {
+        Ok(RowsValue::Null)
+    }
+
+    fn visit_none<E: de::Error>(self) -> Result<Self::Value, E> {
+        Ok(RowsValue::Null)
+    }
+
+    fn visit_some<D: Deserializer<'de>>(self, deserializer: D) -> Result<Self::Value, D::Error> {
+        deserializer.deserialize_any(self)
+    }
+
+    fn visit_map<A: MapAccess<'de>>(self, mut map: A) -> Result<Self::Value, A::Error> {
+        while map.next_entry::<IgnoredAny, IgnoredAny>()?.is_some() {}
+        Ok(RowsValue::Other)
+    }
+
+    fn visit_bool<E: de::Error>(self, _v: bool) -> Result<Self::Value, E> {
+        Ok(RowsValue::Other)
+    }
+
+    fn visit_i64<E: de::Error>(self, _v: i64) -> Result<Self::Value, E> {
+        Ok(RowsValue::Other)
+    }
+
+    fn visit_u64<E: de::Error>(self, _v: u64) -> Result<Self::Value, E> {
+        Ok(RowsValue::Other)
+    }
+
+    fn visit_f64<E: de::Error>(self, _v: f64) -> Result<Self::Value, E> {
+        Ok(RowsValue::Other)
+    }
+
+    fn visit_str<E: de::Error>(self, _v: &str) -> Result<Self::Value, E> {
+        Ok(RowsValue::Other)
+    }
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    #[test]
+    fn test_page_accepts_bare_array_and_wrapped_rows() {
+        let bare: LighterPage<u32> = from_body(b"[1, 2, 3]").unwrap();
+        assert_eq!(bare.rows, vec![1, 2, 3]);
+
+        let wrapped: LighterPage<u32> =
+            from_body(br#"{"code": 200, "orders": [4], "next": "c2", "prev": null}"#).unwrap();
+        assert_eq!(wrapped.rows, vec![4]);
+        assert_eq!(wrapped.next.as_deref(), Some("c2"));
+        assert_eq!(wrapped.prev, None);
+    }
+
+    #[test]
+    fn test_page_skips_non_array_row_keys_and_rejects_objects_without_rows() {
+        let skipped: LighterPage<u32> =
+            from_body(br#"{"data": {"total": 1}, "results": [5]}"#).unwrap();
+        assert_eq!(skipped.rows, vec![5]);
+
+        let empty: LighterPage<u32> = from_body(br#"{"results": null}"#).unwrap();
+        assert!(empty.rows.is_empty());
+
+        assert!(from_body::<LighterPage<u32>>(br#"{"data": "busy"}"#).is_err());
+        assert!(from_body::<LighterPage<u32>>(br#"{"code": 500, "msg": "oops"}"#).is_err());
+    }
+}
@@ -4,12 +4,19 @@ use nautilus_network::http::HttpClient;
 use serde_json::json;
 use std::collections::HashMap;
 use std::sync::Arc;
+use std::time::Duration;
 
+use crate::common::consts::{
+    FILL_LOOKUP_MAX_PAGES, FILL_LOOKUP_PAGE_SIZE, FILL_LOOKUP_WINDOW_SECS,
+    LOOKUP_CACHE_MAX_ENTRIES, LOOKUP_CACHE_TTL_SECS,
+};
 use crate::common::credential::LighterCredential;
+use crate::common::json::{LighterPage, from_body};
 use crate::common::models::{
     LighterActionResponse, LighterFillResponse, LighterFillsResponse, LighterInfoResponse,
     LighterOrderResponse, LighterOrderbookResponse, LighterOrdersResponse, LighterTradesResponse,
 };
+use crate::http::lookup::{TtlCache, epoch_millis, find_paged, now_millis};
 
 /// Raw HTTP client matching Lighter venue API endpoints.
 pub struct LighterRawHttpClient {
@@ -41,7 +48,7 @@ impl LighterRawHttpClient {
                 .get(url, None, None, None, None)
                 .await
                 .map_err(|e| anyhow::anyhow!("{e}"))?;
-            let info: LighterInfoResponse = serde_json::from_slice(&response.body)?;
+            let info: LighterInfoResponse = from_body(&response.body)?;
             Ok(info)
         })
     }
@@ -56,7 +63,7 @@ impl LighterRawHttpClient {
                 .get(url, None, None, None, None)
                 .await
                 .map_err(|e| anyhow::anyhow!("{e}"))?;
-            let orderbook: LighterOrderbookResponse = serde_json::from_slice(&response.body)?;
+            let orderbook: LighterOrderbookResponse = from_body(&response.body)?;
             Ok(orderbook)
         })
     }
@@ -78,7 +85,7 @@ impl LighterRawHttpClient {
                 .get(url, None, None, None, None)
                 .await
                 .map_err(|e| anyhow::anyhow!("{e}"))?;
-            let trades: LighterTradesResponse = serde_json::from_slice(&response.body)?;
+            let trades: LighterTradesResponse = from_body(&response.body)?;
             Ok(trades)
         })
     }
@@ -110,7 +117,7 @@ impl LighterRawHttpClient {
                 .post(url, None, None, Some(body_bytes), None, None)
                 .await
                 .map_err(|e| anyhow::anyhow!("{e}"))?;
-            let action: LighterActionResponse = serde_json::from_slice(&response.body)?;
+            let action: LighterActionResponse = from_body(&response.body)?;
             Ok(action)
         })
     }
@@ -119,6 +126,7 @@ impl LighterRawHttpClient {
 /// Domain HTTP client exposing Nautilus types.
 pub struct LighterHttpClient {
     inner: Arc<LighterRawHttpClient>,
+    fill_cache: TtlCache<String, LighterFillResponse>,
 }
 
 impl LighterHttpClient {
@@ -127,7 +135,13 @@ impl LighterHttpClient {
         client: HttpClient,
         credential: Option<LighterCredential>,
     ) -> Self {
-        Self { inner: Arc::new(LighterRawHttpClient::new(base_url, client, credential)) }
+        Self {
+            inner: Arc::new(LighterRawHttpClient::new(base_url, client, credential)),
+            fill_cache: TtlCache::new(
+                Duration::from_secs(LOOKUP_CACHE_TTL_SECS),
+                LOOKUP_CACHE_MAX_ENTRIES,
+            ),
+        }
     }
 
     /// Fetch exchange info including markets and tokens.
@@ -393,7 +407,7 @@ impl LighterHttpClient {
                 ));
             }
 
-            let order: LighterOrderResponse = serde_json::from_slice(&response.body)?;
+            let order: LighterOrderResponse = from_body(&response.body)?;
             Ok(order)
         })
     }
@@ -426,14 +440,8 @@ impl LighterHttpClient {
                 ));
             }
 
-            let wrapper: LighterOrdersResponse = match serde_json::from_slice(&response.body) {
-                Ok(parsed) => parsed,
-                Err(_) => {
-                    let rows: Vec<LighterOrderResponse> = serde_json::from_slice(&response.body)?;
-                    LighterOrdersResponse { orders: rows, next: None, prev: None }
-                }
-            };
-            Ok(wrapper.orders)
+            let page: LighterPage<LighterOrderResponse> = from_body(&response.body)?;
+            Ok(page.rows)
         })
     }
 
@@ -458,7 +466,7 @@ impl LighterHttpClient {
                 ));
             }
 
-            let order: LighterOrderResponse = serde_json::from_slice(&response.body)?;
+            let order: LighterOrderResponse = from_body(&response.body)?;
             Ok(order)
         })
     }
@@ -487,7 +495,7 @@ impl LighterHttpClient {
                 ));
             }
 
-            let order: LighterOrderResponse = serde_json::from_slice(&response.body)?;
+            let order: LighterOrderResponse = from_body(&response.body)?;
             Ok(order)
         })
     }
@@ -544,14 +552,8 @@ impl LighterHttpClient {
                 ));
             }
 
-            let orders: LighterOrdersResponse = match serde_json::from_slice(&response.body) {
-                Ok(parsed) => parsed,
-                Err(_) => {
-                    let rows: Vec<LighterOrderResponse> = serde_json::from_slice(&response.body)?;
-                    LighterOrdersResponse { orders: rows, next: None, prev: None }
-                }
-            };
-            Ok(orders)
+            let page: LighterPage<LighterOrderResponse> = from_body(&response.body)?;
+            Ok(LighterOrdersResponse { orders: page.rows, next: page.next, prev: page.prev })
         })
     }
 
@@ -561,6 +563,18 @@ impl LighterHttpClient {
         start_at_ms: Option<u64>,
         end_at_ms: Option<u64>,
         page_size: Option<u32>,
+    ) -> anyhow::Result<LighterFillsResponse> {
+        self.get_fills_page(market, start_at_ms, end_at_ms, page_size, None)
+    }
+
+    /// One page of fills; `cursor` is the `next` value of the previous page.
+    pub fn get_fills_page(
+        &self,
+        market: Option<String>,
+        start_at_ms: Option<u64>,
+        end_at_ms: Option<u64>,
+        page_size: Option<u32>,
+        cursor: Option<String>,
     ) -> anyhow::Result<LighterFillsResponse> {
         let inner = self.inner.clone();
         let headers = self.auth_headers()?;
@@ -579,6 +593,9 @@ impl LighterHttpClient {
             if let Some(page_size) = page_size {
                 params.push(("limit", page_size.to_string()));
             }
+            if let Some(cursor) = cursor {
+                params.push(("cursor", cursor));
+            }
 
             let mut url = format!("{}/api/v1/trades", inner.base_url);
             if !params.is_empty() {
@@ -603,27 +620,50 @@ impl LighterHttpClient {
                 ));
             }
 
-            let fills: LighterFillsResponse = match serde_json::from_slice(&response.body) {
-                Ok(parsed) => parsed,
-                Err(_) => {
-                    let rows: Vec<LighterFillResponse> = serde_json::from_slice(&response.body)?;
-                    LighterFillsResponse { trades: rows, results: vec![], next: None, prev: None }
-                }
-            };
-            Ok(fills)
+            let page: LighterPage<LighterFillResponse> = from_body(&response.body)?;
+            Ok(LighterFillsResponse {
+                trades: page.rows,
+                results: vec![],
+                next: page.next,
+                prev: page.prev,
+            })
         })
     }
 
+    /// Find a fill by fill or trade id.
+    ///
+    /// The fills endpoint has no id filter, so recent pages are scanned newest
+    /// first and stop at the first match, at the first fill older than
+    /// `FILL_LOOKUP_WINDOW_SECS` or after `FILL_LOOKUP_MAX_PAGES` pages.
+    /// Every fill seen is cached briefly, so looking up the other fills of the
+    /// same reconciliation pass does not hit the venue again.
     pub fn get_fill_by_id(&self, fill_id: String) -> anyhow::Result<Option<LighterFillResponse>> {
-        let fills = self.get_fills(None, None, None, Some(200))?;
-        Ok(fills
-            .trades
-            .iter()
-            .chain(fills.results.iter())
-            .find(|f| {
-                f.id.as_deref() == Some(fill_id.as_str())
-                    || f.trade_id.as_deref() == Some(fill_id.as_str())
-            })
-            .cloned())
+        if let Some(fill) = self.fill_cache.get(&fill_id) {
+            return Ok(Some(fill));
+        }
+        let start_at_ms = now_millis().saturating_sub(FILL_LOOKUP_WINDOW_SECS * 1_000);
+        find_paged(
+            |cursor| {
+                let page = self.get_fills_page(
+                    None,
+                    Some(start_at_ms),
+                    None,
+                    Some(FILL_LOOKUP_PAGE_SIZE),
+                    cursor,
+                )?;
+                Ok((page.trades.into_iter().chain(page.results).collect(), page.next))
+            },
+            FILL_LOOKUP_MAX_PAGES,
+            |fill: &LighterFillResponse| {
+                for id in [&fill.id, &fill.trade_id].into_iter().flatten() {
+                    self.fill_cache.insert(id.clone(), fill.clone());
+                }
+            },
+            |fill| {
+                fill.id.as_deref() == Some(fill_id.as_str())
+                    || fill.trade_id.as_deref() == Some(fill_id.as_str())
+            },
+            |fill| fill.timestamp.is_some_and(|ts| epoch_millis(ts) < start_at_ms),
+        )
     }
 }
@@ -0,0 +1,244 @@
+//! Short-lived lookup cache and bounded paginated search.
+//!
+//! Used where the venue has no id-filtered endpoint: pages are walked newest
+//! first until the row is found, the rows fall out of the search window or the
+//! page budget is spent, and every row seen is cached so a burst of
+//! reconciliation lookups shares the downloads.
+
+use std::collections::{HashMap, VecDeque};
+use std::hash::Hash;
+use std::sync::Mutex;
+use std::time::{Duration, Instant, SystemTime, UNIX_EPOCH};
+
+struct Entries<K, V> {
+    map: HashMap<K, (Instant, V)>,
+    // Insertion order; a key inserted again leaves a stale slot that is
+    // skipped when popped because its instant no longer matches the map.
+    order: VecDeque<(Instant, K)>,
+}
+
+impl<K: Eq + Hash, V> Entries<K, V> {
+    fn pop_oldest(&mut self) -> bool {
+        let Some((inserted, key)) = self.order.pop_front() else {
+            return false;
+        };
+        if self.map.get(&key).is_some_and(|(at, _)| *at == inserted) {
+            self.map.remove(&key);
+        }
+        true
+    }
+}
+
+/// Bounded map whose entries expire `ttl` after insertion.
+///
+/// When full, expired entries go first and then the oldest ones, so a burst
+/// of inserts only displaces what was cached longest ago.
+pub struct TtlCache<K, V> {
+    ttl: Duration,
+    max_entries: usize,
+    entries: Mutex<Entries<K, V>>,
+}
+
+impl<K: Eq + Hash + Clone, V: Clone> TtlCache<K, V> {
+    pub fn new(ttl: Duration, max_entries: usize) -> Self {
+        let entries = Entries { map: HashMap::new(), order: VecDeque::new() };
+        Self { ttl, max_entries: max_entries.max(1), entries: Mutex::new(entries) }
+    }
+
+    pub fn get(&self, key: &K) -> Option<V> {
+        let mut entries = self.entries.lock().unwrap();
+        match entries.map.get(key) {
+            Some((inserted, value)) if inserted.elapsed() < self.ttl => Some(value.clone()),
+            Some(_) => {
+                entries.map.remove(key);
+                None
+            }
+            None => None,
+        }
+    }
+
+    pub fn insert(&self, key: K, value: V) {
+        let mut entries = self.entries.lock().unwrap();
+        // Every entry shares one ttl, so insertion order is also expiry order
+        while entries.order.front().is_some_and(|(inserted, _)| inserted.elapsed() >= self.ttl) {
+            entries.pop_oldest();
+        }
+        while entries.map.len() >= self.max_entries && !entries.map.contains_key(&key) {
+            if !entries.pop_oldest() {
+                break;
+            }
+        }
+        let now = Instant::now();
+        entries.order.push_back((now, key.clone()));
+        entries.map.insert(key, (now, value));
+    }
+
+    pub fn len(&self) -> usize {
+        self.entries.lock().unwrap().map.len()
+    }
+
+    pub fn is_empty(&self) -> bool {
+        self.len() == 0
+    }
+
+    pub fn clear(&self) {
+        let mut entries = self.entries.lock().unwrap();
+        entries.map.clear();
+        entries.order.clear();
+    }
+}
+
+/// Current wall-clock time in epoch milliseconds.
+pub fn now_millis() -> u64 {
+    SystemTime::now().duration_since(UNIX_EPOCH).map_or(0, |d| d.as_millis() as u64)
+}
+
+/// Epoch milliseconds from a venue timestamp in seconds, milliseconds,
+/// microseconds or nanoseconds, told apart by magnitude.
+pub fn epoch_millis(ts: u64) -> u64 {
+    match ts {
+        0..100_000_000_000 => ts * 1_000,
+        100_000_000_000..100_000_000_000_000 => ts,
+        100_000_000_000_000..100_000_000_000_000_000 => ts / 1_000,
+        _ => ts / 1_000_000,
+    }
+}
+
+/// Walk cursor pages until `matches` accepts a row, at most `max_pages` pages.
+///
+/// `fetch_page` receives the cursor of the previous page (`None` first) and
+/// returns the rows plus the next cursor; `seen` is called for every row
+/// fetched, including those after a match on the same page. Pages come newest
+/// first, so once `past` flags a row as older than the search window the
+/// walk ends after that page.
+pub fn find_paged<T, F, S, M, P>(
+    mut fetch_page: F,
+    max_pages: usize,
+    mut seen: S,
+    matches: M,
+    past: P,
+) -> anyhow::Result<Option<T>>
+where
+    T: Clone,
+    F: FnMut(Option<String>) -> anyhow::Result<(Vec<T>, Option<String>)>,
+    S: FnMut(&T),
+    M: Fn(&T) -> bool,
+    P: Fn(&T) -> bool,
+{
+    let mut cursor = None;
+    for _ in 0..max_pages {
+        let (rows, next) = fetch_page(cursor.take())?;
+        let mut found = None;
+        let mut exhausted = false;
+        for row in &rows {
+            seen(row);
+            if found.is_none() && matches(row) {
+                found = Some(row.clone());
+            }
+            exhausted = exhausted || past(row);
+        }
+        if found.is_some() || exhausted {
+            return Ok(found);
+        }
+        match next {
+            Some(next) if !next.is_empty() && !rows.is_empty() => cursor = Some(next),
+            _ => break,
+        }
+    }
+    Ok(None)
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    #[test]
+    fn test_ttl_cache_expires_and_bounds_entries() {
+        let cache = TtlCache::new(Duration::from_millis(20), 2);
+        cache.insert("a", 1);
+        assert_eq!(cache.get(&"a"), Some(1));
+        std::thread::sleep(Duration::from_millis(30));
+        assert_eq!(cache.get(&"a"), None);
+
+        cache.insert("b", 2);
+        cache.insert("c", 3);
+        cache.insert("d", 4);
+        assert!(cache.len() <= 2);
+        assert_eq!(cache.get(&"d"), Some(4));
+    }
+
+    #[test]
+    fn test_ttl_cache_evicts_only_the_oldest_when_full() {
+        let cache = TtlCache::new(Duration::from_secs(60), 3);
+        cache.insert("a", 1);
+        cache.insert("b", 2);
+        cache.insert("c", 3);
+        cache.insert("a", 10);
+        cache.insert("d", 4);
+        assert_eq!(cache.len(), 3);
+        assert_eq!(cache.get(&"b"), None);
+        assert_eq!(cache.get(&"a"), Some(10));
+        assert_eq!(cache.get(&"c"), Some(3));
+        assert_eq!(cache.get(&"d"), Some(4));
+    }
+
+    #[test]
+    fn test_epoch_millis_normalises_units() {
+        let ms = 1_700_000_000_000;
+        assert_eq!(epoch_millis(1_700_000_000), ms);
+        assert_eq!(epoch_millis(ms), ms);
+        assert_eq!(epoch_millis(ms * 1_000), ms);
+        assert_eq!(epoch_millis(ms * 1_000_000), ms);
+    }
+
+    #[test]
+    fn test_find_paged_stops_at_first_match_or_budget() {
+        let pages = vec![vec![1, 2], vec![3, 4], vec![5, 6]];
+        let mut fetched = 0;
+        let mut seen = Vec::new();
+        let found = find_paged(
+            |cursor: Option<String>| {
+                let i = cursor.map_or(0, |c| c.parse::<usize>().unwrap());
+                fetched += 1;
+                Ok((pages[i].clone(), (i + 1 < pages.len()).then(|| (i + 1).to_string())))
+            },
+            10,
+            |row: &i32| seen.push(*row),
+            |row| *row == 3,
+            |_| false,
+        )
+        .unwrap();
+        assert_eq!(found, Some(3));
+        assert_eq!(fetched, 2);
+        assert_eq!(seen, vec![1, 2, 3, 4]);
+
+        let missing = find_paged(
+            |_| Ok((vec![1], Some("next".to_string()))),
+            3,
+            |_: &i32| {},
+            |row| *row == 9,
+            |_| false,
+        )
+        .unwrap();
+        assert_eq!(missing, None);
+    }
+
+    #[test]
+    fn test_find_paged_stops_once_rows_leave_the_window() {
+        let mut fetched = 0;
+        let missing = find_paged(
+            |cursor: Option<String>| {
+                let i = cursor.map_or(0, |c| c.parse::<i32>().unwrap());
+                fetched += 1;
+                Ok((vec![100 - i * 10, 95 - i * 10], Some((i + 1).to_string())))
+            },
+            10,
+            |_: &i32| {},
+            |row| *row == 1,
+            |row| *row < 80,
+        )
+        .unwrap();
+        assert_eq!(missing, None);
+        assert_eq!(fetched, 3);
+    }
+}
@@ -1,5 +1,6 @@
 pub mod client;
 pub mod error;
+pub mod lookup;
 pub mod models;
 pub mod signing;
 pub mod parse;
@@ -234,6 +234,14 @@ impl PyLighterHttpClient {
             .map_err(|e| pyo3::exceptions::PyRuntimeError::new_err(format!("{e}")))
     }
 
+    /// Fill as JSON, or `None` if it is not among the recent fills scanned.
+    pub fn get_fill_by_id(&self, fill_id: String) -> PyResult<Option<String>> {
+        self.client
+            .get_fill_by_id(fill_id)
+            .map(|fill| fill.map(|fill| serde_json::to_string(&fill).unwrap_or_default()))
+            .map_err(|e| pyo3::exceptions::PyRuntimeError::new_err(format!("{e}")))
+    }
+
     pub fn get_orders_history(
         &self,
         market: Option<String>,
@@ -1,24 +1,96 @@
+use std::fs::File;
+use std::io::{BufRead, BufReader};
+use std::path::Path;
+use std::thread;
+use std::time::{Duration, Instant};
+
+use flate2::read::MultiGzDecoder;
+use serde_json::Value;
+
+/// One recorded WebSocket message: receive time, stream name and raw payload.
+#[derive(Debug, Clone, PartialEq)]
+pub struct WsTapeRecord {
+    pub ts_recv_ns: u64,
+    pub stream: String,
+    pub payload: Value,
+}
+
 /// WebSocket replay utility for testing Lighter message handling.
 ///
-/// Reads recorded WebSocket messages from a file and replays them
-/// through the handler for deterministic testing.
+/// Loads tapes written by the Python recorder (gzip or plain JSON lines of
+/// `[ts_recv_ns, stream, payload]`) and replays them through a handler,
+/// either paced by the recorded receive times or as fast as possible.
 pub struct LighterWsReplay {
-    pub messages: Vec<String>,
+    pub records: Vec<WsTapeRecord>,
 }
 
 impl LighterWsReplay {
     pub fn new() -> Self {
         Self {
-            messages: Vec::new(),
+            records: Vec::new(),
         }
     }
 
+    /// Load a tape; unreadable lines are skipped and a torn gzip tail ends it.
+    pub fn from_tape<P: AsRef<Path>>(path: P) -> std::io::Result<Self> {
+        let mut reader = BufReader::new(File::open(path)?);
+        let compressed = reader.fill_buf()?.starts_with(&[0x1f, 0x8b]);
+        let lines: Box<dyn BufRead> = if compressed {
+            Box::new(BufReader::new(MultiGzDecoder::new(reader)))
+        } else {
+            Box::new(reader)
+        };
+
+        let mut replay = Self::new();
+        for line in lines.lines() {
+            let Ok(line) = line else { break };
+            if let Ok((ts_recv_ns, stream, payload)) =
+                serde_json::from_str::<(u64, String, Value)>(&line)
+            {
+                replay.records.push(WsTapeRecord {
+                    ts_recv_ns,
+                    stream,
+                    payload,
+                });
+            }
+        }
+        Ok(replay)
+    }
+
     pub fn add_message(&mut self, msg: String) {
-        self.messages.push(msg);
+        let payload = serde_json::from_str(&msg).unwrap_or(Value::String(msg));
+        self.records.push(WsTapeRecord {
+            ts_recv_ns: 0,
+            stream: "public".to_string(),
+            payload,
+        });
     }
 
     pub fn message_count(&self) -> usize {
-        self.messages.len()
+        self.records.len()
+    }
+
+    /// Feed every record to `handler` and return the elapsed time.
+    ///
+    /// `speed` of `None` replays as fast as possible; `Some(1.0)` keeps the
+    /// recorded spacing and `Some(10.0)` runs ten times faster.
+    pub fn replay<F>(&self, speed: Option<f64>, mut handler: F) -> Duration
+    where
+        F: FnMut(&WsTapeRecord),
+    {
+        let started = Instant::now();
+        let first_ts = self.records.first().map(|r| r.ts_recv_ns).unwrap_or(0);
+        let speed = speed.filter(|s| *s > 0.0);
+        for record in &self.records {
+            if let Some(speed) = speed {
+                let offset = record.ts_recv_ns.saturating_sub(first_ts) as f64 / 1e9 / speed;
+                if let Some(wait) = Duration::from_secs_f64(offset).checked_sub(started.elapsed()) {
+                    thread::sleep(wait);
+                }
+            }
+            handler(record);
+        }
+        started.elapsed()
     }
 }
 
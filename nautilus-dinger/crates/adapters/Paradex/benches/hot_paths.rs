@@ -0,0 +1,181 @@
+//! Paradex hot paths: StarkNet signing, request building and REST/WebSocket
+//! parsing of production-shaped payloads from `benches/fixtures`.
+//!
+//! One iteration is one order or one message, except for the REST pages,
+//! which declare their row count so criterion reports a per-row cost.
+
+use std::hint::black_box;
+
+use criterion::{BatchSize, Criterion, Throughput, criterion_group, criterion_main};
+use nautilus_core::UnixNanos;
+use paradex::common::json::{ParadexPage, from_body};
+use paradex::common::models::ParadexOrderResponse;
+use paradex::http::parse::{parse_info_response, parse_orderbook_response, parse_trades_response};
+use paradex::http::query::build_url;
+use paradex::http::signing::{OrderParams, sign_auth_message, sign_order};
+use paradex::websocket::messages::{
+    ParadexWsBbo, ParadexWsOrderbook, ParadexWsRpcMessage, ParadexWsTrade,
+};
+use paradex::websocket::parse::{
+    ParadexWsInstrument, parse_orderbook_deltas, parse_quote_tick, parse_trade_tick,
+};
+
+const MARKETS: &str = include_str!("fixtures/markets.json");
+const ORDERBOOK: &str = include_str!("fixtures/orderbook.json");
+const TRADES: &str = include_str!("fixtures/trades.json");
+const ORDERS_HISTORY: &str = include_str!("fixtures/orders_history.json");
+const WS_TRADE: &str = include_str!("fixtures/ws_trade.json");
+const WS_BBO: &str = include_str!("fixtures/ws_bbo.json");
+const WS_BOOK_SNAPSHOT: &str = include_str!("fixtures/ws_book_snapshot.json");
+const WS_BOOK_DELTA: &str = include_str!("fixtures/ws_book_delta.json");
+
+const CHAIN_ID: &str = "PRIVATE_SN_POTC_SEPOLIA";
+const TS_MS: u64 = 1_760_000_000_000;
+
+fn private_key() -> String {
+    hex::encode([1u8; 32])
+}
+
+fn account() -> String {
+    hex::encode([2u8; 32])
+}
+
+fn order_params() -> OrderParams {
+    OrderParams {
+        chain_id: CHAIN_ID.to_string(),
+        timestamp: TS_MS,
+        market: "BTC-USD-PERP".to_string(),
+        side: "1".to_string(),
+        order_type: "LIMIT".to_string(),
+        size: "1250000".to_string(),
+        price: "6400130000000".to_string(),
+    }
+}
+
+fn instrument() -> ParadexWsInstrument {
+    ParadexWsInstrument::new("BTC-USD-PERP", 1, 5)
+}
+
+/// Borrow the `params.data` payload of a JSON-RPC subscription frame.
+fn push_data(frame: &str) -> &str {
+    let message: ParadexWsRpcMessage = serde_json::from_str(frame).unwrap();
+    message.params.unwrap().data.get()
+}
+
+fn rows(raw: &str, key: &str) -> u64 {
+    let value: serde_json::Value = serde_json::from_str(raw).unwrap();
+    value[key].as_array().map_or(0, |rows| rows.len() as u64)
+}
+
+fn bench_signing(c: &mut Criterion) {
+    let pk = private_key();
+    let addr = account();
+    let mut group = c.benchmark_group("paradex.signing");
+    group.throughput(Throughput::Elements(1));
+
+    group.bench_function("sign_order", |b| {
+        b.iter_batched(
+            order_params,
+            |params| sign_order(black_box(&pk), black_box(&addr), params).unwrap(),
+            BatchSize::SmallInput,
+        )
+    });
+    group.bench_function("sign_auth_message", |b| {
+        b.iter(|| {
+            sign_auth_message(
+                black_box(&pk),
+                black_box(&addr),
+                CHAIN_ID,
+                1_760_000_000,
+                1_760_086_400,
+            )
+            .unwrap()
+        })
+    });
+    group.finish();
+}
+
+fn bench_request(c: &mut Criterion) {
+    let mut group = c.benchmark_group("paradex.request");
+    group.throughput(Throughput::Elements(1));
+
+    group.bench_function("build_url_orders_history", |b| {
+        b.iter(|| {
+            build_url(
+                black_box("https://api.prod.paradex.trade/v1"),
+                "/orders-history",
+                black_box(&[
+                    ("market", "BTC-USD-PERP"),
+                    ("start_at", "1760000000000"),
+                    ("end_at", "1760086400000"),
+                    ("page_size", "100"),
+                    ("cursor", "eyJmaWx0ZXIiOiJNVEF3TURBd01EQXdNREF3In0="),
+                ]),
+            )
+        })
+    });
+    group.finish();
+}
+
+fn bench_rest_parse(c: &mut Criterion) {
+    let mut group = c.benchmark_group("paradex.rest");
+
+    group.throughput(Throughput::Elements(rows(MARKETS, "results")));
+    group.bench_function("parse_markets", |b| {
+        b.iter(|| parse_info_response(black_box(MARKETS)).unwrap())
+    });
+
+    group.throughput(Throughput::Elements(1));
+    group.bench_function("parse_orderbook", |b| {
+        b.iter(|| parse_orderbook_response(black_box(ORDERBOOK)).unwrap())
+    });
+
+    group.throughput(Throughput::Elements(rows(TRADES, "trades")));
+    group.bench_function("parse_trades", |b| {
+        b.iter(|| parse_trades_response(black_box(TRADES)).unwrap())
+    });
+
+    group.throughput(Throughput::Elements(rows(ORDERS_HISTORY, "results")));
+    group.bench_function("decode_orders_history", |b| {
+        b.iter(|| {
+            from_body::<ParadexPage<ParadexOrderResponse>>(black_box(ORDERS_HISTORY.as_bytes()))
+                .unwrap()
+        })
+    });
+    group.finish();
+}
+
+fn bench_ws_parse(c: &mut Criterion) {
+    let instrument = instrument();
+    let ts_init = UnixNanos::from(TS_MS * 1_000_000);
+    let mut group = c.benchmark_group("paradex.ws");
+    group.throughput(Throughput::Elements(1));
+
+    // Each case decodes the whole frame, as the handler does per message
+    group.bench_function("trade_tick", |b| {
+        b.iter(|| {
+            let trade: ParadexWsTrade =
+                serde_json::from_str(push_data(black_box(WS_TRADE))).unwrap();
+            parse_trade_tick(&trade, &instrument, ts_init).unwrap()
+        })
+    });
+    group.bench_function("quote_tick", |b| {
+        b.iter(|| {
+            let bbo: ParadexWsBbo = serde_json::from_str(push_data(black_box(WS_BBO))).unwrap();
+            parse_quote_tick(&bbo, &instrument, ts_init).unwrap()
+        })
+    });
+    for (name, frame) in [("book_snapshot", WS_BOOK_SNAPSHOT), ("book_delta", WS_BOOK_DELTA)] {
+        group.bench_function(name, |b| {
+            b.iter(|| {
+                let book: ParadexWsOrderbook =
+                    serde_json::from_str(push_data(black_box(frame))).unwrap();
+                parse_orderbook_deltas(&book, &instrument, ts_init).unwrap()
+            })
+        });
+    }
+    group.finish();
+}
+
+criterion_group!(benches, bench_signing, bench_request, bench_rest_parse, bench_ws_parse);
+criterion_main!(benches);
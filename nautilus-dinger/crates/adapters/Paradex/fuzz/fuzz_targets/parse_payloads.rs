@@ -0,0 +1,47 @@
+//! Every Paradex REST and WebSocket parser must reject malformed input
+//! without panicking.
+//!
+//! The bench fixtures are the seed corpus; pass them after the working corpus
+//! so new inputs are not written into them:
+//! `cargo fuzz run parse_payloads corpus/parse_payloads ../benches/fixtures`
+#![no_main]
+
+use libfuzzer_sys::fuzz_target;
+use nautilus_core::UnixNanos;
+use paradex::common::json::{ParadexPage, from_body};
+use paradex::common::models::{ParadexFillResponse, ParadexOrderResponse};
+use paradex::http::parse::{parse_info_response, parse_orderbook_response, parse_trades_response};
+use paradex::websocket::messages::{
+    ParadexWsBbo, ParadexWsOrderbook, ParadexWsRpcMessage, ParadexWsTrade,
+};
+use paradex::websocket::parse::{
+    ParadexWsInstrument, parse_orderbook_deltas, parse_quote_tick, parse_trade_tick,
+};
+
+fuzz_target!(|data: &[u8]| {
+    let _ = from_body::<ParadexPage<ParadexOrderResponse>>(data);
+    let _ = from_body::<ParadexPage<ParadexFillResponse>>(data);
+
+    let Ok(raw) = std::str::from_utf8(data) else {
+        return;
+    };
+    let _ = parse_info_response(raw);
+    let _ = parse_orderbook_response(raw);
+    let _ = parse_trades_response(raw);
+
+    let Ok(ParadexWsRpcMessage { params: Some(push), .. }) = serde_json::from_str(raw) else {
+        return;
+    };
+    let payload = push.data.get();
+    let instrument = ParadexWsInstrument::new("BTC-USD-PERP", 1, 5);
+    let ts_init = UnixNanos::default();
+    if let Ok(trade) = serde_json::from_str::<ParadexWsTrade>(payload) {
+        let _ = parse_trade_tick(&trade, &instrument, ts_init);
+    }
+    if let Ok(bbo) = serde_json::from_str::<ParadexWsBbo>(payload) {
+        let _ = parse_quote_tick(&bbo, &instrument, ts_init);
+    }
+    if let Ok(book) = serde_json::from_str::<ParadexWsOrderbook>(payload) {
+        let _ = parse_orderbook_deltas(&book, &instrument, ts_init);
+    }
+});
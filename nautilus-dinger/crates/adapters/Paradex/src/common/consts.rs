@@ -1,11 +1,25 @@
 pub const VENUE_NAME: &str = "PARADEX";
 
+/// The nautilus_trader release the nautilus crates are pinned to (their `tag`
+/// in Cargo.toml). Market data reaches Python as capsules holding these raw
+/// structs, so Python must run the same release to decode them.
+pub const NAUTILUS_TRADER_VERSION: &str = "1.222.0";
+
 /// REST API version prefix
 pub const API_VERSION: &str = "v1";
 
 /// WebSocket heartbeat interval in seconds
 pub const WS_HEARTBEAT_INTERVAL_SECS: u64 = 30;
 
+/// Initial and maximum delay between WebSocket reconnect attempts
+pub const WS_RECONNECT_DELAY_INITIAL_MS: u64 = 250;
+pub const WS_RECONNECT_DELAY_MAX_MS: u64 = 10_000;
+
+/// Parsed market data items delivered to the callback per batch, and how long
+/// a partial batch may wait for more items
+pub const WS_BATCH_MAX_MESSAGES: usize = 256;
+pub const WS_BATCH_LINGER_MS: u64 = 2;
+
 /// Maximum WebSocket message size (10 MB)
 pub const WS_MAX_MESSAGE_SIZE: usize = 10 * 1024 * 1024;
 
@@ -17,3 +31,18 @@ pub const MAX_RETRIES: u32 = 3;
 
 /// Delay between retries in seconds
 pub const RETRY_DELAY_SECS: f64 = 1.0;
+
+/// How long rows fetched for an id lookup are reused, in seconds
+pub const LOOKUP_CACHE_TTL_SECS: u64 = 5;
+
+/// Maximum number of rows held by a lookup cache
+pub const LOOKUP_CACHE_MAX_ENTRIES: usize = 10_000;
+
+/// Page size used when scanning fills for an id
+pub const FILL_LOOKUP_PAGE_SIZE: u32 = 100;
+
+/// Maximum number of pages scanned for a single fill lookup
+pub const FILL_LOOKUP_MAX_PAGES: usize = 10;
+
+/// How far back a fill lookup searches, in seconds
+pub const FILL_LOOKUP_WINDOW_SECS: u64 = 3_600;
@@ -5,12 +5,19 @@ use serde_json::json;
 use std::collections::HashMap;
 use std::sync::Arc;
 use std::sync::Mutex;
+use std::time::Duration;
 
+use crate::common::consts::{
+    FILL_LOOKUP_MAX_PAGES, FILL_LOOKUP_PAGE_SIZE, FILL_LOOKUP_WINDOW_SECS,
+    LOOKUP_CACHE_MAX_ENTRIES, LOOKUP_CACHE_TTL_SECS,
+};
 use crate::common::credential::ParadexCredential;
+use crate::common::json::{from_body, ParadexPage};
 use crate::common::models::{
     ParadexActionResponse, ParadexFillResponse, ParadexFillsResponse, ParadexInfoResponse,
     ParadexOrderResponse, ParadexOrderbookResponse, ParadexOrdersResponse, ParadexTradesResponse,
 };
+use crate::http::lookup::{epoch_millis, find_paged, now_millis, TtlCache};
 use crate::http::signing::{
     sign_auth_message, sign_modify_order, sign_order, ModifyOrderParams, OrderParams,
 };
@@ -33,6 +40,7 @@ pub struct ParadexRawHttpClient {
 /// Domain HTTP client exposing Nautilus types.
 pub struct ParadexHttpClient {
     inner: Arc<ParadexRawHttpClient>,
+    fill_cache: TtlCache<String, ParadexFillResponse>,
 }
 
 impl ParadexHttpClient {
@@ -50,6 +58,10 @@ impl ParadexHttpClient {
                 credential,
                 auth_state: Mutex::new(None),
             }),
+            fill_cache: TtlCache::new(
+                Duration::from_secs(LOOKUP_CACHE_TTL_SECS),
+                LOOKUP_CACHE_MAX_ENTRIES,
+            ),
         }
     }
 
@@ -138,7 +150,7 @@ impl ParadexHttpClient {
                 .get(url, None, None, None, None)
                 .await
                 .map_err(|e| anyhow::anyhow!("{e}"))?;
-            let info: ParadexInfoResponse = serde_json::from_slice(&response.body)?;
+            let info: ParadexInfoResponse = from_body(&response.body)?;
             Ok(info)
         })
     }
@@ -192,30 +204,39 @@ impl ParadexHttpClient {
                 .get(url, None, None, None, None)
                 .await
                 .map_err(|e| anyhow::anyhow!("{e}"))?;
-            let orderbook: ParadexOrderbookResponse = serde_json::from_slice(&response.body)?;
+            let orderbook: ParadexOrderbookResponse = from_body(&response.body)?;
             Ok(orderbook)
         })
     }
 
-    /// Fetch recent trades.
+    /// Fetch public trades for a market, optionally bounded to a time range.
     /// GET /trades
     pub fn get_trades(
         &self,
-        market_id: u32,
-        limit: Option<u32>,
+        market: &str,
+        start_at_ms: Option<u64>,
+        end_at_ms: Option<u64>,
+        page_size: Option<u32>,
     ) -> anyhow::Result<ParadexTradesResponse> {
         let inner = self.inner.clone();
+        let market = market.to_string();
         get_runtime().block_on(async move {
-            let mut url = format!("{}/trades?market_id={}", inner.base_url, market_id);
-            if let Some(limit) = limit {
-                url.push_str(&format!("&limit={}", limit));
+            let mut url = format!("{}/trades?market={}", inner.base_url, market);
+            if let Some(start_at_ms) = start_at_ms {
+                url.push_str(&format!("&start_at={}", start_at_ms));
+            }
+            if let Some(end_at_ms) = end_at_ms {
+                url.push_str(&format!("&end_at={}", end_at_ms));
+            }
+            if let Some(page_size) = page_size {
+                url.push_str(&format!("&page_size={}", page_size));
             }
             let response = inner
                 .client
                 .get(url, None, None, None, None)
                 .await
                 .map_err(|e| anyhow::anyhow!("{e}"))?;
-            let trades: ParadexTradesResponse = serde_json::from_slice(&response.body)?;
+            let trades: ParadexTradesResponse = from_body(&response.body)?;
             Ok(trades)
         })
     }
@@ -496,7 +517,7 @@ impl ParadexHttpClient {
                 return Err(anyhow::anyhow!("API Error {:?}: {}", response.status, err_msg));
             }
 
-            let order: ParadexOrderResponse = serde_json::from_slice(&response.body)?;
+            let order: ParadexOrderResponse = from_body(&response.body)?;
             Ok(order)
         })
     }
@@ -575,7 +596,7 @@ impl ParadexHttpClient {
                 return Err(anyhow::anyhow!("API Error {:?}: {}", response.status, err_msg));
             }
 
-            let order: ParadexOrderResponse = serde_json::from_slice(&response.body)?;
+            let order: ParadexOrderResponse = from_body(&response.body)?;
             Ok(order)
         })
     }
@@ -603,7 +624,7 @@ impl ParadexHttpClient {
                 return Err(anyhow::anyhow!("API Error {:?}: {}", response.status, err_msg));
             }
 
-            let order: ParadexOrderResponse = serde_json::from_slice(&response.body)?;
+            let order: ParadexOrderResponse = from_body(&response.body)?;
             Ok(order)
         })
     }
@@ -636,18 +657,9 @@ impl ParadexHttpClient {
                 return Err(anyhow::anyhow!("API Error {:?}: {}", response.status, err_msg));
             }
 
-            let body: serde_json::Value = serde_json::from_slice(&response.body)?;
-            if body.get("results").is_some() {
-                let payload: ParadexOrdersResponse = serde_json::from_value(body)?;
-                return Ok(payload.results);
-            }
-
-            if body.is_array() {
-                let orders: Vec<ParadexOrderResponse> = serde_json::from_value(body)?;
-                return Ok(orders);
-            }
-
-            Err(anyhow::anyhow!("Unexpected open orders payload"))
+            let page: ParadexPage<ParadexOrderResponse> = from_body(&response.body)
+                .map_err(|e| anyhow::anyhow!("Unexpected open orders payload: {e}"))?;
+            Ok(page.rows)
         })
     }
 
@@ -700,7 +712,7 @@ impl ParadexHttpClient {
                 return Err(anyhow::anyhow!("API Error {:?}: {}", response.status, err_msg));
             }
 
-            let payload: ParadexOrdersResponse = serde_json::from_slice(&response.body)?;
+            let payload: ParadexOrdersResponse = from_body(&response.body)?;
             Ok(payload)
         })
     }
@@ -711,6 +723,18 @@ impl ParadexHttpClient {
         start_at_ms: Option<u64>,
         end_at_ms: Option<u64>,
         page_size: Option<u32>,
+    ) -> anyhow::Result<ParadexFillsResponse> {
+        self.get_fills_page(market, start_at_ms, end_at_ms, page_size, None)
+    }
+
+    /// One page of fills; `cursor` is the `next` value of the previous page.
+    pub fn get_fills_page(
+        &self,
+        market: Option<String>,
+        start_at_ms: Option<u64>,
+        end_at_ms: Option<u64>,
+        page_size: Option<u32>,
+        cursor: Option<String>,
     ) -> anyhow::Result<ParadexFillsResponse> {
         let inner = self.inner.clone();
         let jwt = self.authenticate()?;
@@ -729,6 +753,9 @@ impl ParadexHttpClient {
             if let Some(page_size) = page_size {
                 params.push(format!("page_size={}", page_size));
             }
+            if let Some(cursor) = cursor {
+                params.push(format!("cursor={}", cursor));
+            }
 
             let mut url = format!("{}/fills", inner.base_url);
             if !params.is_empty() {
@@ -750,14 +777,43 @@ impl ParadexHttpClient {
                 return Err(anyhow::anyhow!("API Error {:?}: {}", response.status, err_msg));
             }
 
-            let payload: ParadexFillsResponse = serde_json::from_slice(&response.body)?;
+            let payload: ParadexFillsResponse = from_body(&response.body)?;
             Ok(payload)
         })
     }
 
+    /// Find a fill by fill or trade id.
+    ///
+    /// The fills endpoint has no id filter, so recent pages are scanned newest
+    /// first and stop at the first match, at the first fill older than
+    /// `FILL_LOOKUP_WINDOW_SECS` or after `FILL_LOOKUP_MAX_PAGES` pages.
+    /// Every fill seen is cached briefly, so looking up the other fills of the
+    /// same reconciliation pass does not hit the venue again.
     pub fn get_fill_by_id(&self, fill_id: String) -> anyhow::Result<Option<ParadexFillResponse>> {
-        let fills = self.get_fills(None, None, None, Some(200))?;
-        Ok(fills.results.into_iter().find(|fill| fill.id.as_deref() == Some(fill_id.as_str())))
+        if let Some(fill) = self.fill_cache.get(&fill_id) {
+            return Ok(Some(fill));
+        }
+        let start_at_ms = now_millis().saturating_sub(FILL_LOOKUP_WINDOW_SECS * 1_000);
+        find_paged(
+            |cursor| {
+                let page = self.get_fills_page(
+                    None,
+                    Some(start_at_ms),
+                    None,
+                    Some(FILL_LOOKUP_PAGE_SIZE),
+                    cursor,
+                )?;
+                Ok((page.results, page.next))
+            },
+            FILL_LOOKUP_MAX_PAGES,
+            |fill: &ParadexFillResponse| {
+                if let Some(id) = &fill.id {
+                    self.fill_cache.insert(id.clone(), fill.clone());
+                }
+            },
+            |fill| fill.id.as_deref() == Some(fill_id.as_str()),
+            |fill| fill.created_at.is_some_and(|ts| epoch_millis(ts) < start_at_ms),
+        )
     }
 }
 
@@ -54,6 +54,19 @@ impl PyParadexHttpClient {
             .map_err(|e| pyo3::exceptions::PyRuntimeError::new_err(format!("{e}")))
     }
 
+    pub fn get_trades(
+        &self,
+        market: &str,
+        start_at_ms: Option<u64>,
+        end_at_ms: Option<u64>,
+        page_size: Option<u32>,
+    ) -> PyResult<String> {
+        self.client
+            .get_trades(market, start_at_ms, end_at_ms, page_size)
+            .map(|trades| serde_json::to_string(&trades).unwrap_or_default())
+            .map_err(|e| pyo3::exceptions::PyRuntimeError::new_err(format!("{e}")))
+    }
+
     pub fn get_account_state(&self) -> PyResult<String> {
         self.client
             .get_account_state()
@@ -161,6 +174,14 @@ impl PyParadexHttpClient {
             .map_err(|e| pyo3::exceptions::PyRuntimeError::new_err(format!("{e}")))
     }
 
+    /// Fill as JSON, or `None` if it is not among the recent fills scanned.
+    pub fn get_fill_by_id(&self, fill_id: String) -> PyResult<Option<String>> {
+        self.client
+            .get_fill_by_id(fill_id)
+            .map(|fill| fill.map(|fill| serde_json::to_string(&fill).unwrap_or_default()))
+            .map_err(|e| pyo3::exceptions::PyRuntimeError::new_err(format!("{e}")))
+    }
+
     pub fn get_orders_history(
         &self,
         market: Option<String>,
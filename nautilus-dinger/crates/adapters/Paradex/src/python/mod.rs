@@ -9,6 +9,10 @@ use pyo3::prelude::*;
 pub fn register_modules(parent_module: &Bound<'_, PyModule>) -> PyResult<()> {
     parent_module.add_function(wrap_pyfunction!(urls::get_rest_url, parent_module)?)?;
     parent_module.add_function(wrap_pyfunction!(urls::get_ws_url, parent_module)?)?;
+    parent_module.add(
+        "NAUTILUS_TRADER_VERSION",
+        crate::common::consts::NAUTILUS_TRADER_VERSION,
+    )?;
 
     bindings::register_bindings(parent_module)?;
     Ok(())
@@ -1,9 +1,22 @@
+use std::sync::Arc;
+
+use nautilus_model::data::Data;
+use nautilus_model::python::data::data_to_pycapsule;
 use pyo3::prelude::*;
+use pyo3::types::PyList;
+
+use crate::websocket::client::ParadexWebSocketClient;
+use crate::websocket::enums::ParadexWsChannel;
 
 /// Python bindings for the Paradex WebSocket client.
+///
+/// The data callback receives one list of Nautilus data capsules per batch
+/// (`TradeTick`, `QuoteTick`, `OrderBookDeltas`); decode them with
+/// `nautilus_trader.model.data.capsule_to_data`. The frame callback, when
+/// set, is called with `(ts_recv_ns, text)` for every raw frame.
 #[pyclass]
 pub struct PyParadexWebSocketClient {
-    url: String,
+    inner: ParadexWebSocketClient,
 }
 
 #[pymethods]
@@ -11,11 +24,79 @@ impl PyParadexWebSocketClient {
     #[new]
     pub fn new(url: Option<String>) -> Self {
         Self {
-            url: url.unwrap_or_else(|| "wss://ws.api.prod.paradex.trade/v1".to_string()),
+            inner: ParadexWebSocketClient::new(
+                url.unwrap_or_else(|| "wss://ws.api.prod.paradex.trade/v1".to_string()),
+            ),
         }
     }
 
     pub fn get_url(&self) -> &str {
-        &self.url
+        &self.inner.url
+    }
+
+    pub fn add_instrument(&self, market: &str, price_precision: u8, size_precision: u8) {
+        self.inner.add_instrument(market, price_precision, size_precision);
+    }
+
+    pub fn set_data_callback(&self, callback: Py<PyAny>) {
+        self.inner.set_callback(Arc::new(move |batch: Vec<Data>| {
+            Python::attach(|py| {
+                let capsules = batch.into_iter().map(|data| data_to_pycapsule(py, data));
+                let result = PyList::new(py, capsules).and_then(|list| callback.call1(py, (list,)));
+                if let Err(e) = result {
+                    e.print(py);
+                }
+            });
+        }));
+    }
+
+    pub fn set_frame_callback(&self, callback: Option<Py<PyAny>>) {
+        let Some(callback) = callback else {
+            self.inner.set_frame_callback(None);
+            return;
+        };
+        self.inner.set_frame_callback(Some(Arc::new(move |ts_recv: u64, text: &str| {
+            Python::attach(|py| {
+                if let Err(e) = callback.call1(py, (ts_recv, text)) {
+                    e.print(py);
+                }
+            });
+        })));
+    }
+
+    pub fn subscribe_trades(&mut self, market: &str) {
+        self.inner.subscribe(ParadexWsChannel::Trades, market);
+    }
+
+    pub fn subscribe_orderbook(&mut self, market: &str) {
+        self.inner.subscribe(ParadexWsChannel::Orderbook, market);
+    }
+
+    pub fn subscribe_bbo(&mut self, market: &str) {
+        self.inner.subscribe(ParadexWsChannel::Bbo, market);
+    }
+
+    pub fn unsubscribe_trades(&mut self, market: &str) {
+        self.inner.unsubscribe(ParadexWsChannel::Trades, market);
+    }
+
+    pub fn unsubscribe_orderbook(&mut self, market: &str) {
+        self.inner.unsubscribe(ParadexWsChannel::Orderbook, market);
+    }
+
+    pub fn unsubscribe_bbo(&mut self, market: &str) {
+        self.inner.unsubscribe(ParadexWsChannel::Bbo, market);
+    }
+
+    pub fn is_running(&self) -> bool {
+        self.inner.is_running()
+    }
+
+    pub fn status(&self) -> String {
+        self.inner.status().to_json().to_string()
+    }
+
+    pub fn close(&mut self) {
+        self.inner.close();
     }
 }
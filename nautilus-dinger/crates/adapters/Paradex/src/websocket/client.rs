@@ -1,18 +1,111 @@
+use std::collections::{BTreeSet, HashMap};
+use std::sync::atomic::{AtomicBool, AtomicU64, Ordering};
+use std::sync::{Arc, Mutex, RwLock};
+use std::time::Duration;
+
+use futures::{SinkExt, StreamExt};
+use nautilus_common::live::get_runtime;
+use nautilus_core::time::get_atomic_clock_realtime;
+use nautilus_model::data::{Data, OrderBookDeltas_API};
+use serde::Deserialize;
+use serde_json::value::RawValue;
+use tokio::sync::mpsc;
+use tokio::time::{Instant, sleep, sleep_until};
+use tokio_tungstenite::connect_async;
+use tokio_tungstenite::tungstenite::Message;
+
+use crate::common::consts::{
+    WS_BATCH_LINGER_MS, WS_BATCH_MAX_MESSAGES, WS_HEARTBEAT_INTERVAL_SECS,
+    WS_RECONNECT_DELAY_INITIAL_MS, WS_RECONNECT_DELAY_MAX_MS,
+};
+use crate::websocket::enums::ParadexWsChannel;
+use crate::websocket::messages::{
+    ParadexWsBbo, ParadexWsOrderbook, ParadexWsRequest, ParadexWsRpcMessage, ParadexWsTrade,
+};
+use crate::websocket::parse::{
+    ParadexBookSequence, ParadexBookSequencer, ParadexWsInstrument, parse_orderbook_deltas,
+    parse_quote_tick, parse_trade_tick,
+};
+
+/// Receives each batch of parsed market data, in arrival order.
+pub type ParadexDataBatchCallback = Arc<dyn Fn(Vec<Data>) + Send + Sync>;
+
+/// Receives every raw text frame with its receive time (UNIX nanoseconds), before parsing.
+pub type ParadexFrameCallback = Arc<dyn Fn(u64, &str) + Send + Sync>;
+
+enum Command {
+    Subscribe(String),
+    Unsubscribe(String),
+    Shutdown,
+}
+
+/// Connection state shared with the background task.
+#[derive(Default)]
+pub struct ParadexWsStatus {
+    pub connected: AtomicBool,
+    pub connects: AtomicU64,
+    pub messages: AtomicU64,
+    pub batches: AtomicU64,
+    pub parse_errors: AtomicU64,
+    pub book_resyncs: AtomicU64,
+    pub last_error: Mutex<Option<String>>,
+}
+
+impl ParadexWsStatus {
+    fn set_error(&self, error: impl ToString) {
+        *self.last_error.lock().unwrap() = Some(error.to_string());
+    }
+
+    pub fn to_json(&self) -> serde_json::Value {
+        serde_json::json!({
+            "connected": self.connected.load(Ordering::Relaxed),
+            "connects": self.connects.load(Ordering::Relaxed),
+            "messages": self.messages.load(Ordering::Relaxed),
+            "batches": self.batches.load(Ordering::Relaxed),
+            "parse_errors": self.parse_errors.load(Ordering::Relaxed),
+            "book_resyncs": self.book_resyncs.load(Ordering::Relaxed),
+            "last_error": self.last_error.lock().unwrap().clone(),
+        })
+    }
+}
+
 /// WebSocket client for Paradex real-time data feeds.
 ///
 /// Connects to `wss://ws.api.prod.paradex.trade/v1` for both public and private channels.
-/// Public channels: orderbook, trades
+/// Public channels: orderbook, trades, bbo
 /// Private channels: user_updates (requires authentication)
+///
+/// Public market data runs on the shared Nautilus runtime: payloads are
+/// parsed into `TradeTick`, `QuoteTick` and `OrderBookDeltas` on the socket
+/// task and handed to the callback in batches of up to
+/// `WS_BATCH_MAX_MESSAGES`, flushed after `WS_BATCH_LINGER_MS`. Every
+/// subscription is replayed after a reconnect (exponential backoff), and an
+/// orderbook that misses a delta is resubscribed to get a fresh snapshot.
+/// Markets must be registered with `add_instrument` before their data is
+/// emitted. A frame callback, when set, sees each raw frame as received
+/// (e.g. to record a tape).
 pub struct ParadexWebSocketClient {
     pub url: String,
     pub heartbeat_interval_secs: u64,
+    subscriptions: Arc<Mutex<BTreeSet<String>>>,
+    instruments: Arc<RwLock<HashMap<String, ParadexWsInstrument>>>,
+    callback: Arc<Mutex<Option<ParadexDataBatchCallback>>>,
+    frame_callback: Arc<Mutex<Option<ParadexFrameCallback>>>,
+    status: Arc<ParadexWsStatus>,
+    commands: Option<mpsc::UnboundedSender<Command>>,
 }
 
 impl ParadexWebSocketClient {
     pub fn new(url: String) -> Self {
         Self {
             url,
-            heartbeat_interval_secs: 30,
+            heartbeat_interval_secs: WS_HEARTBEAT_INTERVAL_SECS,
+            subscriptions: Arc::new(Mutex::new(BTreeSet::new())),
+            instruments: Arc::new(RwLock::new(HashMap::new())),
+            callback: Arc::new(Mutex::new(None)),
+            frame_callback: Arc::new(Mutex::new(None)),
+            status: Arc::new(ParadexWsStatus::default()),
+            commands: None,
         }
     }
 
@@ -23,4 +116,340 @@ impl ParadexWebSocketClient {
     pub fn new_private() -> Self {
         Self::new("wss://ws.api.prod.paradex.trade/v1".to_string())
     }
+
+    pub fn status(&self) -> Arc<ParadexWsStatus> {
+        self.status.clone()
+    }
+
+    pub fn is_running(&self) -> bool {
+        self.commands.as_ref().is_some_and(|tx| !tx.is_closed())
+    }
+
+    pub fn set_callback(&self, callback: ParadexDataBatchCallback) {
+        *self.callback.lock().unwrap() = Some(callback);
+    }
+
+    pub fn set_frame_callback(&self, callback: Option<ParadexFrameCallback>) {
+        *self.frame_callback.lock().unwrap() = callback;
+    }
+
+    /// Register (or update) the precisions used to parse a market's payloads.
+    pub fn add_instrument(&self, market: &str, price_precision: u8, size_precision: u8) {
+        let instrument = ParadexWsInstrument::new(market, price_precision, size_precision);
+        self.instruments.write().unwrap().insert(market.to_string(), instrument);
+    }
+
+    /// Subscribe to a public channel for a market, starting the stream if needed.
+    pub fn subscribe(&mut self, channel: ParadexWsChannel, market: &str) {
+        let name = channel.subscription(market);
+        let added = self.subscriptions.lock().unwrap().insert(name.clone());
+        // A stopped stream is restarted even for a known channel: it subscribes on connect
+        if !self.is_running() {
+            self.start();
+        } else if added {
+            if let Some(tx) = &self.commands {
+                let _ = tx.send(Command::Subscribe(name));
+            }
+        }
+    }
+
+    pub fn unsubscribe(&mut self, channel: ParadexWsChannel, market: &str) {
+        let name = channel.subscription(market);
+        if !self.subscriptions.lock().unwrap().remove(&name) {
+            return;
+        }
+        if let Some(tx) = &self.commands {
+            let _ = tx.send(Command::Unsubscribe(name));
+        }
+    }
+
+    fn start(&mut self) {
+        let (tx, rx) = mpsc::unbounded_channel();
+        self.commands = Some(tx);
+        let task = MarketDataTask {
+            url: self.url.clone(),
+            heartbeat_interval: Duration::from_secs(self.heartbeat_interval_secs.max(1)),
+            subscriptions: self.subscriptions.clone(),
+            instruments: self.instruments.clone(),
+            callback: self.callback.clone(),
+            frame_callback: self.frame_callback.clone(),
+            status: self.status.clone(),
+            batch: Vec::with_capacity(WS_BATCH_MAX_MESSAGES),
+            sequencer: ParadexBookSequencer::default(),
+            next_request_id: 0,
+        };
+        get_runtime().spawn(task.run(rx));
+    }
+
+    /// Stop the stream and forget its subscriptions.
+    pub fn close(&mut self) {
+        if let Some(tx) = self.commands.take() {
+            let _ = tx.send(Command::Shutdown);
+        }
+        self.subscriptions.lock().unwrap().clear();
+    }
+}
+
+impl Drop for ParadexWebSocketClient {
+    fn drop(&mut self) {
+        self.close();
+    }
+}
+
+fn decode<'a, T: Deserialize<'a>>(data: &'a RawValue) -> anyhow::Result<T> {
+    Ok(serde_json::from_str(data.get())?)
+}
+
+struct MarketDataTask {
+    url: String,
+    heartbeat_interval: Duration,
+    subscriptions: Arc<Mutex<BTreeSet<String>>>,
+    instruments: Arc<RwLock<HashMap<String, ParadexWsInstrument>>>,
+    callback: Arc<Mutex<Option<ParadexDataBatchCallback>>>,
+    frame_callback: Arc<Mutex<Option<ParadexFrameCallback>>>,
+    status: Arc<ParadexWsStatus>,
+    batch: Vec<Data>,
+    sequencer: ParadexBookSequencer,
+    next_request_id: u64,
+}
+
+enum SessionEnd {
+    Reconnect,
+    Shutdown,
+}
+
+impl MarketDataTask {
+    async fn run(mut self, mut commands: mpsc::UnboundedReceiver<Command>) {
+        let mut backoff = Duration::from_millis(WS_RECONNECT_DELAY_INITIAL_MS);
+        loop {
+            match self.session(&mut commands).await {
+                Ok(SessionEnd::Shutdown) => break,
+                Ok(SessionEnd::Reconnect) => {
+                    backoff = Duration::from_millis(WS_RECONNECT_DELAY_INITIAL_MS);
+                }
+                Err(e) => self.status.set_error(e),
+            }
+            self.status.connected.store(false, Ordering::Relaxed);
+            self.flush();
+
+            tokio::select! {
+                _ = sleep(backoff) => {}
+                command = commands.recv() => {
+                    if matches!(command, None | Some(Command::Shutdown)) {
+                        break;
+                    }
+                }
+            }
+            backoff = (backoff * 2).min(Duration::from_millis(WS_RECONNECT_DELAY_MAX_MS));
+        }
+        self.status.connected.store(false, Ordering::Relaxed);
+        self.flush();
+    }
+
+    fn request(&mut self, subscribe: bool, channel: &str) -> anyhow::Result<Message> {
+        self.next_request_id += 1;
+        let request = if subscribe {
+            ParadexWsRequest::subscribe(channel, self.next_request_id)
+        } else {
+            ParadexWsRequest::unsubscribe(channel, self.next_request_id)
+        };
+        Ok(Message::Text(serde_json::to_string(&request)?.into()))
+    }
+
+    async fn session(
+        &mut self,
+        commands: &mut mpsc::UnboundedReceiver<Command>,
+    ) -> anyhow::Result<SessionEnd> {
+        let (ws, _) = connect_async(self.url.as_str()).await?;
+        let (mut sink, mut stream) = ws.split();
+        // Every book restarts from the snapshot sent on subscribe
+        self.sequencer.reset();
+        let channels: Vec<String> = self.subscriptions.lock().unwrap().iter().cloned().collect();
+        for channel in &channels {
+            sink.send(self.request(true, channel)?).await?;
+        }
+        self.status.connected.store(true, Ordering::Relaxed);
+        self.status.connects.fetch_add(1, Ordering::Relaxed);
+
+        let linger = Duration::from_millis(WS_BATCH_LINGER_MS);
+        let mut heartbeat = tokio::time::interval(self.heartbeat_interval);
+        heartbeat.tick().await;
+        let mut last_received = Instant::now();
+        let mut flush_at: Option<Instant> = None;
+
+        loop {
+            tokio::select! {
+                message = stream.next() => {
+                    last_received = Instant::now();
+                    match message {
+                        Some(Ok(Message::Text(text))) => {
+                            self.status.messages.fetch_add(1, Ordering::Relaxed);
+                            let frame_callback = self.frame_callback.lock().unwrap().clone();
+                            if let Some(frame_callback) = frame_callback {
+                                let ts_recv = get_atomic_clock_realtime().get_time_ns();
+                                frame_callback(ts_recv.as_u64(), text.as_str());
+                            }
+                            if let Some(channel) = self.handle_text(text.as_str()) {
+                                // Drop the stale book and ask for a new snapshot
+                                sink.send(self.request(false, &channel)?).await?;
+                                sink.send(self.request(true, &channel)?).await?;
+                            }
+                            if self.batch.len() >= WS_BATCH_MAX_MESSAGES {
+                                self.flush();
+                                flush_at = None;
+                            } else if flush_at.is_none() && !self.batch.is_empty() {
+                                flush_at = Some(last_received + linger);
+                            }
+                        }
+                        Some(Ok(Message::Ping(payload))) => sink.send(Message::Pong(payload)).await?,
+                        Some(Ok(Message::Close(_))) | None => return Ok(SessionEnd::Reconnect),
+                        Some(Ok(_)) => {}
+                        Some(Err(e)) => return Err(e.into()),
+                    }
+                }
+                _ = sleep_until(flush_at.unwrap_or_else(Instant::now)), if flush_at.is_some() => {
+                    self.flush();
+                    flush_at = None;
+                }
+                _ = heartbeat.tick() => {
+                    if last_received.elapsed() > self.heartbeat_interval * 2 {
+                        return Err(anyhow::anyhow!("Market data stream heartbeat timed out"));
+                    }
+                    sink.send(Message::Ping(Vec::new().into())).await?;
+                }
+                command = commands.recv() => match command {
+                    Some(Command::Subscribe(channel)) => {
+                        sink.send(self.request(true, &channel)?).await?;
+                    }
+                    Some(Command::Unsubscribe(channel)) => {
+                        sink.send(self.request(false, &channel)?).await?;
+                    }
+                    Some(Command::Shutdown) | None => {
+                        let _ = sink.send(Message::Close(None)).await;
+                        return Ok(SessionEnd::Shutdown);
+                    }
+                },
+            }
+        }
+    }
+
+    /// Parse one frame into the pending batch.
+    ///
+    /// Returns the channel to resubscribe when an orderbook update was missed.
+    fn handle_text(&mut self, text: &str) -> Option<String> {
+        let message: ParadexWsRpcMessage = match serde_json::from_str(text) {
+            Ok(message) => message,
+            Err(e) => {
+                self.status.parse_errors.fetch_add(1, Ordering::Relaxed);
+                self.status.set_error(e);
+                return None;
+            }
+        };
+        if let Some(error) = message.error {
+            self.status.set_error(format!(
+                "Request {:?} failed: {} (code {})",
+                message.id, error.message, error.code
+            ));
+            return None;
+        }
+        let push = match message.params {
+            Some(push) if message.method.as_deref() == Some("subscription") => push,
+            _ => return None,
+        };
+        let (channel, market) = ParadexWsChannel::from_subscription(&push.channel)?;
+        let instrument = *self.instruments.read().unwrap().get(market)?;
+        let ts_init = get_atomic_clock_realtime().get_time_ns();
+
+        let parsed = match channel {
+            ParadexWsChannel::Trades => decode::<ParadexWsTrade>(push.data)
+                .and_then(|trade| parse_trade_tick(&trade, &instrument, ts_init))
+                .map(|tick| Some(Data::Trade(tick))),
+            ParadexWsChannel::Bbo => decode::<ParadexWsBbo>(push.data)
+                .and_then(|bbo| parse_quote_tick(&bbo, &instrument, ts_init))
+                .map(|quote| Some(Data::Quote(quote))),
+            ParadexWsChannel::Orderbook => match decode::<ParadexWsOrderbook>(push.data) {
+                Ok(book) => match self.sequencer.check(&book) {
+                    ParadexBookSequence::Apply => {
+                        parse_orderbook_deltas(&book, &instrument, ts_init)
+                            .map(|deltas| deltas.map(|d| Data::Deltas(OrderBookDeltas_API::new(d))))
+                    }
+                    ParadexBookSequence::Skip => Ok(None),
+                    ParadexBookSequence::Gap => {
+                        self.status.book_resyncs.fetch_add(1, Ordering::Relaxed);
+                        return Some(push.channel.into_owned());
+                    }
+                },
+                Err(e) => Err(e),
+            },
+            ParadexWsChannel::UserUpdates => Ok(None),
+        };
+
+        match parsed {
+            Ok(Some(data)) => self.batch.push(data),
+            Ok(None) => {}
+            Err(e) => {
+                self.status.parse_errors.fetch_add(1, Ordering::Relaxed);
+                self.status.set_error(format!("{}: {e}", push.channel));
+            }
+        }
+        None
+    }
+
+    fn flush(&mut self) {
+        if self.batch.is_empty() {
+            return;
+        }
+        let batch = std::mem::replace(&mut self.batch, Vec::with_capacity(WS_BATCH_MAX_MESSAGES));
+        let callback = self.callback.lock().unwrap().clone();
+        if let Some(callback) = callback {
+            self.status.batches.fetch_add(1, Ordering::Relaxed);
+            callback(batch);
+        }
+    }
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    #[test]
+    fn test_subscribe_request_is_json_rpc() {
+        let request =
+            serde_json::to_value(ParadexWsRequest::subscribe("bbo.BTC-USD-PERP", 3)).unwrap();
+        assert_eq!(request["jsonrpc"], "2.0");
+        assert_eq!(request["method"], "subscribe");
+        assert_eq!(request["params"]["channel"], "bbo.BTC-USD-PERP");
+        assert_eq!(request["id"], 3);
+    }
+
+    #[test]
+    fn test_close_forgets_subscriptions() {
+        let mut client = ParadexWebSocketClient::new_public();
+        client.subscriptions.lock().unwrap().insert("bbo.ETH-USD-PERP".to_string());
+        client.close();
+        assert!(client.subscriptions.lock().unwrap().is_empty());
+        assert!(!client.is_running());
+    }
+
+    #[test]
+    fn test_channel_names_round_trip() {
+        let name = ParadexWsChannel::Orderbook.subscription("ETH-USD-PERP");
+        assert_eq!(name, "order_book.ETH-USD-PERP.deltas");
+        assert_eq!(
+            ParadexWsChannel::from_subscription(&name),
+            Some((ParadexWsChannel::Orderbook, "ETH-USD-PERP"))
+        );
+        assert_eq!(ParadexWsChannel::from_subscription("markets_summary"), None);
+    }
+
+    #[test]
+    fn test_push_payload_is_borrowed_raw() {
+        let raw = r#"{"jsonrpc":"2.0","method":"subscription",
+            "params":{"channel":"trades.ETH-USD-PERP","data":{"id":"1","market":"ETH-USD-PERP",
+            "side":"BUY","size":"1","price":"2","created_at":5}}}"#;
+        let message: ParadexWsRpcMessage = serde_json::from_str(raw).unwrap();
+        let push = message.params.unwrap();
+        let trade: ParadexWsTrade = decode(push.data).unwrap();
+        assert_eq!((trade.side.as_ref(), trade.created_at), ("BUY", 5));
+    }
 }
@@ -4,6 +4,7 @@ use serde::{Deserialize, Serialize};
 pub enum ParadexWsChannel {
     Orderbook,
     Trades,
+    Bbo,
     UserUpdates,
 }
 
@@ -12,9 +13,37 @@ impl ParadexWsChannel {
         match self {
             Self::Orderbook => "orderbook",
             Self::Trades => "trades",
+            Self::Bbo => "bbo",
             Self::UserUpdates => "user_updates",
         }
     }
+
+    /// Venue channel name for a market, e.g. `trades.BTC-USD-PERP`.
+    ///
+    /// The orderbook channel streams a snapshot on subscribe followed by
+    /// sequenced deltas.
+    pub fn subscription(&self, market: &str) -> String {
+        match self {
+            Self::Orderbook => format!("order_book.{market}.deltas"),
+            Self::Trades => format!("trades.{market}"),
+            Self::Bbo => format!("bbo.{market}"),
+            Self::UserUpdates => "user_updates".to_string(),
+        }
+    }
+
+    /// Split a venue channel name back into the channel and its market.
+    pub fn from_subscription(name: &str) -> Option<(Self, &str)> {
+        let (prefix, rest) = name.split_once('.').unwrap_or((name, ""));
+        let channel = match prefix {
+            "order_book" => Self::Orderbook,
+            "trades" => Self::Trades,
+            "bbo" => Self::Bbo,
+            "user_updates" => Self::UserUpdates,
+            _ => return None,
+        };
+        let market = rest.split('.').next().unwrap_or_default();
+        Some((channel, market))
+    }
 }
 
 #[derive(Debug, Clone, Copy, PartialEq, Eq, Serialize, Deserialize)]
@@ -1,4 +1,7 @@
+use std::borrow::Cow;
+
 use serde::{Deserialize, Serialize};
+use serde_json::value::RawValue;
 
 /// Outbound WebSocket subscription message.
 #[derive(Debug, Clone, Serialize, Deserialize)]
@@ -44,8 +47,141 @@ pub struct ParadexWsPing {
 
 impl Default for ParadexWsPing {
     fn default() -> Self {
+        Self { op: "ping".to_string() }
+    }
+}
+
+/// Outbound JSON-RPC request (`subscribe` / `unsubscribe`).
+#[derive(Debug, Clone, Serialize)]
+pub struct ParadexWsRequest<'a> {
+    pub jsonrpc: &'static str,
+    pub method: &'static str,
+    pub params: ParadexWsChannelParams<'a>,
+    pub id: u64,
+}
+
+#[derive(Debug, Clone, Serialize)]
+pub struct ParadexWsChannelParams<'a> {
+    pub channel: &'a str,
+}
+
+impl<'a> ParadexWsRequest<'a> {
+    pub fn subscribe(channel: &'a str, id: u64) -> Self {
+        Self { jsonrpc: "2.0", method: "subscribe", params: ParadexWsChannelParams { channel }, id }
+    }
+
+    pub fn unsubscribe(channel: &'a str, id: u64) -> Self {
         Self {
-            op: "ping".to_string(),
+            jsonrpc: "2.0",
+            method: "unsubscribe",
+            params: ParadexWsChannelParams { channel },
+            id,
         }
     }
 }
+
+/// Inbound JSON-RPC frame: a subscription push, or the reply to a request.
+///
+/// The channel payload is kept as raw JSON so it can be deserialized straight
+/// into the model for its channel.
+#[derive(Debug, Deserialize)]
+pub struct ParadexWsRpcMessage<'a> {
+    #[serde(default, borrow)]
+    pub method: Option<Cow<'a, str>>,
+    #[serde(default, borrow)]
+    pub params: Option<ParadexWsPush<'a>>,
+    #[serde(default)]
+    pub id: Option<u64>,
+    #[serde(default)]
+    pub error: Option<ParadexWsRpcError>,
+}
+
+#[derive(Debug, Deserialize)]
+pub struct ParadexWsPush<'a> {
+    #[serde(borrow)]
+    pub channel: Cow<'a, str>,
+    #[serde(borrow)]
+    pub data: &'a RawValue,
+}
+
+#[derive(Debug, Clone, Deserialize)]
+pub struct ParadexWsRpcError {
+    #[serde(default)]
+    pub code: i64,
+    #[serde(default)]
+    pub message: String,
+}
+
+/// `trades.<market>` payload.
+#[derive(Debug, Deserialize)]
+pub struct ParadexWsTrade<'a> {
+    #[serde(borrow)]
+    pub id: Cow<'a, str>,
+    #[serde(borrow)]
+    pub market: Cow<'a, str>,
+    #[serde(borrow)]
+    pub side: Cow<'a, str>,
+    #[serde(borrow)]
+    pub price: Cow<'a, str>,
+    #[serde(borrow)]
+    pub size: Cow<'a, str>,
+    /// Milliseconds since the epoch
+    pub created_at: u64,
+}
+
+/// `bbo.<market>` payload.
+#[derive(Debug, Deserialize)]
+pub struct ParadexWsBbo<'a> {
+    #[serde(borrow)]
+    pub market: Cow<'a, str>,
+    #[serde(borrow)]
+    pub bid: Cow<'a, str>,
+    #[serde(borrow)]
+    pub bid_size: Cow<'a, str>,
+    #[serde(borrow)]
+    pub ask: Cow<'a, str>,
+    #[serde(borrow)]
+    pub ask_size: Cow<'a, str>,
+    /// Milliseconds since the epoch
+    pub last_updated_at: u64,
+}
+
+/// One price level change in an orderbook update.
+#[derive(Debug, Deserialize)]
+pub struct ParadexWsBookLevel<'a> {
+    #[serde(borrow)]
+    pub side: Cow<'a, str>,
+    #[serde(borrow)]
+    pub price: Cow<'a, str>,
+    #[serde(borrow)]
+    pub size: Cow<'a, str>,
+}
+
+/// `order_book.<market>.deltas` payload.
+///
+/// `update_type` is `s` for a full snapshot (levels arrive as inserts) and
+/// `d` for a delta against the previous `seq_no`.
+#[derive(Debug, Deserialize)]
+pub struct ParadexWsOrderbook<'a> {
+    #[serde(borrow)]
+    pub market: Cow<'a, str>,
+    #[serde(default)]
+    pub seq_no: u64,
+    /// Milliseconds since the epoch
+    #[serde(default)]
+    pub last_updated_at: u64,
+    #[serde(borrow)]
+    pub update_type: Cow<'a, str>,
+    #[serde(default, borrow)]
+    pub inserts: Vec<ParadexWsBookLevel<'a>>,
+    #[serde(default, borrow)]
+    pub updates: Vec<ParadexWsBookLevel<'a>>,
+    #[serde(default, borrow)]
+    pub deletes: Vec<ParadexWsBookLevel<'a>>,
+}
+
+impl ParadexWsOrderbook<'_> {
+    pub fn is_snapshot(&self) -> bool {
+        self.update_type == "s"
+    }
+}
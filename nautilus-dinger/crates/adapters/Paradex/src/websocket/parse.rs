@@ -1,4 +1,15 @@
-use crate::websocket::messages::ParadexWsMessage;
+use std::collections::HashMap;
+
+use nautilus_core::UnixNanos;
+use nautilus_model::data::{BookOrder, OrderBookDelta, OrderBookDeltas, QuoteTick, TradeTick};
+use nautilus_model::enums::{AggressorSide, BookAction, OrderSide, RecordFlag};
+use nautilus_model::identifiers::{InstrumentId, Symbol, TradeId, Venue};
+use nautilus_model::types::{Price, Quantity};
+
+use crate::common::consts::VENUE_NAME;
+use crate::websocket::messages::{
+    ParadexWsBbo, ParadexWsMessage, ParadexWsOrderbook, ParadexWsTrade,
+};
 
 /// Parse a raw WebSocket JSON payload into a typed message.
 pub fn parse_ws_message(raw: &str) -> Result<ParadexWsMessage, serde_json::Error> {
@@ -9,3 +20,238 @@ pub fn parse_ws_message(raw: &str) -> Result<ParadexWsMessage, serde_json::Error
 pub fn extract_channel(msg: &ParadexWsMessage) -> Option<&str> {
     msg.channel.as_deref()
 }
+
+/// Identity and precisions needed to turn a market's payloads into Nautilus data.
+#[derive(Debug, Clone, Copy, PartialEq, Eq)]
+pub struct ParadexWsInstrument {
+    pub instrument_id: InstrumentId,
+    pub price_precision: u8,
+    pub size_precision: u8,
+}
+
+impl ParadexWsInstrument {
+    pub fn new(market: &str, price_precision: u8, size_precision: u8) -> Self {
+        Self {
+            instrument_id: InstrumentId::new(Symbol::new(market), Venue::new(VENUE_NAME)),
+            price_precision,
+            size_precision,
+        }
+    }
+}
+
+fn millis_to_nanos(millis: u64) -> UnixNanos {
+    UnixNanos::from(millis.saturating_mul(1_000_000))
+}
+
+fn parse_price(value: &str, precision: u8) -> anyhow::Result<Price> {
+    Price::new_checked(value.parse::<f64>()?, precision)
+}
+
+fn parse_quantity(value: &str, precision: u8) -> anyhow::Result<Quantity> {
+    Quantity::new_checked(value.parse::<f64>()?, precision)
+}
+
+fn parse_order_side(side: &str) -> anyhow::Result<OrderSide> {
+    match side {
+        "BUY" => Ok(OrderSide::Buy),
+        "SELL" => Ok(OrderSide::Sell),
+        other => anyhow::bail!("Unknown book side: {other}"),
+    }
+}
+
+/// Convert a `trades.<market>` payload into a `TradeTick`.
+pub fn parse_trade_tick(
+    trade: &ParadexWsTrade,
+    instrument: &ParadexWsInstrument,
+    ts_init: UnixNanos,
+) -> anyhow::Result<TradeTick> {
+    let aggressor_side = match trade.side.as_ref() {
+        "BUY" => AggressorSide::Buyer,
+        "SELL" => AggressorSide::Seller,
+        _ => AggressorSide::NoAggressor,
+    };
+    Ok(TradeTick::new(
+        instrument.instrument_id,
+        parse_price(&trade.price, instrument.price_precision)?,
+        parse_quantity(&trade.size, instrument.size_precision)?,
+        aggressor_side,
+        TradeId::new_checked(trade.id.as_ref())?,
+        millis_to_nanos(trade.created_at),
+        ts_init,
+    ))
+}
+
+/// Convert a `bbo.<market>` payload into a `QuoteTick`.
+pub fn parse_quote_tick(
+    bbo: &ParadexWsBbo,
+    instrument: &ParadexWsInstrument,
+    ts_init: UnixNanos,
+) -> anyhow::Result<QuoteTick> {
+    Ok(QuoteTick::new(
+        instrument.instrument_id,
+        parse_price(&bbo.bid, instrument.price_precision)?,
+        parse_price(&bbo.ask, instrument.price_precision)?,
+        parse_quantity(&bbo.bid_size, instrument.size_precision)?,
+        parse_quantity(&bbo.ask_size, instrument.size_precision)?,
+        millis_to_nanos(bbo.last_updated_at),
+        ts_init,
+    ))
+}
+
+/// Convert an `order_book.<market>.deltas` payload into `OrderBookDeltas`.
+///
+/// A snapshot starts with a clear so the consumer rebuilds the book from the
+/// inserted levels. Returns `None` for an update that changes nothing.
+pub fn parse_orderbook_deltas(
+    book: &ParadexWsOrderbook,
+    instrument: &ParadexWsInstrument,
+    ts_init: UnixNanos,
+) -> anyhow::Result<Option<OrderBookDeltas>> {
+    let instrument_id = instrument.instrument_id;
+    let ts_event = millis_to_nanos(book.last_updated_at);
+    let sequence = book.seq_no;
+    let snapshot = book.is_snapshot();
+
+    let count = book.inserts.len() + book.updates.len() + book.deletes.len();
+    let mut deltas = Vec::with_capacity(count + usize::from(snapshot));
+    if snapshot {
+        deltas.push(OrderBookDelta::clear(instrument_id, sequence, ts_event, ts_init));
+    }
+    let flags = if snapshot { RecordFlag::F_SNAPSHOT as u8 } else { 0 };
+
+    for (action, levels) in [
+        (BookAction::Add, &book.inserts),
+        (BookAction::Update, &book.updates),
+        (BookAction::Delete, &book.deletes),
+    ] {
+        for level in levels {
+            let size = if action == BookAction::Delete {
+                Quantity::zero(instrument.size_precision)
+            } else {
+                parse_quantity(&level.size, instrument.size_precision)?
+            };
+            let order = BookOrder::new(
+                parse_order_side(&level.side)?,
+                parse_price(&level.price, instrument.price_precision)?,
+                size,
+                0,
+            );
+            deltas.push(OrderBookDelta::new(
+                instrument_id,
+                action,
+                order,
+                flags,
+                sequence,
+                ts_event,
+                ts_init,
+            ));
+        }
+    }
+
+    let Some(last) = deltas.last_mut() else {
+        return Ok(None);
+    };
+    last.flags |= RecordFlag::F_LAST as u8;
+    Ok(Some(OrderBookDeltas::new(instrument_id, deltas)))
+}
+
+/// What to do with an orderbook update given the sequence seen so far.
+#[derive(Debug, Clone, Copy, PartialEq, Eq)]
+pub enum ParadexBookSequence {
+    /// Contiguous with the previous update (or a snapshot): apply it
+    Apply,
+    /// Waiting for a snapshot after a gap: drop it
+    Skip,
+    /// An update was missed: the market needs a fresh snapshot
+    Gap,
+}
+
+/// Tracks orderbook `seq_no` per market so a missed delta is never applied on
+/// top of a stale book.
+#[derive(Debug, Default)]
+pub struct ParadexBookSequencer {
+    last: HashMap<String, Option<u64>>,
+}
+
+impl ParadexBookSequencer {
+    pub fn check(&mut self, book: &ParadexWsOrderbook) -> ParadexBookSequence {
+        if book.is_snapshot() {
+            self.last.insert(book.market.to_string(), Some(book.seq_no));
+            return ParadexBookSequence::Apply;
+        }
+        // Unsequenced updates cannot be checked
+        if book.seq_no == 0 {
+            return ParadexBookSequence::Apply;
+        }
+        match self.last.get_mut(book.market.as_ref()) {
+            Some(Some(last)) if book.seq_no == *last + 1 => {
+                *last = book.seq_no;
+                ParadexBookSequence::Apply
+            }
+            Some(state @ Some(_)) => {
+                *state = None;
+                ParadexBookSequence::Gap
+            }
+            _ => ParadexBookSequence::Skip,
+        }
+    }
+
+    /// Forget all sequences, e.g. after a reconnect (every book restarts with a snapshot).
+    pub fn reset(&mut self) {
+        self.last.clear();
+    }
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    fn instrument() -> ParadexWsInstrument {
+        ParadexWsInstrument::new("ETH-USD-PERP", 2, 3)
+    }
+
+    #[test]
+    fn test_parse_trade_tick() {
+        let raw = r#"{"id":"1681462770114010100","market":"ETH-USD-PERP","side":"SELL",
+            "size":"0.5","price":"1900.15","created_at":1681462770114,"trade_type":"FILL"}"#;
+        let trade: ParadexWsTrade = serde_json::from_str(raw).unwrap();
+        let tick = parse_trade_tick(&trade, &instrument(), UnixNanos::from(1)).unwrap();
+        assert_eq!(tick.instrument_id.to_string(), "ETH-USD-PERP.PARADEX");
+        assert_eq!(tick.price, Price::from("1900.15"));
+        assert_eq!(tick.size, Quantity::from("0.500"));
+        assert_eq!(tick.aggressor_side, AggressorSide::Seller);
+        assert_eq!(tick.ts_event, UnixNanos::from(1_681_462_770_114_000_000));
+    }
+
+    #[test]
+    fn test_snapshot_clears_then_adds_levels() {
+        let raw = r#"{"seq_no":7,"market":"ETH-USD-PERP","last_updated_at":1,"update_type":"s",
+            "inserts":[{"side":"BUY","price":"1900.1","size":"1"},
+                       {"side":"SELL","price":"1900.2","size":"2"}],
+            "updates":[],"deletes":[]}"#;
+        let book: ParadexWsOrderbook = serde_json::from_str(raw).unwrap();
+        let deltas =
+            parse_orderbook_deltas(&book, &instrument(), UnixNanos::from(1)).unwrap().unwrap();
+        let actions: Vec<_> = deltas.deltas.iter().map(|d| d.action).collect();
+        assert_eq!(actions, [BookAction::Clear, BookAction::Add, BookAction::Add]);
+        assert_eq!(deltas.sequence, 7);
+        assert_ne!(deltas.deltas[2].flags & RecordFlag::F_LAST as u8, 0);
+    }
+
+    #[test]
+    fn test_sequencer_requests_snapshot_after_gap() {
+        let mut sequencer = ParadexBookSequencer::default();
+        let mut check = |update_type: &str, seq_no: u64| {
+            let raw = format!(
+                r#"{{"seq_no":{seq_no},"market":"ETH-USD-PERP","update_type":"{update_type}"}}"#
+            );
+            sequencer.check(&serde_json::from_str(&raw).unwrap())
+        };
+        assert_eq!(check("d", 3), ParadexBookSequence::Skip);
+        assert_eq!(check("s", 3), ParadexBookSequence::Apply);
+        assert_eq!(check("d", 4), ParadexBookSequence::Apply);
+        assert_eq!(check("d", 6), ParadexBookSequence::Gap);
+        assert_eq!(check("d", 7), ParadexBookSequence::Skip);
+        assert_eq!(check("s", 9), ParadexBookSequence::Apply);
+    }
+}
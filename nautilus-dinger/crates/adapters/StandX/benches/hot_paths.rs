@@ -0,0 +1,128 @@
+//! StandX hot paths: ed25519 request signing, request building and REST/WebSocket
+//! parsing of production-shaped payloads from `benches/fixtures`.
+//!
+//! One iteration is one order or one message, except for the REST pages,
+//! which declare their row count so criterion reports a per-row cost.
+
+use std::hint::black_box;
+
+use criterion::{Criterion, Throughput, criterion_group, criterion_main};
+use standx::common::json::{StandXPage, from_body};
+use standx::common::models::{StandXFillResponse, StandXMarketList, StandXOrderResponse};
+use standx::http::parse::{parse_orderbook_response, parse_trades_response};
+use standx::http::query::build_url;
+use standx::http::signing::sign_request;
+use standx::websocket::parse::{extract_channel, parse_ws_message};
+
+const SYMBOL_INFO: &str = include_str!("fixtures/symbol_info.json");
+const ORDERBOOK: &str = include_str!("fixtures/orderbook.json");
+const TRADES: &str = include_str!("fixtures/trades.json");
+const ORDERS: &str = include_str!("fixtures/orders.json");
+const FILLS: &str = include_str!("fixtures/fills.json");
+const NEW_ORDER: &str = include_str!("fixtures/new_order.json");
+const WS_DEPTH: &str = include_str!("fixtures/ws_depth.json");
+const WS_TRADE: &str = include_str!("fixtures/ws_trade.json");
+
+/// A 64-byte keypair in the base58 form the credentials carry.
+fn secret() -> String {
+    let mut keypair = [7u8; 64];
+    keypair[32..].copy_from_slice(&[9u8; 32]);
+    bs58::encode(keypair).into_string()
+}
+
+fn rows(raw: &str, key: Option<&str>) -> u64 {
+    let value: serde_json::Value = serde_json::from_str(raw).unwrap();
+    let rows = match key {
+        Some(key) => &value[key],
+        None => &value,
+    };
+    rows.as_array().map_or(0, |rows| rows.len() as u64)
+}
+
+fn bench_signing(c: &mut Criterion) {
+    let secret = secret();
+    let body: serde_json::Value = serde_json::from_str(NEW_ORDER).unwrap();
+    let mut group = c.benchmark_group("standx.signing");
+    group.throughput(Throughput::Elements(1));
+
+    // What `auth_headers` does per signed request: serialize the body, then sign it
+    group.bench_function("sign_order_request", |b| {
+        b.iter(|| {
+            let payload = serde_json::to_string(black_box(&body)).unwrap();
+            sign_request(&secret, "req-1760000000000", "1760000000000", &payload).unwrap()
+        })
+    });
+    group.finish();
+}
+
+fn bench_request(c: &mut Criterion) {
+    let mut group = c.benchmark_group("standx.request");
+    group.throughput(Throughput::Elements(1));
+
+    group.bench_function("build_url_query_orders", |b| {
+        b.iter(|| {
+            build_url(
+                black_box("https://perps.standx.com"),
+                "/api/query_orders",
+                black_box(&[
+                    ("symbol", "BTC-USD"),
+                    ("start_time", "1760000000000"),
+                    ("end_time", "1760086400000"),
+                    ("limit", "100"),
+                ]),
+            )
+        })
+    });
+    group.finish();
+}
+
+fn bench_rest_parse(c: &mut Criterion) {
+    let mut group = c.benchmark_group("standx.rest");
+
+    group.throughput(Throughput::Elements(rows(SYMBOL_INFO, None)));
+    group.bench_function("decode_symbol_info", |b| {
+        b.iter(|| from_body::<StandXMarketList>(black_box(SYMBOL_INFO.as_bytes())).unwrap())
+    });
+
+    group.throughput(Throughput::Elements(1));
+    group.bench_function("parse_orderbook", |b| {
+        b.iter(|| parse_orderbook_response(black_box(ORDERBOOK)).unwrap())
+    });
+
+    group.throughput(Throughput::Elements(rows(TRADES, Some("trades"))));
+    group.bench_function("parse_trades", |b| {
+        b.iter(|| parse_trades_response(black_box(TRADES)).unwrap())
+    });
+
+    group.throughput(Throughput::Elements(rows(ORDERS, Some("result"))));
+    group.bench_function("decode_orders", |b| {
+        b.iter(|| {
+            from_body::<StandXPage<StandXOrderResponse>>(black_box(ORDERS.as_bytes())).unwrap()
+        })
+    });
+
+    group.throughput(Throughput::Elements(rows(FILLS, Some("result"))));
+    group.bench_function("decode_fills", |b| {
+        b.iter(|| from_body::<StandXPage<StandXFillResponse>>(black_box(FILLS.as_bytes())).unwrap())
+    });
+    group.finish();
+}
+
+fn bench_ws_parse(c: &mut Criterion) {
+    let mut group = c.benchmark_group("standx.ws");
+    group.throughput(Throughput::Elements(1));
+
+    for (name, frame) in [("depth_book", WS_DEPTH), ("public_trade", WS_TRADE)] {
+        group.bench_function(name, |b| {
+            b.iter(|| {
+                let message = parse_ws_message(black_box(frame)).unwrap();
+                black_box(extract_channel(&message).is_some());
+                message
+            })
+        });
+    }
+    group.finish();
+}
+
+criterion_group!(benches, bench_signing, bench_request, bench_rest_parse, bench_ws_parse);
+criterion_main!(benches);
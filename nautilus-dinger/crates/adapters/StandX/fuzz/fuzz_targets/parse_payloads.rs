@@ -0,0 +1,29 @@
+//! Every StandX REST and WebSocket parser must reject malformed input
+//! without panicking.
+//!
+//! The bench fixtures are the seed corpus; pass them after the working corpus
+//! so new inputs are not written into them:
+//! `cargo fuzz run parse_payloads corpus/parse_payloads ../benches/fixtures`
+#![no_main]
+
+use libfuzzer_sys::fuzz_target;
+use standx::common::json::{StandXPage, from_body};
+use standx::common::models::{StandXFillResponse, StandXMarketList, StandXOrderResponse};
+use standx::http::parse::{parse_info_response, parse_orderbook_response, parse_trades_response};
+use standx::websocket::parse::{extract_channel, parse_ws_message};
+
+fuzz_target!(|data: &[u8]| {
+    let _ = from_body::<StandXMarketList>(data);
+    let _ = from_body::<StandXPage<StandXOrderResponse>>(data);
+    let _ = from_body::<StandXPage<StandXFillResponse>>(data);
+
+    let Ok(raw) = std::str::from_utf8(data) else {
+        return;
+    };
+    let _ = parse_info_response(raw);
+    let _ = parse_orderbook_response(raw);
+    let _ = parse_trades_response(raw);
+    if let Ok(message) = parse_ws_message(raw) {
+        let _ = extract_channel(&message);
+    }
+});
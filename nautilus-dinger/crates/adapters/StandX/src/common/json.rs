@@ -0,0 +1,345 @@
+//! Typed response-body parsing.
+//!
+//! Bodies are deserialized straight into the response models; field aliases
+//! are resolved by serde and strings are borrowed from the body where the
+//! model allows it, so no intermediate `serde_json::Value` tree is built.
+//! With the `simd-json` feature the body is parsed by simd-json instead.
+
+use std::borrow::Cow;
+use std::fmt;
+use std::marker::PhantomData;
+
+use serde::de::{self, DeserializeOwned, IgnoredAny, MapAccess, SeqAccess, Visitor};
+use serde::{Deserialize, Deserializer};
+
+/// Deserialize a complete response body.
+#[cfg(not(feature = "simd-json"))]
+pub fn from_body<T: DeserializeOwned>(body: &[u8]) -> anyhow::Result<T> {
+    Ok(serde_json::from_slice(body)?)
+}
+
+/// Deserialize a complete response body.
+#[cfg(feature = "simd-json")]
+pub fn from_body<T: DeserializeOwned>(body: &[u8]) -> anyhow::Result<T> {
+    // simd-json parses in place, so it needs its own mutable copy
+    let mut buf = body.to_vec();
+    Ok(simd_json::serde::from_slice(&mut buf)?)
+}
+
+/// Keys under which list endpoints wrap their rows.
+const ROW_KEYS: [&str; 6] = ["result", "results", "orders", "trades", "markets", "data"];
+
+/// A list response that is either a bare array or an object wrapping the rows
+/// under one of `ROW_KEYS`, with optional `next`/`prev` cursors.
+///
+/// The first row key holding an array supplies the rows; a row key holding
+/// anything else is skipped, and null counts as no rows. An object with no
+/// usable row key is an error rather than an empty page.
+#[derive(Debug, Clone)]
+pub struct StandXPage<T> {
+    pub rows: Vec<T>,
+    pub next: Option<String>,
+    pub prev: Option<String>,
+}
+
+impl<T> Default for StandXPage<T> {
+    fn default() -> Self {
+        Self { rows: Vec::new(), next: None, prev: None }
+    }
+}
+
+impl<'de, T: Deserialize<'de>> Deserialize<'de> for StandXPage<T> {
+    fn deserialize<D: Deserializer<'de>>(deserializer: D) -> Result<Self, D::Error> {
+        deserializer.deserialize_any(PageVisitor(PhantomData))
+    }
+}
+
+struct PageVisitor<T>(PhantomData<T>);
+
+impl<'de, T: Deserialize<'de>> Visitor<'de> for PageVisitor<T> {
+    type Value = StandXPage<T>;
+
+    fn expecting(&self, f: &mut fmt::Formatter) -> fmt::Result {
+        f.write_str("an array of rows or an object wrapping one")
+    }
+
+    fn visit_seq<A: SeqAccess<'de>>(self, mut seq: A) -> Result<Self::Value, A::Error> {
+        let mut rows = Vec::with_capacity(seq.size_hint().unwrap_or(0));
+        while let Some(row) = seq.next_element()? {
+            rows.push(row);
+        }
+        Ok(StandXPage { rows, next: None, prev: None })
+    }
+
+    fn visit_map<A: MapAccess<'de>>(self, mut map: A) -> Result<Self::Value, A::Error> {
+        let mut page = StandXPage::default();
+        let mut found_rows = false;
+        let mut null_rows = false;
+        while let Some(key) = map.next_key::<Cow<'de, str>>()? {
+            match key.as_ref() {
+                "next" => page.next = map.next_value::<Option<LenientString>>()?.map(|s| s.0),
+                "prev" => page.prev = map.next_value::<Option<LenientString>>()?.map(|s| s.0),
+                k if !found_rows && ROW_KEYS.contains(&k) => match map.next_value()? {
+                    RowsValue::Rows(rows) => {
+                        page.rows = rows;
+                        found_rows = true;
+                    }
+                    RowsValue::Null => null_rows = true,
+                    RowsValue::Other => {}
+                },
+                _ => {
+                    map.next_value::<IgnoredAny>()?;
+                }
+            }
+        }
+        if !found_rows && !null_rows {
+            return Err(de::Error::custom(format_args!("no row array under any of {ROW_KEYS:?}")));
+        }
+        Ok(page)
+    }
+}
+
+/// The value found under a row key.
+enum RowsValue<T> {
+    Rows(Vec<T>),
+    Null,
+    Other,
+}
+
+impl<'de, T: Deserialize<'de>> Deserialize<'de> for RowsValue<T> {
+    fn deserialize<D: Deserializer<'de>>(deserializer: D) -> Result<Self, D::Error> {
+        deserializer.deserialize_any(RowsValueVisitor(PhantomData))
+    }
+}
+
+struct RowsValueVisitor<T>(PhantomData<T>);
+
+impl<'de, T: Deserialize<'de>> Visitor<'de> for RowsValueVisitor<T> {
+    type Value = RowsValue<T>;
+
+    fn expecting(&self, f: &mut fmt::Formatter) -> fmt::Result {
+        f.write_str("an array of rows, or any value to skip")
+    }
+
+    fn visit_seq<A: SeqAccess<'de>>(self, mut seq: A) -> Result<Self::Value, A::Error> {
+        let mut rows = Vec::with_capacity(seq.size_hint().unwrap_or(0));
+        while let Some(row) = seq.next_element()? {
+            rows.push(row);
+        }
+        Ok(RowsValue::Rows(rows))
+    }
+
+    fn visit_unit<E: de::Error>(self) -> Result<Self::Value, E> {
+        Ok(RowsValue::Null)
+    }
+
+    fn visit_none<E: de::Error>(self) -> Result<Self::Value, E> {
+        Ok(RowsValue::Null)
+    }
+
+    fn visit_some<D: Deserializer<'de>>(self, deserializer: D) -> Result<Self::Value, D::Error> {
+        deserializer.deserialize_any(self)
+    }
+
+    fn visit_map<A: MapAccess<'de>>(self, mut map: A) -> Result<Self::Value, A::Error> {
+        while map.next_entry::<IgnoredAny, IgnoredAny>()?.is_some() {}
+        Ok(RowsValue::Other)
+    }
+
+    fn visit_bool<E: de::Error>(self, _v: bool) -> Result<Self::Value, E> {
+        Ok(RowsValue::Other)
+    }
+
+    fn visit_i64<E: de::Error>(self, _v: i64) -> Result<Self::Value, E> {
+        Ok(RowsValue::Other)
+    }
+
+    fn visit_u64<E: de::Error>(self, _v: u64) -> Result<Self::Value, E> {
+        Ok(RowsValue::Other)
+    }
+
+    fn visit_f64<E: de::Error>(self, _v: f64) -> Result<Self::Value, E> {
+        Ok(RowsValue::Other)
+    }
+
+    fn visit_str<E: de::Error>(self, _v: &str) -> Result<Self::Value, E> {
+        Ok(RowsValue::Other)
+    }
+}
+
+/// A string, or a number/bool rendered as one.
+struct LenientString(String);
+
+impl<'de> Deserialize<'de> for LenientString {
+    fn deserialize<D: Deserializer<'de>>(deserializer: D) -> Result<Self, D::Error> {
+        de_opt_string(deserializer)?
+            .map(LenientString)
+            .ok_or_else(|| de::Error::custom("expected a string"))
+    }
+}
+
+struct OptStringVisitor;
+
+impl<'de> Visitor<'de> for OptStringVisitor {
+    type Value = Option<String>;
+
+    fn expecting(&self, f: &mut fmt::Formatter) -> fmt::Result {
+        f.write_str("a string, number, bool or null")
+    }
+
+    fn visit_str<E: de::Error>(self, v: &str) -> Result<Self::Value, E> {
+        Ok(Some(v.to_owned()))
+    }
+
+    fn visit_string<E: de::Error>(self, v: String) -> Result<Self::Value, E> {
+        Ok(Some(v))
+    }
+
+    fn visit_u64<E: de::Error>(self, v: u64) -> Result<Self::Value, E> {
+        Ok(Some(v.to_string()))
+    }
+
+    fn visit_i64<E: de::Error>(self, v: i64) -> Result<Self::Value, E> {
+        Ok(Some(v.to_string()))
+    }
+
+    fn visit_f64<E: de::Error>(self, v: f64) -> Result<Self::Value, E> {
+        Ok(Some(serde_json::Number::from_f64(v).map_or_else(|| v.to_string(), |n| n.to_string())))
+    }
+
+    fn visit_bool<E: de::Error>(self, v: bool) -> Result<Self::Value, E> {
+        Ok(Some(v.to_string()))
+    }
+
+    fn visit_unit<E: de::Error>(self) -> Result<Self::Value, E> {
+        Ok(None)
+    }
+
+    fn visit_none<E: de::Error>(self) -> Result<Self::Value, E> {
+        Ok(None)
+    }
+
+    fn visit_some<D: Deserializer<'de>>(self, deserializer: D) -> Result<Self::Value, D::Error> {
+        deserializer.deserialize_any(self)
+    }
+
+    fn visit_seq<A: SeqAccess<'de>>(self, seq: A) -> Result<Self::Value, A::Error> {
+        let value = serde_json::Value::deserialize(de::value::SeqAccessDeserializer::new(seq))?;
+        Ok(Some(value.to_string()))
+    }
+
+    fn visit_map<A: MapAccess<'de>>(self, map: A) -> Result<Self::Value, A::Error> {
+        let value = serde_json::Value::deserialize(de::value::MapAccessDeserializer::new(map))?;
+        Ok(Some(value.to_string()))
+    }
+}
+
+/// Deserialize an optional string field that the venue may send as a number,
+/// bool or nested value, without building a `serde_json::Value` for scalars.
+pub fn de_opt_string<'de, D: Deserializer<'de>>(
+    deserializer: D,
+) -> Result<Option<String>, D::Error> {
+    deserializer.deserialize_any(OptStringVisitor)
+}
+
+struct LenientU32Visitor;
+
+impl<'de> Visitor<'de> for LenientU32Visitor {
+    type Value = Option<u32>;
+
+    fn expecting(&self, f: &mut fmt::Formatter) -> fmt::Result {
+        f.write_str("an unsigned integer or a numeric string")
+    }
+
+    fn visit_u64<E: de::Error>(self, v: u64) -> Result<Self::Value, E> {
+        Ok(u32::try_from(v).ok())
+    }
+
+    fn visit_i64<E: de::Error>(self, v: i64) -> Result<Self::Value, E> {
+        Ok(u32::try_from(v).ok())
+    }
+
+    fn visit_f64<E: de::Error>(self, _v: f64) -> Result<Self::Value, E> {
+        Ok(None)
+    }
+
+    fn visit_str<E: de::Error>(self, v: &str) -> Result<Self::Value, E> {
+        Ok(v.trim().parse().ok())
+    }
+
+    fn visit_unit<E: de::Error>(self) -> Result<Self::Value, E> {
+        Ok(None)
+    }
+
+    fn visit_none<E: de::Error>(self) -> Result<Self::Value, E> {
+        Ok(None)
+    }
+
+    fn visit_some<D: Deserializer<'de>>(self, deserializer: D) -> Result<Self::Value, D::Error> {
+        deserializer.deserialize_any(self)
+    }
+}
+
+/// Deserialize an optional `u32` sent either as a number or a numeric string.
+pub fn de_opt_u32_lenient<'de, D: Deserializer<'de>>(
+    deserializer: D,
+) -> Result<Option<u32>, D::Error> {
+    deserializer.deserialize_any(LenientU32Visitor)
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    #[derive(Debug, Deserialize)]
+    struct Row<'a> {
+        #[serde(borrow)]
+        symbol: Cow<'a, str>,
+        #[serde(default, deserialize_with = "de_opt_string")]
+        qty: Option<String>,
+    }
+
+    #[test]
+    fn test_page_accepts_bare_array_and_wrapped_rows() {
+        let bare: StandXPage<Row> =
+            serde_json::from_str(r#"[{"symbol":"BTC-USD","qty":1.5}]"#).unwrap();
+        assert_eq!(bare.rows.len(), 1);
+        assert_eq!(bare.rows[0].qty.as_deref(), Some("1.5"));
+        assert!(matches!(bare.rows[0].symbol, Cow::Borrowed("BTC-USD")));
+
+        let body =
+            r#"{"code":0,"results":[{"symbol":"ETH-USD","qty":"2"}],"next":"c2","extra":{}}"#;
+        let wrapped: StandXPage<Row> = serde_json::from_str(body).unwrap();
+        assert_eq!(wrapped.rows[0].symbol, "ETH-USD");
+        assert_eq!(wrapped.next.as_deref(), Some("c2"));
+        assert_eq!(wrapped.prev, None);
+    }
+
+    #[test]
+    fn test_lenient_scalars() {
+        #[derive(Deserialize)]
+        struct Fields {
+            #[serde(default, deserialize_with = "de_opt_u32_lenient")]
+            a: Option<u32>,
+            #[serde(default, deserialize_with = "de_opt_u32_lenient")]
+            b: Option<u32>,
+            #[serde(default, deserialize_with = "de_opt_string")]
+            c: Option<String>,
+        }
+        let parsed: Fields = serde_json::from_str(r#"{"a":"7","b":3,"c":null}"#).unwrap();
+        assert_eq!((parsed.a, parsed.b, parsed.c), (Some(7), Some(3), None));
+    }
+
+    #[test]
+    fn test_page_skips_non_array_row_keys_and_rejects_objects_without_rows() {
+        let skipped: StandXPage<u32> =
+            from_body(br#"{"data": {"total": 1}, "results": [5]}"#).unwrap();
+        assert_eq!(skipped.rows, vec![5]);
+
+        let empty: StandXPage<u32> = from_body(br#"{"results": null}"#).unwrap();
+        assert!(empty.rows.is_empty());
+
+        assert!(from_body::<StandXPage<u32>>(br#"{"data": "busy"}"#).is_err());
+        assert!(from_body::<StandXPage<u32>>(br#"{"code": 500, "msg": "oops"}"#).is_err());
+    }
+}
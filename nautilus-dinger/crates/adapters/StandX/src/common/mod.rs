@@ -1,6 +1,7 @@
 pub mod consts;
 pub mod credential;
 pub mod enums;
+pub mod json;
 pub mod models;
 pub mod risk;
 pub mod symbols;
@@ -1,20 +1,9 @@
+use std::borrow::Cow;
+
 use serde::{Deserialize, Serialize};
 use serde_json::Value;
 
-fn de_opt_string<'de, D>(deserializer: D) -> Result<Option<String>, D::Error>
-where
-    D: serde::Deserializer<'de>,
-{
-    let value = Option::<Value>::deserialize(deserializer)?;
-    let out = match value {
-        None | Some(Value::Null) => None,
-        Some(Value::String(s)) => Some(s),
-        Some(Value::Number(n)) => Some(n.to_string()),
-        Some(Value::Bool(b)) => Some(b.to_string()),
-        Some(other) => Some(other.to_string()),
-    };
-    Ok(out)
-}
+use crate::common::json::{StandXPage, de_opt_string, de_opt_u32_lenient};
 
 /// A generic WebSocket or REST API message from StandX.
 #[derive(Debug, Clone, Serialize, Deserialize)]
@@ -37,6 +26,60 @@ pub struct StandXMarketInfo {
     pub cmf: f64,
 }
 
+/// Borrowed row of GET /api/query_symbol_info, normalized into `StandXMarketInfo`.
+#[derive(Debug, Deserialize)]
+pub struct StandXMarketRow<'a> {
+    #[serde(default, borrow)]
+    pub symbol: Cow<'a, str>,
+    #[serde(default, alias = "marketId", deserialize_with = "de_opt_u32_lenient")]
+    pub market_id: Option<u32>,
+    #[serde(
+        default,
+        alias = "price_decimals",
+        alias = "priceDecimals",
+        deserialize_with = "de_opt_u32_lenient"
+    )]
+    pub price_tick_decimals: Option<u32>,
+    #[serde(
+        default,
+        alias = "size_decimals",
+        alias = "sizeDecimals",
+        deserialize_with = "de_opt_u32_lenient"
+    )]
+    pub qty_tick_decimals: Option<u32>,
+}
+
+impl From<StandXMarketRow<'_>> for StandXMarketInfo {
+    fn from(row: StandXMarketRow<'_>) -> Self {
+        Self {
+            market_id: row.market_id.unwrap_or(0),
+            symbol: if row.symbol.is_empty() {
+                "UNKNOWN-USD".to_string()
+            } else {
+                row.symbol.into_owned()
+            },
+            price_decimals: row.price_tick_decimals.unwrap_or(2),
+            size_decimals: row.qty_tick_decimals.unwrap_or(4),
+            base_token_id: 0,
+            quote_token_id: 0,
+            imf: 0.0,
+            mmf: 0.0,
+            cmf: 0.0,
+        }
+    }
+}
+
+/// Market list of GET /api/query_symbol_info, deserialized through borrowed rows.
+#[derive(Debug, Clone)]
+pub struct StandXMarketList(pub Vec<StandXMarketInfo>);
+
+impl<'de> Deserialize<'de> for StandXMarketList {
+    fn deserialize<D: serde::Deserializer<'de>>(deserializer: D) -> Result<Self, D::Error> {
+        let page = StandXPage::<StandXMarketRow<'de>>::deserialize(deserializer)?;
+        Ok(Self(page.rows.into_iter().map(StandXMarketInfo::from).collect()))
+    }
+}
+
 /// Token information returned by GET /info.
 #[derive(Debug, Clone, Serialize, Deserialize)]
 #[serde(rename_all = "camelCase")]
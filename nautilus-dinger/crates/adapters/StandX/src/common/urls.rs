@@ -11,6 +11,13 @@ pub fn get_rest_url(sandbox: bool) -> String {
 }
 
 /// Get the WebSocket URL for StandX.
-pub fn get_ws_url(_sandbox: bool) -> String {
-    "wss://perps.standx.com/ws-stream/v1".to_string()
+///
+/// - Mainnet: `wss://perps.standx.com/ws-stream/v1`
+/// - Devnet (sandbox/testnet): `wss://testnet.perps.standx.com/ws-stream/v1`
+pub fn get_ws_url(sandbox: bool) -> String {
+    if sandbox {
+        "wss://testnet.perps.standx.com/ws-stream/v1".to_string()
+    } else {
+        "wss://perps.standx.com/ws-stream/v1".to_string()
+    }
 }
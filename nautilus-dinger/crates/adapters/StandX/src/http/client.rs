@@ -4,16 +4,22 @@ use nautilus_network::http::HttpClient;
 use serde_json::json;
 use std::collections::HashMap;
 use std::sync::Arc;
-use std::time::{SystemTime, UNIX_EPOCH};
+use std::time::{Duration, SystemTime, UNIX_EPOCH};
 
+use crate::common::consts::{
+    FILL_LOOKUP_MAX_PAGES, FILL_LOOKUP_PAGE_SIZE, FILL_LOOKUP_WINDOW_SECS,
+    LOOKUP_CACHE_MAX_ENTRIES, LOOKUP_CACHE_TTL_SECS,
+};
 use crate::common::credential::StandXCredential;
+use crate::common::json::{StandXPage, from_body};
 use crate::common::models::{
     StandXAccountStateResponse, StandXActionResponse, StandXFillResponse, StandXFillsResponse,
-    StandXInfoResponse, StandXMarketInfo, StandXOrderResponse, StandXOrderbookResponse,
+    StandXInfoResponse, StandXMarketList, StandXOrderResponse, StandXOrderbookResponse,
     StandXOrdersResponse, StandXTradesResponse,
 };
 use crate::common::symbols::normalize_symbol_to_venue;
-use crate::http::signing::sign_ed25519_base64;
+use crate::http::lookup::{TtlCache, epoch_millis, find_paged, now_millis};
+use crate::http::signing::{REQUEST_SIGN_VERSION, sign_request};
 
 pub struct StandXRawHttpClient {
     base_url: String,
@@ -47,63 +53,7 @@ impl StandXRawHttpClient {
                 ));
             }
 
-            let payload: serde_json::Value = serde_json::from_slice(&response.body)?;
-            let rows = if let Some(arr) = payload.as_array() {
-                arr.clone()
-            } else {
-                payload
-                    .get("result")
-                    .or_else(|| payload.get("results"))
-                    .or_else(|| payload.get("markets"))
-                    .and_then(|v| v.as_array())
-                    .cloned()
-                    .unwrap_or_default()
-            };
-
-            let mut markets = Vec::with_capacity(rows.len());
-            for row in rows {
-                let symbol =
-                    row.get("symbol").and_then(|v| v.as_str()).unwrap_or("UNKNOWN-USD").to_string();
-
-                let market_id = row
-                    .get("market_id")
-                    .or_else(|| row.get("marketId"))
-                    .and_then(|v| {
-                        v.as_u64().or_else(|| v.as_str().and_then(|s| s.parse::<u64>().ok()))
-                    })
-                    .unwrap_or(0) as u32;
-
-                let price_decimals = row
-                    .get("price_tick_decimals")
-                    .or_else(|| row.get("price_decimals"))
-                    .or_else(|| row.get("priceDecimals"))
-                    .and_then(|v| {
-                        v.as_u64().or_else(|| v.as_str().and_then(|s| s.parse::<u64>().ok()))
-                    })
-                    .unwrap_or(2) as u32;
-
-                let size_decimals = row
-                    .get("qty_tick_decimals")
-                    .or_else(|| row.get("size_decimals"))
-                    .or_else(|| row.get("sizeDecimals"))
-                    .and_then(|v| {
-                        v.as_u64().or_else(|| v.as_str().and_then(|s| s.parse::<u64>().ok()))
-                    })
-                    .unwrap_or(4) as u32;
-
-                markets.push(StandXMarketInfo {
-                    market_id,
-                    symbol,
-                    price_decimals,
-                    size_decimals,
-                    base_token_id: 0,
-                    quote_token_id: 0,
-                    imf: 0.0,
-                    mmf: 0.0,
-                    cmf: 0.0,
-                });
-            }
-
+            let StandXMarketList(markets) = from_body(&response.body)?;
             let info = StandXInfoResponse { markets, tokens: vec![] };
             Ok(info)
         })
@@ -126,12 +76,20 @@ impl StandXRawHttpClient {
         &self,
         market_id: u32,
         limit: Option<u32>,
+        start_at_ms: Option<u64>,
+        end_at_ms: Option<u64>,
     ) -> anyhow::Result<StandXTradesResponse> {
         get_runtime().block_on(async {
             let mut url = format!("{}/trades?market_id={}", self.base_url, market_id);
             if let Some(limit) = limit {
                 url.push_str(&format!("&limit={}", limit));
             }
+            if let Some(start_at_ms) = start_at_ms {
+                url.push_str(&format!("&start_at={}", start_at_ms));
+            }
+            if let Some(end_at_ms) = end_at_ms {
+                url.push_str(&format!("&end_at={}", end_at_ms));
+            }
             let response = self
                 .client
                 .get(url, None, None, None, None)
@@ -173,11 +131,18 @@ impl StandXRawHttpClient {
 
 pub struct StandXHttpClient {
     inner: Arc<StandXRawHttpClient>,
+    fill_cache: TtlCache<String, StandXFillResponse>,
 }
 
 impl StandXHttpClient {
     pub fn new(base_url: String, client: HttpClient, credential: Option<StandXCredential>) -> Self {
-        Self { inner: Arc::new(StandXRawHttpClient::new(base_url, client, credential)) }
+        Self {
+            inner: Arc::new(StandXRawHttpClient::new(base_url, client, credential)),
+            fill_cache: TtlCache::new(
+                Duration::from_secs(LOOKUP_CACHE_TTL_SECS),
+                LOOKUP_CACHE_MAX_ENTRIES,
+            ),
+        }
     }
 
     pub fn get_info(&self) -> anyhow::Result<StandXInfoResponse> {
@@ -192,8 +157,10 @@ impl StandXHttpClient {
         &self,
         market_id: u32,
         limit: Option<u32>,
+        start_at_ms: Option<u64>,
+        end_at_ms: Option<u64>,
     ) -> anyhow::Result<StandXTradesResponse> {
-        self.inner.get_trades(market_id, limit)
+        self.inner.get_trades(market_id, limit, start_at_ms, end_at_ms)
     }
 
     pub fn get_timestamp(&self) -> anyhow::Result<u64> {
@@ -219,7 +186,6 @@ impl StandXHttpClient {
         headers.insert("Content-Type".to_string(), "application/json".to_string());
 
         if let Some(value) = body {
-            let sign_version = "v1".to_string();
             let timestamp_ms = SystemTime::now()
                 .duration_since(UNIX_EPOCH)
                 .map_err(|e| anyhow::anyhow!("timestamp error: {e}"))?
@@ -227,10 +193,12 @@ impl StandXHttpClient {
                 .to_string();
             let request_id = format!("req-{}", timestamp_ms);
             let payload = serde_json::to_string(value)?;
-            let message = format!("{},{},{},{}", sign_version, request_id, timestamp_ms, payload);
-            let signature = sign_ed25519_base64(&creds.api_secret, message.as_bytes())
+            let signature = sign_request(&creds.api_secret, &request_id, &timestamp_ms, &payload)
                 .map_err(|e| anyhow::anyhow!("signature error: {e}"))?;
-            headers.insert("x-request-sign-version".to_string(), sign_version);
+            headers.insert(
+                "x-request-sign-version".to_string(),
+                REQUEST_SIGN_VERSION.to_string(),
+            );
             headers.insert("x-request-id".to_string(), request_id.clone());
             headers.insert("x-request-timestamp".to_string(), timestamp_ms);
             headers.insert("x-request-signature".to_string(), signature);
@@ -538,24 +506,8 @@ impl StandXHttpClient {
                     body_text
                 ));
             }
-            let parsed: serde_json::Value = serde_json::from_slice(&response.body)?;
-            let rows = if let Some(arr) = parsed.as_array() {
-                arr.clone()
-            } else {
-                parsed
-                    .get("result")
-                    .or_else(|| parsed.get("results"))
-                    .or_else(|| parsed.get("orders"))
-                    .and_then(|v| v.as_array())
-                    .cloned()
-                    .unwrap_or_default()
-            };
-
-            let mut out = Vec::with_capacity(rows.len());
-            for row in rows {
-                out.push(serde_json::from_value::<StandXOrderResponse>(row)?);
-            }
-            Ok(out)
+            let page: StandXPage<StandXOrderResponse> = from_body(&response.body)?;
+            Ok(page.rows)
         })
     }
 
@@ -657,28 +609,13 @@ impl StandXHttpClient {
                     body_text
                 ));
             }
-            let parsed: serde_json::Value = serde_json::from_slice(&response.body)?;
-            let rows = if let Some(arr) = parsed.as_array() {
-                arr.clone()
-            } else {
-                parsed
-                    .get("result")
-                    .or_else(|| parsed.get("results"))
-                    .or_else(|| parsed.get("orders"))
-                    .and_then(|v| v.as_array())
-                    .cloned()
-                    .unwrap_or_default()
-            };
-            let mut normalized = Vec::with_capacity(rows.len());
-            for row in rows {
-                normalized.push(serde_json::from_value::<StandXOrderResponse>(row)?);
-            }
+            let page: StandXPage<StandXOrderResponse> = from_body(&response.body)?;
             let orders = StandXOrdersResponse {
                 orders: vec![],
-                result: normalized,
+                result: page.rows,
                 results: vec![],
-                next: parsed.get("next").and_then(|v| v.as_str()).map(str::to_string),
-                prev: parsed.get("prev").and_then(|v| v.as_str()).map(str::to_string),
+                next: page.next,
+                prev: page.prev,
             };
             Ok(orders)
         })
@@ -690,6 +627,18 @@ impl StandXHttpClient {
         start_at_ms: Option<u64>,
         end_at_ms: Option<u64>,
         page_size: Option<u32>,
+    ) -> anyhow::Result<StandXFillsResponse> {
+        self.get_fills_page(market, start_at_ms, end_at_ms, page_size, None)
+    }
+
+    /// One page of fills; `cursor` is the `next` value of the previous page.
+    pub fn get_fills_page(
+        &self,
+        market: Option<String>,
+        start_at_ms: Option<u64>,
+        end_at_ms: Option<u64>,
+        page_size: Option<u32>,
+        cursor: Option<String>,
     ) -> anyhow::Result<StandXFillsResponse> {
         let inner = self.inner.clone();
         let headers = self.auth_headers(None)?;
@@ -704,6 +653,9 @@ impl StandXHttpClient {
             if let Some(page_size) = page_size {
                 params.push(("limit", page_size.to_string()));
             }
+            if let Some(cursor) = cursor {
+                params.push(("cursor", cursor));
+            }
 
             let mut url = format!("{}/api/query_trades", inner.base_url);
             if !params.is_empty() {
@@ -727,45 +679,60 @@ impl StandXHttpClient {
                 ));
             }
 
-            let parsed: serde_json::Value = serde_json::from_slice(&response.body)?;
-            let rows = if let Some(arr) = parsed.as_array() {
-                arr.clone()
-            } else {
-                parsed
-                    .get("result")
-                    .or_else(|| parsed.get("results"))
-                    .or_else(|| parsed.get("trades"))
-                    .and_then(|v| v.as_array())
-                    .cloned()
-                    .unwrap_or_default()
-            };
-            let mut normalized = Vec::with_capacity(rows.len());
-            for row in rows {
-                normalized.push(serde_json::from_value::<StandXFillResponse>(row)?);
-            }
-
+            let page: StandXPage<StandXFillResponse> = from_body(&response.body)?;
             let fills = StandXFillsResponse {
                 trades: vec![],
-                result: normalized,
+                result: page.rows,
                 results: vec![],
-                next: parsed.get("next").and_then(|v| v.as_str()).map(str::to_string),
-                prev: parsed.get("prev").and_then(|v| v.as_str()).map(str::to_string),
+                next: page.next,
+                prev: page.prev,
             };
             Ok(fills)
         })
     }
 
+    /// Find a fill by fill or trade id.
+    ///
+    /// The trades endpoint has no id filter, so recent pages are scanned newest
+    /// first and stop at the first match, at the first fill older than
+    /// `FILL_LOOKUP_WINDOW_SECS` or after `FILL_LOOKUP_MAX_PAGES` pages.
+    /// Every fill seen is cached briefly, so looking up the other fills of the
+    /// same reconciliation pass does not hit the venue again.
     pub fn get_fill_by_id(&self, fill_id: String) -> anyhow::Result<Option<StandXFillResponse>> {
-        let fills = self.get_fills(None, None, None, Some(200))?;
-        Ok(fills
-            .trades
-            .iter()
-            .chain(fills.result.iter())
-            .chain(fills.results.iter())
-            .find(|f| {
-                f.id.as_deref() == Some(fill_id.as_str())
-                    || f.trade_id.as_deref() == Some(fill_id.as_str())
-            })
-            .cloned())
+        if let Some(fill) = self.fill_cache.get(&fill_id) {
+            return Ok(Some(fill));
+        }
+        let start_at_ms = now_millis().saturating_sub(FILL_LOOKUP_WINDOW_SECS * 1_000);
+        find_paged(
+            |cursor| {
+                let page = self.get_fills_page(
+                    None,
+                    Some(start_at_ms),
+                    None,
+                    Some(FILL_LOOKUP_PAGE_SIZE),
+                    cursor,
+                )?;
+                let rows = page.trades.into_iter().chain(page.result).chain(page.results);
+                Ok((rows.collect(), page.next))
+            },
+            FILL_LOOKUP_MAX_PAGES,
+            |fill: &StandXFillResponse| {
+                for id in [&fill.id, &fill.trade_id].into_iter().flatten() {
+                    self.fill_cache.insert(id.clone(), fill.clone());
+                }
+            },
+            |fill| {
+                fill.id.as_deref() == Some(fill_id.as_str())
+                    || fill.trade_id.as_deref() == Some(fill_id.as_str())
+            },
+            |fill| {
+                let ts = fill.timestamp.as_ref().and_then(|ts| match ts {
+                    serde_json::Value::Number(n) => n.as_u64(),
+                    serde_json::Value::String(s) => s.parse().ok(),
+                    _ => None,
+                });
+                ts.is_some_and(|ts| epoch_millis(ts) < start_at_ms)
+            },
+        )
     }
 }
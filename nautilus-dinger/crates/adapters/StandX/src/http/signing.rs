@@ -29,6 +29,22 @@ pub fn sign_ed25519_base64(secret_base58: &str, message: &[u8]) -> Result<String
     Ok(general_purpose::STANDARD.encode(sig_bytes))
 }
 
+/// Version sent in `x-request-sign-version`.
+pub const REQUEST_SIGN_VERSION: &str = "v1";
+
+/// Sign a request body for the `x-request-signature` header.
+///
+/// The signed message is `{version},{request_id},{timestamp_ms},{payload}`.
+pub fn sign_request(
+    secret_base58: &str,
+    request_id: &str,
+    timestamp_ms: &str,
+    payload: &str,
+) -> Result<String, String> {
+    let message = format!("{REQUEST_SIGN_VERSION},{request_id},{timestamp_ms},{payload}");
+    sign_ed25519_base64(secret_base58, message.as_bytes())
+}
+
 /// Sign a message using HMAC-SHA256 (fallback for standard API key auth).
 pub fn sign_hmac_sha256(secret: &str, message: &str) -> String {
     use hmac::{Hmac, Mac};
@@ -1,9 +1,13 @@
 #[cfg(test)]
 mod tests {
+    use crate::common::json::{StandXPage, from_body};
+    use crate::common::models::{StandXFillResponse, StandXMarketList, StandXOrderResponse};
     use crate::http::parse::{
         parse_info_response, parse_orderbook_response, parse_trades_response,
     };
-    use crate::http::signing::{sign_ed25519, sign_hmac_sha256};
+    use crate::http::signing::{
+        sign_ed25519, sign_ed25519_base64, sign_hmac_sha256, sign_request,
+    };
 
     // ── Signing tests ──────────────────────────────────────────────────
 
@@ -56,6 +60,15 @@ mod tests {
         assert!(result.is_err(), "Key shorter than 32 bytes should error");
     }
 
+    #[test]
+    fn test_sign_request_signs_versioned_message() {
+        let secret_b58 = bs58::encode(&[7u8; 32]).into_string();
+        let sig = sign_request(&secret_b58, "req-1", "1700000000000", r#"{"qty":"1"}"#).unwrap();
+        let expected =
+            sign_ed25519_base64(&secret_b58, br#"v1,req-1,1700000000000,{"qty":"1"}"#).unwrap();
+        assert_eq!(sig, expected);
+    }
+
     #[test]
     fn test_sign_hmac_sha256_deterministic() {
         let sig1 = sign_hmac_sha256("secret", "message");
@@ -154,4 +167,53 @@ mod tests {
         assert!(ob.asks.is_empty());
         assert!(ob.bids.is_empty());
     }
+
+    // ── Typed list parsing ─────────────────────────────────────────────
+
+    #[test]
+    fn test_symbol_info_rows_resolve_field_aliases() {
+        let body = br#"[
+            {"symbol": "BTC-USD", "market_id": 1, "price_tick_decimals": "1", "qty_tick_decimals": 4},
+            {"symbol": "ETH-USD", "marketId": "2", "priceDecimals": 2, "sizeDecimals": "3"}
+        ]"#;
+
+        let StandXMarketList(markets) = from_body(body).unwrap();
+        assert_eq!(markets.len(), 2);
+        assert_eq!((markets[0].market_id, markets[0].price_decimals), (1, 1));
+        assert_eq!(markets[1].symbol, "ETH-USD");
+        assert_eq!((markets[1].market_id, markets[1].size_decimals), (2, 3));
+
+        let wrapped: StandXMarketList =
+            from_body(br#"{"result": [{"symbol": "SOL-USD"}]}"#).unwrap();
+        assert_eq!(wrapped.0[0].price_decimals, 2);
+    }
+
+    #[test]
+    fn test_fills_page_parses_wrapped_rows_and_cursor() {
+        let body = br#"{
+            "code": 0,
+            "result": [
+                {"id": 11, "order_id": "7", "cl_ord_id": "O-1", "price": 100.5, "qty": "1"},
+                {"id": "12", "order_id": 8, "side": "sell", "fee": null}
+            ],
+            "next": "cursor-2"
+        }"#;
+
+        let page: StandXPage<StandXFillResponse> = from_body(body).unwrap();
+        assert_eq!(page.rows.len(), 2);
+        assert_eq!(page.rows[0].id.as_deref(), Some("11"));
+        assert_eq!(page.rows[0].client_order_id.as_deref(), Some("O-1"));
+        assert_eq!(page.rows[0].price.as_deref(), Some("100.5"));
+        assert_eq!(page.rows[1].order_id.as_deref(), Some("8"));
+        assert_eq!(page.rows[1].fee, None);
+        assert_eq!(page.next.as_deref(), Some("cursor-2"));
+    }
+
+    #[test]
+    fn test_orders_page_accepts_bare_array() {
+        let page: StandXPage<StandXOrderResponse> =
+            from_body(br#"[{"id": 1, "status": "open"}]"#).unwrap();
+        assert_eq!(page.rows[0].status.as_deref(), Some("open"));
+        assert!(page.next.is_none());
+    }
 }
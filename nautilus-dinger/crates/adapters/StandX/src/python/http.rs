@@ -2,7 +2,10 @@ use pyo3::prelude::*;
 use std::collections::HashMap;
 
 use crate::common::credential::StandXCredential;
+use crate::common::urls::get_ws_url;
 use crate::http::client::{StandXHttpClient, StandXRawHttpClient};
+use crate::websocket::enums::StandXWsChannel;
+use crate::websocket::private::StandXPrivateWsClient;
 use nautilus_network::http::HttpClient;
 
 #[pyclass(name = "PyStandXRawHttpClient")]
@@ -44,9 +47,15 @@ impl PyStandXRawHttpClient {
             .map_err(|e| pyo3::exceptions::PyRuntimeError::new_err(format!("{e}")))
     }
 
-    pub fn get_trades(&self, market_id: u32, limit: Option<u32>) -> PyResult<String> {
+    pub fn get_trades(
+        &self,
+        market_id: u32,
+        limit: Option<u32>,
+        start_at_ms: Option<u64>,
+        end_at_ms: Option<u64>,
+    ) -> PyResult<String> {
         self.client
-            .get_trades(market_id, limit)
+            .get_trades(market_id, limit, start_at_ms, end_at_ms)
             .map(|trades| serde_json::to_string(&trades).unwrap_or_default())
             .map_err(|e| pyo3::exceptions::PyRuntimeError::new_err(format!("{e}")))
     }
@@ -69,6 +78,7 @@ impl PyStandXRawHttpClient {
 pub struct PyStandXHttpClient {
     client: StandXHttpClient,
     base_url: String,
+    private_ws: Option<StandXPrivateWsClient>,
 }
 
 #[pymethods]
@@ -78,13 +88,20 @@ impl PyStandXHttpClient {
         base_url: Option<String>,
         api_key: Option<String>,
         api_secret: Option<String>,
+        ws_url: Option<String>,
+        sandbox: Option<bool>,
     ) -> Self {
         let base = base_url.unwrap_or_else(|| "https://perps.standx.com".to_string());
+        // The private stream carries the API token, so it must follow the session's environment
+        let ws_url = ws_url.unwrap_or_else(|| get_ws_url(sandbox.unwrap_or(false)));
         let credential = StandXCredential::resolve(api_key, api_secret).ok().flatten();
         let client = HttpClient::new(HashMap::new(), Vec::new(), Vec::new(), None, None, None)
             .expect("Failed to create HttpClient");
+        let private_ws = credential
+            .as_ref()
+            .map(|c| StandXPrivateWsClient::new(ws_url, c.api_key.clone()));
         let standx_client = StandXHttpClient::new(base.clone(), client, credential);
-        Self { client: standx_client, base_url: base }
+        Self { client: standx_client, base_url: base, private_ws }
     }
 
     pub fn get_base_url(&self) -> &str {
@@ -105,9 +122,15 @@ impl PyStandXHttpClient {
             .map_err(|e| pyo3::exceptions::PyRuntimeError::new_err(format!("{e}")))
     }
 
-    pub fn get_trades(&self, market_id: u32, limit: Option<u32>) -> PyResult<String> {
+    pub fn get_trades(
+        &self,
+        market_id: u32,
+        limit: Option<u32>,
+        start_at_ms: Option<u64>,
+        end_at_ms: Option<u64>,
+    ) -> PyResult<String> {
         self.client
-            .get_trades(market_id, limit)
+            .get_trades(market_id, limit, start_at_ms, end_at_ms)
             .map(|trades| serde_json::to_string(&trades).unwrap_or_default())
             .map_err(|e| pyo3::exceptions::PyRuntimeError::new_err(format!("{e}")))
     }
@@ -233,6 +256,14 @@ impl PyStandXHttpClient {
             .map_err(|e| pyo3::exceptions::PyRuntimeError::new_err(format!("{e}")))
     }
 
+    /// Fill as JSON, or `None` if it is not among the recent fills scanned.
+    pub fn get_fill_by_id(&self, fill_id: String) -> PyResult<Option<String>> {
+        self.client
+            .get_fill_by_id(fill_id)
+            .map(|fill| fill.map(|fill| serde_json::to_string(&fill).unwrap_or_default()))
+            .map_err(|e| pyo3::exceptions::PyRuntimeError::new_err(format!("{e}")))
+    }
+
     pub fn get_orders_history(
         &self,
         market: Option<String>,
@@ -259,4 +290,52 @@ impl PyStandXHttpClient {
             .map(|fills| serde_json::to_string(&fills).unwrap_or_default())
             .map_err(|e| pyo3::exceptions::PyRuntimeError::new_err(format!("{e}")))
     }
+
+    /// Register the callable receiving private stream batches (a JSON array string).
+    pub fn set_private_message_callback(&self, callback: Py<PyAny>) -> PyResult<()> {
+        let ws = self.require_private_ws()?;
+        ws.set_callback(std::sync::Arc::new(move |payload: String| {
+            Python::attach(|py| {
+                if let Err(e) = callback.call1(py, (payload,)) {
+                    e.print(py);
+                }
+            });
+        }));
+        Ok(())
+    }
+
+    pub fn subscribe_private_orders(&mut self) -> PyResult<()> {
+        self.subscribe_private(&[StandXWsChannel::Order, StandXWsChannel::Position])
+    }
+
+    pub fn subscribe_private_fills(&mut self) -> PyResult<()> {
+        self.subscribe_private(&[StandXWsChannel::Trade, StandXWsChannel::Balance])
+    }
+
+    pub fn private_ws_status(&self) -> PyResult<String> {
+        Ok(self.require_private_ws()?.status().to_json().to_string())
+    }
+
+    pub fn close(&mut self) {
+        if let Some(ws) = self.private_ws.as_mut() {
+            ws.close();
+        }
+    }
+}
+
+impl PyStandXHttpClient {
+    fn require_private_ws(&self) -> PyResult<&StandXPrivateWsClient> {
+        self.private_ws.as_ref().ok_or_else(|| {
+            pyo3::exceptions::PyRuntimeError::new_err("Private stream requires API credentials")
+        })
+    }
+
+    fn subscribe_private(&mut self, channels: &[StandXWsChannel]) -> PyResult<()> {
+        self.require_private_ws()?;
+        let ws = self.private_ws.as_mut().expect("checked above");
+        for channel in channels {
+            ws.subscribe(channel.as_str());
+        }
+        Ok(())
+    }
 }
@@ -5,6 +5,10 @@ pub enum StandXWsChannel {
     Orderbook,
     Trades,
     UserUpdates,
+    Order,
+    Trade,
+    Balance,
+    Position,
 }
 
 impl StandXWsChannel {
@@ -13,6 +17,10 @@ impl StandXWsChannel {
             Self::Orderbook => "orderbook",
             Self::Trades => "trades",
             Self::UserUpdates => "user_updates",
+            Self::Order => "order",
+            Self::Trade => "trade",
+            Self::Balance => "balance",
+            Self::Position => "position",
         }
     }
 }
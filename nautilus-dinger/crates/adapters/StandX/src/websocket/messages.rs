@@ -27,6 +27,38 @@ impl StandXWsSubscribe {
     }
 }
 
+/// Private stream authentication; re-sent with the full stream list whenever
+/// the subscribed channels change or the connection is re-established.
+#[derive(Debug, Clone, Serialize, Deserialize)]
+pub struct StandXWsAuth {
+    pub auth: StandXWsAuthBody,
+}
+
+#[derive(Debug, Clone, Serialize, Deserialize)]
+pub struct StandXWsAuthBody {
+    pub token: String,
+    pub streams: Vec<StandXWsStream>,
+}
+
+#[derive(Debug, Clone, Serialize, Deserialize)]
+pub struct StandXWsStream {
+    pub channel: String,
+}
+
+impl StandXWsAuth {
+    pub fn new<'a>(token: &str, channels: impl IntoIterator<Item = &'a String>) -> Self {
+        Self {
+            auth: StandXWsAuthBody {
+                token: token.to_string(),
+                streams: channels
+                    .into_iter()
+                    .map(|channel| StandXWsStream { channel: channel.clone() })
+                    .collect(),
+            },
+        }
+    }
+}
+
 /// Inbound WebSocket message (generic envelope).
 #[derive(Debug, Clone, Serialize, Deserialize)]
 pub struct StandXWsMessage {
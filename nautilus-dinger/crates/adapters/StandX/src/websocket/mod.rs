@@ -4,3 +4,4 @@ pub mod error;
 pub mod handler;
 pub mod messages;
 pub mod parse;
+pub mod private;
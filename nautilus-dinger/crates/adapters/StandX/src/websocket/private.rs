@@ -0,0 +1,302 @@
+use std::collections::BTreeSet;
+use std::sync::atomic::{AtomicBool, AtomicU64, Ordering};
+use std::sync::{Arc, Mutex};
+use std::time::Duration;
+
+use futures::{SinkExt, StreamExt};
+use nautilus_common::live::get_runtime;
+use tokio::sync::mpsc;
+use tokio::time::{Instant, sleep, sleep_until};
+use tokio_tungstenite::connect_async;
+use tokio_tungstenite::tungstenite::Message;
+
+use crate::common::consts::{
+    WS_BATCH_LINGER_MS, WS_BATCH_MAX_MESSAGES, WS_HEARTBEAT_INTERVAL_SECS,
+    WS_RECONNECT_DELAY_INITIAL_MS, WS_RECONNECT_DELAY_MAX_MS,
+};
+use crate::websocket::messages::StandXWsAuth;
+
+/// Receives one JSON array (as text) of raw private stream messages per batch.
+pub type StandXPrivateBatchCallback = Arc<dyn Fn(String) + Send + Sync>;
+
+enum Command {
+    Resubscribe,
+    Shutdown,
+}
+
+/// Connection state shared with the background task.
+#[derive(Default)]
+pub struct StandXPrivateWsStatus {
+    pub connected: AtomicBool,
+    pub connects: AtomicU64,
+    pub messages: AtomicU64,
+    pub batches: AtomicU64,
+    pub last_error: Mutex<Option<String>>,
+}
+
+impl StandXPrivateWsStatus {
+    fn set_error(&self, error: impl ToString) {
+        *self.last_error.lock().unwrap() = Some(error.to_string());
+    }
+
+    pub fn to_json(&self) -> serde_json::Value {
+        serde_json::json!({
+            "connected": self.connected.load(Ordering::Relaxed),
+            "connects": self.connects.load(Ordering::Relaxed),
+            "messages": self.messages.load(Ordering::Relaxed),
+            "batches": self.batches.load(Ordering::Relaxed),
+            "last_error": self.last_error.lock().unwrap().clone(),
+        })
+    }
+}
+
+/// Authenticated StandX private stream (orders, fills, balances, positions).
+///
+/// Runs on the shared Nautilus runtime: authenticates with the API token and
+/// the subscribed stream list, re-authenticates after every reconnect
+/// (exponential backoff), pings every heartbeat interval and reconnects when
+/// nothing arrives for two intervals. Messages are handed to the callback in
+/// batches of up to `WS_BATCH_MAX_MESSAGES`, flushed after
+/// `WS_BATCH_LINGER_MS` so a lone update is not held back.
+pub struct StandXPrivateWsClient {
+    url: String,
+    token: String,
+    channels: Arc<Mutex<BTreeSet<String>>>,
+    callback: Arc<Mutex<Option<StandXPrivateBatchCallback>>>,
+    status: Arc<StandXPrivateWsStatus>,
+    commands: Option<mpsc::UnboundedSender<Command>>,
+}
+
+impl StandXPrivateWsClient {
+    pub fn new(url: String, token: String) -> Self {
+        Self {
+            url,
+            token,
+            channels: Arc::new(Mutex::new(BTreeSet::new())),
+            callback: Arc::new(Mutex::new(None)),
+            status: Arc::new(StandXPrivateWsStatus::default()),
+            commands: None,
+        }
+    }
+
+    pub fn status(&self) -> Arc<StandXPrivateWsStatus> {
+        self.status.clone()
+    }
+
+    pub fn is_running(&self) -> bool {
+        self.commands.as_ref().is_some_and(|tx| !tx.is_closed())
+    }
+
+    pub fn set_callback(&self, callback: StandXPrivateBatchCallback) {
+        *self.callback.lock().unwrap() = Some(callback);
+    }
+
+    /// Add a private channel and make sure the stream is running.
+    pub fn subscribe(&mut self, channel: &str) {
+        let added = self.channels.lock().unwrap().insert(channel.to_string());
+        if !self.is_running() {
+            self.start();
+        } else if added {
+            if let Some(tx) = &self.commands {
+                let _ = tx.send(Command::Resubscribe);
+            }
+        }
+    }
+
+    fn start(&mut self) {
+        let (tx, rx) = mpsc::unbounded_channel();
+        self.commands = Some(tx);
+        let task = PrivateStreamTask {
+            url: self.url.clone(),
+            token: self.token.clone(),
+            channels: self.channels.clone(),
+            callback: self.callback.clone(),
+            status: self.status.clone(),
+            batch: Vec::with_capacity(WS_BATCH_MAX_MESSAGES),
+        };
+        get_runtime().spawn(task.run(rx));
+    }
+
+    pub fn close(&mut self) {
+        if let Some(tx) = self.commands.take() {
+            let _ = tx.send(Command::Shutdown);
+        }
+    }
+}
+
+impl Drop for StandXPrivateWsClient {
+    fn drop(&mut self) {
+        self.close();
+    }
+}
+
+/// Join raw JSON messages into one JSON array without re-serializing them.
+pub fn encode_batch(messages: &[String]) -> String {
+    let mut out = String::with_capacity(messages.iter().map(|m| m.len() + 1).sum::<usize>() + 2);
+    out.push('[');
+    for (i, message) in messages.iter().enumerate() {
+        if i > 0 {
+            out.push(',');
+        }
+        out.push_str(message);
+    }
+    out.push(']');
+    out
+}
+
+fn is_json_document(text: &str) -> bool {
+    matches!(text.trim_start().as_bytes().first(), Some(b'{') | Some(b'['))
+}
+
+struct PrivateStreamTask {
+    url: String,
+    token: String,
+    channels: Arc<Mutex<BTreeSet<String>>>,
+    callback: Arc<Mutex<Option<StandXPrivateBatchCallback>>>,
+    status: Arc<StandXPrivateWsStatus>,
+    batch: Vec<String>,
+}
+
+enum SessionEnd {
+    Reconnect,
+    Shutdown,
+}
+
+impl PrivateStreamTask {
+    async fn run(mut self, mut commands: mpsc::UnboundedReceiver<Command>) {
+        let mut backoff = Duration::from_millis(WS_RECONNECT_DELAY_INITIAL_MS);
+        loop {
+            match self.session(&mut commands).await {
+                Ok(SessionEnd::Shutdown) => break,
+                Ok(SessionEnd::Reconnect) => {
+                    backoff = Duration::from_millis(WS_RECONNECT_DELAY_INITIAL_MS);
+                }
+                Err(e) => self.status.set_error(e),
+            }
+            self.status.connected.store(false, Ordering::Relaxed);
+            self.flush();
+
+            tokio::select! {
+                _ = sleep(backoff) => {}
+                command = commands.recv() => {
+                    if matches!(command, None | Some(Command::Shutdown)) {
+                        break;
+                    }
+                }
+            }
+            backoff = (backoff * 2).min(Duration::from_millis(WS_RECONNECT_DELAY_MAX_MS));
+        }
+        self.status.connected.store(false, Ordering::Relaxed);
+        self.flush();
+    }
+
+    fn auth_message(&self) -> anyhow::Result<Message> {
+        let channels = self.channels.lock().unwrap();
+        let auth = StandXWsAuth::new(&self.token, channels.iter());
+        Ok(Message::Text(serde_json::to_string(&auth)?.into()))
+    }
+
+    async fn session(
+        &mut self,
+        commands: &mut mpsc::UnboundedReceiver<Command>,
+    ) -> anyhow::Result<SessionEnd> {
+        let (ws, _) = connect_async(self.url.as_str()).await?;
+        let (mut sink, mut stream) = ws.split();
+        sink.send(self.auth_message()?).await?;
+        self.status.connected.store(true, Ordering::Relaxed);
+        self.status.connects.fetch_add(1, Ordering::Relaxed);
+
+        let heartbeat_interval = Duration::from_secs(WS_HEARTBEAT_INTERVAL_SECS);
+        let linger = Duration::from_millis(WS_BATCH_LINGER_MS);
+        let mut heartbeat = tokio::time::interval(heartbeat_interval);
+        heartbeat.tick().await;
+        let mut last_received = Instant::now();
+        let mut flush_at: Option<Instant> = None;
+
+        loop {
+            tokio::select! {
+                message = stream.next() => {
+                    last_received = Instant::now();
+                    match message {
+                        Some(Ok(Message::Text(text))) => {
+                            if !is_json_document(text.as_str()) {
+                                continue;
+                            }
+                            self.status.messages.fetch_add(1, Ordering::Relaxed);
+                            self.batch.push(text.to_string());
+                            if self.batch.len() >= WS_BATCH_MAX_MESSAGES {
+                                self.flush();
+                                flush_at = None;
+                            } else if flush_at.is_none() {
+                                flush_at = Some(last_received + linger);
+                            }
+                        }
+                        Some(Ok(Message::Ping(payload))) => sink.send(Message::Pong(payload)).await?,
+                        Some(Ok(Message::Close(_))) | None => return Ok(SessionEnd::Reconnect),
+                        Some(Ok(_)) => {}
+                        Some(Err(e)) => return Err(e.into()),
+                    }
+                }
+                _ = sleep_until(flush_at.unwrap_or_else(Instant::now)), if flush_at.is_some() => {
+                    self.flush();
+                    flush_at = None;
+                }
+                _ = heartbeat.tick() => {
+                    if last_received.elapsed() > heartbeat_interval * 2 {
+                        return Err(anyhow::anyhow!("Private stream heartbeat timed out"));
+                    }
+                    sink.send(Message::Ping(Vec::new().into())).await?;
+                }
+                command = commands.recv() => match command {
+                    Some(Command::Resubscribe) => sink.send(self.auth_message()?).await?,
+                    Some(Command::Shutdown) | None => {
+                        let _ = sink.send(Message::Close(None)).await;
+                        return Ok(SessionEnd::Shutdown);
+                    }
+                },
+            }
+        }
+    }
+
+    fn flush(&mut self) {
+        if self.batch.is_empty() {
+            return;
+        }
+        let payload = encode_batch(&self.batch);
+        self.batch.clear();
+        let callback = self.callback.lock().unwrap().clone();
+        if let Some(callback) = callback {
+            self.status.batches.fetch_add(1, Ordering::Relaxed);
+            callback(payload);
+        }
+    }
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    #[test]
+    fn test_encode_batch_joins_raw_messages() {
+        let messages =
+            vec![r#"{"channel":"order"}"#.to_string(), r#"{"channel":"trade"}"#.to_string()];
+        let encoded = encode_batch(&messages);
+        let parsed: serde_json::Value = serde_json::from_str(&encoded).unwrap();
+        assert_eq!(parsed.as_array().unwrap().len(), 2);
+        assert_eq!(encode_batch(&[]), "[]");
+    }
+
+    #[test]
+    fn test_auth_message_lists_every_channel() {
+        let channels: BTreeSet<String> = ["order", "trade"].iter().map(|c| c.to_string()).collect();
+        let auth = serde_json::to_value(StandXWsAuth::new("token", channels.iter())).unwrap();
+        assert_eq!(auth["auth"]["token"], "token");
+        assert_eq!(auth["auth"]["streams"][1]["channel"], "trade");
+    }
+
+    #[test]
+    fn test_non_json_frames_are_skipped() {
+        assert!(is_json_document(" {\"a\":1}"));
+        assert!(!is_json_document("pong"));
+    }
+}
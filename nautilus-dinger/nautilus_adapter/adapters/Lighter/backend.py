@@ -2,9 +2,14 @@ import time
 import hashlib
 import inspect
 import asyncio
+from collections import OrderedDict
 from dataclasses import dataclass
 from decimal import Decimal
-from typing import Any, Awaitable, cast
+from typing import Any, Awaitable, Callable, cast
+
+from ...common.client_id_map import ClientOrderIdStore
+from ...common.instrument_cache import MarketMetadataCache
+from ...common.ttl_cache import TtlCache
 
 
 @dataclass
@@ -18,6 +23,9 @@ class _MarketMeta:
 
 class LighterSdkBackend:
     _MAX_CLIENT_ORDER_INDEX = 281_474_976_710_655
+    _LOOKUP_CACHE_TTL_SECS = 5.0
+    _LOOKUP_MAX_INACTIVE_PAGES = 5
+    _MAX_ORDER_MARKETS = 10_000
 
     def __init__(
         self,
@@ -25,6 +33,8 @@ class LighterSdkBackend:
         account_index: int,
         api_key_index: int,
         api_key_private_key: str,
+        metadata_cache: MarketMetadataCache | None = None,
+        client_id_store: ClientOrderIdStore | None = None,
     ) -> None:
         self._base_url = base_url.rstrip("/")
         self._account_index = account_index
@@ -36,8 +46,18 @@ class LighterSdkBackend:
         self._api_client: Any | None = None
         self._order_api: Any | None = None
         self._account_api: Any | None = None
+        self._candlestick_api: Any | None = None
         self._market_by_symbol: dict[str, _MarketMeta] = {}
         self._market_by_id: dict[int, _MarketMeta] = {}
+        self._metadata_cache = metadata_cache
+        # Hashed client_order_index -> Nautilus client order id, for reports
+        self.client_id_store = client_id_store
+        # Terminal order rows seen by recent lookups, keyed by ("client"|"order", id)
+        self._order_lookup_cache: TtlCache[dict[str, Any]] = TtlCache(
+            self._LOOKUP_CACHE_TTL_SECS,
+        )
+        # ("client"|"order", id) -> market id, so live orders are looked up there first
+        self._order_markets: OrderedDict[tuple[str, str], int] = OrderedDict()
 
     async def _close_handle(self, handle: Any | None) -> None:
         if handle is None:
@@ -88,6 +108,7 @@ class LighterSdkBackend:
             )
             self._order_api = self._lighter.OrderApi(self._api_client)
             self._account_api = self._lighter.AccountApi(self._api_client)
+            self._candlestick_api = self._lighter.CandlestickApi(self._api_client)
 
         if self._signer is None:
             self._signer = self._lighter.SignerClient(
@@ -125,12 +146,16 @@ class LighterSdkBackend:
 
         await self._close_handle(self._order_api)
         await self._close_handle(self._account_api)
+        await self._close_handle(self._candlestick_api)
         await self._close_handle(self._signer)
         await self._close_handle(self._api_client)
         self._api_client = None
         self._order_api = None
         self._account_api = None
+        self._candlestick_api = None
         self._signer = None
+        if self.client_id_store is not None:
+            self.client_id_store.close()
 
     async def _auth_token(self) -> str:
         await self._ensure_clients()
@@ -177,22 +202,18 @@ class LighterSdkBackend:
             order.get("client_order_id")
         ) in {candidate, mapped}
 
-    async def _refresh_markets(self) -> None:
-        await self._ensure_clients()
-        assert self._order_api is not None
-        order_api = cast(Any, self._order_api)
-        payload = await self._with_rate_limit_retries(lambda: order_api.order_books())
-        raw = payload.model_dump().get("order_books", [])
-
+    def _apply_market_rows(self, rows: list[dict[str, Any]]) -> None:
         by_symbol: dict[str, _MarketMeta] = {}
         by_id: dict[int, _MarketMeta] = {}
 
-        for row in raw:
+        for row in rows:
             try:
                 symbol = str(row.get("symbol", ""))
                 market_id = int(row["market_id"])
-                size_dec = int(row.get("supported_size_decimals", 5))
-                price_dec = int(row.get("supported_price_decimals", 1))
+                size_dec = int(row.get("supported_size_decimals", row.get("size_decimals", 5)))
+                price_dec = int(
+                    row.get("supported_price_decimals", row.get("price_decimals", 1))
+                )
                 min_base_amount = Decimal(str(row.get("min_base_amount", "0.00001")))
             except Exception:
                 continue
@@ -210,11 +231,29 @@ class LighterSdkBackend:
         self._market_by_symbol = by_symbol
         self._market_by_id = by_id
 
+    async def _refresh_markets(self) -> None:
+        await self._ensure_clients()
+        assert self._order_api is not None
+        order_api = cast(Any, self._order_api)
+        payload = await self._with_rate_limit_retries(lambda: order_api.order_books())
+        self._apply_market_rows(payload.model_dump().get("order_books", []))
+
+    async def _ensure_markets(self) -> None:
+        # Warm start from the shared metadata cache (rows written by the
+        # instrument provider in get_info shape); the provider revalidates
+        # through get_info, which refreshes these maps from the venue.
+        if self._market_by_id:
+            return
+        if self._metadata_cache is not None:
+            self._apply_market_rows(self._metadata_cache.load() or [])
+        if not self._market_by_id:
+            await self._refresh_markets()
+
     async def check_connection(self) -> dict[str, Any]:
         await self._ensure_clients()
         assert self._signer is not None
         check_error = self._signer.check_client()
-        await self._refresh_markets()
+        await self._ensure_markets()
         return {
             "ok": check_error is None,
             "error": check_error,
@@ -285,8 +324,7 @@ class LighterSdkBackend:
 
     async def get_orderbook(self, market: str, limit: int = 20) -> dict[str, Any]:
         await self._ensure_clients()
-        if not self._market_by_id:
-            await self._refresh_markets()
+        await self._ensure_markets()
         assert self._order_api is not None
         order_api = cast(Any, self._order_api)
 
@@ -305,6 +343,78 @@ class LighterSdkBackend:
             "asks": data.get("asks", []),
         }
 
+    @staticmethod
+    def _ts_ms(value: Any) -> int:
+        # Lighter reports trade timestamps in seconds on some endpoints and
+        # milliseconds on others.
+        ts = int(value or 0)
+        return ts * 1000 if 0 < ts < 10_000_000_000 else ts
+
+    async def get_trades(
+        self,
+        market: str,
+        start_at_ms: int | None = None,
+        end_at_ms: int | None = None,
+        page_size: int | None = None,
+    ) -> dict[str, Any]:
+        await self._ensure_clients()
+        await self._ensure_markets()
+        assert self._order_api is not None
+        order_api = cast(Any, self._order_api)
+
+        meta = self._resolve_market(market)
+        limit = min(max(1, int(page_size or 100)), 100)
+        kwargs: dict[str, Any] = {}
+        if start_at_ms is not None:
+            kwargs["var_from"] = int(start_at_ms)
+        payload = await self._with_rate_limit_retries(
+            lambda: order_api.trades(
+                sort_by="timestamp",
+                sort_dir="asc",
+                limit=limit,
+                market_id=meta.market_id,
+                **kwargs,
+            )
+        )
+        rows = payload.model_dump().get("trades", [])
+        for row in rows:
+            row["timestamp"] = self._ts_ms(row.get("timestamp"))
+
+        if start_at_ms is not None:
+            rows = [r for r in rows if r["timestamp"] >= start_at_ms]
+        if end_at_ms is not None:
+            rows = [r for r in rows if r["timestamp"] <= end_at_ms]
+
+        return {"market": meta.symbol, "market_id": meta.market_id, "results": rows}
+
+    async def get_candles(
+        self,
+        market: str,
+        resolution: str,
+        start_at_ms: int,
+        end_at_ms: int,
+        count_back: int = 500,
+    ) -> dict[str, Any]:
+        await self._ensure_clients()
+        await self._ensure_markets()
+        assert self._candlestick_api is not None
+        candlestick_api = cast(Any, self._candlestick_api)
+
+        meta = self._resolve_market(market)
+        payload = await self._with_rate_limit_retries(
+            lambda: candlestick_api.candlesticks(
+                market_id=meta.market_id,
+                resolution=resolution,
+                start_timestamp=int(start_at_ms),
+                end_timestamp=int(end_at_ms),
+                count_back=max(1, int(count_back)),
+            )
+        )
+        rows = payload.model_dump().get("candlesticks", [])
+        for row in rows:
+            row["timestamp"] = self._ts_ms(row.get("timestamp"))
+        return {"market": meta.symbol, "market_id": meta.market_id, "results": rows}
+
     def _resolve_market(self, market: str | None) -> _MarketMeta:
         if not self._market_by_id:
             raise RuntimeError("Lighter markets not loaded")
@@ -351,8 +461,7 @@ class LighterSdkBackend:
         _signature_timestamp_ms: int | None,
     ) -> dict[str, Any]:
         await self._ensure_clients()
-        if not self._market_by_id:
-            await self._refresh_markets()
+        await self._ensure_markets()
 
         meta = self._resolve_market(market)
         assert self._signer is not None and self._lighter is not None
@@ -360,6 +469,9 @@ class LighterSdkBackend:
         base_amount, price_int = self._order_ints(meta, size=size, price=price)
         is_ask = side.upper() == "SELL"
         coi = self._client_order_index(client_id)
+        if self.client_id_store is not None and str(coi) != client_id:
+            self.client_id_store.put(client_id, coi)
+        self._remember_order_market(("client", str(client_id)), meta.market_id)
 
         order_type_upper = order_type.upper()
         if order_type_upper == "MARKET":
@@ -452,33 +564,144 @@ class LighterSdkBackend:
         return active, inactive
 
     async def get_open_orders(self, market: str | None = None) -> list[dict[str, Any]]:
-        if not self._market_by_id:
-            await self._refresh_markets()
+        await self._ensure_markets()
         market_id = self._resolve_market(market).market_id if market is not None else None
         active, _ = await self._fetch_order_lists(market_id)
         return active
 
-    async def get_order_by_client_id(self, client_id: str) -> dict[str, Any]:
-        if not self._market_by_id:
-            await self._refresh_markets()
-        for market_id in self._market_by_id:
-            active, inactive = await self._fetch_order_lists(market_id)
-            for order in active + inactive:
-                if self._matches_client_id(order, client_id):
+    @staticmethod
+    def _is_terminal_status(status: Any) -> bool:
+        text = str(status or "").lower()
+        return text.startswith(("filled", "cancel", "expired", "rejected"))
+
+    def _remember_order_market(self, key: tuple[str, str], market_id: int) -> None:
+        self._order_markets[key] = market_id
+        self._order_markets.move_to_end(key)
+        if len(self._order_markets) > self._MAX_ORDER_MARKETS:
+            self._order_markets.popitem(last=False)
+
+    def _remember_orders(self, orders: list[dict[str, Any]]) -> None:
+        # Live rows can change at any moment, so only their market is kept
+        for order in orders:
+            keys = [
+                (kind, str(order[field]))
+                for kind, field in (
+                    ("client", "client_order_index"),
+                    ("client", "client_order_id"),
+                    ("order", "order_index"),
+                    ("order", "order_id"),
+                )
+                if order.get(field) not in (None, "")
+            ]
+            terminal = self._is_terminal_status(order.get("status"))
+            market_id = order.get("market_index")
+            for key in keys:
+                if terminal:
+                    self._order_lookup_cache.put(key, order)
+                elif market_id is not None:
+                    self._remember_order_market(key, int(market_id))
+
+    async def _fetch_active_orders(self, market_id: int) -> list[dict[str, Any]]:
+        await self._ensure_clients()
+        assert self._order_api is not None
+        order_api = cast(Any, self._order_api)
+        auth = await self._auth_token()
+        payload = await self._with_rate_limit_retries(
+            lambda: order_api.account_active_orders(
+                account_index=self._account_index,
+                market_id=market_id,
+                auth=auth,
+            )
+        )
+        return payload.model_dump().get("orders", [])
+
+    async def _iter_inactive_order_pages(self, max_pages: int):
+        await self._ensure_clients()
+        assert self._order_api is not None
+        order_api = cast(Any, self._order_api)
+        auth = await self._auth_token()
+        cursor: str | None = None
+        for _ in range(max_pages):
+            kwargs: dict[str, Any] = {"cursor": cursor} if cursor else {}
+            payload = await self._with_rate_limit_retries(
+                lambda: order_api.account_inactive_orders(
+                    account_index=self._account_index,
+                    limit=100,
+                    auth=auth,
+                    **kwargs,
+                )
+            )
+            data = payload.model_dump()
+            rows = data.get("orders") or []
+            yield rows
+            cursor = data.get("next_cursor")
+            if not rows or not cursor:
+                return
+
+    async def _find_order(
+        self,
+        matches: Callable[[dict[str, Any]], bool],
+        market_hint: int | None = None,
+    ) -> dict[str, Any] | None:
+        """
+        Search active orders (hinted market first), then recent inactive pages.
+
+        Returns at the first match. Rows fetched on the way are remembered
+        (terminal rows whole, live rows by market), so follow-up lookups in
+        the same pass cost at most one small request.
+        """
+        await self._ensure_markets()
+        markets = list(self._market_by_id)
+        first = [market_hint] if market_hint in self._market_by_id else markets
+        for market_id in first:
+            rows = await self._fetch_active_orders(market_id)
+            self._remember_orders(rows)
+            for order in rows:
+                if matches(order):
+                    return order
+        async for rows in self._iter_inactive_order_pages(self._LOOKUP_MAX_INACTIVE_PAGES):
+            self._remember_orders(rows)
+            for order in rows:
+                if matches(order):
+                    return order
+        for market_id in markets:
+            if market_id in first:
+                continue
+            rows = await self._fetch_active_orders(market_id)
+            self._remember_orders(rows)
+            for order in rows:
+                if matches(order):
                     return order
-        raise RuntimeError(f"Order not found for client_id={client_id}")
+        return None
+
+    async def get_order_by_client_id(self, client_id: str) -> dict[str, Any]:
+        market_hint = None
+        for candidate in (str(client_id), str(self._client_order_index(client_id))):
+            cached = self._order_lookup_cache.get(("client", candidate))
+            if cached is not None:
+                return cached
+            if market_hint is None:
+                market_hint = self._order_markets.get(("client", candidate))
+        order = await self._find_order(
+            lambda o: self._matches_client_id(o, client_id),
+            market_hint=market_hint,
+        )
+        if order is None:
+            raise RuntimeError(f"Order not found for client_id={client_id}")
+        return order
 
     async def get_order_by_id(self, order_id: str) -> dict[str, Any]:
-        if not self._market_by_id:
-            await self._refresh_markets()
-        for market_id in self._market_by_id:
-            active, inactive = await self._fetch_order_lists(market_id)
-            for order in active + inactive:
-                if str(order.get("order_index")) == str(order_id) or str(
-                    order.get("order_id")
-                ) == str(order_id):
-                    return order
-        raise RuntimeError(f"Order not found for order_id={order_id}")
+        cached = self._order_lookup_cache.get(("order", str(order_id)))
+        if cached is not None:
+            return cached
+        order = await self._find_order(
+            lambda o: str(o.get("order_index")) == str(order_id)
+            or str(o.get("order_id")) == str(order_id),
+            market_hint=self._order_markets.get(("order", str(order_id))),
+        )
+        if order is None:
+            raise RuntimeError(f"Order not found for order_id={order_id}")
+        return order
 
     async def get_orders_history(
         self,
@@ -488,8 +711,7 @@ class LighterSdkBackend:
         end_at_ms: int | None,
         page_size: int | None,
     ) -> dict[str, Any]:
-        if not self._market_by_id:
-            await self._refresh_markets()
+        await self._ensure_markets()
         market_id = self._resolve_market(market).market_id if market is not None else None
         _, inactive = await self._fetch_order_lists(market_id)
 
@@ -515,8 +737,7 @@ class LighterSdkBackend:
         page_size: int | None,
     ) -> dict[str, Any]:
         await self._ensure_clients()
-        if not self._market_by_id:
-            await self._refresh_markets()
+        await self._ensure_markets()
 
         assert self._order_api is not None
         order_api = cast(Any, self._order_api)
@@ -576,8 +797,7 @@ class LighterSdkBackend:
     ) -> dict[str, Any]:
         del side, _signature_timestamp_ms
         await self._ensure_clients()
-        if not self._market_by_id:
-            await self._refresh_markets()
+        await self._ensure_markets()
 
         meta = self._resolve_market(market)
         assert self._signer is not None
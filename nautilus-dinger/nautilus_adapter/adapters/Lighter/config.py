@@ -1,3 +1,4 @@
+from nautilus_trader.common.config import NonNegativeFloat
 from nautilus_trader.common.config import PositiveInt
 from nautilus_trader.config import LiveDataClientConfig
 from nautilus_trader.config import LiveExecClientConfig
@@ -39,6 +40,38 @@ class LighterDataClientConfig(LiveDataClientConfig, frozen=True):
         The interval (minutes) between reloading instruments from the venue.
     max_requests_per_second : PositiveInt, default 10
         The maximum number of requests per second (rate limit).
+    use_instrument_cache : bool, default False
+        If instruments are warm-started from the on-disk market metadata cache
+        and revalidated against the venue in the background.
+    instrument_cache_dir : str, optional
+        The directory for the market metadata cache.
+        If ``None`` then will use ``$NAUTILUS_ADAPTER_CACHE_DIR/instruments``
+        or ``~/.cache/nautilus_adapter/instruments``.
+    use_historical_cache : bool, default True
+        If historical trade and bar request results are persisted to a local
+        Parquet catalog, so repeated requests are served from disk.
+    historical_cache_dir : str, optional
+        The root directory for the historical data catalog.
+        If ``None`` then will use ``$NAUTILUS_ADAPTER_CACHE_DIR/catalog``
+        or ``~/.cache/nautilus_adapter/catalog``.
+    historical_page_span_mins : PositiveInt, default 60
+        The span (minutes) of each concurrently fetched window when a
+        historical request range is split up.
+    historical_max_concurrency : PositiveInt, default 4
+        The maximum number of historical page requests in flight; request
+        starts are also spaced by ``max_requests_per_second``.
+    quote_throttle_ms : PositiveInt, optional
+        The minimum interval (milliseconds) between quotes derived from the
+        book for each instrument; a ``throttle_ms`` subscription param
+        overrides it per instrument. If ``None`` then every top-of-book change
+        is published.
+    record_ws_tape : bool, default False
+        If raw public WebSocket messages are recorded, with receive timestamps,
+        to a compressed JSONL tape for offline replay.
+    ws_tape_dir : str, optional
+        The directory for recorded tapes.
+        If ``None`` then will use ``$NAUTILUS_ADAPTER_CACHE_DIR/tapes``
+        or ``~/.cache/nautilus_adapter/tapes``.
 
     """
 
@@ -55,6 +88,15 @@ class LighterDataClientConfig(LiveDataClientConfig, frozen=True):
     retry_delay_max_ms: PositiveInt | None = 5_000
     update_instruments_interval_mins: PositiveInt | None = 60
     max_requests_per_second: PositiveInt = 10
+    use_instrument_cache: bool = False
+    instrument_cache_dir: str | None = None
+    use_historical_cache: bool = True
+    historical_cache_dir: str | None = None
+    historical_page_span_mins: PositiveInt = 60
+    historical_max_concurrency: PositiveInt = 4
+    quote_throttle_ms: PositiveInt | None = None
+    record_ws_tape: bool = False
+    ws_tape_dir: str | None = None
 
 
 class LighterExecClientConfig(LiveExecClientConfig, frozen=True):
@@ -73,6 +115,37 @@ class LighterExecClientConfig(LiveExecClientConfig, frozen=True):
         The base URL for WebSocket API.
     is_testnet : bool, default False
         If the client is connecting to the testnet (devnet) environment.
+    use_instrument_cache : bool, default False
+        If instruments are warm-started from the on-disk market metadata cache
+        and revalidated against the venue in the background.
+    instrument_cache_dir : str, optional
+        The directory for the market metadata cache.
+        If ``None`` then will use ``$NAUTILUS_ADAPTER_CACHE_DIR/instruments``
+        or ``~/.cache/nautilus_adapter/instruments``.
+    account_poll_interval_secs : PositiveInt, optional, default 60
+        The interval (seconds) of the safety-net account state poll; stream
+        events trigger refreshes in between. If ``None`` then no poll runs.
+    account_state_min_change : NonNegativeFloat, default 0.01
+        The minimum absolute change in any balance or margin value before a new
+        account state is published.
+    use_client_id_store : bool, default True
+        If the mapping from hashed ``client_order_index`` values back to
+        Nautilus client order ids is persisted, so reports after a restart
+        resolve to the original orders.
+    client_id_store_dir : str, optional
+        The directory for the client order id mapping log.
+        If ``None`` then will use ``$NAUTILUS_ADAPTER_CACHE_DIR/client_orders``
+        or ``~/.cache/nautilus_adapter/client_orders``.
+    client_id_store_max_entries : PositiveInt, default 100_000
+        The maximum number of mappings kept (least recently used evicted).
+    latency_log_interval_secs : PositiveInt, optional, default 300
+        The interval (seconds) between order lifecycle latency summary log
+        lines. If ``None`` then no summary is logged.
+    metrics_port : PositiveInt, optional
+        The local port of the HTTP metrics endpoint (``/metrics`` in Prometheus
+        text format, ``/metrics.json``). If ``None`` then no endpoint is started.
+    metrics_host : str, default "127.0.0.1"
+        The interface the metrics endpoint binds to.
 
     """
 
@@ -89,3 +162,13 @@ class LighterExecClientConfig(LiveExecClientConfig, frozen=True):
     retry_delay_max_ms: PositiveInt | None = 5_000
     reconciliation_lookback_mins: PositiveInt | None = 120
     reconciliation_page_size: PositiveInt = 100
+    use_instrument_cache: bool = False
+    instrument_cache_dir: str | None = None
+    account_poll_interval_secs: PositiveInt | None = 60
+    account_state_min_change: NonNegativeFloat = 0.01
+    use_client_id_store: bool = True
+    client_id_store_dir: str | None = None
+    client_id_store_max_entries: PositiveInt = 100_000
+    latency_log_interval_secs: PositiveInt | None = 300
+    metrics_port: PositiveInt | None = None
+    metrics_host: str = "127.0.0.1"
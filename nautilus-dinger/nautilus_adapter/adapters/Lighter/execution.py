@@ -43,12 +43,19 @@ from nautilus_trader.model.objects import Money
 from nautilus_trader.model.objects import Price
 from nautilus_trader.model.objects import Quantity
 
+from ...common.account_state import AccountSnapshot, AccountStateFilter
+from ...common.latency import ensure_metrics_server
+from ...common.latency import latency_recorder
+from ...common.report_fastpath import InstrumentPrecisions, ReportMemo, first_of
 from .constants import REST_URL_MAINNET
 from .constants import REST_URL_TESTNET
 from .constants import WS_URL_PRIVATE
 
 
 class LighterExecutionClient(LiveExecutionClient):
+    _order_venue_id = staticmethod(first_of("order_index", "order_id"))
+    _order_market = staticmethod(first_of("market_index", "market_id"))
+
     def __init__(
         self,
         loop: asyncio.AbstractEventLoop,
@@ -93,6 +100,24 @@ class LighterExecutionClient(LiveExecutionClient):
             getattr(config, "reconciliation_page_size", 100) if config is not None else 100
         )
         self._reconciliation_page_size = max(1, min(int(configured_page_size), 200))
+        self._precisions = InstrumentPrecisions(self._cache)
+        self._order_report_memo = ReportMemo()
+        poll_secs = getattr(config, "account_poll_interval_secs", 60) if config else 60
+        self._account_poll_interval_secs: int | None = int(poll_secs) if poll_secs else None
+        min_change = getattr(config, "account_state_min_change", 0.01) if config else 0.01
+        self._account_filter = AccountStateFilter(Decimal(str(min_change)))
+        self._account_refresh_debounce_secs = 0.25
+        self._account_refresh_pending = False
+        self._account_refresh_task: asyncio.Task[Any] | None = None
+        self._account_poll_task: asyncio.Task[Any] | None = None
+        self._latency = latency_recorder(venue.value)
+        log_secs = getattr(config, "latency_log_interval_secs", 300) if config else 300
+        self._latency_log_interval_secs: int | None = int(log_secs) if log_secs else None
+        self._latency_log_task: asyncio.Task[Any] | None = None
+        self._revalidate_task: asyncio.Task[Any] | None = None
+        self._metrics_host: str = getattr(config, "metrics_host", None) or "127.0.0.1"
+        self._metrics_port: int | None = getattr(config, "metrics_port", None)
+        self._client_id_store = getattr(client, "client_id_store", None)
         self._set_account_id(AccountId(f"{venue.value}-001"))
 
     def _require_client(self) -> Any:
@@ -103,10 +128,11 @@ class LighterExecutionClient(LiveExecutionClient):
     async def _call_client(self, method_name: str, *args: Any, **kwargs: Any) -> Any:
         client = self._require_client()
         method = getattr(client, method_name)
-        result = method(*args, **kwargs)
-        if asyncio.iscoroutine(result):
-            return await result
-        return result
+        with self._latency.time(method_name):
+            result = method(*args, **kwargs)
+            if asyncio.iscoroutine(result):
+                return await result
+            return result
 
     @staticmethod
     def _ns_from_ms(value: Any) -> int:
@@ -231,58 +257,93 @@ class LighterExecutionClient(LiveExecutionClient):
         if not probe.get("ok", False):
             raise RuntimeError(str(probe.get("error") or "Unknown Lighter connection error"))
 
-        await self._instrument_provider.load_all_async()
+        if self._instrument_provider.load_cached():
+            self._revalidate_task = self.create_task(self._revalidate_instruments())
+        else:
+            await self._instrument_provider.load_all_async()
         for instrument in self._instrument_provider.get_all().values():
             self._cache.add_instrument(instrument)
         for currency in self._instrument_provider.currencies().values():
             self._cache.add_currency(currency)
-        await self._update_account_state()
+        await self._update_account_state(initial=True)
         await self._await_account_registered()
+        if self._account_poll_interval_secs:
+            self._account_poll_task = self.create_task(
+                self._account_poll_loop(self._account_poll_interval_secs),
+            )
+        await self._start_latency_reporting()
+
+    async def _revalidate_instruments(self) -> None:
+        try:
+            updated = await self._instrument_provider.refresh_async()
+        except Exception as e:
+            self._log.warning(f"Lighter instrument revalidation failed: {e}")
+            return
+        for instrument in updated:
+            self._cache.add_instrument(instrument)
+        if updated:
+            self._precisions.invalidate()
+            self._order_report_memo.clear()
+            self._log.info(f"Revalidated {len(updated)} changed Lighter instrument(s)")
+
+    def _account_snapshot_from_payload(self, snapshot: dict[str, Any]) -> AccountSnapshot:
+        collateral = self._parse_decimal(snapshot.get("collateral"))
+        available = self._parse_decimal(snapshot.get("available_balance"))
+        total_asset = self._parse_decimal(snapshot.get("total_asset_value"), collateral)
+
+        total_balance = total_asset if total_asset > Decimal("0") else collateral
+        free_balance = available
+        locked_balance = max(total_balance - free_balance, Decimal("0"))
 
-    async def _update_account_state(self) -> None:
-        currency = Currency.from_str("USD")
-        total_balance = Decimal("0")
-        free_balance = Decimal("0")
-        locked_balance = Decimal("0")
         initial_margin = Decimal("0")
+        positions = snapshot.get("positions") or []
+        for pos in positions:
+            initial_margin += self._parse_decimal(pos.get("allocated_margin"))
+
+        return AccountSnapshot(
+            total=total_balance,
+            free=free_balance,
+            locked=locked_balance,
+            initial_margin=initial_margin,
+        )
 
+    async def _update_account_state(self, initial: bool = False) -> None:
         try:
             snapshot = await self._call_client("get_account_state")
-            collateral = self._parse_decimal(snapshot.get("collateral"))
-            available = self._parse_decimal(snapshot.get("available_balance"))
-            total_asset = self._parse_decimal(snapshot.get("total_asset_value"), collateral)
-
-            total_balance = total_asset if total_asset > Decimal("0") else collateral
-            free_balance = available
-            locked_balance = max(total_balance - free_balance, Decimal("0"))
-
-            positions = snapshot.get("positions") or []
-            for pos in positions:
-                initial_margin += self._parse_decimal(pos.get("allocated_margin"))
+            account = self._account_snapshot_from_payload(snapshot)
         except Exception as e:
+            if not initial:
+                # Keep the last published state; the next event or poll retries.
+                self._log.debug(f"Lighter account state refresh failed: {e}")
+                return
             self._log.warning(
                 f"Failed to fetch live Lighter account snapshot, falling back to zero balances: {e}",
                 LogColor.YELLOW,
             )
+            zero = Decimal("0")
+            account = AccountSnapshot(total=zero, free=zero, locked=zero, initial_margin=zero)
 
-        total_money = Money(total_balance, currency)
-        free_money = Money(free_balance, currency)
-        locked_money = Money(locked_balance, currency)
-        initial_margin_money = Money(initial_margin, currency)
-        maintenance_margin_money = Money(Decimal("0"), currency)
+        self._publish_account_state(account, force=initial)
 
+    def _publish_account_state(self, account: AccountSnapshot, force: bool = False) -> None:
+        if force:
+            self._account_filter.reset()
+        if not self._account_filter.should_publish(account):
+            return
+
+        currency = Currency.from_str("USD")
         self.generate_account_state(
             balances=[
                 AccountBalance(
-                    total=total_money,
-                    locked=locked_money,
-                    free=free_money,
+                    total=Money(account.total, currency),
+                    locked=Money(account.locked, currency),
+                    free=Money(account.free, currency),
                 ),
             ],
             margins=[
                 MarginBalance(
-                    initial=initial_margin_money,
-                    maintenance=maintenance_margin_money,
+                    initial=Money(account.initial_margin, currency),
+                    maintenance=Money(account.maintenance_margin, currency),
                     instrument_id=None,
                 ),
             ],
@@ -290,8 +351,64 @@ class LighterExecutionClient(LiveExecutionClient):
             ts_event=self._clock.timestamp_ns(),
         )
 
+    def _request_account_refresh(self) -> None:
+        # Bursts of fills/order events collapse into one REST refresh.
+        self._account_refresh_pending = True
+        task = self._account_refresh_task
+        if task is None or task.done():
+            self._account_refresh_task = self.create_task(self._debounced_account_refresh())
+
+    async def _debounced_account_refresh(self) -> None:
+        # Requests arriving during a refresh are served by one more pass
+        while self._account_refresh_pending:
+            await asyncio.sleep(self._account_refresh_debounce_secs)
+            self._account_refresh_pending = False
+            await self._update_account_state()
+
+    async def _account_poll_loop(self, interval_secs: int) -> None:
+        try:
+            while True:
+                await asyncio.sleep(interval_secs)
+                await self._update_account_state()
+        except asyncio.CancelledError:
+            self._log.debug("Canceled task 'account_poll'")
+
+    async def _start_latency_reporting(self) -> None:
+        if self._metrics_port:
+            try:
+                await ensure_metrics_server(self._metrics_host, self._metrics_port)
+            except OSError as e:
+                self._log.warning(f"Metrics endpoint failed to start: {e}")
+        if self._latency_log_interval_secs and self._latency_log_task is None:
+            self._latency_log_task = self.create_task(
+                self._latency_log_loop(self._latency_log_interval_secs),
+            )
+
+    async def _latency_log_loop(self, interval_secs: int) -> None:
+        try:
+            while True:
+                await asyncio.sleep(interval_secs)
+                summary = self._latency.summary()
+                if summary is not None:
+                    self._log.info(summary)
+        except asyncio.CancelledError:
+            self._log.debug("Canceled task 'latency_log'")
+
     async def _disconnect(self) -> None:
         self._log.info("Disconnecting from Lighter execution...", LogColor.BLUE)
+        if self._account_poll_task is not None:
+            self._account_poll_task.cancel()
+            self._account_poll_task = None
+        if self._latency_log_task is not None:
+            self._latency_log_task.cancel()
+            self._latency_log_task = None
+        if self._revalidate_task is not None:
+            self._revalidate_task.cancel()
+            self._revalidate_task = None
+        if self._account_refresh_task is not None:
+            self._account_refresh_task.cancel()
+            self._account_refresh_task = None
+        self._account_refresh_pending = False
         client = self._client
         if client is not None and hasattr(client, "close"):
             typed_client: Any = client
@@ -351,6 +468,7 @@ class LighterExecutionClient(LiveExecutionClient):
             client_order_id=order.client_order_id,
             ts_event=self._clock.timestamp_ns(),
         )
+        self._latency.order_submitted(client_order_id, self._clock.timestamp_ns())
 
         try:
             result = await self._call_client(
@@ -378,6 +496,8 @@ class LighterExecutionClient(LiveExecutionClient):
                 venue_order_id=VenueOrderId(str(venue_id)),
                 ts_event=self._clock.timestamp_ns(),
             )
+            self._latency.order_accepted(client_order_id, self._clock.timestamp_ns())
+            self._request_account_refresh()
         except Exception as e:
             self.generate_order_rejected(
                 strategy_id=strategy_id,
@@ -386,9 +506,11 @@ class LighterExecutionClient(LiveExecutionClient):
                 reason=str(e),
                 ts_event=self._clock.timestamp_ns(),
             )
+            self._latency.order_rejected(client_order_id)
 
     async def _cancel_order(self, command: CancelOrder) -> None:
         self._log.info(f"Canceling order {command.client_order_id}", LogColor.BLUE)
+        self._latency.cancel_requested(command.client_order_id.value, self._clock.timestamp_ns())
 
         def _is_not_found_error(exc: Exception) -> bool:
             message = str(exc).upper()
@@ -424,6 +546,8 @@ class LighterExecutionClient(LiveExecutionClient):
                 venue_order_id=command.venue_order_id,
                 ts_event=self._clock.timestamp_ns(),
             )
+            self._latency.order_canceled(command.client_order_id.value, self._clock.timestamp_ns())
+            self._request_account_refresh()
         except Exception as e:
             if _is_not_found_error(e):
                 self.generate_order_canceled(
@@ -433,6 +557,10 @@ class LighterExecutionClient(LiveExecutionClient):
                     venue_order_id=command.venue_order_id,
                     ts_event=self._clock.timestamp_ns(),
                 )
+                self._latency.order_canceled(
+                    command.client_order_id.value,
+                    self._clock.timestamp_ns(),
+                )
                 return
 
             self.generate_order_cancel_rejected(
@@ -443,6 +571,7 @@ class LighterExecutionClient(LiveExecutionClient):
                 reason=str(e),
                 ts_event=self._clock.timestamp_ns(),
             )
+            self._latency.cancel_rejected(command.client_order_id.value)
 
     async def _cancel_all_orders(self, command: CancelAllOrders) -> None:
         instrument_id = getattr(command, "instrument_id", None)
@@ -480,6 +609,7 @@ class LighterExecutionClient(LiveExecutionClient):
             await self._cancel_order(cancel_command)
 
     async def _modify_order(self, command: ModifyOrder) -> None:
+        self._latency.modify_requested(command.client_order_id.value, self._clock.timestamp_ns())
         client = self._require_client()
         if not hasattr(client, "modify_order"):
             self.generate_order_modify_rejected(
@@ -490,6 +620,7 @@ class LighterExecutionClient(LiveExecutionClient):
                 reason="Modify order is not available in current Lighter client build",
                 ts_event=self._clock.timestamp_ns(),
             )
+            self._latency.modify_rejected(command.client_order_id.value)
             return
 
         def _is_order_not_open_error(exc: Exception) -> bool:
@@ -598,6 +729,7 @@ class LighterExecutionClient(LiveExecutionClient):
                 ts_event=self._clock.timestamp_ns(),
                 venue_order_id_modified=venue_order_id_modified,
             )
+            self._latency.order_updated(command.client_order_id.value, self._clock.timestamp_ns())
         except Exception as e:
             self.generate_order_modify_rejected(
                 strategy_id=command.strategy_id,
@@ -607,6 +739,7 @@ class LighterExecutionClient(LiveExecutionClient):
                 reason=str(e),
                 ts_event=self._clock.timestamp_ns(),
             )
+            self._latency.modify_rejected(command.client_order_id.value)
 
     async def _batch_cancel_orders(self, command: BatchCancelOrders) -> None:
         for cancel_command in command.cancels:
@@ -624,14 +757,49 @@ class LighterExecutionClient(LiveExecutionClient):
                 order=order,
             )
 
+    def _client_order_id_from_venue(self, value: Any) -> ClientOrderId | None:
+        # Venue rows carry the (possibly hashed) integer client_order_index
+        if value in (None, ""):
+            return None
+        if self._client_id_store is not None:
+            try:
+                mapped = self._client_id_store.client_order_id_for(int(value))
+            except (TypeError, ValueError):
+                mapped = None
+            if mapped is not None:
+                return ClientOrderId(mapped)
+        try:
+            return ClientOrderId(str(value))
+        except Exception:
+            return None
+
     def _build_order_status_report_from_venue(
-        self, venue_order: dict[str, Any]
+        self,
+        venue_order: dict[str, Any],
+        instrument_id: InstrumentId | None = None,
     ) -> OrderStatusReport | None:
-        order_id = venue_order.get("order_index") or venue_order.get("order_id")
-        market_id = venue_order.get("market_index") or venue_order.get("market_id")
-        instrument_id = self._instrument_id_from_market(
-            str(market_id) if market_id is not None else None
-        )
+        parsed = self._parse_venue_order(venue_order, instrument_id)
+        if parsed is None:
+            return None
+        return self._order_status_report(*parsed)
+
+    def _parse_venue_order(
+        self,
+        venue_order: dict[str, Any],
+        instrument_id: InstrumentId | None = None,
+    ) -> tuple[Any, dict[str, Any]] | None:
+        """
+        Parse the venue-side fields of an order report.
+
+        Returns the venue's client order index and the report fields that
+        depend only on the row, so they can be reused while it is unchanged.
+        """
+        order_id = self._order_venue_id(venue_order)
+        if instrument_id is None:
+            market_id = self._order_market(venue_order)
+            instrument_id = self._instrument_id_from_market(
+                str(market_id) if market_id is not None else None
+            )
         if not order_id or instrument_id is None:
             return None
 
@@ -642,37 +810,26 @@ class LighterExecutionClient(LiveExecutionClient):
             venue_order.get("remaining_base_amount") or venue_order.get("remaining_size"), size
         )
         filled = size - remaining if size >= remaining else Decimal("0")
-        venue_status = self._map_order_status_from_venue(venue_order)
-
-        client_order_id = venue_order.get("client_order_index") or venue_order.get(
-            "client_order_id"
-        )
-        cached_order = None
-        if client_order_id is not None:
-            try:
-                cached_order = self._cache.order(ClientOrderId(str(client_order_id)))
-            except Exception:
-                cached_order = None
-
-        if cached_order is None:
-            try:
-                cache_client_id = self._cache.client_order_id(VenueOrderId(str(order_id)))
-                if cache_client_id is not None:
-                    cached_order = self._cache.order(cache_client_id)
-            except Exception:
-                cached_order = None
 
         try:
-            qty = Quantity.from_str(str(size))
-            filled_qty = Quantity.from_str(str(filled))
+            qty = self._precisions.quantity(instrument_id, size)
+            filled_qty = self._precisions.quantity(instrument_id, filled)
         except Exception:
             return None
 
         price_val = venue_order.get("price")
         trigger_val = venue_order.get("trigger_price")
         avg_fill_val = venue_order.get("avg_fill_price")
-        price = Price.from_str(str(price_val)) if price_val not in (None, "") else None
-        trigger_price = Price.from_str(str(trigger_val)) if trigger_val not in (None, "") else None
+        price = (
+            self._precisions.price(instrument_id, price_val)
+            if price_val not in (None, "")
+            else None
+        )
+        trigger_price = (
+            self._precisions.price(instrument_id, trigger_val)
+            if trigger_val not in (None, "")
+            else None
+        )
         trigger_type = (
             self._map_trigger_type(venue_order.get("trigger_type"))
             if trigger_price is not None
@@ -680,47 +837,90 @@ class LighterExecutionClient(LiveExecutionClient):
         )
         avg_px = self._parse_decimal(avg_fill_val) if avg_fill_val not in (None, "") else None
 
-        ts_init = (
+        ts_accepted = (
             self._ns_from_ms(venue_order.get("created_at") or venue_order.get("timestamp"))
             or self._clock.timestamp_ns()
         )
         ts_last = (
             self._ns_from_ms(venue_order.get("updated_at") or venue_order.get("timestamp"))
-            or ts_init
+            or ts_accepted
         )
 
-        report_client_order_id = cached_order.client_order_id if cached_order is not None else None
-        if report_client_order_id is None and client_order_id is not None:
+        client_order_index = venue_order.get("client_order_index") or venue_order.get("client_order_id")
+        return client_order_index, {
+            "instrument_id": instrument_id,
+            "venue_order_id": VenueOrderId(str(order_id)),
+            "order_side": self._map_order_side("SELL" if venue_order.get("is_ask") else "BUY"),
+            "order_type": self._map_order_type_from_venue(venue_order.get("type")),
+            "time_in_force": self._map_tif(venue_order.get("time_in_force")),
+            "order_status": self._map_order_status_from_venue(venue_order),
+            "quantity": qty,
+            "filled_qty": filled_qty,
+            "ts_accepted": ts_accepted,
+            "ts_last": ts_last,
+            "price": price,
+            "trigger_price": trigger_price,
+            "trigger_type": trigger_type,
+            "avg_px": avg_px,
+            "reduce_only": bool(venue_order.get("reduce_only", False)),
+            "cancel_reason": venue_order.get("status")
+            if "cancel" in str(venue_order.get("status", "")).lower()
+            else None,
+        }
+
+    def _order_status_report(self, client_order_index: Any, fields: dict[str, Any]) -> OrderStatusReport:
+        """
+        Build a report from parsed venue fields, resolving the order against the cache now.
+        """
+        client_order_id = self._client_order_id_from_venue(client_order_index)
+        cached_order = None
+        if client_order_id is not None:
+            try:
+                cached_order = self._cache.order(client_order_id)
+            except Exception:
+                cached_order = None
+
+        if cached_order is None:
             try:
-                report_client_order_id = ClientOrderId(str(client_order_id))
+                cache_client_id = self._cache.client_order_id(fields["venue_order_id"])
+                if cache_client_id is not None:
+                    cached_order = self._cache.order(cache_client_id)
             except Exception:
-                report_client_order_id = None
+                cached_order = None
 
         return OrderStatusReport(
             account_id=self.account_id,
-            instrument_id=instrument_id,
-            venue_order_id=VenueOrderId(str(order_id)),
-            order_side=self._map_order_side("SELL" if venue_order.get("is_ask") else "BUY"),
-            order_type=self._map_order_type_from_venue(venue_order.get("type")),
-            time_in_force=self._map_tif(venue_order.get("time_in_force")),
-            order_status=venue_status,
-            quantity=qty,
-            filled_qty=filled_qty,
+            client_order_id=(
+                cached_order.client_order_id if cached_order is not None else client_order_id
+            ),
             report_id=UUID4(),
-            ts_accepted=ts_init,
-            ts_last=ts_last,
-            ts_init=ts_init,
-            client_order_id=report_client_order_id,
-            price=price,
-            trigger_price=trigger_price,
-            trigger_type=trigger_type,
-            avg_px=avg_px,
-            reduce_only=bool(venue_order.get("reduce_only", False)),
-            cancel_reason=venue_order.get("status")
-            if "cancel" in str(venue_order.get("status", "")).lower()
-            else None,
+            ts_init=self._clock.timestamp_ns(),
+            **fields,
         )
 
+    def _build_order_status_reports(
+        self,
+        venue_orders: dict[str, dict[str, Any]],
+    ) -> list[OrderStatusReport]:
+        # Markets repeat across rows: resolve each once per batch. Rows equal to
+        # the ones seen on the previous reconcile reuse their parsed fields; the
+        # client order id and report identity are resolved afresh every time.
+        instrument_ids: dict[str, InstrumentId | None] = {}
+        reports: list[OrderStatusReport] = []
+        for key, venue_order in venue_orders.items():
+            parsed = self._order_report_memo.get(key, venue_order)
+            if parsed is None:
+                market = self._order_market(venue_order)
+                market_key = str(market) if market is not None else ""
+                if market_key not in instrument_ids:
+                    instrument_ids[market_key] = self._instrument_id_from_market(market_key or None)
+                parsed = self._parse_venue_order(venue_order, instrument_ids[market_key])
+                if parsed is None:
+                    continue
+                self._order_report_memo.put(key, venue_order, parsed)
+            reports.append(self._order_status_report(*parsed))
+        return reports
+
     async def _fetch_open_orders(self, market: str | None) -> list[dict[str, Any]]:
         payload = await self._call_client("get_open_orders", market)
         if isinstance(payload, list):
@@ -794,10 +994,7 @@ class LighterExecutionClient(LiveExecutionClient):
                 dedup[key] = item
 
         reports: list[OrderStatusReport] = []
-        for venue_order in dedup.values():
-            report = self._build_order_status_report_from_venue(venue_order)
-            if report is None:
-                continue
+        for report in self._build_order_status_reports(dedup):
             if instrument_id is not None and report.instrument_id != instrument_id:
                 continue
             reports.append(report)
@@ -858,6 +1055,8 @@ class LighterExecutionClient(LiveExecutionClient):
             end_at_ms,
             self._reconciliation_page_size,
         )
+        # Fills pair with the local ack time, so time them on the local clock too
+        received_ns = self._clock.timestamp_ns()
         rows = payload.get("results", []) if isinstance(payload, dict) else []
 
         reports: list[FillReport] = []
@@ -914,13 +1113,14 @@ class LighterExecutionClient(LiveExecutionClient):
                         report_id=UUID4(),
                         ts_event=ts_event,
                         ts_init=ts_event,
-                        client_order_id=ClientOrderId(str(client_id_value))
-                        if client_id_value is not None
-                        else None,
+                        client_order_id=self._client_order_id_from_venue(client_id_value),
                     ),
                 )
             except Exception:
                 continue
+        for report in reports:
+            if report.client_order_id is not None:
+                self._latency.order_filled(report.client_order_id.value, received_ns)
         return reports
 
     async def generate_position_status_reports(self, command) -> list[PositionStatusReport]:
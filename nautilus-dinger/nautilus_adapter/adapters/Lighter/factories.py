@@ -1,5 +1,6 @@
 import asyncio
 import os
+from pathlib import Path
 
 from nautilus_trader.cache.cache import Cache
 from nautilus_trader.common.component import LiveClock, MessageBus
@@ -9,6 +10,9 @@ from nautilus_trader.live.execution_client import LiveExecutionClient
 from nautilus_trader.live.factories import LiveDataClientFactory, LiveExecClientFactory
 from nautilus_trader.model.identifiers import ClientId
 
+from ...common.client_id_map import ClientOrderIdStore
+from ...common.client_id_map import default_store_dir
+from ...common.instrument_cache import MarketMetadataCache
 from .backend import LighterSdkBackend
 from .config import LighterDataClientConfig, LighterExecClientConfig
 from .constants import REST_URL_MAINNET, REST_URL_TESTNET, VENUE
@@ -17,7 +21,10 @@ from .execution import LighterExecutionClient
 from .providers import LighterInstrumentProvider
 
 
-def _build_lighter_backend(config: object) -> LighterSdkBackend | None:
+def _build_lighter_backend(
+    config: object,
+    metadata_cache: MarketMetadataCache | None = None,
+) -> LighterSdkBackend | None:
     is_testnet = bool(getattr(config, "is_testnet", False))
     base_url = getattr(config, "base_url_http", None) or (
         REST_URL_TESTNET if is_testnet else REST_URL_MAINNET
@@ -39,6 +46,34 @@ def _build_lighter_backend(config: object) -> LighterSdkBackend | None:
         account_index=int(account_index),
         api_key_index=int(api_key_index),
         api_key_private_key=str(api_private_key),
+        metadata_cache=metadata_cache,
+        client_id_store=_build_lighter_client_id_store(config, int(account_index)),
+    )
+
+
+def _build_lighter_client_id_store(
+    config: object,
+    account_index: int,
+) -> ClientOrderIdStore | None:
+    if not getattr(config, "use_client_id_store", False):
+        return None
+    environment = "testnet" if bool(getattr(config, "is_testnet", False)) else "mainnet"
+    store_dir = getattr(config, "client_id_store_dir", None)
+    directory = Path(store_dir).expanduser() if store_dir else default_store_dir()
+    return ClientOrderIdStore(
+        directory / f"{VENUE.value.lower()}-{environment}-{account_index}.log",
+        max_entries=getattr(config, "client_id_store_max_entries", 100_000),
+    )
+
+
+def _build_lighter_metadata_cache(config: object) -> MarketMetadataCache | None:
+    if not getattr(config, "use_instrument_cache", False):
+        return None
+    environment = "testnet" if bool(getattr(config, "is_testnet", False)) else "mainnet"
+    return MarketMetadataCache(
+        VENUE.value,
+        environment,
+        getattr(config, "instrument_cache_dir", None),
     )
 
 
@@ -55,8 +90,12 @@ class LighterLiveDataClientFactory(LiveDataClientFactory):
         typed_config = (
             config if isinstance(config, LighterDataClientConfig) else LighterDataClientConfig()
         )
-        backend_client = _build_lighter_backend(typed_config)
-        instrument_provider = LighterInstrumentProvider(client=backend_client)
+        metadata_cache = _build_lighter_metadata_cache(typed_config)
+        backend_client = _build_lighter_backend(typed_config, metadata_cache)
+        instrument_provider = LighterInstrumentProvider(
+            client=backend_client,
+            metadata_cache=metadata_cache,
+        )
 
         return LighterDataClient(
             loop=loop,
@@ -86,8 +125,12 @@ class LighterLiveExecClientFactory(LiveExecClientFactory):
         typed_config = (
             config if isinstance(config, LighterExecClientConfig) else LighterExecClientConfig()
         )
-        backend_client = _build_lighter_backend(typed_config)
-        instrument_provider = LighterInstrumentProvider(client=backend_client)
+        metadata_cache = _build_lighter_metadata_cache(typed_config)
+        backend_client = _build_lighter_backend(typed_config, metadata_cache)
+        instrument_provider = LighterInstrumentProvider(
+            client=backend_client,
+            metadata_cache=metadata_cache,
+        )
 
         return LighterExecutionClient(
             loop=loop,
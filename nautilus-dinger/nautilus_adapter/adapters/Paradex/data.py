@@ -1,4 +1,5 @@
 import asyncio
+import json
 from typing import Any
 
 from nautilus_trader.common.component import MessageBus
@@ -6,11 +7,29 @@ from nautilus_trader.cache.cache import Cache
 from nautilus_trader.common.component import LiveClock
 from nautilus_trader.common.providers import InstrumentProvider
 from nautilus_trader.config import NautilusConfig
+from nautilus_trader.core.datetime import dt_to_unix_nanos
 from nautilus_trader.live.data_client import LiveMarketDataClient
-from nautilus_trader.model.identifiers import ClientId, Venue
+from nautilus_trader.model.data import Bar, QuoteTick, TradeTick, capsule_to_data
+from nautilus_trader.model.enums import AggressorSide, PriceType
+from nautilus_trader.model.identifiers import ClientId, InstrumentId, TradeId, Venue
+from nautilus_trader.model.instruments import Instrument
 from nautilus_trader.data.messages import SubscribeTradeTicks, SubscribeQuoteTicks, SubscribeOrderBook
+from nautilus_trader.data.messages import RequestBars, RequestQuoteTicks, RequestTradeTicks
+from nautilus_trader.data.messages import UnsubscribeOrderBook, UnsubscribeQuoteTicks
+from nautilus_trader.data.messages import UnsubscribeTradeTicks
 from nautilus_trader.common.enums import LogColor
 
+from ...common.historical import DEFAULT_SETTLE_NS
+from ...common.historical import HistoricalDataCache
+from ...common.historical import RequestBudget
+from ...common.historical import aggregate_trade_bars
+from ...common.historical import fetch_range
+from ...common.historical import load_cached_range
+from ...common.ingest_queue import CoalescingIngestQueue
+from ...common.report_fastpath import InstrumentPrecisions
+from ...common.top_of_book import QuoteFilter
+from ...common.top_of_book import Top
+from ...common.ws_tape import WsTapeRecorder
 from .constants import WS_URL_PUBLIC
 
 
@@ -20,8 +39,13 @@ class ParadexDataClient(LiveMarketDataClient):
 
     Connects to the Paradex WebSocket feed for real-time market data
     including orderbook updates, trade executions, and ticker data.
+
+    Live payloads are parsed by the native WebSocket client, which hands over
+    batches of ready ``TradeTick``/``QuoteTick``/``OrderBookDeltas`` objects.
     """
 
+    _TRADES_PAGE_SIZE = 1_000
+
     def __init__(
         self,
         loop: asyncio.AbstractEventLoop,
@@ -33,6 +57,7 @@ class ParadexDataClient(LiveMarketDataClient):
         clock: LiveClock,
         instrument_provider: InstrumentProvider,
         config: NautilusConfig | None = None,
+        ws_client: object | None = None,
     ):
         super().__init__(
             loop=loop,
@@ -46,7 +71,44 @@ class ParadexDataClient(LiveMarketDataClient):
         )
         self._client = client
         self._websocket_url = getattr(config, "base_url_ws", None) or WS_URL_PUBLIC
+        self._ws_client = ws_client
         self._ws = None
+        self._ws_queue: CoalescingIngestQueue | None = None
+        self._update_instruments_interval_mins: int | None = getattr(
+            config,
+            "update_instruments_interval_mins",
+            None,
+        )
+        self._update_instruments_task: asyncio.Task | None = None
+        self._revalidate_task: asyncio.Task | None = None
+        self._precisions = InstrumentPrecisions(cache)
+        self._historical_page_span_ms = (
+            getattr(config, "historical_page_span_mins", None) or 60
+        ) * 60_000
+        self._historical_budget = RequestBudget(
+            getattr(config, "max_requests_per_second", None) or 10,
+            getattr(config, "historical_max_concurrency", None) or 4,
+        )
+        self._book_ts_event: dict[InstrumentId, int] = {}
+        # Replayed on the native client after a reconnect, which starts it afresh
+        self._trade_subscriptions: set[InstrumentId] = set()
+        self._quote_subscriptions: set[InstrumentId] = set()
+        self._book_subscriptions: set[InstrumentId] = set()
+        self._quote_filter = QuoteFilter(
+            (getattr(config, "quote_throttle_ms", None) or 0) * 1_000_000,
+        )
+        self._quote_flush_handles: dict[InstrumentId, asyncio.TimerHandle] = {}
+        self._environment = "testnet" if getattr(config, "is_testnet", False) else "mainnet"
+        self._historical_cache: HistoricalDataCache | None = None
+        if getattr(config, "use_historical_cache", False):
+            self._historical_cache = HistoricalDataCache.for_venue(
+                venue.value,
+                self._environment,
+                getattr(config, "historical_cache_dir", None),
+            )
+        self._record_ws_tape = bool(getattr(config, "record_ws_tape", False))
+        self._ws_tape_dir: str | None = getattr(config, "ws_tape_dir", None)
+        self._ws_tape: WsTapeRecorder | None = None
 
     async def _connect(self) -> None:
         """
@@ -56,10 +118,52 @@ class ParadexDataClient(LiveMarketDataClient):
         if self._client is None:
             raise RuntimeError("Paradex data client backend is not configured")
 
-        await self._instrument_provider.load_all_async()
-        self._send_all_instruments_to_data_engine()
+        if self._instrument_provider.load_cached():
+            # Warm start: trade on cached metadata, revalidate against the venue
+            self._log.info(f"Loaded {self._instrument_provider.count} instrument(s) from cache")
+            self._send_all_instruments_to_data_engine()
+            self._revalidate_task = self.create_task(self._revalidate_instruments())
+        else:
+            await self._instrument_provider.load_all_async()
+            self._send_all_instruments_to_data_engine()
 
-        self._ws = self._client
+        if self._update_instruments_interval_mins:
+            self._update_instruments_task = self.create_task(
+                self._update_instruments(self._update_instruments_interval_mins),
+            )
+
+        if self._record_ws_tape and self._ws_tape is None:
+            self._ws_tape = WsTapeRecorder.for_venue(
+                self.venue.value,
+                self._environment,
+                "public",
+                self._ws_tape_dir,
+            )
+            self._log.info(f"Recording public WS tape to {self._ws_tape.path}")
+
+        ws: Any = self._ws_client
+        if ws is None:
+            self._log.warning("Paradex native WebSocket client unavailable: no live market data")
+            return
+        self._register_ws_instruments(self._instrument_provider.get_all().values())
+        self._ws_queue = CoalescingIngestQueue(self._loop, self._publish_ws_data)
+        ws.set_data_callback(self._on_ws_batch)
+        # Frames are parsed natively, so the tape is fed from there too
+        ws.set_frame_callback(self._record_ws_frame if self._ws_tape is not None else None)
+        self._ws = ws
+        await self._resubscribe()
+
+    async def _resubscribe(self) -> None:
+        """
+        Restore the channels that were subscribed before the last disconnect.
+        """
+        for method, instrument_ids in (
+            ("subscribe_trades", self._trade_subscriptions),
+            ("subscribe_bbo", self._quote_subscriptions),
+            ("subscribe_orderbook", self._book_subscriptions),
+        ):
+            for instrument_id in sorted(instrument_ids, key=str):
+                await self._ws_call(method, instrument_id.symbol.value)
 
     def _send_all_instruments_to_data_engine(self) -> None:
         for instrument in self._instrument_provider.get_all().values():
@@ -68,13 +172,87 @@ class ParadexDataClient(LiveMarketDataClient):
         for currency in self._instrument_provider.currencies().values():
             self._cache.add_currency(currency)
 
+    def _send_instruments_to_data_engine(self, instruments: list[Instrument]) -> None:
+        """
+        Publish only the given (added or changed) instruments.
+        """
+        for instrument in instruments:
+            self._cache.add_currency(instrument.base_currency)
+            self._cache.add_currency(instrument.quote_currency)
+            self._cache.add_currency(instrument.settlement_currency)
+            self._handle_data(instrument)
+        self._register_ws_instruments(instruments)
+
+    def _register_ws_instruments(self, instruments) -> None:
+        """
+        Give the native client the precisions it parses each market with.
+        """
+        ws: Any = self._ws_client
+        if ws is None:
+            return
+        for instrument in instruments:
+            ws.add_instrument(
+                instrument.id.symbol.value,
+                instrument.price_precision,
+                instrument.size_precision,
+            )
+
+    async def _update_instruments(self, interval_mins: int) -> None:
+        """
+        Periodically re-fetch markets and publish the ones that changed.
+        """
+        try:
+            while True:
+                self._log.debug(
+                    f"Scheduled task 'update_instruments' to run in {interval_mins} minutes",
+                )
+                await asyncio.sleep(interval_mins * 60)
+                await self._revalidate_instruments()
+        except asyncio.CancelledError:
+            self._log.debug("Canceled task 'update_instruments'")
+
+    async def _revalidate_instruments(self) -> None:
+        """
+        Re-fetch markets and publish only the instruments that changed.
+        """
+        try:
+            updated = await self._instrument_provider.refresh_async()
+        except Exception as e:
+            self._log.warning(f"Paradex instrument refresh failed: {e}")
+            return
+        if updated:
+            self._log.info(f"Refreshed {len(updated)} Paradex instrument(s)")
+            self._send_instruments_to_data_engine(updated)
+
     async def _disconnect(self) -> None:
         """
         Disconnect from the Paradex WebSocket feed.
         """
+        if self._update_instruments_task:
+            self._log.debug("Canceling task 'update_instruments'")
+            self._update_instruments_task.cancel()
+            self._update_instruments_task = None
+        if self._revalidate_task is not None:
+            self._log.debug("Canceling task 'revalidate_instruments'")
+            self._revalidate_task.cancel()
+            self._revalidate_task = None
+
+        for handle in self._quote_flush_handles.values():
+            handle.cancel()
+        self._quote_flush_handles.clear()
+        if self._ws_tape is not None:
+            self._ws_tape.close()
+            self._ws_tape = None
+
         if self._ws is not None:
             self._log.info("Disconnecting from Paradex WebSocket...", LogColor.BLUE)
+            ws: Any = self._ws
+            ws.set_frame_callback(None)
+            await self._loop.run_in_executor(None, ws.close)
         self._ws = None
+        if self._ws_queue is not None:
+            self._ws_queue.close()
+            self._ws_queue = None
 
     async def _request(self, request) -> None:
         """
@@ -82,6 +260,202 @@ class ParadexDataClient(LiveMarketDataClient):
         """
         self._log.debug(f"Ignoring unsupported request command: {request}")
 
+    def _request_range_ns(self, request, default_lookback_ns: int) -> tuple[int, int]:
+        """
+        Resolve a request's start/end to nanoseconds, clamping the end to now.
+        """
+        now_ns = self._clock.timestamp_ns()
+        end_ns = now_ns if request.end is None else min(dt_to_unix_nanos(request.end), now_ns)
+        if request.start is None:
+            return end_ns - default_lookback_ns, end_ns
+        return dt_to_unix_nanos(request.start), end_ns
+
+    async def _request_quote_ticks(self, request: RequestQuoteTicks) -> None:
+        """
+        Serve historical quotes from the local catalog only.
+
+        Paradex has no historical top-of-book endpoint.
+        """
+        start_ns, end_ns = self._request_range_ns(request, 3_600_000_000_000)
+        quotes = []
+        if self._historical_cache is not None:
+            quotes = self._historical_cache.read(
+                QuoteTick,
+                str(request.instrument_id),
+                start_ns,
+                end_ns,
+            )
+        if not quotes:
+            self._log.error("Cannot request historical quotes: not published by Paradex")
+            return
+        if request.limit:
+            quotes = quotes[-request.limit :]
+        self._handle_quote_ticks(
+            request.instrument_id,
+            quotes,
+            request.id,
+            request.start,
+            request.end,
+            request.params,
+        )
+
+    async def _request_trade_ticks(self, request: RequestTradeTicks) -> None:
+        """
+        Fetch historical trades, serving already-cached intervals from disk.
+        """
+        instrument_id = request.instrument_id
+        start_ns, end_ns = self._request_range_ns(request, 3_600_000_000_000)
+        try:
+            ticks = await self._load_trade_ticks(instrument_id, start_ns, end_ns)
+        except Exception as e:
+            self._log.error(f"Failed to request trades for {instrument_id}: {e}")
+            return
+        if request.limit:
+            ticks = ticks[-request.limit :]
+        self._handle_trade_ticks(
+            instrument_id,
+            ticks,
+            request.id,
+            request.start,
+            request.end,
+            request.params,
+        )
+
+    async def _load_trade_ticks(
+        self,
+        instrument_id: InstrumentId,
+        start_ns: int,
+        end_ns: int,
+    ) -> list[TradeTick]:
+        return await load_cached_range(
+            self._historical_cache,
+            TradeTick,
+            str(instrument_id),
+            start_ns,
+            end_ns,
+            self._clock.timestamp_ns() - DEFAULT_SETTLE_NS,
+            lambda s, e: self._fetch_trade_ticks(instrument_id, s, e),
+        )
+
+    async def _fetch_trade_ticks(
+        self,
+        instrument_id: InstrumentId,
+        start_ns: int,
+        end_ns: int,
+    ) -> list[TradeTick]:
+        """
+        Fetch trades for the range as concurrent, rate-budgeted pages.
+        """
+        typed_client: Any = self._client
+        market = instrument_id.symbol.value
+
+        async def fetch_page(start_ms: int, end_ms: int) -> list[dict]:
+            raw = await self._loop.run_in_executor(
+                None,
+                lambda: typed_client.get_trades(market, start_ms, end_ms, self._TRADES_PAGE_SIZE),
+            )
+            data = json.loads(raw) if isinstance(raw, str) else raw
+            return data.get("trades", []) if isinstance(data, dict) else []
+
+        rows = await fetch_range(
+            fetch_page,
+            start_ns // 1_000_000,
+            end_ns // 1_000_000,
+            lambda row: int(row.get("timestamp") or 0) or None,
+            self._historical_budget,
+            self._TRADES_PAGE_SIZE,
+            self._historical_page_span_ms,
+            # The trades endpoint returns the newest page_size trades in range
+            newest_first=True,
+        )
+
+        ticks: list[TradeTick] = []
+        last_ts = 0
+        seq = 0
+        for row in rows:
+            try:
+                ts_event = int(row["timestamp"]) * 1_000_000
+                # Venue trades carry no id; number trades within a millisecond
+                seq = seq + 1 if ts_event == last_ts else 0
+                last_ts = ts_event
+                side = str(row.get("side") or "").upper()
+                if side == "BUY":
+                    aggressor_side = AggressorSide.BUYER
+                elif side == "SELL":
+                    aggressor_side = AggressorSide.SELLER
+                else:
+                    aggressor_side = AggressorSide.NO_AGGRESSOR
+                trade_id_val = row.get("trade_id") or row.get("id") or f"{ts_event}-{seq}"
+                ticks.append(
+                    TradeTick(
+                        instrument_id=instrument_id,
+                        price=self._precisions.price(instrument_id, row["price"]),
+                        size=self._precisions.quantity(instrument_id, row["size"]),
+                        aggressor_side=aggressor_side,
+                        trade_id=TradeId(str(trade_id_val)),
+                        ts_event=ts_event,
+                        ts_init=ts_event,
+                    ),
+                )
+            except Exception as exc:
+                self._log.debug(f"Historical trade parse skipped: {exc} ({row})")
+        return ticks
+
+    async def _request_bars(self, request: RequestBars) -> None:
+        """
+        Build historical time bars from the trade history.
+        """
+        bar_type = request.bar_type
+        if (
+            bar_type.is_internally_aggregated()
+            or not bar_type.spec.is_time_aggregated()
+            or bar_type.spec.price_type != PriceType.LAST
+        ):
+            self._log.error(
+                f"Cannot request {bar_type} bars: "
+                "only EXTERNAL time bars of LAST price are available from Paradex",
+            )
+            return
+
+        step_ns = int(bar_type.spec.timedelta.total_seconds() * 1_000_000_000)
+        start_ns, end_ns = self._request_range_ns(request, (request.limit or 1_000) * step_ns)
+        instrument_id = bar_type.instrument_id
+
+        async def fetch(s: int, e: int) -> list[Bar]:
+            # Trades for every interval closing inside [s, e]
+            first_open = s - step_ns - s % step_ns
+            last_open = e - step_ns - e % step_ns
+            trades = await self._load_trade_ticks(
+                instrument_id,
+                first_open,
+                last_open + step_ns - 1,
+            )
+            return aggregate_trade_bars(bar_type, trades, step_ns)
+
+        try:
+            bars = await load_cached_range(
+                self._historical_cache,
+                Bar,
+                str(bar_type),
+                start_ns,
+                end_ns,
+                self._clock.timestamp_ns() - DEFAULT_SETTLE_NS,
+                fetch,
+            )
+        except Exception as e:
+            self._log.error(f"Failed to request {bar_type} bars: {e}")
+            return
+        if request.limit:
+            bars = bars[-request.limit :]
+        self._handle_bars(
+            bar_type,
+            bars,
+            request.id,
+            request.start,
+            request.end,
+            request.params,
+        )
+
     async def _subscribe(self, command) -> None:
         """
         Handle generic subscription logic.
@@ -94,17 +468,44 @@ class ParadexDataClient(LiveMarketDataClient):
         """
         symbol = command.instrument_id.symbol.value
         self._log.info(f"Subscribing to trades for {symbol}", LogColor.BLUE)
-        client = self._client
-        if client is not None and hasattr(client, "subscribe_trades"):
-            typed_client: Any = client
-            await self._loop.run_in_executor(None, lambda: typed_client.subscribe_trades(symbol))
+        self._trade_subscriptions.add(command.instrument_id)
+        await self._ws_call("subscribe_trades", symbol)
+
+    async def _unsubscribe_trade_ticks(self, command: UnsubscribeTradeTicks) -> None:
+        """
+        Unsubscribe from the trades channel for a given instrument.
+        """
+        self._trade_subscriptions.discard(command.instrument_id)
+        await self._ws_call("unsubscribe_trades", command.instrument_id.symbol.value)
 
     async def _subscribe_quote_ticks(self, command: SubscribeQuoteTicks) -> None:
         """
-        Subscribe to the ticker channel for a given instrument.
+        Subscribe to the best bid/offer channel for a given instrument.
+
+        An optional ``throttle_ms`` subscription param caps the publish rate
+        for this instrument.
         """
-        symbol = command.instrument_id.symbol.value
+        instrument_id = command.instrument_id
+        symbol = instrument_id.symbol.value
         self._log.info(f"Subscribing to quotes for {symbol}", LogColor.BLUE)
+        throttle_ms = (command.params or {}).get("throttle_ms")
+        if throttle_ms is not None:
+            self._quote_filter.set_interval(instrument_id, int(throttle_ms) * 1_000_000)
+        self._quote_subscriptions.add(instrument_id)
+        await self._ws_call("subscribe_bbo", symbol)
+
+    async def _unsubscribe_quote_ticks(self, command: UnsubscribeQuoteTicks) -> None:
+        """
+        Stop publishing quotes for a given instrument.
+        """
+        instrument_id = command.instrument_id
+        await self._ws_call("unsubscribe_bbo", instrument_id.symbol.value)
+        self._quote_subscriptions.discard(instrument_id)
+        self._quote_filter.reset(instrument_id)
+        self._quote_filter.set_interval(instrument_id, None)
+        handle = self._quote_flush_handles.pop(instrument_id, None)
+        if handle is not None:
+            handle.cancel()
 
     async def _subscribe_order_book_deltas(self, command: SubscribeOrderBook) -> None:
         """
@@ -112,29 +513,109 @@ class ParadexDataClient(LiveMarketDataClient):
         """
         symbol = command.instrument_id.symbol.value
         self._log.info(f"Subscribing to orderbook for {symbol}", LogColor.BLUE)
-        client = self._client
-        if client is not None and hasattr(client, "subscribe_orderbook"):
-            typed_client: Any = client
-            await self._loop.run_in_executor(None, lambda: typed_client.subscribe_orderbook(symbol))
+        self._book_subscriptions.add(command.instrument_id)
+        await self._ws_call("subscribe_orderbook", symbol)
+
+    async def _unsubscribe_order_book_deltas(self, command: UnsubscribeOrderBook) -> None:
+        """
+        Stop publishing orderbook updates for a given instrument.
+        """
+        self._book_subscriptions.discard(command.instrument_id)
+        await self._ws_call("unsubscribe_orderbook", command.instrument_id.symbol.value)
+
+    async def _ws_call(self, method: str, symbol: str) -> None:
+        ws = self._ws
+        if ws is None:
+            self._log.warning(f"Cannot {method} for {symbol}: Paradex WebSocket not connected")
+            return
+        await self._loop.run_in_executor(None, getattr(ws, method), symbol)
 
-    async def _handle_ws_message(self, msg: dict) -> None:
+    def _on_ws_batch(self, batch: list) -> None:
         """
-        Process incoming WebSocket messages and dispatch to handlers.
+        Receive a batch of data capsules from the native client.
+
+        Runs on the backend thread: decode here and let the loop publish whole
+        batches. A quote still pending when a newer one arrives is replaced,
+        and takes the newer one's place so trades and book updates received in
+        between are still published first. Only quotes may be dropped when the
+        loop falls behind: a lost delta would silently corrupt the book.
         """
-        channel = msg.get("channel", "")
-        if channel == "trades":
-            self._handle_trade(msg)
-        elif channel == "orderbook":
-            self._handle_orderbook(msg)
+        queue = self._ws_queue
+        if queue is None:
+            return
+        for capsule in batch:
+            data = capsule_to_data(capsule)
+            if isinstance(data, QuoteTick):
+                queue.put(data, key=data.instrument_id, move_to_end=True)
+            else:
+                queue.put(data, lossless=True)
 
-    def _handle_trade(self, msg: dict) -> None:
+    def _record_ws_frame(self, ts_recv_ns: int, text: str) -> None:
         """
-        Parse a trade message and emit a TradeTick.
+        Append a raw frame from the native client to the tape (backend thread).
         """
-        self._log.debug(f"Trade message received: {msg}")
+        tape = self._ws_tape
+        if tape is not None:
+            tape.record("public", text, ts_recv_ns)
 
-    def _handle_orderbook(self, msg: dict) -> None:
+    def _publish_ws_data(self, items: list) -> None:
+        for data in items:
+            if isinstance(data, QuoteTick):
+                top = (
+                    data.bid_price.as_double(),
+                    data.bid_size.as_double(),
+                    data.ask_price.as_double(),
+                    data.ask_size.as_double(),
+                )
+                self._book_ts_event[data.instrument_id] = data.ts_event
+                self._publish_top_of_book(data.instrument_id, top, data.ts_event, data)
+            else:
+                self._handle_data(data)
+
+    def _publish_top_of_book(
+        self,
+        instrument_id: InstrumentId,
+        top: Top,
+        ts_event: int,
+        quote: QuoteTick | None = None,
+    ) -> None:
         """
-        Parse an orderbook message and emit OrderBookDeltas.
+        Publish a changed top of book now, or schedule it once throttling allows.
         """
-        self._log.debug(f"Orderbook message received: {msg}")
+        now_ns = self._clock.timestamp_ns()
+        if self._quote_filter.offer(instrument_id, top, now_ns):
+            self._handle_data(quote or self._build_quote(instrument_id, top, ts_event, now_ns))
+            return
+        due_in_ns = self._quote_filter.due_in_ns(instrument_id, now_ns)
+        if due_in_ns is not None and instrument_id not in self._quote_flush_handles:
+            self._quote_flush_handles[instrument_id] = self._loop.call_later(
+                due_in_ns / 1e9,
+                self._flush_quote,
+                instrument_id,
+            )
+
+    def _flush_quote(self, instrument_id: InstrumentId) -> None:
+        self._quote_flush_handles.pop(instrument_id, None)
+        now_ns = self._clock.timestamp_ns()
+        top = self._quote_filter.take_pending(instrument_id, now_ns)
+        if top is not None:
+            ts_event = self._book_ts_event.get(instrument_id, now_ns)
+            self._handle_data(self._build_quote(instrument_id, top, ts_event, now_ns))
+
+    def _build_quote(
+        self,
+        instrument_id: InstrumentId,
+        top: Top,
+        ts_event: int,
+        ts_init: int,
+    ) -> QuoteTick:
+        bid_price, bid_size, ask_price, ask_size = top
+        return QuoteTick(
+            instrument_id=instrument_id,
+            bid_price=self._precisions.price(instrument_id, bid_price),
+            ask_price=self._precisions.price(instrument_id, ask_price),
+            bid_size=self._precisions.quantity(instrument_id, bid_size),
+            ask_size=self._precisions.quantity(instrument_id, ask_size),
+            ts_event=ts_event,
+            ts_init=ts_init,
+        )
@@ -2,7 +2,7 @@ import asyncio
 import json
 from decimal import Decimal
 from datetime import datetime, timezone
-from typing import Any
+from typing import Any, Callable
 
 from nautilus_trader.common.component import MessageBus
 from nautilus_trader.cache.cache import Cache
@@ -42,6 +42,9 @@ from nautilus_trader.common.enums import LogColor
 from nautilus_trader.model.identifiers import VenueOrderId
 from nautilus_trader.core.uuid import UUID4
 
+from ...common.latency import ensure_metrics_server
+from ...common.latency import latency_recorder
+from ...common.report_fastpath import InstrumentPrecisions, ReportMemo, first_of
 from .constants import WS_URL_PRIVATE, REST_URL_MAINNET, REST_URL_TESTNET
 
 
@@ -53,6 +56,9 @@ class ParadexExecutionClient(LiveExecutionClient):
     via the Paradex REST API and WebSocket private feed.
     Orders are submitted as stark_ecdsa transactions via the /action endpoint.
     """
+    _order_venue_id = staticmethod(first_of("id"))
+    _order_market = staticmethod(first_of("market"))
+
 
     def __init__(
         self,
@@ -93,6 +99,15 @@ class ParadexExecutionClient(LiveExecutionClient):
         self._reconciliation_lookback_mins = int(configured_lookback) if configured_lookback is not None else 120
         configured_page_size = getattr(config, "reconciliation_page_size", 100) if config is not None else 100
         self._reconciliation_page_size = max(1, min(int(configured_page_size), 200))
+        self._precisions = InstrumentPrecisions(self._cache)
+        self._order_report_memo = ReportMemo()
+        self._latency = latency_recorder(venue.value)
+        log_secs = getattr(config, "latency_log_interval_secs", 300) if config else 300
+        self._latency_log_interval_secs: int | None = int(log_secs) if log_secs else None
+        self._latency_log_task: asyncio.Task[Any] | None = None
+        self._revalidate_task: asyncio.Task[Any] | None = None
+        self._metrics_host: str = getattr(config, "metrics_host", None) or "127.0.0.1"
+        self._metrics_port: int | None = getattr(config, "metrics_port", None)
         self._set_account_id(AccountId(f"{venue.value}-001"))
 
     def _require_client(self) -> Any:
@@ -100,6 +115,13 @@ class ParadexExecutionClient(LiveExecutionClient):
             raise RuntimeError("Paradex execution client backend is not configured")
         return self._client
 
+    async def _run_client(self, method_name: str, call: Callable[[], Any]) -> Any:
+        """
+        Run a blocking backend call in the executor, timing it per method.
+        """
+        with self._latency.time(method_name):
+            return await self._loop.run_in_executor(None, call)
+
     @staticmethod
     def _ns_from_ms(value: Any) -> int:
         try:
@@ -221,13 +243,33 @@ class ParadexExecutionClient(LiveExecutionClient):
         await self._loop.run_in_executor(None, _probe_connection)
         if hasattr(client, "set_account_id"):
             await self._loop.run_in_executor(None, lambda: client.set_account_id(str(self.account_id)))
-        await self._instrument_provider.load_all_async()
+        if self._instrument_provider.load_cached():
+            self._revalidate_task = self.create_task(self._revalidate_instruments())
+        else:
+            await self._instrument_provider.load_all_async()
         for instrument in self._instrument_provider.get_all().values():
             self._cache.add_instrument(instrument)
         for currency in self._instrument_provider.currencies().values():
             self._cache.add_currency(currency)
         await self._update_account_state()
         await self._await_account_registered()
+        await self._start_latency_reporting()
+
+    async def _revalidate_instruments(self) -> None:
+        """
+        Re-fetch markets after a warm start and swap in the ones that changed.
+        """
+        try:
+            updated = await self._instrument_provider.refresh_async()
+        except Exception as e:
+            self._log.warning(f"Paradex instrument revalidation failed: {e}")
+            return
+        for instrument in updated:
+            self._cache.add_instrument(instrument)
+        if updated:
+            self._precisions.invalidate()
+            self._order_report_memo.clear()
+            self._log.info(f"Revalidated {len(updated)} changed Paradex instrument(s)")
 
     async def _update_account_state(self) -> None:
         currency = Currency.from_str("USDC")
@@ -251,12 +293,41 @@ class ParadexExecutionClient(LiveExecutionClient):
             ts_event=self._clock.timestamp_ns(),
         )
 
+    async def _start_latency_reporting(self) -> None:
+        """
+        Start the shared metrics endpoint and the periodic latency summary log.
+        """
+        if self._metrics_port:
+            try:
+                await ensure_metrics_server(self._metrics_host, self._metrics_port)
+            except OSError as e:
+                self._log.warning(f"Metrics endpoint failed to start: {e}")
+        if self._latency_log_interval_secs and self._latency_log_task is None:
+            self._latency_log_task = self.create_task(
+                self._latency_log_loop(self._latency_log_interval_secs),
+            )
+
+    async def _latency_log_loop(self, interval_secs: int) -> None:
+        try:
+            while True:
+                await asyncio.sleep(interval_secs)
+                summary = self._latency.summary()
+                if summary is not None:
+                    self._log.info(summary)
+        except asyncio.CancelledError:
+            self._log.debug("Canceled task 'latency_log'")
+
     async def _disconnect(self) -> None:
         """
         Disconnect from the Paradex execution interface.
         """
         self._log.info("Disconnecting from Paradex execution...", LogColor.BLUE)
-        return None
+        if self._latency_log_task is not None:
+            self._latency_log_task.cancel()
+            self._latency_log_task = None
+        if self._revalidate_task is not None:
+            self._revalidate_task.cancel()
+            self._revalidate_task = None
 
     async def _submit_order(self, command: SubmitOrder) -> None:
         """
@@ -330,10 +401,11 @@ class ParadexExecutionClient(LiveExecutionClient):
             client_order_id=order.client_order_id,
             ts_event=ts_event,
         )
+        self._latency.order_submitted(client_order_id, self._clock.timestamp_ns())
 
         try:
-            result = await self._loop.run_in_executor(
-                None,
+            result = await self._run_client(
+                "submit_order",
                 lambda: client.submit_order(
                     instrument_id.symbol.value,
                     side,
@@ -366,6 +438,7 @@ class ParadexExecutionClient(LiveExecutionClient):
                     venue_order_id=venue_order_id,
                     ts_event=self._clock.timestamp_ns(),
                 )
+                self._latency.order_accepted(client_order_id, self._clock.timestamp_ns())
             else:
                 self.generate_order_rejected(
                     strategy_id=strategy_id,
@@ -374,6 +447,7 @@ class ParadexExecutionClient(LiveExecutionClient):
                     reason="Venue response missing order identifier",
                     ts_event=self._clock.timestamp_ns(),
                 )
+                self._latency.order_rejected(client_order_id)
         except Exception as e:
             self.generate_order_rejected(
                 strategy_id=strategy_id,
@@ -382,6 +456,7 @@ class ParadexExecutionClient(LiveExecutionClient):
                 reason=str(e),
                 ts_event=self._clock.timestamp_ns(),
             )
+            self._latency.order_rejected(client_order_id)
 
     async def _cancel_order(self, command: CancelOrder) -> None:
         """
@@ -391,6 +466,7 @@ class ParadexExecutionClient(LiveExecutionClient):
             f"Canceling order {command.client_order_id}",
             LogColor.BLUE,
         )
+        self._latency.cancel_requested(command.client_order_id.value, self._clock.timestamp_ns())
         client = self._require_client()
         market = command.instrument_id.symbol.value if command.instrument_id is not None else None
 
@@ -404,16 +480,16 @@ class ParadexExecutionClient(LiveExecutionClient):
 
         try:
             try:
-                await self._loop.run_in_executor(
-                    None,
+                await self._run_client(
+                    "cancel_order_by_client_id",
                     lambda: client.cancel_order_by_client_id(str(command.client_order_id), market),
                 )
             except Exception:
                 venue_order_id = str(command.venue_order_id) if command.venue_order_id is not None else None
                 if venue_order_id is None or not hasattr(client, "cancel_order"):
                     raise
-                await self._loop.run_in_executor(
-                    None,
+                await self._run_client(
+                    "cancel_order",
                     lambda: client.cancel_order(venue_order_id),
                 )
             self.generate_order_canceled(
@@ -423,6 +499,7 @@ class ParadexExecutionClient(LiveExecutionClient):
                 venue_order_id=command.venue_order_id,
                 ts_event=self._clock.timestamp_ns(),
             )
+            self._latency.order_canceled(command.client_order_id.value, self._clock.timestamp_ns())
         except Exception as e:
             if _is_not_found_error(e):
                 self._log.warning(
@@ -436,6 +513,10 @@ class ParadexExecutionClient(LiveExecutionClient):
                     venue_order_id=command.venue_order_id,
                     ts_event=self._clock.timestamp_ns(),
                 )
+                self._latency.order_canceled(
+                    command.client_order_id.value,
+                    self._clock.timestamp_ns(),
+                )
                 return
             self.generate_order_cancel_rejected(
                 strategy_id=command.strategy_id,
@@ -445,6 +526,7 @@ class ParadexExecutionClient(LiveExecutionClient):
                 reason=str(e),
                 ts_event=self._clock.timestamp_ns(),
             )
+            self._latency.cancel_rejected(command.client_order_id.value)
 
     async def _cancel_all_orders(self, command: CancelAllOrders) -> None:
         """
@@ -487,6 +569,7 @@ class ParadexExecutionClient(LiveExecutionClient):
             await self._cancel_order(cancel_command)
 
     async def _modify_order(self, command: ModifyOrder) -> None:
+        self._latency.modify_requested(command.client_order_id.value, self._clock.timestamp_ns())
         client = self._require_client()
         if not hasattr(client, "modify_order"):
             self.generate_order_modify_rejected(
@@ -497,6 +580,7 @@ class ParadexExecutionClient(LiveExecutionClient):
                 reason="Modify order is not available in Paradex client build",
                 ts_event=self._clock.timestamp_ns(),
             )
+            self._latency.modify_rejected(command.client_order_id.value)
             return
 
         def _is_order_not_open_error(exc: Exception) -> bool:
@@ -504,12 +588,17 @@ class ParadexExecutionClient(LiveExecutionClient):
             return "ORDER_IS_NOT_OPEN" in text or "CANNOT BE MODIFIED" in text
 
         try:
-            existing_raw = await self._loop.run_in_executor(
-                None,
-                lambda: client.get_order_by_id(str(command.venue_order_id))
-                if command.venue_order_id is not None
-                else client.get_order_by_client_id(str(command.client_order_id)),
-            )
+            # Labelled after the backend method actually called, as for cancels
+            if command.venue_order_id is not None:
+                existing_raw = await self._run_client(
+                    "get_order_by_id",
+                    lambda: client.get_order_by_id(str(command.venue_order_id)),
+                )
+            else:
+                existing_raw = await self._run_client(
+                    "get_order_by_client_id",
+                    lambda: client.get_order_by_client_id(str(command.client_order_id)),
+                )
             existing = json.loads(existing_raw) if isinstance(existing_raw, str) else existing_raw
             if not isinstance(existing, dict):
                 raise RuntimeError("Unexpected modify lookup payload")
@@ -561,20 +650,20 @@ class ParadexExecutionClient(LiveExecutionClient):
                 )
 
             try:
-                modified_raw = await self._loop.run_in_executor(None, _call_modify)
+                modified_raw = await self._run_client("modify_order", _call_modify)
             except Exception as first_error:
                 if not _is_order_not_open_error(first_error):
                     raise
 
-                latest_raw = await self._loop.run_in_executor(
-                    None,
+                latest_raw = await self._run_client(
+                    "get_order_by_id",
                     lambda: client.get_order_by_id(order_id),
                 )
                 latest = json.loads(latest_raw) if isinstance(latest_raw, str) else latest_raw
                 latest_status = str(latest.get("status", "")).upper() if isinstance(latest, dict) else ""
                 if latest_status in {"NEW", "UNTRIGGERED"}:
                     await asyncio.sleep(0.25)
-                    modified_raw = await self._loop.run_in_executor(None, _call_modify)
+                    modified_raw = await self._run_client("modify_order", _call_modify)
                 else:
                     raise
 
@@ -611,6 +700,7 @@ class ParadexExecutionClient(LiveExecutionClient):
                 ts_event=self._clock.timestamp_ns(),
                 venue_order_id_modified=venue_order_id_modified,
             )
+            self._latency.order_updated(command.client_order_id.value, self._clock.timestamp_ns())
         except Exception as e:
             self.generate_order_modify_rejected(
                 strategy_id=command.strategy_id,
@@ -620,6 +710,7 @@ class ParadexExecutionClient(LiveExecutionClient):
                 reason=str(e),
                 ts_event=self._clock.timestamp_ns(),
             )
+            self._latency.modify_rejected(command.client_order_id.value)
 
     async def _batch_cancel_orders(self, command: BatchCancelOrders) -> None:
         """
@@ -628,19 +719,87 @@ class ParadexExecutionClient(LiveExecutionClient):
         for cancel_command in command.cancels:
             await self._cancel_order(cancel_command)
 
-    def _build_order_status_report_from_venue(self, venue_order: dict[str, Any]) -> OrderStatusReport | None:
-        order_id = venue_order.get("id")
-        market = venue_order.get("market")
-        instrument_id = self._instrument_id_from_market(market)
+    def _build_order_status_report_from_venue(
+        self,
+        venue_order: dict[str, Any],
+        instrument_id: InstrumentId | None = None,
+    ) -> OrderStatusReport | None:
+        parsed = self._parse_venue_order(venue_order, instrument_id)
+        if parsed is None:
+            return None
+        return self._order_status_report(*parsed)
+
+    def _parse_venue_order(
+        self,
+        venue_order: dict[str, Any],
+        instrument_id: InstrumentId | None = None,
+    ) -> tuple[Any, dict[str, Any]] | None:
+        """
+        Parse the venue-side fields of an order report.
+
+        Returns the venue's client id and the report fields that depend only on
+        the row, so they can be reused while the row is unchanged.
+        """
+        order_id = self._order_venue_id(venue_order)
+        if instrument_id is None:
+            instrument_id = self._instrument_id_from_market(self._order_market(venue_order))
         if not order_id or instrument_id is None:
             return None
 
         size = self._parse_decimal(venue_order.get("size"))
         remaining = self._parse_decimal(venue_order.get("remaining_size"), size)
         filled = size - remaining if size >= remaining else Decimal("0")
-        venue_status = self._map_order_status_from_venue(venue_order)
 
-        client_order_id = venue_order.get("client_id")
+        try:
+            qty = self._precisions.quantity(instrument_id, size)
+            filled_qty = self._precisions.quantity(instrument_id, filled)
+        except Exception:
+            return None
+
+        price_val = venue_order.get("price")
+        trigger_val = venue_order.get("trigger_price")
+        avg_fill_val = venue_order.get("avg_fill_price")
+        price = (
+            self._precisions.price(instrument_id, price_val)
+            if price_val not in (None, "")
+            else None
+        )
+        trigger_price = (
+            self._precisions.price(instrument_id, trigger_val)
+            if trigger_val not in (None, "")
+            else None
+        )
+        trigger_type = self._map_trigger_type(venue_order.get("trigger_type")) if trigger_price is not None else TriggerType.NO_TRIGGER
+        avg_px = self._parse_decimal(avg_fill_val) if avg_fill_val not in (None, "") else None
+
+        ts_accepted = self._ns_from_ms(venue_order.get("created_at")) or self._clock.timestamp_ns()
+        ts_last = self._ns_from_ms(venue_order.get("last_updated_at")) or ts_accepted
+
+        return venue_order.get("client_id"), {
+            "instrument_id": instrument_id,
+            "venue_order_id": VenueOrderId(str(order_id)),
+            "order_side": self._map_order_side(venue_order.get("side")),
+            "order_type": self._map_order_type_from_venue(venue_order.get("type")),
+            "time_in_force": self._map_tif(venue_order.get("instruction")),
+            "order_status": self._map_order_status_from_venue(venue_order),
+            "quantity": qty,
+            "filled_qty": filled_qty,
+            "ts_accepted": ts_accepted,
+            "ts_last": ts_last,
+            "price": price,
+            "trigger_price": trigger_price,
+            "trigger_type": trigger_type,
+            "avg_px": avg_px,
+            "reduce_only": "REDUCE_ONLY" in [str(flag).upper() for flag in venue_order.get("flags", [])],
+            "cancel_reason": venue_order.get("cancel_reason"),
+        }
+
+    def _order_status_report(self, client_order_id: Any, fields: dict[str, Any]) -> OrderStatusReport:
+        """
+        Build a report from parsed venue fields, resolving the order against the cache now.
+        """
+        venue_order_id = fields["venue_order_id"]
+        venue_status = fields["order_status"]
         cached_order = None
         if client_order_id is not None:
             try:
@@ -649,7 +808,7 @@ class ParadexExecutionClient(LiveExecutionClient):
                 cached_order = None
         if cached_order is None:
             try:
-                cache_client_id = self._cache.client_order_id(VenueOrderId(str(order_id)))
+                cache_client_id = self._cache.client_order_id(venue_order_id)
                 if cache_client_id is not None:
                     cached_order = self._cache.order(cache_client_id)
             except Exception:
@@ -657,26 +816,9 @@ class ParadexExecutionClient(LiveExecutionClient):
 
         if cached_order is not None and cached_order.status != venue_status:
             self._log.warning(
-                f"Order status mismatch for {order_id}: cache={cached_order.status_string()} venue={venue_status.name}",
+                f"Order status mismatch for {venue_order_id}: cache={cached_order.status_string()} venue={venue_status.name}",
             )
 
-        try:
-            qty = Quantity.from_str(str(size))
-            filled_qty = Quantity.from_str(str(filled))
-        except Exception:
-            return None
-
-        price_val = venue_order.get("price")
-        trigger_val = venue_order.get("trigger_price")
-        avg_fill_val = venue_order.get("avg_fill_price")
-        price = Price.from_str(str(price_val)) if price_val not in (None, "") else None
-        trigger_price = Price.from_str(str(trigger_val)) if trigger_val not in (None, "") else None
-        trigger_type = self._map_trigger_type(venue_order.get("trigger_type")) if trigger_price is not None else TriggerType.NO_TRIGGER
-        avg_px = self._parse_decimal(avg_fill_val) if avg_fill_val not in (None, "") else None
-
-        ts_init = self._ns_from_ms(venue_order.get("created_at")) or self._clock.timestamp_ns()
-        ts_last = self._ns_from_ms(venue_order.get("last_updated_at")) or ts_init
-
         report_client_order_id = cached_order.client_order_id if cached_order is not None else None
         if report_client_order_id is not None:
             try:
@@ -691,27 +833,38 @@ class ParadexExecutionClient(LiveExecutionClient):
 
         return OrderStatusReport(
             account_id=self.account_id,
-            instrument_id=instrument_id,
-            venue_order_id=VenueOrderId(str(order_id)),
-            order_side=self._map_order_side(venue_order.get("side")),
-            order_type=self._map_order_type_from_venue(venue_order.get("type")),
-            time_in_force=self._map_tif(venue_order.get("instruction")),
-            order_status=venue_status,
-            quantity=qty,
-            filled_qty=filled_qty,
-            report_id=UUID4(),
-            ts_accepted=ts_init,
-            ts_last=ts_last,
-            ts_init=ts_init,
             client_order_id=report_client_order_id,
-            price=price,
-            trigger_price=trigger_price,
-            trigger_type=trigger_type,
-            avg_px=avg_px,
-            reduce_only="REDUCE_ONLY" in [str(flag).upper() for flag in venue_order.get("flags", [])],
-            cancel_reason=venue_order.get("cancel_reason"),
+            report_id=UUID4(),
+            ts_init=self._clock.timestamp_ns(),
+            **fields,
         )
 
+    def _build_order_status_reports(
+        self,
+        venue_orders: dict[str, dict[str, Any]],
+    ) -> list[OrderStatusReport]:
+        """
+        Convert deduplicated venue orders (keyed by order key) in one pass.
+        """
+        # Markets repeat across rows: resolve each once per batch. Rows equal to
+        # the ones seen on the previous reconcile reuse their parsed fields; the
+        # client order id and report identity are resolved afresh every time.
+        instrument_ids: dict[str, InstrumentId | None] = {}
+        reports: list[OrderStatusReport] = []
+        for key, venue_order in venue_orders.items():
+            parsed = self._order_report_memo.get(key, venue_order)
+            if parsed is None:
+                market = self._order_market(venue_order)
+                market_key = str(market) if market is not None else ""
+                if market_key not in instrument_ids:
+                    instrument_ids[market_key] = self._instrument_id_from_market(market_key or None)
+                parsed = self._parse_venue_order(venue_order, instrument_ids[market_key])
+                if parsed is None:
+                    continue
+                self._order_report_memo.put(key, venue_order, parsed)
+            reports.append(self._order_status_report(*parsed))
+        return reports
+
     async def _fetch_open_orders(self, market: str | None) -> list[dict[str, Any]]:
         client = self._require_client()
         if not hasattr(client, "get_open_orders"):
@@ -795,10 +948,7 @@ class ParadexExecutionClient(LiveExecutionClient):
                 dedup[key] = item
 
         reports: list[OrderStatusReport] = []
-        for venue_order in dedup.values():
-            report = self._build_order_status_report_from_venue(venue_order)
-            if report is None:
-                continue
+        for report in self._build_order_status_reports(dedup):
             if instrument_id is not None and report.instrument_id != instrument_id:
                 continue
             reports.append(report)
@@ -882,6 +1032,8 @@ class ParadexExecutionClient(LiveExecutionClient):
             None,
             lambda: client.get_fills(market, start_at_ms, end_at_ms, self._reconciliation_page_size),
         )
+        # Fills pair with the local ack time, so time them on the local clock too
+        received_ns = self._clock.timestamp_ns()
         data = json.loads(payload) if isinstance(payload, str) else payload
         venue_fills = data.get("results", []) if isinstance(data, dict) else []
 
@@ -946,6 +1098,9 @@ class ParadexExecutionClient(LiveExecutionClient):
             )
             reports.append(report)
 
+        for report in reports:
+            if report.client_order_id is not None:
+                self._latency.order_filled(report.client_order_id.value, received_ns)
         return reports
 
     async def generate_position_status_reports(self, command) -> list[PositionStatusReport]:
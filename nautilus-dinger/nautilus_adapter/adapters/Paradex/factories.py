@@ -2,6 +2,7 @@ import asyncio
 import importlib
 import os
 
+import nautilus_trader
 from nautilus_trader.cache.cache import Cache
 from nautilus_trader.common.component import LiveClock, MessageBus
 from nautilus_trader.live.factories import LiveDataClientFactory, LiveExecClientFactory
@@ -10,9 +11,10 @@ from nautilus_trader.live.execution_client import LiveExecutionClient
 from nautilus_trader.config import LiveDataClientConfig, LiveExecClientConfig
 from nautilus_trader.model.identifiers import ClientId
 
+from ...common.instrument_cache import MarketMetadataCache
 from .data import ParadexDataClient
 from .execution import ParadexExecutionClient
-from .constants import VENUE, REST_URL_MAINNET, REST_URL_TESTNET
+from .constants import VENUE, REST_URL_MAINNET, REST_URL_TESTNET, WS_URL_PUBLIC
 from .providers import ParadexInstrumentProvider
 
 
@@ -50,6 +52,43 @@ def _build_paradex_http_client(config: object) -> object | None:
     )
 
 
+def _check_nautilus_version(paradex_backend: object) -> None:
+    """
+    Refuse a native backend built against another nautilus_trader release.
+
+    Its market data arrives as capsules holding raw Rust structs, which only
+    the release it was built against can decode safely.
+    """
+    built_with = getattr(paradex_backend, "NAUTILUS_TRADER_VERSION", None)
+    if built_with != nautilus_trader.__version__:
+        raise RuntimeError(
+            f"Paradex native backend was built against nautilus_trader "
+            f"{built_with or '(unknown)'} but {nautilus_trader.__version__} is installed; "
+            "install the matching nautilus_trader release or rebuild the backend",
+        )
+
+
+def _build_paradex_ws_client(config: object) -> object | None:
+    try:
+        paradex_backend = importlib.import_module("paradex")
+    except Exception:
+        return None
+    _check_nautilus_version(paradex_backend)
+    url = getattr(config, "base_url_ws", None) or WS_URL_PUBLIC
+    return paradex_backend.PyParadexWebSocketClient(url)
+
+
+def _build_paradex_metadata_cache(config: object) -> MarketMetadataCache | None:
+    if not getattr(config, "use_instrument_cache", False):
+        return None
+    environment = "testnet" if bool(getattr(config, "is_testnet", False)) else "mainnet"
+    return MarketMetadataCache(
+        VENUE.value,
+        environment,
+        getattr(config, "instrument_cache_dir", None),
+    )
+
+
 class ParadexLiveDataClientFactory(LiveDataClientFactory):
     """
     Factory for creating Paradex live data client instances.
@@ -68,7 +107,11 @@ class ParadexLiveDataClientFactory(LiveDataClientFactory):
         Create a new ParadexDataClient instance.
         """
         backend_client = _build_paradex_http_client(config)
-        instrument_provider = ParadexInstrumentProvider(client=backend_client)
+        metadata_cache = _build_paradex_metadata_cache(config)
+        instrument_provider = ParadexInstrumentProvider(
+            client=backend_client,
+            metadata_cache=metadata_cache,
+        )
 
         return ParadexDataClient(
             loop=loop,
@@ -80,6 +123,7 @@ class ParadexLiveDataClientFactory(LiveDataClientFactory):
             clock=clock,
             instrument_provider=instrument_provider,
             config=config,
+            ws_client=_build_paradex_ws_client(config),
         )
 
 
@@ -103,7 +147,11 @@ class ParadexLiveExecClientFactory(LiveExecClientFactory):
         from nautilus_trader.model.enums import OmsType, AccountType
 
         backend_client = _build_paradex_http_client(config)
-        instrument_provider = ParadexInstrumentProvider(client=backend_client)
+        metadata_cache = _build_paradex_metadata_cache(config)
+        instrument_provider = ParadexInstrumentProvider(
+            client=backend_client,
+            metadata_cache=metadata_cache,
+        )
 
         return ParadexExecutionClient(
             loop=loop,
@@ -10,6 +10,7 @@ from nautilus_trader.model.identifiers import InstrumentId, Symbol
 from nautilus_trader.model.instruments import CryptoPerpetual, Instrument
 from nautilus_trader.model.objects import Currency, Price, Quantity
 
+from ...common.instrument_cache import MarketMetadataCache
 from .constants import REST_URL_MAINNET, VENUE
 
 
@@ -24,10 +25,16 @@ class ParadexInstrumentProvider(InstrumentProvider):
     - imf, mmf, cmf (margin factors)
     """
 
-    def __init__(self, client: object | None = None):
+    def __init__(
+        self,
+        client: object | None = None,
+        metadata_cache: MarketMetadataCache | None = None,
+    ):
         super().__init__(config=InstrumentProviderConfig(load_all=True))
         self._client = client
         self._base_url = REST_URL_MAINNET
+        self._fingerprints: dict[str, tuple] = {}
+        self._metadata_cache = metadata_cache
 
     def find(self, instrument_id: InstrumentId) -> Instrument | None:
         """
@@ -67,8 +74,24 @@ class ParadexInstrumentProvider(InstrumentProvider):
             info=market,
         )
 
-    async def load_all_async(self, filters: dict | None = None) -> None:
-        _ = filters
+    @staticmethod
+    def _market_fingerprint(market: dict) -> tuple:
+        """
+        Return the subset of a market payload that shapes its instrument.
+
+        Volatile fields (funding, open interest, margin factors) are excluded so
+        they never register as an instrument change.
+        """
+        return (
+            str(market.get("symbol")),
+            market.get("base_currency"),
+            market.get("quote_currency"),
+            market.get("settlement_currency"),
+            market.get("order_size_increment"),
+            market.get("price_tick_size"),
+        )
+
+    async def _fetch_markets(self) -> list[dict]:
         if self._client is None or not hasattr(self._client, "get_info"):
             raise RuntimeError("Paradex instrument provider client is not configured")
 
@@ -76,21 +99,88 @@ class ParadexInstrumentProvider(InstrumentProvider):
         raw_info = await loop.run_in_executor(None, self._client.get_info)
         parsed = json.loads(raw_info) if isinstance(raw_info, str) else raw_info
         markets = parsed.get("results", []) if isinstance(parsed, dict) else []
+        self._store_markets(markets)
+        return markets
+
+    def _add_market(self, market: dict) -> Instrument | None:
+        try:
+            instrument = self._build_instrument(market)
+            self.add_currency(instrument.base_currency)
+            self.add_currency(instrument.quote_currency)
+            self.add_currency(instrument.settlement_currency)
+            self.add(instrument)
+        except Exception as e:
+            self._log.warning(
+                f"Skipping invalid Paradex market payload: {market} ({e})",
+            )
+            return None
+
+        fingerprint = self._market_fingerprint(market)
+        self._fingerprints[fingerprint[0]] = fingerprint
+        return instrument
+
+    def _store_markets(self, markets: list[dict]) -> None:
+        """
+        Persist the raw market rows for the next warm start.
+        """
+        if self._metadata_cache is None or not markets:
+            return
+        try:
+            self._metadata_cache.save(markets)
+        except OSError as e:
+            self._log.warning(f"Failed to persist Paradex market metadata: {e}")
+
+    def load_cached(self) -> bool:
+        """
+        Build instruments from the on-disk market metadata cache, if any.
+
+        Returns ``False`` when there is no usable cache entry, in which case the
+        caller should ``load_all_async``; otherwise the caller is expected to
+        revalidate in the background with ``refresh_async``.
+        """
+        markets = self._metadata_cache.load() if self._metadata_cache is not None else None
+        if not markets:
+            return False
 
         self._instruments.clear()
         self._currencies.clear()
+        self._fingerprints.clear()
+
+        for market in markets:
+            self._add_market(market)
+        return self.count > 0
+
+    async def load_all_async(self, filters: dict | None = None) -> None:
+        _ = filters
+        markets = await self._fetch_markets()
+
+        self._instruments.clear()
+        self._currencies.clear()
+        self._fingerprints.clear()
+
+        for market in markets:
+            self._add_market(market)
+
+    async def refresh_async(self) -> list[Instrument]:
+        """
+        Re-fetch markets and rebuild only those whose tick/step sizes changed.
+
+        Returns the added or changed instruments; markets missing from the
+        response are kept.
+        """
+        markets = await self._fetch_markets()
 
+        updated: list[Instrument] = []
         for market in markets:
-            try:
-                instrument = self._build_instrument(market)
-                self.add_currency(instrument.base_currency)
-                self.add_currency(instrument.quote_currency)
-                self.add_currency(instrument.settlement_currency)
-                self.add(instrument)
-            except Exception as e:
-                self._log.warning(
-                    f"Skipping invalid Paradex market payload: {market} ({e})",
-                )
+            if not isinstance(market, dict):
+                continue
+            fingerprint = self._market_fingerprint(market)
+            if self._fingerprints.get(fingerprint[0]) == fingerprint:
+                continue
+            instrument = self._add_market(market)
+            if instrument is not None:
+                updated.append(instrument)
+        return updated
 
     async def load_ids_async(
         self,
@@ -8,10 +8,17 @@ from nautilus_trader.common.component import MessageBus
 from nautilus_trader.common.enums import LogColor
 from nautilus_trader.common.providers import InstrumentProvider
 from nautilus_trader.config import NautilusConfig
+from nautilus_trader.core.datetime import dt_to_unix_nanos
+from nautilus_trader.data.messages import RequestBars
+from nautilus_trader.data.messages import RequestQuoteTicks
+from nautilus_trader.data.messages import RequestTradeTicks
 from nautilus_trader.data.messages import SubscribeOrderBook
 from nautilus_trader.data.messages import SubscribeQuoteTicks
 from nautilus_trader.data.messages import SubscribeTradeTicks
+from nautilus_trader.data.messages import UnsubscribeOrderBook
+from nautilus_trader.data.messages import UnsubscribeQuoteTicks
 from nautilus_trader.live.data_client import LiveMarketDataClient
+from nautilus_trader.model.data import Bar
 from nautilus_trader.model.data import BookOrder
 from nautilus_trader.model.data import OrderBookDelta
 from nautilus_trader.model.data import OrderBookDeltas
@@ -20,18 +27,33 @@ from nautilus_trader.model.data import TradeTick
 from nautilus_trader.model.enums import AggressorSide
 from nautilus_trader.model.enums import BookAction
 from nautilus_trader.model.enums import OrderSide
+from nautilus_trader.model.enums import PriceType
 from nautilus_trader.model.identifiers import ClientId
 from nautilus_trader.model.identifiers import InstrumentId
 from nautilus_trader.model.identifiers import TradeId
 from nautilus_trader.model.identifiers import Venue
+from nautilus_trader.model.instruments import Instrument
 from nautilus_trader.model.objects import Price
 from nautilus_trader.model.objects import Quantity
 
+from ...common.historical import DEFAULT_SETTLE_NS
+from ...common.historical import HistoricalDataCache
+from ...common.historical import RequestBudget
+from ...common.historical import aggregate_trade_bars
+from ...common.historical import fetch_range
+from ...common.historical import load_cached_range
+from ...common.report_fastpath import InstrumentPrecisions
+from ...common.top_of_book import BookLevels
+from ...common.top_of_book import QuoteFilter
+from ...common.top_of_book import Top
+from ...common.ws_tape import WsTapeRecorder
 from .constants import WS_URL_PUBLIC
 from .providers import StandXInstrumentProvider
 
 
 class StandXDataClient(LiveMarketDataClient):
+    _TRADES_PAGE_SIZE = 1_000
+
     def __init__(
         self,
         loop: asyncio.AbstractEventLoop,
@@ -57,6 +79,40 @@ class StandXDataClient(LiveMarketDataClient):
         self._client = client
         self._websocket_url = getattr(config, "base_url_ws", None) or WS_URL_PUBLIC
         self._ws = None
+        self._update_instruments_interval_mins: int | None = getattr(
+            config,
+            "update_instruments_interval_mins",
+            None,
+        )
+        self._update_instruments_task: asyncio.Task | None = None
+        self._revalidate_task: asyncio.Task | None = None
+        self._precisions = InstrumentPrecisions(cache)
+        self._historical_page_span_ms = (
+            getattr(config, "historical_page_span_mins", None) or 60
+        ) * 60_000
+        self._historical_budget = RequestBudget(
+            getattr(config, "max_requests_per_second", None) or 10,
+            getattr(config, "historical_max_concurrency", None) or 4,
+        )
+        self._books: dict[InstrumentId, BookLevels] = {}
+        self._book_ts_event: dict[InstrumentId, int] = {}
+        self._book_subscriptions: set[InstrumentId] = set()
+        self._quote_subscriptions: set[InstrumentId] = set()
+        self._quote_filter = QuoteFilter(
+            (getattr(config, "quote_throttle_ms", None) or 0) * 1_000_000,
+        )
+        self._quote_flush_handles: dict[InstrumentId, asyncio.TimerHandle] = {}
+        self._environment = "testnet" if getattr(config, "is_testnet", False) else "mainnet"
+        self._historical_cache: HistoricalDataCache | None = None
+        if getattr(config, "use_historical_cache", False):
+            self._historical_cache = HistoricalDataCache.for_venue(
+                venue.value,
+                self._environment,
+                getattr(config, "historical_cache_dir", None),
+            )
+        self._record_ws_tape = bool(getattr(config, "record_ws_tape", False))
+        self._ws_tape_dir: str | None = getattr(config, "ws_tape_dir", None)
+        self._ws_tape: WsTapeRecorder | None = None
 
     @staticmethod
     def _ns_from_ms(value: Any) -> int:
@@ -91,10 +147,32 @@ class StandXDataClient(LiveMarketDataClient):
         if self._client is None:
             raise RuntimeError("StandX data client backend is not configured")
 
-        if hasattr(self._instrument_provider, "load_all_async"):
+        if self._instrument_provider.load_cached():
+            # Warm start: trade on cached metadata, revalidate against the venue
+            self._log.info(f"Loaded {self._instrument_provider.count} instrument(s) from cache")
+            self._send_all_instruments_to_data_engine()
+            self._revalidate_task = self.create_task(self._revalidate_instruments())
+        else:
             await self._instrument_provider.load_all_async()
-        self._send_all_instruments_to_data_engine()
+            self._send_all_instruments_to_data_engine()
+
+        if self._update_instruments_interval_mins:
+            self._update_instruments_task = self.create_task(
+                self._update_instruments(self._update_instruments_interval_mins),
+            )
+        if self._record_ws_tape and self._ws_tape is None:
+            self._ws_tape = WsTapeRecorder.for_venue(
+                self.venue.value,
+                self._environment,
+                "public",
+                self._ws_tape_dir,
+            )
+            self._log.info(f"Recording public WS tape to {self._ws_tape.path}")
         self._ws = self._client
+        ws: Any = self._ws
+        if hasattr(ws, "set_frame_callback"):
+            # As for Paradex, frames are taped where they enter, not in the handlers
+            ws.set_frame_callback(self._on_ws_frame)
 
     def _send_all_instruments_to_data_engine(self) -> None:
         for instrument in self._instrument_provider.get_all().values():
@@ -103,7 +181,55 @@ class StandXDataClient(LiveMarketDataClient):
         for currency in self._instrument_provider.currencies().values():
             self._cache.add_currency(currency)
 
+    def _send_instruments_to_data_engine(self, instruments: list[Instrument]) -> None:
+        for instrument in instruments:
+            self._cache.add_currency(instrument.base_currency)
+            self._cache.add_currency(instrument.quote_currency)
+            self._cache.add_currency(instrument.settlement_currency)
+            self._handle_data(instrument)
+
+    async def _update_instruments(self, interval_mins: int) -> None:
+        try:
+            while True:
+                self._log.debug(
+                    f"Scheduled task 'update_instruments' to run in {interval_mins} minutes",
+                )
+                await asyncio.sleep(interval_mins * 60)
+                await self._revalidate_instruments()
+        except asyncio.CancelledError:
+            self._log.debug("Canceled task 'update_instruments'")
+
+    async def _revalidate_instruments(self) -> None:
+        try:
+            updated = await self._instrument_provider.refresh_async()
+        except Exception as e:
+            self._log.warning(f"StandX instrument refresh failed: {e}")
+            return
+        if updated:
+            self._log.info(f"Refreshed {len(updated)} StandX instrument(s)")
+            self._send_instruments_to_data_engine(updated)
+
     async def _disconnect(self) -> None:
+        if self._update_instruments_task:
+            self._log.debug("Canceling task 'update_instruments'")
+            self._update_instruments_task.cancel()
+            self._update_instruments_task = None
+        if self._revalidate_task is not None:
+            self._log.debug("Canceling task 'revalidate_instruments'")
+            self._revalidate_task.cancel()
+            self._revalidate_task = None
+
+        for handle in self._quote_flush_handles.values():
+            handle.cancel()
+        self._quote_flush_handles.clear()
+        self._books.clear()
+        ws: Any = self._ws
+        if ws is not None and hasattr(ws, "set_frame_callback"):
+            ws.set_frame_callback(None)
+        if self._ws_tape is not None:
+            self._ws_tape.close()
+            self._ws_tape = None
+
         if self._ws is not None:
             self._log.info("Disconnecting from StandX WebSocket...", LogColor.BLUE)
 
@@ -118,6 +244,206 @@ class StandXDataClient(LiveMarketDataClient):
     async def _request(self, request) -> None:
         self._log.debug(f"Ignoring unsupported request command: {request}")
 
+    def _request_range_ns(self, request, default_lookback_ns: int) -> tuple[int, int]:
+        now_ns = self._clock.timestamp_ns()
+        end_ns = now_ns if request.end is None else min(dt_to_unix_nanos(request.end), now_ns)
+        if request.start is None:
+            return end_ns - default_lookback_ns, end_ns
+        return dt_to_unix_nanos(request.start), end_ns
+
+    def _market_id_for(self, instrument_id: InstrumentId) -> int | None:
+        instrument = self._instrument_provider.find(instrument_id)
+        info = getattr(instrument, "info", None)
+        if not isinstance(info, dict):
+            return None
+        market_id = info.get("market_id") or info.get("marketId")
+        return int(market_id) if market_id is not None else None
+
+    async def _request_quote_ticks(self, request: RequestQuoteTicks) -> None:
+        # StandX has no historical top-of-book endpoint; serve only what an
+        # external recorder wrote to the local catalog.
+        start_ns, end_ns = self._request_range_ns(request, 3_600_000_000_000)
+        quotes = []
+        if self._historical_cache is not None:
+            quotes = self._historical_cache.read(
+                QuoteTick,
+                str(request.instrument_id),
+                start_ns,
+                end_ns,
+            )
+        if not quotes:
+            self._log.error("Cannot request historical quotes: not published by StandX")
+            return
+        if request.limit:
+            quotes = quotes[-request.limit :]
+        self._handle_quote_ticks(
+            request.instrument_id,
+            quotes,
+            request.id,
+            request.start,
+            request.end,
+            request.params,
+        )
+
+    async def _request_trade_ticks(self, request: RequestTradeTicks) -> None:
+        instrument_id = request.instrument_id
+        start_ns, end_ns = self._request_range_ns(request, 3_600_000_000_000)
+        try:
+            ticks = await self._load_trade_ticks(instrument_id, start_ns, end_ns)
+        except Exception as e:
+            self._log.error(f"Failed to request trades for {instrument_id}: {e}")
+            return
+        if request.limit:
+            ticks = ticks[-request.limit :]
+        self._handle_trade_ticks(
+            instrument_id,
+            ticks,
+            request.id,
+            request.start,
+            request.end,
+            request.params,
+        )
+
+    async def _load_trade_ticks(
+        self,
+        instrument_id: InstrumentId,
+        start_ns: int,
+        end_ns: int,
+    ) -> list[TradeTick]:
+        return await load_cached_range(
+            self._historical_cache,
+            TradeTick,
+            str(instrument_id),
+            start_ns,
+            end_ns,
+            self._clock.timestamp_ns() - DEFAULT_SETTLE_NS,
+            lambda s, e: self._fetch_trade_ticks(instrument_id, s, e),
+        )
+
+    async def _fetch_trade_ticks(
+        self,
+        instrument_id: InstrumentId,
+        start_ns: int,
+        end_ns: int,
+    ) -> list[TradeTick]:
+        market_id = self._market_id_for(instrument_id)
+        if market_id is None:
+            raise RuntimeError(f"No StandX market id for {instrument_id}")
+        typed_client: Any = self._client
+
+        async def fetch_page(start_ms: int, end_ms: int) -> list[dict]:
+            data = await self._loop.run_in_executor(
+                None,
+                lambda: typed_client.get_trades(
+                    market_id,
+                    self._TRADES_PAGE_SIZE,
+                    start_ms,
+                    end_ms,
+                ),
+            )
+            if asyncio.iscoroutine(data):
+                data = await data
+            if isinstance(data, str):
+                data = json.loads(data)
+            return data.get("trades", []) if isinstance(data, dict) else []
+
+        rows = await fetch_range(
+            fetch_page,
+            start_ns // 1_000_000,
+            end_ns // 1_000_000,
+            lambda row: int(row.get("timestamp") or 0) or None,
+            self._historical_budget,
+            self._TRADES_PAGE_SIZE,
+            self._historical_page_span_ms,
+            # The trades endpoint returns the newest page_size trades in range
+            newest_first=True,
+        )
+
+        ticks: list[TradeTick] = []
+        last_ts = 0
+        seq = 0
+        for row in rows:
+            try:
+                ts_event = self._ns_from_ms(row["timestamp"])
+                # Venue trades carry no id; number trades within a millisecond
+                seq = seq + 1 if ts_event == last_ts else 0
+                last_ts = ts_event
+                side = str(row.get("side") or "").upper()
+                if side == "BUY":
+                    aggressor_side = AggressorSide.BUYER
+                elif side == "SELL":
+                    aggressor_side = AggressorSide.SELLER
+                else:
+                    aggressor_side = AggressorSide.NO_AGGRESSOR
+                trade_id_val = row.get("trade_id") or row.get("id") or f"{ts_event}-{seq}"
+                ticks.append(
+                    TradeTick(
+                        instrument_id=instrument_id,
+                        price=self._precisions.price(instrument_id, row["price"]),
+                        size=self._precisions.quantity(instrument_id, row["size"]),
+                        aggressor_side=aggressor_side,
+                        trade_id=TradeId(str(trade_id_val)),
+                        ts_event=ts_event,
+                        ts_init=ts_event,
+                    ),
+                )
+            except Exception as exc:
+                self._log.debug(f"Historical trade parse skipped: {exc} ({row})")
+        return ticks
+
+    async def _request_bars(self, request: RequestBars) -> None:
+        bar_type = request.bar_type
+        if (
+            bar_type.is_internally_aggregated()
+            or not bar_type.spec.is_time_aggregated()
+            or bar_type.spec.price_type != PriceType.LAST
+        ):
+            self._log.error(
+                f"Cannot request {bar_type} bars: "
+                "only EXTERNAL time bars of LAST price are available from StandX",
+            )
+            return
+
+        step_ns = int(bar_type.spec.timedelta.total_seconds() * 1_000_000_000)
+        start_ns, end_ns = self._request_range_ns(request, (request.limit or 1_000) * step_ns)
+        instrument_id = bar_type.instrument_id
+
+        async def fetch(s: int, e: int) -> list[Bar]:
+            # No kline endpoint: build bars from the (cached) trade history
+            # of every interval closing inside [s, e].
+            first_open = s - step_ns - s % step_ns
+            last_open = e - step_ns - e % step_ns
+            trades = await self._load_trade_ticks(
+                instrument_id,
+                first_open,
+                last_open + step_ns - 1,
+            )
+            return aggregate_trade_bars(bar_type, trades, step_ns)
+
+        try:
+            bars = await load_cached_range(
+                self._historical_cache,
+                Bar,
+                str(bar_type),
+                start_ns,
+                end_ns,
+                self._clock.timestamp_ns() - DEFAULT_SETTLE_NS,
+                fetch,
+            )
+        except Exception as e:
+            self._log.error(f"Failed to request {bar_type} bars: {e}")
+            return
+        if request.limit:
+            bars = bars[-request.limit :]
+        self._handle_bars(
+            bar_type,
+            bars,
+            request.id,
+            request.start,
+            request.end,
+            request.params,
+        )
+
     async def _subscribe(self, command) -> None:
         self._log.debug(f"Generic subscribe command received: {command}")
 
@@ -144,6 +470,23 @@ class StandXDataClient(LiveMarketDataClient):
             else command.instrument_id.symbol.value.replace("-PERP", "")
         )
         self._log.info(f"Subscribing to quotes for {symbol}", LogColor.BLUE)
+        # Quotes are derived from the book stream; no separate BBO channel
+        instrument_id = command.instrument_id
+        throttle_ms = (command.params or {}).get("throttle_ms")
+        if throttle_ms is not None:
+            self._quote_filter.set_interval(instrument_id, int(throttle_ms) * 1_000_000)
+        self._quote_subscriptions.add(instrument_id)
+        if instrument_id not in self._book_subscriptions:
+            await self._subscribe_venue_orderbook(symbol)
+
+    async def _unsubscribe_quote_ticks(self, command: UnsubscribeQuoteTicks) -> None:
+        instrument_id = command.instrument_id
+        self._quote_subscriptions.discard(instrument_id)
+        self._quote_filter.reset(instrument_id)
+        self._quote_filter.set_interval(instrument_id, None)
+        handle = self._quote_flush_handles.pop(instrument_id, None)
+        if handle is not None:
+            handle.cancel()
 
     async def _subscribe_order_book_deltas(self, command: SubscribeOrderBook) -> None:
         instrument = self._cache.instrument(command.instrument_id)
@@ -153,6 +496,14 @@ class StandXDataClient(LiveMarketDataClient):
             else command.instrument_id.symbol.value.replace("-PERP", "")
         )
         self._log.info(f"Subscribing to orderbook for {symbol}", LogColor.BLUE)
+        self._book_subscriptions.add(command.instrument_id)
+        if command.instrument_id not in self._quote_subscriptions:
+            await self._subscribe_venue_orderbook(symbol)
+
+    async def _unsubscribe_order_book_deltas(self, command: UnsubscribeOrderBook) -> None:
+        self._book_subscriptions.discard(command.instrument_id)
+
+    async def _subscribe_venue_orderbook(self, symbol: str) -> None:
         client = self._client
         if client is not None and hasattr(client, "subscribe_orderbook"):
             typed_client: Any = client
@@ -160,7 +511,64 @@ class StandXDataClient(LiveMarketDataClient):
             if asyncio.iscoroutine(maybe):
                 await maybe
 
-    async def _handle_ws_message(self, msg: dict) -> None:
+    def _publish_top_of_book(self, instrument_id: InstrumentId, top: Top, ts_event: int) -> None:
+        now_ns = self._clock.timestamp_ns()
+        if self._quote_filter.offer(instrument_id, top, now_ns):
+            self._handle_data(self._build_quote(instrument_id, top, ts_event, now_ns))
+            return
+        due_in_ns = self._quote_filter.due_in_ns(instrument_id, now_ns)
+        if due_in_ns is not None and instrument_id not in self._quote_flush_handles:
+            self._quote_flush_handles[instrument_id] = self._loop.call_later(
+                due_in_ns / 1e9,
+                self._flush_quote,
+                instrument_id,
+            )
+
+    def _flush_quote(self, instrument_id: InstrumentId) -> None:
+        self._quote_flush_handles.pop(instrument_id, None)
+        now_ns = self._clock.timestamp_ns()
+        top = self._quote_filter.take_pending(instrument_id, now_ns)
+        if top is not None:
+            ts_event = self._book_ts_event.get(instrument_id, now_ns)
+            self._handle_data(self._build_quote(instrument_id, top, ts_event, now_ns))
+
+    def _build_quote(
+        self,
+        instrument_id: InstrumentId,
+        top: Top,
+        ts_event: int,
+        ts_init: int,
+    ) -> QuoteTick:
+        bid_price, bid_size, ask_price, ask_size = top
+        return QuoteTick(
+            instrument_id=instrument_id,
+            bid_price=self._precisions.price(instrument_id, bid_price),
+            ask_price=self._precisions.price(instrument_id, ask_price),
+            bid_size=self._precisions.quantity(instrument_id, bid_size),
+            ask_size=self._precisions.quantity(instrument_id, ask_size),
+            ts_event=ts_event,
+            ts_init=ts_init,
+        )
+
+    def _on_ws_frame(self, ts_recv_ns: int, text: str) -> None:
+        """
+        Take a raw public frame from the backend, on any thread: tape it as
+        received, then hand the decoded message to the event loop.
+        """
+        tape = self._ws_tape
+        if tape is not None:
+            tape.record("public", text, ts_recv_ns)
+        try:
+            msg = json.loads(text)
+        except ValueError:
+            return
+        if isinstance(msg, dict):
+            asyncio.run_coroutine_threadsafe(self._handle_ws_message(msg), self._loop)
+
+    async def _handle_ws_message(self, msg: dict | str) -> None:
+        if isinstance(msg, str):
+            # Tapes hold the raw frames
+            msg = json.loads(msg)
         channel = msg.get("channel", "")
         if channel == "trades":
             self._handle_trade(msg)
@@ -240,8 +648,12 @@ class StandXDataClient(LiveMarketDataClient):
         if ts_event == 0:
             ts_event = self._clock.timestamp_ns()
         sequence = int(payload.get("sequence") or msg.get("sequence") or 0)
+        # depth_book pushes carry the full book; orderbook pushes are changes
+        snapshot = msg.get("channel") == "depth_book" or bool(payload.get("snapshot"))
 
         deltas: list[OrderBookDelta] = []
+        bid_levels: list[tuple[float, float]] = []
+        ask_levels: list[tuple[float, float]] = []
 
         for level in bids:
             price_raw = None
@@ -254,6 +666,7 @@ class StandXDataClient(LiveMarketDataClient):
             if price_raw in (None, "") or size_raw in (None, ""):
                 continue
             try:
+                bid_levels.append((float(price_raw), float(size_raw)))
                 order = BookOrder(
                     OrderSide.BUY,
                     Price.from_str(str(price_raw)),
@@ -285,6 +698,7 @@ class StandXDataClient(LiveMarketDataClient):
             if price_raw in (None, "") or size_raw in (None, ""):
                 continue
             try:
+                ask_levels.append((float(price_raw), float(size_raw)))
                 order = BookOrder(
                     OrderSide.SELL,
                     Price.from_str(str(price_raw)),
@@ -305,6 +719,16 @@ class StandXDataClient(LiveMarketDataClient):
             except Exception:
                 continue
 
+        if bid_levels or ask_levels or snapshot:
+            book = self._books.get(instrument_id)
+            if book is None:
+                book = self._books[instrument_id] = BookLevels()
+            book.update(bid_levels, ask_levels, snapshot=snapshot)
+            self._book_ts_event[instrument_id] = ts_event
+            top = book.top()
+            if top is not None and instrument_id in self._quote_subscriptions:
+                self._publish_top_of_book(instrument_id, top, ts_event)
+
         if not deltas:
             best_bid = payload.get("best_bid") if isinstance(payload, dict) else None
             best_ask = payload.get("best_ask") if isinstance(payload, dict) else None
@@ -317,18 +741,15 @@ class StandXDataClient(LiveMarketDataClient):
                 and ask_size not in (None, "")
             ):
                 try:
-                    quote = QuoteTick(
-                        instrument_id=instrument_id,
-                        bid_price=Price.from_str(str(best_bid)),
-                        ask_price=Price.from_str(str(best_ask)),
-                        bid_size=Quantity.from_str(str(bid_size)),
-                        ask_size=Quantity.from_str(str(ask_size)),
-                        ts_event=ts_event,
-                        ts_init=self._clock.timestamp_ns(),
-                    )
-                    self._handle_data(quote)
+                    top = (float(best_bid), float(bid_size), float(best_ask), float(ask_size))
+                    self._publish_top_of_book(instrument_id, top, ts_event)
                 except Exception:
                     self._log.debug(f"Orderbook quote parse skipped: {payload}")
             return
 
-        self._handle_data(OrderBookDeltas(instrument_id=instrument_id, deltas=deltas))
+        # Quote-only subscribers do not need the depth pushed through the engine
+        if (
+            instrument_id in self._book_subscriptions
+            or instrument_id not in self._quote_subscriptions
+        ):
+            self._handle_data(OrderBookDeltas(instrument_id=instrument_id, deltas=deltas))
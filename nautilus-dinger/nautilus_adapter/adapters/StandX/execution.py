@@ -1,5 +1,6 @@
 import asyncio
 import json
+import time
 from datetime import datetime, timedelta, timezone
 from decimal import Decimal
 from typing import Any
@@ -44,6 +45,12 @@ from nautilus_trader.model.objects import Money
 from nautilus_trader.model.objects import Price
 from nautilus_trader.model.objects import Quantity
 
+from ...common.ingest_queue import CoalescingIngestQueue
+from ...common.account_state import AccountSnapshot, AccountStateFilter
+from ...common.latency import ensure_metrics_server
+from ...common.latency import latency_recorder
+from ...common.report_fastpath import InstrumentPrecisions, ReportMemo, first_of
+from ...common.ws_tape import WsTapeRecorder
 from .constants import REST_URL_MAINNET
 from .constants import REST_URL_TESTNET
 from .constants import WS_URL_PRIVATE
@@ -51,6 +58,9 @@ from .providers import StandXInstrumentProvider
 
 
 class StandXExecutionClient(LiveExecutionClient):
+    _order_venue_id = staticmethod(first_of("order_index", "order_id", "id"))
+    _order_market = staticmethod(first_of("market_index", "market_id", "symbol"))
+
     def __init__(
         self,
         loop: asyncio.AbstractEventLoop,
@@ -99,11 +109,37 @@ class StandXExecutionClient(LiveExecutionClient):
         self._ws_fill_cache: list[dict[str, Any]] = []
         self._ws_fill_seen: set[str] = set()
         self._private_sync_task: asyncio.Task[Any] | None = None
+        self._private_queue: CoalescingIngestQueue | None = None
+        self._private_queue_max_pending = 10_000
+        self._private_queue_dropped_reported = 0
+        self._private_malformed = 0
+        self._private_malformed_reported = 0
+        self._environment = "testnet" if is_testnet else "mainnet"
+        self._record_ws_tape = bool(getattr(config, "record_ws_tape", False))
+        self._ws_tape_dir: str | None = getattr(config, "ws_tape_dir", None)
+        self._ws_tape: WsTapeRecorder | None = None
         poll_interval = getattr(config, "private_sync_poll_interval_secs", 1.0) if config else 1.0
         try:
             self._private_sync_poll_interval_secs = max(0.2, float(poll_interval))
         except Exception:
             self._private_sync_poll_interval_secs = 1.0
+        self._precisions = InstrumentPrecisions(self._cache)
+        self._order_report_memo = ReportMemo()
+        poll_secs = getattr(config, "account_poll_interval_secs", 60) if config else 60
+        self._account_poll_interval_secs: int | None = int(poll_secs) if poll_secs else None
+        min_change = getattr(config, "account_state_min_change", 0.01) if config else 0.01
+        self._account_filter = AccountStateFilter(Decimal(str(min_change)))
+        self._account_refresh_debounce_secs = 0.25
+        self._account_refresh_pending = False
+        self._account_refresh_task: asyncio.Task[Any] | None = None
+        self._account_poll_task: asyncio.Task[Any] | None = None
+        self._latency = latency_recorder(venue.value)
+        log_secs = getattr(config, "latency_log_interval_secs", 300) if config else 300
+        self._latency_log_interval_secs: int | None = int(log_secs) if log_secs else None
+        self._latency_log_task: asyncio.Task[Any] | None = None
+        self._revalidate_task: asyncio.Task[Any] | None = None
+        self._metrics_host: str = getattr(config, "metrics_host", None) or "127.0.0.1"
+        self._metrics_port: int | None = getattr(config, "metrics_port", None)
         self._set_account_id(AccountId(f"{venue.value}-001"))
 
     def _require_client(self) -> Any:
@@ -123,9 +159,10 @@ class StandXExecutionClient(LiveExecutionClient):
     async def _call_client(self, method_name: str, *args: Any, **kwargs: Any) -> Any:
         client = self._require_client()
         method = getattr(client, method_name)
-        result = method(*args, **kwargs)
-        if asyncio.iscoroutine(result):
-            result = await result
+        with self._latency.time(method_name):
+            result = method(*args, **kwargs)
+            if asyncio.iscoroutine(result):
+                result = await result
         return self._coerce_json(result)
 
     @staticmethod
@@ -314,14 +351,35 @@ class StandXExecutionClient(LiveExecutionClient):
             and hasattr(client, "subscribe_private_fills")
         ):
             try:
+                if self._record_ws_tape and self._ws_tape is None:
+                    self._ws_tape = WsTapeRecorder.for_venue(
+                        self.venue.value,
+                        self._environment,
+                        "private",
+                        self._ws_tape_dir,
+                    )
+                    self._log.info(f"Recording private WS tape to {self._ws_tape.path}")
+                self._private_queue = CoalescingIngestQueue(
+                    self._loop,
+                    self._apply_private_rows,
+                    max_pending=self._private_queue_max_pending,
+                )
+
                 def _on_private_ws_message(payload: Any) -> None:
+                    # Runs on the backend thread: parse here, let the loop
+                    # apply whole batches.
+                    queue = self._private_queue
+                    if queue is None:
+                        return
+                    tape = self._ws_tape
+                    if tape is not None:
+                        tape.record("private", payload)
                     try:
-                        asyncio.run_coroutine_threadsafe(
-                            self._ingest_private_ws_payload(payload),
-                            self._loop,
-                        )
-                    except Exception:
-                        pass
+                        for kind, key, row in self._split_private_payload(payload):
+                            queue.put((kind, key, row), key=key if kind == "order" else None)
+                    except Exception as e:
+                        self._private_malformed += 1
+                        self._log.debug(f"StandX private WS batch could not be parsed: {e!r}")
 
                 await self._call_client("set_private_message_callback", _on_private_ws_message)
                 await self._call_client("subscribe_private_orders")
@@ -336,58 +394,93 @@ class StandXExecutionClient(LiveExecutionClient):
         if not private_ws_ready:
             self._start_private_sync_fallback()
 
-        await self._instrument_provider.load_all_async()
+        if self._instrument_provider.load_cached():
+            self._revalidate_task = self.create_task(self._revalidate_instruments())
+        else:
+            await self._instrument_provider.load_all_async()
         for instrument in self._instrument_provider.get_all().values():
             self._cache.add_instrument(instrument)
         for currency in self._instrument_provider.currencies().values():
             self._cache.add_currency(currency)
-        await self._update_account_state()
+        await self._update_account_state(initial=True)
         await self._await_account_registered()
+        if self._account_poll_interval_secs:
+            self._account_poll_task = self.create_task(
+                self._account_poll_loop(self._account_poll_interval_secs),
+            )
+        await self._start_latency_reporting()
+
+    async def _revalidate_instruments(self) -> None:
+        try:
+            updated = await self._instrument_provider.refresh_async()
+        except Exception as e:
+            self._log.warning(f"StandX instrument revalidation failed: {e}")
+            return
+        for instrument in updated:
+            self._cache.add_instrument(instrument)
+        if updated:
+            self._precisions.invalidate()
+            self._order_report_memo.clear()
+            self._log.info(f"Revalidated {len(updated)} changed StandX instrument(s)")
+
+    def _account_snapshot_from_payload(self, snapshot: dict[str, Any]) -> AccountSnapshot:
+        collateral = self._parse_decimal(snapshot.get("collateral"))
+        available = self._parse_decimal(snapshot.get("available_balance"))
+        total_asset = self._parse_decimal(snapshot.get("total_asset_value"), collateral)
+
+        total_balance = total_asset if total_asset > Decimal("0") else collateral
+        free_balance = available
+        locked_balance = max(total_balance - free_balance, Decimal("0"))
 
-    async def _update_account_state(self) -> None:
-        currency = Currency.from_str("USD")
-        total_balance = Decimal("0")
-        free_balance = Decimal("0")
-        locked_balance = Decimal("0")
         initial_margin = Decimal("0")
+        positions = snapshot.get("positions") or []
+        for pos in positions:
+            initial_margin += self._parse_decimal(pos.get("allocated_margin"))
+
+        return AccountSnapshot(
+            total=total_balance,
+            free=free_balance,
+            locked=locked_balance,
+            initial_margin=initial_margin,
+        )
 
+    async def _update_account_state(self, initial: bool = False) -> None:
         try:
             snapshot = await self._call_client("get_account_state")
-            collateral = self._parse_decimal(snapshot.get("collateral"))
-            available = self._parse_decimal(snapshot.get("available_balance"))
-            total_asset = self._parse_decimal(snapshot.get("total_asset_value"), collateral)
-
-            total_balance = total_asset if total_asset > Decimal("0") else collateral
-            free_balance = available
-            locked_balance = max(total_balance - free_balance, Decimal("0"))
-
-            positions = snapshot.get("positions") or []
-            for pos in positions:
-                initial_margin += self._parse_decimal(pos.get("allocated_margin"))
+            account = self._account_snapshot_from_payload(snapshot)
         except Exception as e:
+            if not initial:
+                # Keep the last published state; the next event or poll retries.
+                self._log.debug(f"StandX account state refresh failed: {e}")
+                return
             self._log.warning(
                 f"Failed to fetch live StandX account snapshot, falling back to zero balances: {e}",
                 LogColor.YELLOW,
             )
+            zero = Decimal("0")
+            account = AccountSnapshot(total=zero, free=zero, locked=zero, initial_margin=zero)
 
-        total_money = Money(total_balance, currency)
-        free_money = Money(free_balance, currency)
-        locked_money = Money(locked_balance, currency)
-        initial_margin_money = Money(initial_margin, currency)
-        maintenance_margin_money = Money(Decimal("0"), currency)
+        self._publish_account_state(account, force=initial)
 
+    def _publish_account_state(self, account: AccountSnapshot, force: bool = False) -> None:
+        if force:
+            self._account_filter.reset()
+        if not self._account_filter.should_publish(account):
+            return
+
+        currency = Currency.from_str("USD")
         self.generate_account_state(
             balances=[
                 AccountBalance(
-                    total=total_money,
-                    locked=locked_money,
-                    free=free_money,
+                    total=Money(account.total, currency),
+                    locked=Money(account.locked, currency),
+                    free=Money(account.free, currency),
                 ),
             ],
             margins=[
                 MarginBalance(
-                    initial=initial_margin_money,
-                    maintenance=maintenance_margin_money,
+                    initial=Money(account.initial_margin, currency),
+                    maintenance=Money(account.maintenance_margin, currency),
                     instrument_id=None,
                 ),
             ],
@@ -395,8 +488,77 @@ class StandXExecutionClient(LiveExecutionClient):
             ts_event=self._clock.timestamp_ns(),
         )
 
+    def _request_account_refresh(self) -> None:
+        # Bursts of fills/order events collapse into one REST refresh.
+        self._account_refresh_pending = True
+        task = self._account_refresh_task
+        if task is None or task.done():
+            self._account_refresh_task = self.create_task(self._debounced_account_refresh())
+
+    async def _debounced_account_refresh(self) -> None:
+        # Requests arriving during a refresh are served by one more pass
+        while self._account_refresh_pending:
+            await asyncio.sleep(self._account_refresh_debounce_secs)
+            self._account_refresh_pending = False
+            await self._update_account_state()
+
+    async def _account_poll_loop(self, interval_secs: int) -> None:
+        try:
+            while True:
+                await asyncio.sleep(interval_secs)
+                await self._update_account_state()
+        except asyncio.CancelledError:
+            self._log.debug("Canceled task 'account_poll'")
+
+    async def _start_latency_reporting(self) -> None:
+        if self._metrics_port:
+            try:
+                await ensure_metrics_server(self._metrics_host, self._metrics_port)
+            except OSError as e:
+                self._log.warning(f"Metrics endpoint failed to start: {e}")
+        if self._latency_log_interval_secs and self._latency_log_task is None:
+            self._latency_log_task = self.create_task(
+                self._latency_log_loop(self._latency_log_interval_secs),
+            )
+
+    async def _latency_log_loop(self, interval_secs: int) -> None:
+        try:
+            while True:
+                await asyncio.sleep(interval_secs)
+                summary = self._latency.summary()
+                if summary is not None:
+                    self._log.info(summary)
+        except asyncio.CancelledError:
+            self._log.debug("Canceled task 'latency_log'")
+
     async def _disconnect(self) -> None:
         self._log.info("Disconnecting from StandX execution...", LogColor.BLUE)
+        if self._account_poll_task is not None:
+            self._account_poll_task.cancel()
+            self._account_poll_task = None
+        if self._latency_log_task is not None:
+            self._latency_log_task.cancel()
+            self._latency_log_task = None
+        if self._revalidate_task is not None:
+            self._revalidate_task.cancel()
+            self._revalidate_task = None
+        if self._account_refresh_task is not None:
+            self._account_refresh_task.cancel()
+            self._account_refresh_task = None
+        self._account_refresh_pending = False
+        if self._private_queue is not None and hasattr(self._client, "close"):
+            try:
+                self._client.close()
+            except Exception as e:
+                self._log.warning(f"StandX private WS close failed: {e}")
+        queue = self._private_queue
+        self._private_queue = None
+        if queue is not None:
+            queue.close()
+            queue.flush()
+        if self._ws_tape is not None:
+            self._ws_tape.close()
+            self._ws_tape = None
         task = self._private_sync_task
         self._private_sync_task = None
         if task is not None:
@@ -421,20 +583,14 @@ class StandXExecutionClient(LiveExecutionClient):
         try:
             while True:
                 try:
+                    items: list[tuple[str, str | None, dict[str, Any]]] = []
                     open_orders = await self._fetch_open_orders(None)
                     for row in open_orders:
                         if not isinstance(row, dict):
                             continue
-                        order_key = (
-                            row.get("order_index")
-                            or row.get("order_id")
-                            or row.get("id")
-                            or row.get("client_order_index")
-                            or row.get("client_order_id")
-                            or row.get("cl_ord_id")
-                        )
+                        order_key = self._private_order_key(row)
                         if order_key is not None:
-                            self._ws_order_cache[str(order_key)] = row
+                            items.append(("order", str(order_key), row))
 
                     fills_payload = await self._call_client(
                         "get_fills",
@@ -461,23 +617,10 @@ class StandXExecutionClient(LiveExecutionClient):
                                 or row.get("fill_id")
                                 or row.get("order_fill_id")
                             )
-                            if fill_key is None:
-                                continue
-                            fill_key_text = str(fill_key)
-                            if fill_key_text in self._ws_fill_seen:
-                                continue
-                            self._ws_fill_seen.add(fill_key_text)
-                            self._ws_fill_cache.append(row)
-
-                    if len(self._ws_fill_cache) > 5000:
-                        self._ws_fill_cache = self._ws_fill_cache[-2500:]
-                    if len(self._ws_fill_seen) > 10000:
-                        keep_ids = {
-                            str(item.get("id") or item.get("trade_id") or item.get("fill_id"))
-                            for item in self._ws_fill_cache
-                            if isinstance(item, dict)
-                        }
-                        self._ws_fill_seen = {k for k in self._ws_fill_seen if k in keep_ids}
+                            if fill_key is not None:
+                                items.append(("fill", None, row))
+
+                    self._apply_private_rows(items)
                 except Exception:
                     pass
 
@@ -485,15 +628,34 @@ class StandXExecutionClient(LiveExecutionClient):
         except asyncio.CancelledError:
             return
 
-    async def _ingest_private_ws_payload(self, payload: Any) -> None:
-        data = self._coerce_json(payload)
+    @staticmethod
+    def _private_order_key(row: dict[str, Any]) -> Any:
+        return (
+            row.get("order_index")
+            or row.get("order_id")
+            or row.get("id")
+            or row.get("client_order_index")
+            or row.get("client_order_id")
+            or row.get("cl_ord_id")
+        )
+
+    @classmethod
+    def _split_private_payload(cls, payload: Any) -> list[tuple[str, str | None, dict[str, Any]]]:
+        data = cls._coerce_json(payload)
         if isinstance(data, str):
             try:
                 data = json.loads(data)
             except Exception:
-                return
+                return []
+        if isinstance(data, list):
+            # Backend delivers private messages in batches (JSON arrays)
+            batch: list[tuple[str, str | None, dict[str, Any]]] = []
+            for message in data:
+                if isinstance(message, dict):
+                    batch.extend(cls._split_private_payload(message))
+            return batch
         if not isinstance(data, dict):
-            return
+            return []
 
         channel = str(data.get("channel") or data.get("type") or "").lower()
         rows = data.get("data")
@@ -502,25 +664,94 @@ class StandXExecutionClient(LiveExecutionClient):
         if not isinstance(rows, list):
             rows = [data]
 
-        if any(key in channel for key in ("order", "execution", "position")):
-            for row in rows:
-                if not isinstance(row, dict):
-                    continue
-                order_key = (
-                    row.get("order_index")
-                    or row.get("order_id")
-                    or row.get("id")
-                    or row.get("client_order_index")
-                    or row.get("client_order_id")
-                    or row.get("cl_ord_id")
-                )
+        is_order = any(key in channel for key in ("order", "execution", "position"))
+        is_fill = any(key in channel for key in ("fill", "trade"))
+        is_account = any(key in channel for key in ("balance", "account"))
+
+        items: list[tuple[str, str | None, dict[str, Any]]] = []
+        if is_account or "position" in channel:
+            # Coalesced by key: one pending account update per batch is enough
+            items.append(("account", "account", rows[-1] if is_account and rows else {}))
+        for row in rows:
+            if not isinstance(row, dict):
+                continue
+            if is_order:
+                order_key = cls._private_order_key(row)
                 if order_key is not None:
-                    self._ws_order_cache[str(order_key)] = row
+                    items.append(("order", str(order_key), row))
+            if is_fill:
+                items.append(("fill", None, row))
+        return items
+
+    def _apply_private_rows(self, items: list[tuple[str, str | None, dict[str, Any]]]) -> None:
+        started_ns = time.perf_counter_ns()
+        account_row: dict[str, Any] | None = None
+        refresh_account = False
+        for kind, key, row in items:
+            if kind == "order" and key is not None:
+                self._ws_order_cache[key] = row
+            elif kind == "account":
+                if isinstance(row, dict) and any(
+                    field in row
+                    for field in ("collateral", "available_balance", "total_asset_value")
+                ):
+                    account_row = row
+                else:
+                    refresh_account = True
+            elif kind == "fill":
+                fill_key = (
+                    row.get("id")
+                    or row.get("trade_id")
+                    or row.get("fill_id")
+                    or row.get("order_fill_id")
+                )
+                if fill_key is not None:
+                    fill_key_text = str(fill_key)
+                    if fill_key_text in self._ws_fill_seen:
+                        continue
+                    self._ws_fill_seen.add(fill_key_text)
+                self._ws_fill_cache.append(row)
+                refresh_account = True
+                fill_client_id = row.get("client_order_id") or row.get("cl_ord_id")
+                if fill_client_id is not None:
+                    self._latency.order_filled(str(fill_client_id), self._clock.timestamp_ns())
+
+        if account_row is not None:
+            self._publish_account_state(self._account_snapshot_from_payload(account_row))
+        elif refresh_account:
+            self._request_account_refresh()
+
+        if len(self._ws_fill_cache) > 5000:
+            self._ws_fill_cache = self._ws_fill_cache[-2500:]
+        if len(self._ws_fill_seen) > 10000:
+            keep_ids = {
+                str(item.get("id") or item.get("trade_id") or item.get("fill_id"))
+                for item in self._ws_fill_cache
+                if isinstance(item, dict)
+            }
+            self._ws_fill_seen = {k for k in self._ws_fill_seen if k in keep_ids}
+
+        queue = self._private_queue
+        if queue is not None and queue.dropped > self._private_queue_dropped_reported:
+            self._log.warning(
+                f"StandX private WS queue overflowed, dropped "
+                f"{queue.dropped - self._private_queue_dropped_reported} update(s); "
+                "reconciliation will backfill from HTTP",
+                LogColor.YELLOW,
+            )
+            self._private_queue_dropped_reported = queue.dropped
+        if self._private_malformed > self._private_malformed_reported:
+            self._log.warning(
+                f"StandX private WS skipped "
+                f"{self._private_malformed - self._private_malformed_reported} malformed batch(es); "
+                "reconciliation will backfill from HTTP",
+                LogColor.YELLOW,
+            )
+            self._private_malformed_reported = self._private_malformed
+        self._latency.record("stream.private_batch", time.perf_counter_ns() - started_ns)
 
-        if any(key in channel for key in ("fill", "trade")):
-            for row in rows:
-                if isinstance(row, dict):
-                    self._ws_fill_cache.append(row)
+    async def _ingest_private_ws_payload(self, payload: Any) -> None:
+        self._apply_private_rows(self._split_private_payload(payload))
 
     @classmethod
     def _map_order_type(cls, order: Any) -> str:
@@ -574,6 +805,7 @@ class StandXExecutionClient(LiveExecutionClient):
             client_order_id=order.client_order_id,
             ts_event=self._clock.timestamp_ns(),
         )
+        self._latency.order_submitted(client_order_id, self._clock.timestamp_ns())
 
         def _extract_submit_identifier(payload: Any) -> str | None:
             if not isinstance(payload, dict):
@@ -637,6 +869,8 @@ class StandXExecutionClient(LiveExecutionClient):
                 venue_order_id=VenueOrderId(str(venue_id)),
                 ts_event=self._clock.timestamp_ns(),
             )
+            self._latency.order_accepted(client_order_id, self._clock.timestamp_ns())
+            self._request_account_refresh()
         except Exception as e:
             self.generate_order_rejected(
                 strategy_id=strategy_id,
@@ -645,9 +879,11 @@ class StandXExecutionClient(LiveExecutionClient):
                 reason=str(e),
                 ts_event=self._clock.timestamp_ns(),
             )
+            self._latency.order_rejected(client_order_id)
 
     async def _cancel_order(self, command: CancelOrder) -> None:
         self._log.info(f"Canceling order {command.client_order_id}", LogColor.BLUE)
+        self._latency.cancel_requested(command.client_order_id.value, self._clock.timestamp_ns())
 
         def _is_not_found_error(exc: Exception) -> bool:
             message = str(exc).upper()
@@ -683,6 +919,8 @@ class StandXExecutionClient(LiveExecutionClient):
                 venue_order_id=command.venue_order_id,
                 ts_event=self._clock.timestamp_ns(),
             )
+            self._latency.order_canceled(command.client_order_id.value, self._clock.timestamp_ns())
+            self._request_account_refresh()
         except Exception as e:
             if _is_not_found_error(e):
                 self.generate_order_canceled(
@@ -692,6 +930,10 @@ class StandXExecutionClient(LiveExecutionClient):
                     venue_order_id=command.venue_order_id,
                     ts_event=self._clock.timestamp_ns(),
                 )
+                self._latency.order_canceled(
+                    command.client_order_id.value,
+                    self._clock.timestamp_ns(),
+                )
                 return
 
             self.generate_order_cancel_rejected(
@@ -702,6 +944,7 @@ class StandXExecutionClient(LiveExecutionClient):
                 reason=str(e),
                 ts_event=self._clock.timestamp_ns(),
             )
+            self._latency.cancel_rejected(command.client_order_id.value)
 
     async def _cancel_all_orders(self, command: CancelAllOrders) -> None:
         instrument_id = getattr(command, "instrument_id", None)
@@ -743,6 +986,7 @@ class StandXExecutionClient(LiveExecutionClient):
             await self._cancel_order(cancel_command)
 
     async def _modify_order(self, command: ModifyOrder) -> None:
+        self._latency.modify_requested(command.client_order_id.value, self._clock.timestamp_ns())
         client = self._require_client()
         if not hasattr(client, "modify_order"):
             self.generate_order_modify_rejected(
@@ -753,6 +997,7 @@ class StandXExecutionClient(LiveExecutionClient):
                 reason="Modify order is not available in current StandX client build",
                 ts_event=self._clock.timestamp_ns(),
             )
+            self._latency.modify_rejected(command.client_order_id.value)
             return
 
         def _is_order_not_open_error(exc: Exception) -> bool:
@@ -869,6 +1114,7 @@ class StandXExecutionClient(LiveExecutionClient):
                 ts_event=self._clock.timestamp_ns(),
                 venue_order_id_modified=venue_order_id_modified,
             )
+            self._latency.order_updated(command.client_order_id.value, self._clock.timestamp_ns())
         except Exception as e:
             self.generate_order_modify_rejected(
                 strategy_id=command.strategy_id,
@@ -878,6 +1124,7 @@ class StandXExecutionClient(LiveExecutionClient):
                 reason=str(e),
                 ts_event=self._clock.timestamp_ns(),
             )
+            self._latency.modify_rejected(command.client_order_id.value)
 
     async def _batch_cancel_orders(self, command: BatchCancelOrders) -> None:
         for cancel_command in command.cancels:
@@ -896,19 +1143,32 @@ class StandXExecutionClient(LiveExecutionClient):
             )
 
     def _build_order_status_report_from_venue(
-        self, venue_order: dict[str, Any]
+        self,
+        venue_order: dict[str, Any],
+        instrument_id: InstrumentId | None = None,
     ) -> OrderStatusReport | None:
-        order_id = (
-            venue_order.get("order_index") or venue_order.get("order_id") or venue_order.get("id")
-        )
-        market_id = (
-            venue_order.get("market_index")
-            or venue_order.get("market_id")
-            or venue_order.get("symbol")
-        )
-        instrument_id = self._instrument_id_from_market(
-            str(market_id) if market_id is not None else None
-        )
+        parsed = self._parse_venue_order(venue_order, instrument_id)
+        if parsed is None:
+            return None
+        return self._order_status_report(*parsed)
+
+    def _parse_venue_order(
+        self,
+        venue_order: dict[str, Any],
+        instrument_id: InstrumentId | None = None,
+    ) -> tuple[Any, dict[str, Any]] | None:
+        """
+        Parse the venue-side fields of an order report.
+
+        Returns the venue's client order id and the report fields that depend
+        only on the row, so they can be reused while it is unchanged.
+        """
+        order_id = self._order_venue_id(venue_order)
+        if instrument_id is None:
+            market_id = self._order_market(venue_order)
+            instrument_id = self._instrument_id_from_market(
+                str(market_id) if market_id is not None else None
+            )
         if not order_id or instrument_id is None:
             return None
 
@@ -924,16 +1184,77 @@ class StandXExecutionClient(LiveExecutionClient):
             size,
         )
         filled = size - remaining if size >= remaining else Decimal("0")
-        venue_status = self._map_order_status_from_venue(venue_order)
 
         if size <= Decimal("0"):
             return None
 
+        try:
+            qty = self._precisions.quantity(instrument_id, size)
+            filled_qty = self._precisions.quantity(instrument_id, filled)
+        except Exception:
+            return None
+
+        price_val = venue_order.get("price")
+        trigger_val = venue_order.get("trigger_price")
+        avg_fill_val = venue_order.get("avg_fill_price")
+        price = (
+            self._precisions.price(instrument_id, price_val)
+            if price_val not in (None, "")
+            else None
+        )
+        trigger_price = (
+            self._precisions.price(instrument_id, trigger_val)
+            if trigger_val not in (None, "")
+            else None
+        )
+        trigger_type = (
+            self._map_trigger_type(venue_order.get("trigger_type"))
+            if trigger_price is not None
+            else TriggerType.NO_TRIGGER
+        )
+        avg_px = self._parse_decimal(avg_fill_val) if avg_fill_val not in (None, "") else None
+
+        ts_accepted = (
+            self._ns_from_ms(venue_order.get("created_at") or venue_order.get("timestamp"))
+            or self._clock.timestamp_ns()
+        )
+        ts_last = (
+            self._ns_from_ms(venue_order.get("updated_at") or venue_order.get("timestamp"))
+            or ts_accepted
+        )
+
+        side_value = venue_order.get("side") or ("SELL" if venue_order.get("is_ask") else "BUY")
         client_order_id = (
             venue_order.get("client_order_index")
             or venue_order.get("client_order_id")
             or venue_order.get("cl_ord_id")
         )
+        return client_order_id, {
+            "instrument_id": instrument_id,
+            "venue_order_id": VenueOrderId(str(order_id)),
+            "order_side": self._map_order_side(str(side_value)),
+            "order_type": self._map_order_type_from_venue(venue_order.get("type")),
+            "time_in_force": self._map_tif(venue_order.get("time_in_force")),
+            "order_status": self._map_order_status_from_venue(venue_order),
+            "quantity": qty,
+            "filled_qty": filled_qty,
+            "ts_accepted": ts_accepted,
+            "ts_last": ts_last,
+            "price": price,
+            "trigger_price": trigger_price,
+            "trigger_type": trigger_type,
+            "avg_px": avg_px,
+            "reduce_only": bool(venue_order.get("reduce_only", False)),
+            "cancel_reason": venue_order.get("status")
+            if "cancel" in str(venue_order.get("status", "")).lower()
+            else None,
+        }
+
+    def _order_status_report(self, client_order_id: Any, fields: dict[str, Any]) -> OrderStatusReport:
+        """
+        Build a report from parsed venue fields, resolving the order against the cache now.
+        """
+        venue_status = fields["order_status"]
         cached_order = None
         if client_order_id is not None:
             try:
@@ -943,7 +1264,7 @@ class StandXExecutionClient(LiveExecutionClient):
 
         if cached_order is None:
             try:
-                cache_client_id = self._cache.client_order_id(VenueOrderId(str(order_id)))
+                cache_client_id = self._cache.client_order_id(fields["venue_order_id"])
                 if cache_client_id is not None:
                     cached_order = self._cache.order(cache_client_id)
             except Exception:
@@ -960,33 +1281,6 @@ class StandXExecutionClient(LiveExecutionClient):
             except Exception:
                 pass
 
-        try:
-            qty = Quantity.from_str(str(size))
-            filled_qty = Quantity.from_str(str(filled))
-        except Exception:
-            return None
-
-        price_val = venue_order.get("price")
-        trigger_val = venue_order.get("trigger_price")
-        avg_fill_val = venue_order.get("avg_fill_price")
-        price = Price.from_str(str(price_val)) if price_val not in (None, "") else None
-        trigger_price = Price.from_str(str(trigger_val)) if trigger_val not in (None, "") else None
-        trigger_type = (
-            self._map_trigger_type(venue_order.get("trigger_type"))
-            if trigger_price is not None
-            else TriggerType.NO_TRIGGER
-        )
-        avg_px = self._parse_decimal(avg_fill_val) if avg_fill_val not in (None, "") else None
-
-        ts_init = (
-            self._ns_from_ms(venue_order.get("created_at") or venue_order.get("timestamp"))
-            or self._clock.timestamp_ns()
-        )
-        ts_last = (
-            self._ns_from_ms(venue_order.get("updated_at") or venue_order.get("timestamp"))
-            or ts_init
-        )
-
         report_client_order_id = cached_order.client_order_id if cached_order is not None else None
         if report_client_order_id is None and client_order_id is not None:
             try:
@@ -994,33 +1288,37 @@ class StandXExecutionClient(LiveExecutionClient):
             except Exception:
                 report_client_order_id = None
 
-        side_value = venue_order.get("side") or ("SELL" if venue_order.get("is_ask") else "BUY")
-
         return OrderStatusReport(
             account_id=self.account_id,
-            instrument_id=instrument_id,
-            venue_order_id=VenueOrderId(str(order_id)),
-            order_side=self._map_order_side(str(side_value)),
-            order_type=self._map_order_type_from_venue(venue_order.get("type")),
-            time_in_force=self._map_tif(venue_order.get("time_in_force")),
-            order_status=venue_status,
-            quantity=qty,
-            filled_qty=filled_qty,
-            report_id=UUID4(),
-            ts_accepted=ts_init,
-            ts_last=ts_last,
-            ts_init=ts_init,
             client_order_id=report_client_order_id,
-            price=price,
-            trigger_price=trigger_price,
-            trigger_type=trigger_type,
-            avg_px=avg_px,
-            reduce_only=bool(venue_order.get("reduce_only", False)),
-            cancel_reason=venue_order.get("status")
-            if "cancel" in str(venue_order.get("status", "")).lower()
-            else None,
+            report_id=UUID4(),
+            ts_init=self._clock.timestamp_ns(),
+            **fields,
         )
 
+    def _build_order_status_reports(
+        self,
+        venue_orders: dict[str, dict[str, Any]],
+    ) -> list[OrderStatusReport]:
+        # Markets repeat across rows: resolve each once per batch. Rows equal to
+        # the ones seen on the previous reconcile reuse their parsed fields; the
+        # client order id and report identity are resolved afresh every time.
+        instrument_ids: dict[str, InstrumentId | None] = {}
+        reports: list[OrderStatusReport] = []
+        for key, venue_order in venue_orders.items():
+            parsed = self._order_report_memo.get(key, venue_order)
+            if parsed is None:
+                market = self._order_market(venue_order)
+                market_key = str(market) if market is not None else ""
+                if market_key not in instrument_ids:
+                    instrument_ids[market_key] = self._instrument_id_from_market(market_key or None)
+                parsed = self._parse_venue_order(venue_order, instrument_ids[market_key])
+                if parsed is None:
+                    continue
+                self._order_report_memo.put(key, venue_order, parsed)
+            reports.append(self._order_status_report(*parsed))
+        return reports
+
     async def _fetch_open_orders(self, market: str | None) -> list[dict[str, Any]]:
         payload = await self._call_client("get_open_orders", market)
         if isinstance(payload, list):
@@ -1107,10 +1405,7 @@ class StandXExecutionClient(LiveExecutionClient):
                 dedup[key] = item
 
         reports: list[OrderStatusReport] = []
-        for venue_order in dedup.values():
-            report = self._build_order_status_report_from_venue(venue_order)
-            if report is None:
-                continue
+        for report in self._build_order_status_reports(dedup):
             if instrument_id is not None and report.instrument_id != instrument_id:
                 continue
             reports.append(report)
@@ -1180,6 +1475,8 @@ class StandXExecutionClient(LiveExecutionClient):
             if not isinstance(payload, dict):
                 return []
             rows = payload.get("result") or payload.get("results") or payload.get("trades") or []
+        # Fills pair with the local ack time, so time them on the local clock too
+        received_ns = self._clock.timestamp_ns()
 
         reports: list[FillReport] = []
         for row in rows:
@@ -1252,6 +1549,9 @@ class StandXExecutionClient(LiveExecutionClient):
                 )
             except Exception:
                 continue
+        for report in reports:
+            if report.client_order_id is not None:
+                self._latency.order_filled(report.client_order_id.value, received_ns)
         return reports
 
     async def generate_position_status_reports(self, command) -> list[PositionStatusReport]:
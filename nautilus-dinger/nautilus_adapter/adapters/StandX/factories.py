@@ -13,6 +13,7 @@ from nautilus_trader.live.execution_client import LiveExecutionClient
 from nautilus_trader.live.factories import LiveDataClientFactory, LiveExecClientFactory
 from nautilus_trader.model.identifiers import ClientId
 
+from ...common.instrument_cache import MarketMetadataCache
 from .config import StandXDataClientConfig, StandXExecClientConfig
 from .constants import REST_URL_MAINNET, REST_URL_TESTNET, VENUE
 from .data import StandXDataClient
@@ -73,7 +74,20 @@ def _build_standx_http_client(config: object) -> object | None:
     if not api_key or not api_secret:
         return None
 
-    return backend.PyStandXHttpClient(base_url, api_key, api_secret)
+    # ``None`` lets the backend pick the private stream for ``is_testnet``
+    ws_url = getattr(config, "base_url_ws", None)
+    return backend.PyStandXHttpClient(base_url, api_key, api_secret, ws_url, is_testnet)
+
+
+def _build_standx_metadata_cache(config: object) -> MarketMetadataCache | None:
+    if not getattr(config, "use_instrument_cache", False):
+        return None
+    environment = "testnet" if bool(getattr(config, "is_testnet", False)) else "mainnet"
+    return MarketMetadataCache(
+        VENUE.value,
+        environment,
+        getattr(config, "instrument_cache_dir", None),
+    )
 
 
 class StandXLiveDataClientFactory(LiveDataClientFactory):
@@ -90,7 +104,11 @@ class StandXLiveDataClientFactory(LiveDataClientFactory):
             config if isinstance(config, StandXDataClientConfig) else StandXDataClientConfig()
         )
         backend_client = _build_standx_http_client(typed_config)
-        instrument_provider = StandXInstrumentProvider(client=backend_client)
+        metadata_cache = _build_standx_metadata_cache(typed_config)
+        instrument_provider = StandXInstrumentProvider(
+            client=backend_client,
+            metadata_cache=metadata_cache,
+        )
 
         return StandXDataClient(
             loop=loop,
@@ -121,7 +139,11 @@ class StandXLiveExecClientFactory(LiveExecClientFactory):
             config if isinstance(config, StandXExecClientConfig) else StandXExecClientConfig()
         )
         backend_client = _build_standx_http_client(typed_config)
-        instrument_provider = StandXInstrumentProvider(client=backend_client)
+        metadata_cache = _build_standx_metadata_cache(typed_config)
+        instrument_provider = StandXInstrumentProvider(
+            client=backend_client,
+            metadata_cache=metadata_cache,
+        )
 
         return StandXExecutionClient(
             loop=loop,
@@ -11,13 +11,20 @@ from nautilus_trader.model.identifiers import InstrumentId, Symbol
 from nautilus_trader.model.instruments import CryptoPerpetual, Instrument
 from nautilus_trader.model.objects import Currency, Price, Quantity
 
+from ...common.instrument_cache import MarketMetadataCache
 from .constants import VENUE
 
 
 class StandXInstrumentProvider(InstrumentProvider):
-    def __init__(self, client: object | None = None):
+    def __init__(
+        self,
+        client: object | None = None,
+        metadata_cache: MarketMetadataCache | None = None,
+    ):
         super().__init__(config=InstrumentProviderConfig(load_all=True))
         self._client = client
+        self._fingerprints: dict[str, tuple] = {}
+        self._metadata_cache = metadata_cache
 
     def find(self, instrument_id: InstrumentId) -> Instrument | None:
         return super().find(instrument_id)
@@ -87,8 +94,18 @@ class StandXInstrumentProvider(InstrumentProvider):
             info=market,
         )
 
-    async def load_all_async(self, filters: dict | None = None) -> None:
-        _ = filters
+    @staticmethod
+    def _market_fingerprint(market: dict) -> tuple:
+        # Only the fields an instrument is built from; volatile market stats
+        # (mark price, funding, open interest) must not count as a change.
+        return (
+            str(market.get("symbol") or "BTC-USD"),
+            market.get("market_id", market.get("marketId")),
+            market.get("size_decimals", market.get("sizeDecimals")),
+            market.get("price_decimals", market.get("priceDecimals")),
+        )
+
+    async def _fetch_markets(self) -> list[dict]:
         if self._client is None or not hasattr(self._client, "get_info"):
             raise RuntimeError("StandX instrument provider client is not configured")
 
@@ -100,19 +117,83 @@ class StandXInstrumentProvider(InstrumentProvider):
             data = json.loads(data)
 
         markets = data.get("markets", []) if isinstance(data, dict) else []
+        self._store_markets(markets)
+        return markets
+
+    def _add_market(self, market: dict) -> Instrument | None:
+        try:
+            instrument = self._build_instrument(market)
+            self.add_currency(instrument.base_currency)
+            self.add_currency(instrument.quote_currency)
+            self.add_currency(instrument.settlement_currency)
+            self.add(instrument)
+        except Exception as e:
+            self._log.warning(f"Skipping invalid StandX market payload: {market} ({e})")
+            return None
+
+        fingerprint = self._market_fingerprint(market)
+        self._fingerprints[fingerprint[0]] = fingerprint
+        return instrument
+
+    def _store_markets(self, markets: list[dict]) -> None:
+        if self._metadata_cache is None or not markets:
+            return
+        try:
+            self._metadata_cache.save(markets)
+        except OSError as e:
+            self._log.warning(f"Failed to persist StandX market metadata: {e}")
+
+    def load_cached(self) -> bool:
+        """
+        Build instruments from the on-disk market metadata cache, if any.
+
+        Returns ``False`` when there is no usable cache entry, in which case the
+        caller should ``load_all_async``; otherwise the caller is expected to
+        revalidate in the background with ``refresh_async``.
+        """
+        markets = self._metadata_cache.load() if self._metadata_cache is not None else None
+        if not markets:
+            return False
 
         self._instruments.clear()
         self._currencies.clear()
+        self._fingerprints.clear()
+
+        for market in markets:
+            self._add_market(market)
+        return self.count > 0
+
+    async def load_all_async(self, filters: dict | None = None) -> None:
+        _ = filters
+        markets = await self._fetch_markets()
+
+        self._instruments.clear()
+        self._currencies.clear()
+        self._fingerprints.clear()
+
+        for market in markets:
+            self._add_market(market)
+
+    async def refresh_async(self) -> list[Instrument]:
+        """
+        Re-fetch markets and rebuild only those whose tick/step/decimals changed.
+
+        Returns the added or changed instruments. Markets missing from the
+        response are kept, since a partial payload must not delist anything.
+        """
+        markets = await self._fetch_markets()
 
+        updated: list[Instrument] = []
         for market in markets:
-            try:
-                instrument = self._build_instrument(market)
-                self.add_currency(instrument.base_currency)
-                self.add_currency(instrument.quote_currency)
-                self.add_currency(instrument.settlement_currency)
-                self.add(instrument)
-            except Exception as e:
-                self._log.warning(f"Skipping invalid StandX market payload: {market} ({e})")
+            if not isinstance(market, dict):
+                continue
+            fingerprint = self._market_fingerprint(market)
+            if self._fingerprints.get(fingerprint[0]) == fingerprint:
+                continue
+            instrument = self._add_market(market)
+            if instrument is not None:
+                updated.append(instrument)
+        return updated
 
     async def load_ids_async(
         self,
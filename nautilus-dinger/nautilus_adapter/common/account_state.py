@@ -0,0 +1,58 @@
+"""
+Change-suppressed account state publication.
+
+Execution clients refresh balances whenever the private stream (or their own
+order flow) suggests the account moved, plus a slow safety poll. Most of those
+refreshes return the same numbers; ``AccountStateFilter`` lets a client call
+``generate_account_state`` only when a balance or margin value actually moved
+by more than a threshold, so risk checks see current data without the message
+bus being flooded with identical ``AccountState`` events.
+"""
+from dataclasses import dataclass
+from decimal import Decimal
+
+
+@dataclass(frozen=True)
+class AccountSnapshot:
+    total: Decimal
+    free: Decimal
+    locked: Decimal
+    initial_margin: Decimal
+    maintenance_margin: Decimal = Decimal("0")
+
+    def max_abs_change(self, other: "AccountSnapshot") -> Decimal:
+        return max(
+            abs(self.total - other.total),
+            abs(self.free - other.free),
+            abs(self.locked - other.locked),
+            abs(self.initial_margin - other.initial_margin),
+            abs(self.maintenance_margin - other.maintenance_margin),
+        )
+
+
+class AccountStateFilter:
+    """
+    Remembers the last published snapshot and rejects insignificant updates.
+
+    A value counts as changed when it moved by more than ``min_change``
+    (absolute, in account currency). The first snapshot always passes.
+    """
+
+    def __init__(self, min_change: Decimal = Decimal("0.01")) -> None:
+        self._min_change = min_change
+        self._last: AccountSnapshot | None = None
+        self.suppressed = 0
+
+    @property
+    def last(self) -> AccountSnapshot | None:
+        return self._last
+
+    def should_publish(self, snapshot: AccountSnapshot) -> bool:
+        if self._last is not None and snapshot.max_abs_change(self._last) <= self._min_change:
+            self.suppressed += 1
+            return False
+        self._last = snapshot
+        return True
+
+    def reset(self) -> None:
+        self._last = None
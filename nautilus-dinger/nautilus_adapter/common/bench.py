@@ -0,0 +1,330 @@
+"""
+Micro-benchmarks with stored baselines.
+
+A ``BenchSuite`` holds named cases. A case is a factory taking the event loop
+the suite runs on: it does its setup and returns the zero-argument callable to
+time (a coroutine function is awaited on that loop), or yields it when it has
+teardown to run afterwards. A factory raises ``BenchSkipped`` when something
+it needs, such as a native binding, is not available here.
+
+Each callable is calibrated so one round lasts at least ``min_round_secs`` and
+is then timed for ``rounds`` rounds. Baselines are the JSON form of a run;
+``compare`` judges the median per-call time, the statistic a noisy neighbour
+moves the least, and flags anything slower than the baseline by more than
+``max_regression``. ``uncompared`` names the baseline cases the run did not
+measure, so a case that vanished or started skipping cannot pass unnoticed.
+
+``load_criterion`` reads the results of the Rust crates' criterion benches
+into the same run form, so both sides share baselines and comparisons.
+"""
+import asyncio
+import fnmatch
+import gc
+import inspect
+import json
+import platform
+import statistics
+import time
+from collections.abc import Callable, Iterable
+from dataclasses import asdict, dataclass, field
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+
+BenchFn = Callable[[], Any]
+CaseFactory = Callable[[asyncio.AbstractEventLoop], Any]
+
+
+class BenchSkipped(Exception):
+    """
+    Raised by a case factory when the case cannot run in this environment.
+    """
+
+
+def machine_info() -> dict[str, str]:
+    return {
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "processor": platform.processor(),
+    }
+
+
+@dataclass(frozen=True)
+class BenchStats:
+    name: str
+    rounds: int
+    iterations: int
+    min_ns: float
+    median_ns: float
+    mean_ns: float
+    stddev_ns: float
+
+    @classmethod
+    def from_samples(cls, name: str, iterations: int, round_ns: list[int]) -> "BenchStats":
+        per_call = [ns / iterations for ns in round_ns]
+        return cls(
+            name=name,
+            rounds=len(per_call),
+            iterations=iterations,
+            min_ns=min(per_call),
+            median_ns=statistics.median(per_call),
+            mean_ns=statistics.fmean(per_call),
+            stddev_ns=statistics.pstdev(per_call),
+        )
+
+
+@dataclass
+class BenchRun:
+    results: dict[str, BenchStats] = field(default_factory=dict)
+    skipped: dict[str, str] = field(default_factory=dict)
+    machine: dict[str, str] = field(default_factory=machine_info)
+    created_at: str = field(default_factory=lambda: datetime.now(UTC).isoformat())
+
+    def to_json(self) -> dict[str, Any]:
+        return {
+            "created_at": self.created_at,
+            "machine": self.machine,
+            "results": {name: asdict(stats) for name, stats in self.results.items()},
+            "skipped": self.skipped,
+        }
+
+    @classmethod
+    def from_json(cls, payload: dict[str, Any]) -> "BenchRun":
+        return cls(
+            results={name: BenchStats(**stats) for name, stats in payload.get("results", {}).items()},
+            skipped=dict(payload.get("skipped", {})),
+            machine=dict(payload.get("machine", {})),
+            created_at=str(payload.get("created_at", "")),
+        )
+
+
+@dataclass(frozen=True)
+class Comparison:
+    name: str
+    baseline_ns: float
+    current_ns: float
+
+    @property
+    def ratio(self) -> float:
+        return self.current_ns / self.baseline_ns if self.baseline_ns > 0 else float("inf")
+
+    def regressed(self, max_regression: float) -> bool:
+        return self.ratio > 1.0 + max_regression
+
+
+def _blocking(fn: BenchFn, loop: asyncio.AbstractEventLoop) -> BenchFn:
+    if not inspect.iscoroutinefunction(fn):
+        return fn
+    return lambda: loop.run_until_complete(fn())
+
+
+def _time_round(fn: BenchFn, iterations: int, clock: Callable[[], int]) -> int:
+    start = clock()
+    for _ in range(iterations):
+        fn()
+    return clock() - start
+
+
+def measure(
+    name: str,
+    fn: BenchFn,
+    rounds: int = 7,
+    min_round_secs: float = 0.05,
+    max_iterations: int = 1_000_000,
+    clock: Callable[[], int] = time.perf_counter_ns,
+) -> BenchStats:
+    """
+    Time ``fn`` after one warm-up call and a calibration of calls per round.
+    """
+    target_ns = min_round_secs * 1e9
+    iterations = 1
+    elapsed = _time_round(fn, iterations, clock)
+    while elapsed < target_ns and iterations < max_iterations:
+        # Aim just past the target from the last round rather than doubling blindly
+        scale = target_ns / elapsed if elapsed > 0 else 10.0
+        iterations = min(max_iterations, max(iterations * 2, int(iterations * scale * 1.1)))
+        elapsed = _time_round(fn, iterations, clock)
+    samples = [_time_round(fn, iterations, clock) for _ in range(max(1, rounds))]
+    return BenchStats.from_samples(name, iterations, samples)
+
+
+class BenchSuite:
+    def __init__(self) -> None:
+        self._cases: dict[str, CaseFactory] = {}
+
+    def case(self, name: str) -> Callable[[CaseFactory], CaseFactory]:
+        def register(factory: CaseFactory) -> CaseFactory:
+            if name in self._cases:
+                raise ValueError(f"Duplicate benchmark case {name!r}")
+            self._cases[name] = factory
+            return factory
+
+        return register
+
+    @property
+    def names(self) -> list[str]:
+        return list(self._cases)
+
+    def select(self, patterns: Iterable[str] | None = None) -> list[str]:
+        patterns = [p for p in (patterns or []) if p]
+        if not patterns:
+            return self.names
+        return [n for n in self._cases if any(fnmatch.fnmatchcase(n, p) for p in patterns)]
+
+    def run(
+        self,
+        patterns: Iterable[str] | None = None,
+        rounds: int = 7,
+        min_round_secs: float = 0.05,
+        on_result: Callable[[str, BenchStats | None, str | None], None] | None = None,
+    ) -> BenchRun:
+        run = BenchRun()
+        loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
+        try:
+            for name in self.select(patterns):
+                try:
+                    stats = self._run_case(name, loop, rounds, min_round_secs)
+                except BenchSkipped as exc:
+                    run.skipped[name] = str(exc) or "skipped"
+                    if on_result is not None:
+                        on_result(name, None, run.skipped[name])
+                    continue
+                run.results[name] = stats
+                if on_result is not None:
+                    on_result(name, stats, None)
+        finally:
+            asyncio.set_event_loop(None)
+            loop.close()
+        return run
+
+    def _run_case(
+        self,
+        name: str,
+        loop: asyncio.AbstractEventLoop,
+        rounds: int,
+        min_round_secs: float,
+    ) -> BenchStats:
+        made = self._cases[name](loop)
+        teardown = made if inspect.isgenerator(made) else None
+        fn = next(made) if teardown is not None else made
+        try:
+            gc.collect()
+            return measure(name, _blocking(fn, loop), rounds=rounds, min_round_secs=min_round_secs)
+        finally:
+            if teardown is not None:
+                teardown.close()
+
+
+def save_baseline(path: str | Path, run: BenchRun) -> Path:
+    target = Path(path)
+    target.parent.mkdir(parents=True, exist_ok=True)
+    target.write_text(json.dumps(run.to_json(), indent=2, sort_keys=True) + "\n")
+    return target
+
+
+def load_baseline(path: str | Path) -> BenchRun:
+    return BenchRun.from_json(json.loads(Path(path).read_text()))
+
+
+def load_criterion(
+    root: str | Path,
+    prefixes: Iterable[str] | None = None,
+    since: float | None = None,
+) -> BenchRun:
+    """
+    Read criterion's ``<root>/**/new`` results into a run.
+
+    Cases are named ``<group>.<function>``. A bench declaring an element
+    throughput has its times divided by the element count, so a page of rows
+    and a single order are both reported per element. ``prefixes`` keeps only
+    the matching case names and ``since`` only results written after that
+    epoch time, which drops stale directories left by earlier runs.
+    """
+    prefixes = tuple(prefixes or ())
+    run = BenchRun()
+    for meta_path in sorted(Path(root).glob("**/new/benchmark.json")):
+        if since is not None and meta_path.stat().st_mtime < since:
+            continue
+        meta = json.loads(meta_path.read_text())
+        name = meta["full_id"].replace("/", ".")
+        if prefixes and not name.startswith(prefixes):
+            continue
+        estimates = json.loads((meta_path.parent / "estimates.json").read_text())
+        sample = json.loads((meta_path.parent / "sample.json").read_text())
+        elements = (meta.get("throughput") or {}).get("Elements") or 1
+        per_iter = [t / i for t, i in zip(sample["times"], sample["iters"]) if i]
+        run.results[name] = BenchStats(
+            name=name,
+            rounds=len(per_iter),
+            iterations=int(sum(sample["iters"])),
+            min_ns=min(per_iter) / elements,
+            median_ns=estimates["median"]["point_estimate"] / elements,
+            mean_ns=estimates["mean"]["point_estimate"] / elements,
+            stddev_ns=estimates["std_dev"]["point_estimate"] / elements,
+        )
+    return run
+
+
+def compare(run: BenchRun, baseline: BenchRun) -> list[Comparison]:
+    """
+    Pair every case present in both runs, in the order of ``run``.
+    """
+    return [
+        Comparison(name, baseline.results[name].median_ns, stats.median_ns)
+        for name, stats in run.results.items()
+        if name in baseline.results
+    ]
+
+
+def uncompared(
+    run: BenchRun,
+    baseline: BenchRun,
+    names: Iterable[str] | None = None,
+) -> dict[str, str]:
+    """
+    Map each baseline case ``run`` has no timing for to the reason why.
+
+    ``names`` limits the check to the cases the run selected, so a filtered
+    run is not blamed for the cases it left out on purpose.
+    """
+    selected = None if names is None else set(names)
+    reasons = {}
+    for name in baseline.results:
+        if name in run.results or (selected is not None and name not in selected):
+            continue
+        reasons[name] = f"skipped: {run.skipped[name]}" if name in run.skipped else "missing from this run"
+    return reasons
+
+
+def _format_ns(value: float) -> str:
+    for unit, scale in (("s", 1e9), ("ms", 1e6), ("us", 1e3)):
+        if value >= scale:
+            return f"{value / scale:.2f}{unit}"
+    return f"{value:.0f}ns"
+
+
+def render_table(
+    run: BenchRun,
+    comparisons: list[Comparison] | None = None,
+    max_regression: float | None = None,
+) -> str:
+    by_name = {c.name: c for c in comparisons or []}
+    width = max([len(n) for n in [*run.results, *run.skipped]] + [4])
+    lines = [f"{'case':<{width}}  {'median':>10}  {'min':>10}  {'stddev':>10}  {'iters':>7}  baseline"]
+    for name, stats in run.results.items():
+        row = (
+            f"{name:<{width}}  {_format_ns(stats.median_ns):>10}  {_format_ns(stats.min_ns):>10}  "
+            f"{_format_ns(stats.stddev_ns):>10}  {stats.iterations:>7}"
+        )
+        comparison = by_name.get(name)
+        if comparison is not None:
+            row += f"  {comparison.ratio:.2f}x of {_format_ns(comparison.baseline_ns)}"
+            if max_regression is not None and comparison.regressed(max_regression):
+                row += "  REGRESSED"
+        lines.append(row)
+    for name, reason in run.skipped.items():
+        lines.append(f"{name:<{width}}  skipped: {reason}")
+    return "\n".join(lines)
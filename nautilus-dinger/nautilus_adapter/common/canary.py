@@ -0,0 +1,356 @@
+"""
+In-process canary attempts against one warm trading node.
+
+Running each canary attempt as a fresh runner process pays for an interpreter
+start, the nautilus import, ``TradingNode.build()``, client connection and
+instrument load every time, and leaves the outcome to be scraped from log
+text. ``CanaryEngine`` builds and starts the node once, then runs each attempt
+as a strategy added to and removed from the running trader, collecting the
+order and position events it publishes on the message bus.
+"""
+import asyncio
+import time
+from dataclasses import dataclass, field
+from typing import Any, NamedTuple, Protocol
+
+import msgspec
+from nautilus_trader.config import ImportableControllerConfig, TradingNodeConfig
+from nautilus_trader.live.node import TradingNode
+from nautilus_trader.model.enums import ContingencyType
+from nautilus_trader.model.identifiers import StrategyId
+from nautilus_trader.trading.controller import Controller
+from nautilus_trader.trading.strategy import Strategy
+
+from nautilus_adapter.common.event_log import EventLogWriter
+
+# Strategies can only be added to a running trader through a controller
+CANARY_CONTROLLER = ImportableControllerConfig(
+    controller_path="nautilus_trader.trading.controller:Controller",
+    config_path="nautilus_trader.common.config:ActorConfig",
+    config={},
+)
+
+# Event kind -> terminal state of the order it belongs to
+_TERMINAL_KINDS = {
+    "OrderFilled": "FILLED",
+    "OrderCanceled": "CANCELED",
+    "OrderExpired": "CANCELED",
+    "OrderRejected": "REJECTED",
+}
+
+
+class CanaryEvent(NamedTuple):
+    kind: str
+    strategy_id: str | None
+    client_order_id: str | None
+    event: Any
+
+
+class CanaryEventLog:
+    """
+    Message bus handler recording every order and position event in order.
+    """
+
+    def __init__(self) -> None:
+        self.events: list[CanaryEvent] = []
+
+    def __len__(self) -> int:
+        return len(self.events)
+
+    def __call__(self, event: Any) -> None:
+        strategy_id = getattr(event, "strategy_id", None)
+        client_order_id = getattr(event, "client_order_id", None)
+        self.events.append(
+            CanaryEvent(
+                type(event).__name__,
+                None if strategy_id is None else str(strategy_id),
+                None if client_order_id is None else str(client_order_id),
+                event,
+            ),
+        )
+
+    def since(self, mark: int, strategy_id: str | None = None) -> list[CanaryEvent]:
+        events = self.events[mark:]
+        if strategy_id is None:
+            return events
+        return [e for e in events if e.strategy_id == strategy_id]
+
+
+class CanaryScenario(Protocol):
+    """
+    One kind of canary attempt.
+
+    ``build_strategy`` may block (it typically fetches reference prices) and
+    is run in the default executor.
+    """
+
+    name: str
+    runtime_secs: float
+
+    def build_strategy(self, attempt: int) -> Strategy: ...
+
+
+@dataclass
+class CanaryAttempt:
+    attempt: int
+    scenario: str
+    strategy_id: str | None
+    elapsed_secs: float
+    events: list[CanaryEvent]
+    reconciliation_ok: bool | None
+    timed_out: bool = False
+    errors: list[str] = field(default_factory=list)
+
+    @property
+    def entry_client_order_id(self) -> str | None:
+        """
+        The bracket entry (the OTO parent), else the last order initialized.
+        """
+        initialized = [e for e in self.events if e.kind == "OrderInitialized"]
+        for event in reversed(initialized):
+            if getattr(event.event, "contingency_type", None) == ContingencyType.OTO:
+                return event.client_order_id
+        return initialized[-1].client_order_id if initialized else None
+
+    def kinds(self, client_order_id: str | None) -> set[str]:
+        return {e.kind for e in self.events if e.client_order_id == client_order_id}
+
+    @property
+    def entry_terminal_state(self) -> str | None:
+        kinds = self.kinds(self.entry_client_order_id)
+        for kind in ("OrderFilled", "OrderCanceled", "OrderExpired", "OrderRejected"):
+            if kind in kinds:
+                return _TERMINAL_KINDS[kind]
+        return None
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "attempt": self.attempt,
+            "scenario": self.scenario,
+            "strategy_id": self.strategy_id,
+            "elapsed_secs": self.elapsed_secs,
+            "entry_client_order_id": self.entry_client_order_id,
+            "entry_terminal_state": self.entry_terminal_state,
+            "reconciliation_ok": self.reconciliation_ok,
+            "timed_out": self.timed_out,
+            "errors": self.errors,
+            "events": [[e.kind, e.client_order_id] for e in self.events],
+        }
+
+
+class CanaryEngine:
+    """
+    Keeps one trading node running and runs canary attempts against it.
+
+    Each attempt adds the scenario's strategy under its own id and order id
+    tag, waits until the entry order is closed and nothing is in flight (or
+    ``runtime_secs`` pass), cancels whatever the strategy left open, removes
+    it and re-runs execution reconciliation. ``close`` stops the node on the
+    loop; call ``dispose`` once the loop has finished. An ``event_log`` also
+    gets every event and reconciliation outcome as JSONL.
+    """
+
+    def __init__(
+        self,
+        config: TradingNodeConfig,
+        factories: dict[str, tuple[Any, Any]],
+        startup_timeout_secs: float | None = None,
+        cancel_timeout_secs: float = 10.0,
+        reconcile_timeout_secs: float = 30.0,
+        poll_interval_secs: float = 0.1,
+        event_log: EventLogWriter | None = None,
+    ) -> None:
+        if config.controller is None:
+            config = msgspec.structs.replace(config, controller=CANARY_CONTROLLER)
+        self._config = config
+        self._factories = factories
+        if startup_timeout_secs is None:
+            # The kernel gives up silently once any of its startup phases times out
+            startup_timeout_secs = (
+                config.timeout_connection
+                + config.timeout_reconciliation
+                + config.timeout_portfolio
+            )
+        self._startup_timeout_secs = startup_timeout_secs
+        self._cancel_timeout_secs = cancel_timeout_secs
+        self._reconcile_timeout_secs = reconcile_timeout_secs
+        self._poll_interval_secs = poll_interval_secs
+        self._event_log = event_log
+        self._node: TradingNode | None = None
+        self._controller: Controller | None = None
+        self._run_task: asyncio.Task | None = None
+        self.events = CanaryEventLog()
+        self.startup_secs: float | None = None
+
+    @property
+    def node(self) -> TradingNode:
+        if self._node is None:
+            raise RuntimeError("Canary engine not started")
+        return self._node
+
+    async def start(self) -> None:
+        """
+        Build and start the node; returns once the trader is running.
+
+        The kernel only starts the trader after startup reconciliation
+        succeeded, so a node that never gets there raises.
+        """
+        started = time.monotonic()
+        loop = asyncio.get_running_loop()
+        node = TradingNode(config=self._config, loop=loop)
+        for name, (data_factory, exec_factory) in self._factories.items():
+            node.add_data_client_factory(name, data_factory)
+            node.add_exec_client_factory(name, exec_factory)
+        node.build()
+        node.kernel.msgbus.subscribe("events.order*", self.events)
+        node.kernel.msgbus.subscribe("events.position*", self.events)
+        if self._event_log is not None:
+            self._event_log.attach(node)
+        self._node = node
+        self._run_task = loop.create_task(node.run_async())
+
+        deadline = loop.time() + self._startup_timeout_secs
+        while not node.trader.is_running:
+            if self._run_task.done():
+                self._run_task.result()
+                raise RuntimeError("Trading node stopped during startup")
+            if loop.time() >= deadline:
+                raise RuntimeError(
+                    f"Trading node not running after {self._startup_timeout_secs}s "
+                    "(client connection or startup reconciliation failed)",
+                )
+            await asyncio.sleep(self._poll_interval_secs)
+
+        self._controller = next(a for a in node.trader.actors() if isinstance(a, Controller))
+        self.startup_secs = time.monotonic() - started
+
+    async def run_attempt(
+        self,
+        scenario: CanaryScenario,
+        attempt: int,
+        timeout_secs: float | None = None,
+        reconcile: bool = True,
+    ) -> CanaryAttempt:
+        """
+        Run one attempt of ``scenario``; with ``reconcile=False`` the closing
+        reconciliation is skipped (``reconciliation_ok`` is ``None``), e.g. when
+        many attempts run concurrently and the caller reconciles once.
+        """
+        started = time.monotonic()
+        mark = len(self.events)
+        strategy: Strategy | None = None
+        errors: list[str] = []
+        timed_out = False
+
+        async def drive() -> None:
+            nonlocal strategy
+            loop = asyncio.get_running_loop()
+            strategy = await loop.run_in_executor(None, scenario.build_strategy, attempt)
+            self._assign_attempt_id(strategy, attempt)
+            self._require_controller().create_strategy(strategy)
+            await self._settle(strategy, scenario.runtime_secs)
+
+        try:
+            await asyncio.wait_for(drive(), timeout_secs)
+        except asyncio.TimeoutError:
+            timed_out = True
+        except Exception as e:
+            errors.append(f"{type(e).__name__}: {e}")
+        finally:
+            if strategy is not None and strategy.id in self.node.trader.strategy_ids():
+                await self._retire(strategy)
+
+        reconciliation_ok = await self.reconcile() if reconcile else None
+        strategy_id = None if strategy is None else strategy.id.value
+        events = self.events.since(mark, strategy_id)
+        errors.extend(
+            f"{e.kind} {e.client_order_id}: {getattr(e.event, 'reason', '')}"
+            for e in events
+            if e.kind in ("OrderDenied", "OrderModifyRejected")
+        )
+        return CanaryAttempt(
+            attempt=attempt,
+            scenario=scenario.name,
+            strategy_id=strategy_id,
+            elapsed_secs=time.monotonic() - started,
+            events=events,
+            reconciliation_ok=reconciliation_ok,
+            timed_out=timed_out,
+            errors=errors,
+        )
+
+    async def reconcile(self) -> bool:
+        return await self.node.kernel.exec_engine.reconcile_execution_state(
+            timeout_secs=self._reconcile_timeout_secs,
+        )
+
+    async def close(self) -> None:
+        node = self._node
+        if node is None:
+            return
+        await node.stop_async()
+        task = self._run_task
+        if task is not None and not task.done():
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+        self._run_task = None
+
+    def dispose(self) -> None:
+        """
+        Dispose the node (call after the event loop has finished).
+        """
+        if self._node is not None:
+            self._node.dispose()
+            self._node = None
+            self._controller = None
+
+    def _require_controller(self) -> Controller:
+        if self._controller is None:
+            raise RuntimeError("Canary engine not started")
+        return self._controller
+
+    @staticmethod
+    def _assign_attempt_id(strategy: Strategy, attempt: int) -> None:
+        # Mirrors the trader's own tag assignment, but unique per attempt so
+        # client order ids never repeat across attempts on the same node.
+        if strategy.order_id_tag not in (None, str(None)):
+            return
+        tag = f"{attempt:03d}"
+        strategy.change_id(StrategyId(f"{strategy.id.value.partition('-')[0]}-{tag}"))
+        strategy.change_order_id_tag(tag)
+
+    def _is_settled(self, strategy: Strategy) -> bool:
+        cache = self.node.cache
+        orders = cache.orders(strategy_id=strategy.id)
+        if not orders or cache.orders_inflight(strategy_id=strategy.id):
+            return False
+        entry = next((o for o in orders if o.parent_order_id is None), orders[0])
+        return entry.is_closed
+
+    async def _settle(self, strategy: Strategy, runtime_secs: float) -> None:
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + runtime_secs
+        while loop.time() < deadline:
+            await asyncio.sleep(self._poll_interval_secs)
+            if self._is_settled(strategy):
+                return
+
+    async def _retire(self, strategy: Strategy) -> None:
+        cache = self.node.cache
+        loop = asyncio.get_running_loop()
+        for order in cache.orders_open(strategy_id=strategy.id):
+            if not order.is_pending_cancel:
+                strategy.cancel_order(order)
+        deadline = loop.time() + self._cancel_timeout_secs
+        while loop.time() < deadline and (
+            cache.orders_open(strategy_id=strategy.id)
+            or cache.orders_inflight(strategy_id=strategy.id)
+        ):
+            await asyncio.sleep(self._poll_interval_secs)
+
+        controller = self._require_controller()
+        controller.stop_strategy(strategy)
+        controller.remove_strategy(strategy)
@@ -0,0 +1,123 @@
+"""
+Persistent mapping between Nautilus client order ids and venue integer ids.
+
+Some venues only accept an integer client id, so non-numeric Nautilus ids are
+hashed on submit and the venue echoes back just the integer. This store keeps
+both directions in memory (bounded, least recently used evicted first) and
+appends every new pair to a local log so the mapping survives restarts. The
+log is rewritten with only the live entries once it grows well past them.
+"""
+import json
+import os
+from collections import OrderedDict
+from pathlib import Path
+from typing import TextIO
+
+from .instrument_cache import CACHE_DIR_ENV
+
+
+def default_store_dir() -> Path:
+    root = os.getenv(CACHE_DIR_ENV)
+    if root:
+        return Path(root).expanduser() / "client_orders"
+    return Path.home() / ".cache" / "nautilus_adapter" / "client_orders"
+
+
+class ClientOrderIdStore:
+    """
+    Bidirectional ``client_order_id <-> index`` map backed by an append-only log.
+
+    Each log line is ``[index, "client_order_id"]``; on load the last line for
+    an id wins and unreadable lines (e.g. a torn final write) are skipped.
+    Passing ``path=None`` keeps the store in memory only.
+    """
+
+    def __init__(
+        self,
+        path: str | Path | None,
+        max_entries: int = 100_000,
+        compact_min_lines: int = 1_000,
+    ) -> None:
+        self.path = Path(path).expanduser() if path is not None else None
+        self._max_entries = max(1, max_entries)
+        self._compact_min_lines = compact_min_lines
+        self._by_client_id: OrderedDict[str, int] = OrderedDict()
+        self._by_index: dict[int, str] = {}
+        self._log: TextIO | None = None
+        self._log_lines = 0
+        self._load()
+
+    def __len__(self) -> int:
+        return len(self._by_client_id)
+
+    def _load(self) -> None:
+        if self.path is None:
+            return
+        try:
+            with self.path.open(encoding="utf-8") as f:
+                for line in f:
+                    self._log_lines += 1
+                    try:
+                        index, client_order_id = json.loads(line)
+                        self._remember(str(client_order_id), int(index))
+                    except (ValueError, TypeError):
+                        continue
+        except OSError:
+            return
+
+    def _remember(self, client_order_id: str, index: int) -> None:
+        previous = self._by_client_id.pop(client_order_id, None)
+        if previous is not None and self._by_index.get(previous) == client_order_id:
+            del self._by_index[previous]
+        self._by_client_id[client_order_id] = index
+        self._by_index[index] = client_order_id
+        while len(self._by_client_id) > self._max_entries:
+            evicted_id, evicted_index = self._by_client_id.popitem(last=False)
+            if self._by_index.get(evicted_index) == evicted_id:
+                del self._by_index[evicted_index]
+
+    def put(self, client_order_id: str, index: int) -> None:
+        if self._by_client_id.get(client_order_id) == index:
+            self._by_client_id.move_to_end(client_order_id)
+            return
+        self._remember(client_order_id, index)
+        if self.path is None:
+            return
+        if self._log is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._log = self.path.open("a", encoding="utf-8")
+        self._log.write(json.dumps([index, client_order_id]) + "\n")
+        self._log.flush()
+        self._log_lines += 1
+        if self._log_lines > max(self._compact_min_lines, 2 * len(self._by_client_id)):
+            self.compact()
+
+    def index_for(self, client_order_id: str) -> int | None:
+        return self._by_client_id.get(client_order_id)
+
+    def client_order_id_for(self, index: int) -> str | None:
+        return self._by_index.get(index)
+
+    def compact(self) -> None:
+        """
+        Rewrite the log with only the live entries (atomic replace).
+        """
+        if self.path is None:
+            return
+        if self._log is not None:
+            self._log.close()
+            self._log = None
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_suffix(self.path.suffix + ".tmp")
+        with tmp_path.open("w", encoding="utf-8") as f:
+            for client_order_id, index in self._by_client_id.items():
+                f.write(json.dumps([index, client_order_id]) + "\n")
+        os.replace(tmp_path, self.path)
+        self._log_lines = len(self._by_client_id)
+
+    def close(self) -> None:
+        if self._log is not None:
+            self._log.close()
+            self._log = None
+        if self.path is not None and self._log_lines > len(self._by_client_id):
+            self.compact()
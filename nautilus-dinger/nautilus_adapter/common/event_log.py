@@ -0,0 +1,218 @@
+"""
+Structured JSONL log of order, position and reconciliation events.
+
+The strategy runners print every message bus event as a
+``BUS_EVENT <type> <repr>`` line, which leaves assertions and canary reports
+to recover state by running regexes over multi-megabyte logs, once per fact.
+``EventLogWriter`` writes each event as one JSON object instead: the event's
+own ``to_dict`` fields (nanosecond ``ts_event``/``ts_init`` included) plus its
+kind, category and wall-clock receive time. Reconciliation outcomes, which
+only ever reached the text log, are written as records of their own.
+``EventLogIndex`` reads a log back in one streaming pass, indexed by kind and
+client order id.
+"""
+import json
+import time
+from collections import defaultdict
+from pathlib import Path
+from typing import Any, Callable, Iterable, Iterator
+
+ORDER = "order"
+POSITION = "position"
+RECONCILIATION = "reconciliation"
+
+RECONCILIATION_COMPLETED = "ReconciliationCompleted"
+STARTUP = "startup"
+RUNTIME = "runtime"
+
+# Bracket legs as tagged by the order factory
+BRACKET_TAGS = ("ENTRY", "STOP_LOSS", "TAKE_PROFIT")
+
+
+def event_record(event: Any) -> dict[str, Any]:
+    """
+    Flatten a Nautilus order or position event into a JSON-ready dict.
+    """
+    kind = type(event).__name__
+    to_dict = getattr(type(event), "to_dict", None)
+    try:
+        fields = dict(to_dict(event)) if to_dict is not None else {}
+    except Exception:
+        fields = {}
+    fields.pop("type", None)
+    if not fields:
+        fields = {"repr": str(event)}
+    category = POSITION if kind.startswith("Position") else ORDER
+    return {"kind": kind, "category": category, **fields}
+
+
+class EventLogWriter:
+    """
+    Message bus handler appending events to a JSONL file.
+
+    The file is line buffered so a runner that dies mid-run keeps every event
+    it saw. ``attach`` subscribes the writer to a node and records each
+    execution reconciliation it runs.
+    """
+
+    def __init__(self, path: str | Path, clock: Callable[[], int] = time.time_ns) -> None:
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._file = self.path.open("a", buffering=1)
+        self._clock = clock
+        self.count = 0
+
+    def __call__(self, event: Any) -> None:
+        self.write(event_record(event))
+
+    def __enter__(self) -> "EventLogWriter":
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+    def write(self, record: dict[str, Any]) -> None:
+        if self._file.closed:
+            return
+        record.setdefault("ts_recv", self._clock())
+        self._file.write(json.dumps(record, separators=(",", ":"), default=str) + "\n")
+        self.count += 1
+
+    def record_reconciliation(
+        self,
+        phase: str,
+        ok: bool,
+        ts_started: int,
+        ts_finished: int,
+    ) -> None:
+        self.write(
+            {
+                "kind": RECONCILIATION_COMPLETED,
+                "category": RECONCILIATION,
+                "phase": phase,
+                "ok": ok,
+                "duration_ns": ts_finished - ts_started,
+                "ts_event": ts_finished,
+                "ts_init": ts_started,
+            },
+        )
+
+    def attach(self, node: Any) -> None:
+        """
+        Subscribe to a built node's order and position events and record the
+        outcome of every execution reconciliation (startup and later).
+        """
+        kernel = node.kernel
+        kernel.msgbus.subscribe("events.order*", self)
+        kernel.msgbus.subscribe("events.position*", self)
+
+        exec_engine = kernel.exec_engine
+        reconcile = exec_engine.reconcile_execution_state
+        clock = kernel.clock
+
+        async def reconcile_execution_state(*args: Any, **kwargs: Any) -> bool:
+            # The trader only starts once startup reconciliation succeeded
+            phase = RUNTIME if node.trader.is_running else STARTUP
+            started = clock.timestamp_ns()
+            ok = False
+            try:
+                ok = await reconcile(*args, **kwargs)
+                return ok
+            finally:
+                self.record_reconciliation(phase, ok, started, clock.timestamp_ns())
+
+        exec_engine.reconcile_execution_state = reconcile_execution_state
+
+    def close(self) -> None:
+        self._file.close()
+
+
+def read_event_log(path: str | Path) -> Iterator[dict[str, Any]]:
+    """
+    Yield the records of a JSONL event log, skipping lines that do not parse
+    (e.g. the last line of a runner killed mid-write).
+    """
+    with Path(path).open() as f:
+        for line in f:
+            try:
+                record = json.loads(line)
+            except ValueError:
+                continue
+            if isinstance(record, dict):
+                yield record
+
+
+class EventLogIndex:
+    """
+    Event log records indexed by kind and client order id.
+    """
+
+    def __init__(self, records: Iterable[dict[str, Any]] = ()) -> None:
+        self.records: list[dict[str, Any]] = []
+        self._by_kind: dict[str, list[dict[str, Any]]] = defaultdict(list)
+        self._by_order: dict[str, list[dict[str, Any]]] = defaultdict(list)
+        for record in records:
+            self.add(record)
+
+    @classmethod
+    def from_path(cls, path: str | Path) -> "EventLogIndex":
+        return cls(read_event_log(path))
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+    def add(self, record: dict[str, Any]) -> None:
+        self.records.append(record)
+        self._by_kind[record.get("kind", "")].append(record)
+        client_order_id = record.get("client_order_id")
+        if client_order_id is not None:
+            self._by_order[client_order_id].append(record)
+
+    def events(
+        self,
+        kind: str | None = None,
+        client_order_id: str | None = None,
+    ) -> list[dict[str, Any]]:
+        if client_order_id is not None:
+            records = self._by_order.get(client_order_id, [])
+            return records if kind is None else [r for r in records if r.get("kind") == kind]
+        if kind is not None:
+            return self._by_kind.get(kind, [])
+        return self.records
+
+    def has(self, kind: str, client_order_id: str | None = None) -> bool:
+        return bool(self.events(kind, client_order_id))
+
+    def kinds(self, client_order_id: str) -> set[str]:
+        return {r.get("kind", "") for r in self._by_order.get(client_order_id, [])}
+
+    def latest_bracket(self) -> tuple[str, str, str] | None:
+        """
+        Client order ids ``(entry, stop_loss, take_profit)`` of the last
+        bracket whose three legs were all initialized.
+        """
+        legs_by_list: dict[str, dict[str, str]] = {}
+        for record in self._by_kind.get("OrderInitialized", []):
+            order_list_id = record.get("order_list_id")
+            tags = record.get("tags") or []
+            leg = next((t for t in BRACKET_TAGS if t in tags), None)
+            if order_list_id is None or leg is None:
+                continue
+            legs_by_list.setdefault(order_list_id, {})[leg] = record["client_order_id"]
+
+        complete = [legs for legs in legs_by_list.values() if len(legs) == len(BRACKET_TAGS)]
+        if not complete:
+            return None
+        legs = complete[-1]
+        return legs["ENTRY"], legs["STOP_LOSS"], legs["TAKE_PROFIT"]
+
+    def reconciliations(self, phase: str | None = None) -> list[dict[str, Any]]:
+        records = self._by_kind.get(RECONCILIATION_COMPLETED, [])
+        return records if phase is None else [r for r in records if r.get("phase") == phase]
+
+    def reconciliation_ok(self, phase: str | None = None) -> bool:
+        """
+        At least one reconciliation ran (in ``phase``) and none failed.
+        """
+        records = self.reconciliations(phase)
+        return bool(records) and all(r.get("ok") for r in records)
@@ -0,0 +1,319 @@
+"""
+Paged, rate-budgeted historical fetches backed by a local Parquet catalog.
+
+Venue trade endpoints return at most one page per call, so a multi-hour
+warm-up request is split into fixed windows that are fetched concurrently and
+paged inside each window, forward or backward depending on the order the
+venue returns its pages in. ``RequestBudget`` keeps the fan-out inside
+the client's request rate. Settled results are written to a Nautilus
+``ParquetDataCatalog``; later requests only fetch the intervals the catalog
+does not cover yet, so repeated warm-ups are served from disk.
+"""
+import asyncio
+import os
+from pathlib import Path
+from typing import Any, Awaitable, Callable
+
+from .instrument_cache import CACHE_DIR_ENV
+
+DEFAULT_PAGE_SPAN_MS = 3_600_000
+# Trades younger than this may still be missing from venue history pages.
+DEFAULT_SETTLE_NS = 60_000_000_000
+
+
+def default_catalog_dir() -> Path:
+    root = os.getenv(CACHE_DIR_ENV)
+    if root:
+        return Path(root).expanduser() / "catalog"
+    return Path.home() / ".cache" / "nautilus_adapter" / "catalog"
+
+
+def split_range(start_ms: int, end_ms: int, span_ms: int) -> list[tuple[int, int]]:
+    """
+    Split the inclusive range ``[start_ms, end_ms]`` into consecutive windows.
+    """
+    span_ms = max(1, span_ms)
+    windows: list[tuple[int, int]] = []
+    cursor = start_ms
+    while cursor <= end_ms:
+        window_end = min(cursor + span_ms - 1, end_ms)
+        windows.append((cursor, window_end))
+        cursor = window_end + 1
+    return windows
+
+
+class RequestBudget:
+    """
+    Async context manager bounding concurrent requests and their start rate.
+
+    Request starts are spaced at least ``1 / max_requests_per_second`` apart
+    across every task sharing the budget.
+    """
+
+    def __init__(self, max_requests_per_second: float, max_concurrency: int = 4) -> None:
+        self._interval = 1.0 / max_requests_per_second if max_requests_per_second > 0 else 0.0
+        self._semaphore = asyncio.Semaphore(max(1, max_concurrency))
+        self._lock = asyncio.Lock()
+        self._next_at = 0.0
+        self.requests = 0
+
+    async def __aenter__(self) -> "RequestBudget":
+        await self._semaphore.acquire()
+        try:
+            async with self._lock:
+                now = asyncio.get_running_loop().time()
+                start_at = max(now, self._next_at)
+                self._next_at = start_at + self._interval
+            if start_at > now:
+                await asyncio.sleep(start_at - now)
+        except BaseException:
+            self._semaphore.release()
+            raise
+        self.requests += 1
+        return self
+
+    async def __aexit__(self, *exc: Any) -> None:
+        self._semaphore.release()
+
+
+async def fetch_window(
+    fetch_page: Callable[[int, int], Awaitable[list[dict[str, Any]]]],
+    start_ms: int,
+    end_ms: int,
+    row_ts_ms: Callable[[dict[str, Any]], int | None],
+    budget: RequestBudget,
+    page_size: int,
+    max_pages: int = 1_000,
+    newest_first: bool = False,
+) -> list[dict[str, Any]]:
+    """
+    Page through ``[start_ms, end_ms]`` until a short or stale page.
+
+    ``fetch_page(from_ms, to_ms)`` returns at most ``page_size`` rows inside
+    its bounds. By default they are the oldest rows in ascending order and the
+    window is paged forward from ``start_ms``; with ``newest_first`` they are
+    the newest rows and the window is paged backward from ``end_ms``. The
+    moving bound restarts at the last timestamp reached so rows sharing that
+    millisecond are not lost; rows already returned are dropped.
+    """
+    rows: list[dict[str, Any]] = []
+    seen: set[tuple] = set()
+    lower, upper = start_ms, end_ms
+    for _ in range(max_pages):
+        async with budget:
+            page = await fetch_page(lower, upper)
+        fresh = 0
+        reached = upper if newest_first else lower
+        for row in page:
+            ts = row_ts_ms(row)
+            if ts is None or ts < start_ms or ts > end_ms:
+                continue
+            key = tuple(sorted((k, str(v)) for k, v in row.items()))
+            if key in seen:
+                continue
+            seen.add(key)
+            rows.append(row)
+            fresh += 1
+            reached = min(reached, ts) if newest_first else max(reached, ts)
+        if len(page) < page_size or fresh == 0:
+            break
+        if newest_first:
+            upper = reached
+        else:
+            lower = reached
+    return rows
+
+
+async def fetch_range(
+    fetch_page: Callable[[int, int], Awaitable[list[dict[str, Any]]]],
+    start_ms: int,
+    end_ms: int,
+    row_ts_ms: Callable[[dict[str, Any]], int | None],
+    budget: RequestBudget,
+    page_size: int,
+    span_ms: int = DEFAULT_PAGE_SPAN_MS,
+    newest_first: bool = False,
+) -> list[dict[str, Any]]:
+    """
+    Fetch ``[start_ms, end_ms]`` as concurrent windows, merged in time order.
+
+    ``newest_first`` is passed to ``fetch_window`` for venues whose pages run
+    from the newest row backward.
+    """
+    windows = split_range(start_ms, end_ms, span_ms)
+    results = await asyncio.gather(
+        *(
+            fetch_window(
+                fetch_page,
+                w_start,
+                w_end,
+                row_ts_ms,
+                budget,
+                page_size,
+                newest_first=newest_first,
+            )
+            for w_start, w_end in windows
+        ),
+    )
+    rows = [row for window_rows in results for row in window_rows]
+    rows.sort(key=lambda row: row_ts_ms(row) or 0)
+    return rows
+
+
+class HistoricalDataCache:
+    """
+    Thin wrapper over a ``ParquetDataCatalog`` tracking fetched intervals.
+
+    Disabled (every call a no-op) when the persistence extras are not
+    installed or the catalog cannot be opened.
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        self.path = Path(path).expanduser()
+        self._catalog: Any | None = None
+        try:
+            from nautilus_trader.persistence.catalog import ParquetDataCatalog
+
+            self.path.mkdir(parents=True, exist_ok=True)
+            self._catalog = ParquetDataCatalog(str(self.path))
+        except (ImportError, OSError):
+            self._catalog = None
+
+    @classmethod
+    def for_venue(
+        cls,
+        venue: str,
+        environment: str,
+        cache_dir: str | Path | None = None,
+    ) -> "HistoricalDataCache":
+        root = Path(cache_dir).expanduser() if cache_dir else default_catalog_dir()
+        return cls(root / f"{venue.lower()}-{environment.lower()}")
+
+    @property
+    def enabled(self) -> bool:
+        return self._catalog is not None
+
+    def missing(
+        self,
+        data_cls: type,
+        identifier: str,
+        start_ns: int,
+        end_ns: int,
+    ) -> list[tuple[int, int]]:
+        if self._catalog is None:
+            return [(start_ns, end_ns)]
+        return self._catalog.get_missing_intervals_for_request(
+            start_ns,
+            end_ns,
+            data_cls,
+            identifier,
+        )
+
+    def read(self, data_cls: type, identifier: str, start_ns: int, end_ns: int) -> list[Any]:
+        if self._catalog is None:
+            return []
+        return self._catalog.query(data_cls, identifiers=[identifier], start=start_ns, end=end_ns)
+
+    def write(self, data: list[Any], start_ns: int, end_ns: int) -> bool:
+        """
+        Persist ``data`` as covering ``[start_ns, end_ns]``.
+
+        Empty results are not recorded, so quiet intervals are re-fetched.
+        A failed write only costs the next request a re-fetch.
+        """
+        if self._catalog is None or not data:
+            return False
+        try:
+            self._catalog.write_data(data, start=start_ns, end=end_ns)
+        except Exception:
+            return False
+        return True
+
+
+async def load_cached_range(
+    cache: HistoricalDataCache | None,
+    data_cls: type,
+    identifier: str,
+    start_ns: int,
+    end_ns: int,
+    settled_ns: int,
+    fetch: Callable[[int, int], Awaitable[list[Any]]],
+) -> list[Any]:
+    """
+    Serve ``[start_ns, end_ns]`` from the catalog, fetching only the gaps.
+
+    Fetched data up to ``settled_ns`` is written back; anything newer is still
+    forming (recent trades, the open bar) and is returned without caching.
+    Results are ordered by ``ts_init``.
+    """
+    if cache is None or not cache.enabled:
+        return sorted(await fetch(start_ns, end_ns), key=lambda d: d.ts_init)
+
+    gaps = cache.missing(data_cls, identifier, start_ns, end_ns)
+    cached: list[Any] = []
+    if gaps != [(start_ns, end_ns)]:
+        cached = cache.read(data_cls, identifier, start_ns, end_ns)
+
+    results = await asyncio.gather(*(fetch(g_start, g_end) for g_start, g_end in gaps))
+    fetched: list[Any] = []
+    for (g_start, g_end), gap_data in zip(gaps, results):
+        gap_data = [d for d in gap_data if g_start <= d.ts_init <= g_end]
+        fetched.extend(gap_data)
+        if g_start > settled_ns:
+            continue
+        write_end = min(g_end, settled_ns)
+        cache.write(
+            sorted((d for d in gap_data if d.ts_init <= write_end), key=lambda d: d.ts_init),
+            g_start,
+            write_end,
+        )
+
+    return sorted(cached + fetched, key=lambda d: d.ts_init)
+
+
+def aggregate_trade_bars(bar_type: Any, trades: list[Any], step_ns: int) -> list[Any]:
+    """
+    Build time bars from trade ticks for venues without a kline endpoint.
+
+    Bars are stamped at their close (``open + step``), matching externally
+    aggregated bars; intervals without trades produce no bar.
+    """
+    from nautilus_trader.model.data import Bar
+    from nautilus_trader.model.objects import Price
+    from nautilus_trader.model.objects import Quantity
+
+    if not trades:
+        return []
+    price_precision = trades[0].price.precision
+    size_precision = trades[0].size.precision
+
+    bars: list[Any] = []
+    bucket: int | None = None
+    o = h = l = c = 0.0
+    volume = 0.0
+    for trade in sorted(trades, key=lambda t: t.ts_event):
+        price = trade.price.as_double()
+        start = trade.ts_event - trade.ts_event % step_ns
+        if start != bucket:
+            if bucket is not None:
+                bars.append((bucket, o, h, l, c, volume))
+            bucket, o, h, l, c, volume = start, price, price, price, price, 0.0
+        h = max(h, price)
+        l = min(l, price)
+        c = price
+        volume += trade.size.as_double()
+    bars.append((bucket, o, h, l, c, volume))
+
+    return [
+        Bar(
+            bar_type=bar_type,
+            open=Price(b_open, price_precision),
+            high=Price(b_high, price_precision),
+            low=Price(b_low, price_precision),
+            close=Price(b_close, price_precision),
+            volume=Quantity(b_volume, size_precision),
+            ts_event=b_start + step_ns,
+            ts_init=b_start + step_ns,
+        )
+        for b_start, b_open, b_high, b_low, b_close, b_volume in bars
+    ]
@@ -0,0 +1,165 @@
+"""
+Batched hand-off of messages from a foreign thread to an asyncio event loop.
+
+Backend callbacks (e.g. the Rust WebSocket reader) run on their own thread.
+Scheduling one coroutine per message costs a future and a loop wake-up each;
+during fill bursts the reader and the loop then spend their time handing work
+back and forth. ``CoalescingIngestQueue`` wakes the loop at most once per
+pending batch instead, and lets superseded updates for the same key collapse
+before the loop ever sees them.
+"""
+import asyncio
+import itertools
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Hashable
+
+
+class CoalescingIngestQueue:
+    """
+    Thread-safe queue drained on the event loop in batches.
+
+    Items put with a ``key`` replace a still-pending item with the same key
+    (latest state wins). The replacement keeps the position of the first
+    occurrence, or moves to the back with ``move_to_end`` so it is not handed
+    over ahead of items that arrived before it. Unkeyed
+    items are never coalesced. When ``max_pending`` items are queued, ``put``
+    blocks the producer for up to ``put_timeout_secs`` (pushing back on the
+    socket reader); if the loop still has not caught up, the oldest pending
+    item is dropped and counted in ``dropped``.
+
+    Items put with ``lossless`` are never dropped: their producer waits for
+    as long as it takes (or until ``close``), and overflow evicts the oldest
+    other item instead. With nothing else to evict, an incoming lossy item is
+    the one dropped.
+    """
+
+    def __init__(
+        self,
+        loop: asyncio.AbstractEventLoop,
+        handler: Callable[[list[Any]], None],
+        max_pending: int = 10_000,
+        max_batch: int = 1_000,
+        put_timeout_secs: float = 0.5,
+    ) -> None:
+        self._loop = loop
+        self._handler = handler
+        self._max_pending = max(1, max_pending)
+        self._max_batch = max(1, max_batch)
+        self._put_timeout_secs = put_timeout_secs
+        self._pending: OrderedDict[Hashable, Any] = OrderedDict()
+        self._lossless: set[Hashable] = set()
+        self._seq = itertools.count()
+        self._cond = threading.Condition()
+        self._scheduled = False
+        self._closed = False
+        self.coalesced = 0
+        self.dropped = 0
+        self.batches = 0
+
+    def __len__(self) -> int:
+        with self._cond:
+            return len(self._pending)
+
+    def put(
+        self,
+        item: Any,
+        key: Hashable | None = None,
+        move_to_end: bool = False,
+        lossless: bool = False,
+    ) -> None:
+        """
+        Enqueue ``item`` from any thread.
+        """
+        slot = ("key", key) if key is not None else ("seq", next(self._seq))
+        with self._cond:
+            if self._closed:
+                return
+            if key is not None and slot in self._pending:
+                self._pending[slot] = item
+                if move_to_end:
+                    self._pending.move_to_end(slot)
+                self.coalesced += 1
+                return
+            if len(self._pending) >= self._max_pending and not self._on_loop_thread():
+                self._cond.wait_for(
+                    lambda: len(self._pending) < self._max_pending or self._closed,
+                    timeout=None if lossless else self._put_timeout_secs,
+                )
+                if self._closed:
+                    return
+            # On the loop thread a lossless item with nothing to evict goes past the bound
+            if len(self._pending) >= self._max_pending and not self._drop_oldest_lossy():
+                if not lossless:
+                    self.dropped += 1
+                    return
+            self._pending[slot] = item
+            if lossless:
+                self._lossless.add(slot)
+            if self._scheduled:
+                return
+            self._scheduled = True
+
+        try:
+            self._loop.call_soon_threadsafe(self._drain)
+        except RuntimeError:
+            # Loop already closed; nothing will consume the queue any more.
+            with self._cond:
+                self._scheduled = False
+
+    def _drop_oldest_lossy(self) -> bool:
+        for slot in self._pending:
+            if slot not in self._lossless:
+                del self._pending[slot]
+                self.dropped += 1
+                return True
+        return False
+
+    def _on_loop_thread(self) -> bool:
+        # Blocking the loop thread would deadlock the drain it is waiting on.
+        try:
+            return asyncio.get_running_loop() is self._loop
+        except RuntimeError:
+            return False
+
+    def _take_batch(self) -> list[Any]:
+        with self._cond:
+            count = min(len(self._pending), self._max_batch)
+            batch = []
+            for _ in range(count):
+                slot, item = self._pending.popitem(last=False)
+                self._lossless.discard(slot)
+                batch.append(item)
+            if not self._pending:
+                self._scheduled = False
+            self._cond.notify_all()
+            return batch
+
+    def _drain(self) -> None:
+        batch = self._take_batch()
+        try:
+            if batch:
+                self.batches += 1
+                self._handler(batch)
+        finally:
+            with self._cond:
+                more = self._scheduled and bool(self._pending)
+            if more:
+                # Yield between batches so other loop work is not starved.
+                self._loop.call_soon(self._drain)
+
+    def flush(self) -> None:
+        """
+        Drain everything pending synchronously (call on the loop thread).
+        """
+        while True:
+            batch = self._take_batch()
+            if not batch:
+                return
+            self.batches += 1
+            self._handler(batch)
+
+    def close(self) -> None:
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
@@ -0,0 +1,71 @@
+"""
+Versioned on-disk cache of raw venue market metadata.
+
+Providers persist the market rows behind every successful ``get_info`` so a
+restarted node can build its instruments from disk immediately and revalidate
+against the venue in the background.
+"""
+import json
+import os
+import time
+from pathlib import Path
+from typing import Any
+
+CACHE_VERSION = 1
+CACHE_DIR_ENV = "NAUTILUS_ADAPTER_CACHE_DIR"
+
+
+def default_cache_dir() -> Path:
+    root = os.getenv(CACHE_DIR_ENV)
+    if root:
+        return Path(root).expanduser() / "instruments"
+    return Path.home() / ".cache" / "nautilus_adapter" / "instruments"
+
+
+class MarketMetadataCache:
+    """
+    Raw market rows for one venue and environment (e.g. ``lighter-mainnet``).
+
+    Entries written by a different ``CACHE_VERSION`` (or unreadable files) are
+    ignored rather than migrated; the next live fetch overwrites them.
+    """
+
+    def __init__(
+        self,
+        venue: str,
+        environment: str,
+        cache_dir: str | Path | None = None,
+    ) -> None:
+        self.venue = venue.lower()
+        self.environment = environment.lower()
+        directory = Path(cache_dir).expanduser() if cache_dir else default_cache_dir()
+        self.path = directory / f"{self.venue}-{self.environment}.json"
+
+    def load(self) -> list[dict[str, Any]] | None:
+        try:
+            payload = json.loads(self.path.read_text())
+        except (OSError, ValueError):
+            return None
+
+        if not isinstance(payload, dict) or payload.get("version") != CACHE_VERSION:
+            return None
+        if payload.get("venue") != self.venue or payload.get("environment") != self.environment:
+            return None
+
+        markets = payload.get("markets")
+        if not isinstance(markets, list):
+            return None
+        return [m for m in markets if isinstance(m, dict)]
+
+    def save(self, markets: list[dict[str, Any]]) -> None:
+        payload = {
+            "version": CACHE_VERSION,
+            "venue": self.venue,
+            "environment": self.environment,
+            "saved_at_ms": int(time.time() * 1000),
+            "markets": markets,
+        }
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+        tmp.write_text(json.dumps(payload, separators=(",", ":"), default=str))
+        os.replace(tmp, self.path)
@@ -0,0 +1,331 @@
+"""
+Order lifecycle and backend call latency histograms.
+
+Each execution client owns a ``LatencyRecorder`` for its venue. It times
+backend calls and pairs lifecycle events by client order id (submit -> ack,
+ack -> first fill, cancel -> confirmed, modify -> updated) into HDR-style
+histograms. Both ends of a pair are local clock readings taken when the
+adapter sent or received the event; venue timestamps come from another clock
+and never enter a histogram. The recorders are registered per venue so one
+local HTTP endpoint can export all of them (Prometheus text or JSON), and
+clients log a periodic summary.
+"""
+import asyncio
+import json
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from typing import Iterator
+
+# Exact below 2 * 2**SUB_BUCKET_BITS, then 2**SUB_BUCKET_BITS buckets per
+# power of two (about 3% relative error with 5 bits).
+SUB_BUCKET_BITS = 5
+_EXACT_LIMIT = 2 << SUB_BUCKET_BITS
+
+SUBMIT_TO_ACK = "submit_to_ack"
+ACK_TO_FILL = "ack_to_fill"
+CANCEL_TO_CONFIRMED = "cancel_to_confirmed"
+MODIFY_TO_UPDATED = "modify_to_updated"
+
+SUMMARY_QUANTILES = (0.5, 0.9, 0.99, 0.999)
+
+
+class LatencyHistogram:
+    """
+    Log-linear histogram of non-negative integer values (nanoseconds).
+
+    Values are bucketed by their top ``SUB_BUCKET_BITS + 1`` significant bits,
+    so recording is constant time and memory grows with the dynamic range
+    rather than the sample count. Quantiles report the bucket's upper bound.
+    """
+
+    __slots__ = ("_counts", "count", "total", "min", "max")
+
+    def __init__(self) -> None:
+        self._counts: dict[int, int] = {}
+        self.count = 0
+        self.total = 0
+        self.min = 0
+        self.max = 0
+
+    @staticmethod
+    def _bucket(value: int) -> tuple[int, int]:
+        if value < _EXACT_LIMIT:
+            return value, 1
+        shift = value.bit_length() - SUB_BUCKET_BITS - 1
+        return (value >> shift) << shift, 1 << shift
+
+    def record(self, value: int) -> None:
+        value = max(0, int(value))
+        lower, _ = self._bucket(value)
+        self._counts[lower] = self._counts.get(lower, 0) + 1
+        if self.count == 0 or value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+        self.count += 1
+        self.total += value
+
+    def merge(self, other: "LatencyHistogram") -> None:
+        if other.count == 0:
+            return
+        for lower, n in other._counts.items():
+            self._counts[lower] = self._counts.get(lower, 0) + n
+        self.min = other.min if self.count == 0 else min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        self.count += other.count
+        self.total += other.total
+
+    def reset(self) -> None:
+        self._counts.clear()
+        self.count = 0
+        self.total = 0
+        self.min = 0
+        self.max = 0
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.count if self.count else 0.0
+
+    def quantile(self, q: float) -> int:
+        if self.count == 0:
+            return 0
+        rank = max(1, min(self.count, int(q * self.count + 0.999999)))
+        seen = 0
+        for lower in sorted(self._counts):
+            seen += self._counts[lower]
+            if seen >= rank:
+                _, width = self._bucket(lower)
+                return min(lower + width - 1, self.max)
+        return self.max
+
+    def snapshot(self) -> dict[str, float]:
+        summary = {
+            "count": self.count,
+            "min": self.min,
+            "max": self.max,
+            "mean": round(self.mean, 1),
+        }
+        for q in SUMMARY_QUANTILES:
+            summary[f"p{q * 100:g}"] = self.quantile(q)
+        return summary
+
+
+class LatencyRecorder:
+    """
+    Per-venue collection of named latency histograms.
+
+    Lifecycle starts are held per client order id in bounded maps (oldest
+    dropped first) until the matching completion arrives; completions without
+    a start are ignored, so replays and reconciliation do not skew results.
+    """
+
+    def __init__(self, venue: str, max_pending: int = 10_000) -> None:
+        self.venue = venue
+        self.histograms: dict[str, LatencyHistogram] = {}
+        self._max_pending = max(1, max_pending)
+        self._pending: dict[str, OrderedDict[str, int]] = {}
+        self._reported_counts: dict[str, int] = {}
+
+    def histogram(self, metric: str) -> LatencyHistogram:
+        hist = self.histograms.get(metric)
+        if hist is None:
+            hist = self.histograms[metric] = LatencyHistogram()
+        return hist
+
+    def record(self, metric: str, value_ns: int) -> None:
+        self.histogram(metric).record(value_ns)
+
+    @contextmanager
+    def time(self, method: str) -> Iterator[None]:
+        """
+        Record the duration of the enclosed backend call as ``call.<method>``.
+        """
+        start = time.perf_counter_ns()
+        try:
+            yield
+        finally:
+            self.record(f"call.{method}", time.perf_counter_ns() - start)
+
+    def start(self, stage: str, key: str, ts_ns: int) -> None:
+        pending = self._pending.get(stage)
+        if pending is None:
+            pending = self._pending[stage] = OrderedDict()
+        pending[key] = ts_ns
+        pending.move_to_end(key)
+        while len(pending) > self._max_pending:
+            pending.popitem(last=False)
+
+    def stop(self, stage: str, key: str, ts_ns: int, metric: str) -> int | None:
+        pending = self._pending.get(stage)
+        started = pending.pop(key, None) if pending is not None else None
+        if started is None:
+            return None
+        elapsed = max(0, ts_ns - started)
+        self.record(metric, elapsed)
+        return elapsed
+
+    def discard(self, stage: str, key: str) -> None:
+        pending = self._pending.get(stage)
+        if pending is not None:
+            pending.pop(key, None)
+
+    def order_submitted(self, client_order_id: str, ts_ns: int) -> None:
+        self.start("submit", client_order_id, ts_ns)
+
+    def order_accepted(self, client_order_id: str, ts_ns: int) -> None:
+        self.stop("submit", client_order_id, ts_ns, SUBMIT_TO_ACK)
+        self.start("fill", client_order_id, ts_ns)
+
+    def order_rejected(self, client_order_id: str) -> None:
+        self.discard("submit", client_order_id)
+
+    def order_filled(self, client_order_id: str, ts_ns: int) -> None:
+        self.stop("fill", client_order_id, ts_ns, ACK_TO_FILL)
+
+    def cancel_requested(self, client_order_id: str, ts_ns: int) -> None:
+        self.start("cancel", client_order_id, ts_ns)
+
+    def order_canceled(self, client_order_id: str, ts_ns: int) -> None:
+        self.stop("cancel", client_order_id, ts_ns, CANCEL_TO_CONFIRMED)
+        self.discard("fill", client_order_id)
+
+    def cancel_rejected(self, client_order_id: str) -> None:
+        self.discard("cancel", client_order_id)
+
+    def modify_requested(self, client_order_id: str, ts_ns: int) -> None:
+        self.start("modify", client_order_id, ts_ns)
+
+    def order_updated(self, client_order_id: str, ts_ns: int) -> None:
+        self.stop("modify", client_order_id, ts_ns, MODIFY_TO_UPDATED)
+
+    def modify_rejected(self, client_order_id: str) -> None:
+        self.discard("modify", client_order_id)
+
+    def snapshot(self) -> dict[str, dict[str, float]]:
+        return {metric: hist.snapshot() for metric, hist in sorted(self.histograms.items())}
+
+    def summary(self, only_new: bool = True) -> str | None:
+        """
+        One log line of count/p50/p99/max (ms) per metric.
+
+        With ``only_new`` returns ``None`` when nothing was recorded since the
+        previous summary.
+        """
+        parts = []
+        changed = False
+        for metric, hist in sorted(self.histograms.items()):
+            if hist.count != self._reported_counts.get(metric, 0):
+                changed = True
+            self._reported_counts[metric] = hist.count
+            parts.append(
+                f"{metric} n={hist.count} p50={hist.quantile(0.5) / 1e6:.2f}ms "
+                f"p99={hist.quantile(0.99) / 1e6:.2f}ms max={hist.max / 1e6:.2f}ms",
+            )
+        if not parts or (only_new and not changed):
+            return None
+        return f"{self.venue} latency: " + "; ".join(parts)
+
+
+_RECORDERS: dict[str, LatencyRecorder] = {}
+
+
+def latency_recorder(venue: str) -> LatencyRecorder:
+    """
+    Return the process-wide recorder for ``venue``, creating it on first use.
+    """
+    recorder = _RECORDERS.get(venue)
+    if recorder is None:
+        recorder = _RECORDERS[venue] = LatencyRecorder(venue)
+    return recorder
+
+
+def render_prometheus(recorders: list[LatencyRecorder] | None = None) -> str:
+    if recorders is None:
+        recorders = list(_RECORDERS.values())
+    name = "nautilus_adapter_latency_seconds"
+    lines = [
+        f"# HELP {name} Order lifecycle and backend call latency.",
+        f"# TYPE {name} summary",
+    ]
+    for recorder in recorders:
+        for metric, hist in sorted(recorder.histograms.items()):
+            labels = f'venue="{recorder.venue}",metric="{metric}"'
+            for q in SUMMARY_QUANTILES:
+                lines.append(f'{name}{{{labels},quantile="{q:g}"}} {hist.quantile(q) / 1e9:.9f}')
+            lines.append(f"{name}_sum{{{labels}}} {hist.total / 1e9:.9f}")
+            lines.append(f"{name}_count{{{labels}}} {hist.count}")
+    return "\n".join(lines) + "\n"
+
+
+def render_json(recorders: list[LatencyRecorder] | None = None) -> str:
+    if recorders is None:
+        recorders = list(_RECORDERS.values())
+    return json.dumps({recorder.venue: recorder.snapshot() for recorder in recorders})
+
+
+class MetricsServer:
+    """
+    Minimal local HTTP endpoint serving ``/metrics`` and ``/metrics.json``.
+    """
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 9464) -> None:
+        self.host = host
+        self.port = port
+        self._server: asyncio.AbstractServer | None = None
+        self._lock = asyncio.Lock()
+
+    @property
+    def is_running(self) -> bool:
+        return self._server is not None
+
+    async def start(self) -> None:
+        async with self._lock:
+            if self._server is None:
+                self._server = await asyncio.start_server(self._handle, self.host, self.port)
+                if self.port == 0:
+                    self.port = self._server.sockets[0].getsockname()[1]
+
+    async def stop(self) -> None:
+        server = self._server
+        self._server = None
+        if server is not None:
+            server.close()
+            await server.wait_closed()
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            request = await asyncio.wait_for(reader.readuntil(b"\r\n\r\n"), timeout=5)
+            path = request.split(b" ", 2)[1].decode("ascii", "replace").split("?", 1)[0]
+            status = "200 OK"
+            if path == "/metrics":
+                content_type, body = "text/plain; version=0.0.4", render_prometheus()
+            elif path == "/metrics.json":
+                content_type, body = "application/json", render_json()
+            else:
+                status, content_type, body = "404 Not Found", "text/plain", "not found\n"
+            payload = body.encode()
+            writer.write(
+                f"HTTP/1.1 {status}\r\nContent-Type: {content_type}\r\n"
+                f"Content-Length: {len(payload)}\r\nConnection: close\r\n\r\n".encode()
+                + payload,
+            )
+            await writer.drain()
+        except (asyncio.TimeoutError, asyncio.IncompleteReadError, IndexError, OSError):
+            pass
+        finally:
+            writer.close()
+
+
+_SERVERS: dict[tuple[str, int], MetricsServer] = {}
+
+
+async def ensure_metrics_server(host: str, port: int) -> MetricsServer:
+    """
+    Start (once per process and address) the shared metrics endpoint.
+    """
+    server = _SERVERS.get((host, port))
+    if server is None:
+        server = _SERVERS[(host, port)] = MetricsServer(host, port)
+    await server.start()
+    return server
@@ -0,0 +1,109 @@
+"""
+Helpers for converting venue order rows into execution reports in bulk.
+
+Reconciliation (``generate_mass_status``) converts every open and historical
+order on each run. The per-row costs that dominate are string round-trips
+through ``Price.from_str`` / ``Quantity.from_str`` (several times slower than
+constructing from a number with a known precision) and re-resolving the same
+market/instrument for every row. These helpers cache instrument precision,
+compile multi-key field accessors once, and memoize what was parsed from rows
+that are unchanged since the previous reconcile.
+"""
+from collections import OrderedDict
+from typing import Any, Callable
+
+from nautilus_trader.model.identifiers import InstrumentId
+from nautilus_trader.model.objects import Price, Quantity
+
+
+def first_of(*keys: str) -> Callable[[dict[str, Any]], Any]:
+    """
+    Compile ``row.get(k1) or row.get(k2) or ...`` into a single accessor.
+    """
+    if len(keys) == 1:
+        key = keys[0]
+        return lambda row: row.get(key)
+
+    def get(row: dict[str, Any]) -> Any:
+        value = None
+        for key in keys:
+            value = row.get(key)
+            if value:
+                return value
+        return value
+
+    return get
+
+
+class InstrumentPrecisions:
+    """
+    Price/Quantity constructors using each instrument's cached precision.
+
+    Falls back to string parsing for instruments not in the cache yet; only
+    known instruments are remembered, so late-loaded ones are picked up.
+    """
+
+    def __init__(self, cache: Any) -> None:
+        self._cache = cache
+        self._precisions: dict[InstrumentId, tuple[int, int]] = {}
+
+    def invalidate(self) -> None:
+        self._precisions.clear()
+
+    def _get(self, instrument_id: InstrumentId) -> tuple[int, int] | None:
+        precisions = self._precisions.get(instrument_id)
+        if precisions is None:
+            instrument = self._cache.instrument(instrument_id)
+            if instrument is None:
+                return None
+            precisions = (instrument.price_precision, instrument.size_precision)
+            self._precisions[instrument_id] = precisions
+        return precisions
+
+    def price(self, instrument_id: InstrumentId, value: Any) -> Price:
+        precisions = self._get(instrument_id)
+        if precisions is None:
+            return Price.from_str(str(value))
+        return Price(float(value), precisions[0])
+
+    def quantity(self, instrument_id: InstrumentId, value: Any) -> Quantity:
+        precisions = self._get(instrument_id)
+        if precisions is None:
+            return Quantity.from_str(str(value))
+        return Quantity(float(value), precisions[1])
+
+
+class ReportMemo:
+    """
+    Bounded memo of what was last parsed from each venue order row.
+
+    A stored value is reused only while the venue row compares equal to the
+    row it was parsed from. Store only what the row determines: anything
+    resolved against local state (client order ids) or stamped per report
+    (report ids, ``ts_init``) must be produced on every use.
+    """
+
+    def __init__(self, max_entries: int = 20_000) -> None:
+        self._max_entries = max(1, max_entries)
+        self._entries: OrderedDict[str, tuple[dict[str, Any], Any]] = OrderedDict()
+        self.hits = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str, row: dict[str, Any]) -> Any | None:
+        entry = self._entries.get(key)
+        if entry is None or entry[0] != row:
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry[1]
+
+    def put(self, key: str, row: dict[str, Any], parsed: Any) -> None:
+        self._entries[key] = (dict(row), parsed)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        self._entries.clear()
@@ -0,0 +1,187 @@
+"""
+Concurrent multi-venue, multi-symbol soak on one canary engine.
+
+Every target (one scenario, i.e. one symbol on one venue) runs its own worker
+that keeps starting attempts until the soak duration is up. Workers on the
+same venue share a ``VenueBudget`` that caps attempts in flight and paces
+attempt starts, so each venue is loaded up to its own limits regardless of
+the others. Results are aggregated per venue: throughput, error and timeout
+rates, attempt duration percentiles and the lifecycle latency histograms the
+venue's execution client records in-process.
+"""
+import asyncio
+import itertools
+import time
+from collections import Counter
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from typing import Any, AsyncIterator, Callable, NamedTuple
+
+from nautilus_adapter.common.canary import CanaryAttempt, CanaryEngine, CanaryScenario
+from nautilus_adapter.common.latency import LatencyHistogram, latency_recorder
+
+# Entry outcomes that count as a clean attempt
+_OK_TERMINAL_STATES = frozenset({"FILLED", "CANCELED"})
+
+
+class VenueBudget:
+    """
+    Per-venue attempt budget: at most ``max_in_flight`` attempts at once,
+    started no faster than ``attempts_per_min`` (0 for unpaced).
+    """
+
+    def __init__(
+        self,
+        max_in_flight: int = 1,
+        attempts_per_min: float = 0.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.max_in_flight = max(1, max_in_flight)
+        self.attempts_per_min = attempts_per_min
+        self._interval = 60.0 / attempts_per_min if attempts_per_min > 0 else 0.0
+        self._clock = clock
+        self._next_start = 0.0
+        self._slots: asyncio.Semaphore | None = None
+
+    @asynccontextmanager
+    async def slot(self) -> AsyncIterator[None]:
+        if self._slots is None:
+            self._slots = asyncio.Semaphore(self.max_in_flight)
+        async with self._slots:
+            now = self._clock()
+            start = max(now, self._next_start)
+            self._next_start = start + self._interval
+            if start > now:
+                await asyncio.sleep(start - now)
+            yield
+
+
+class SoakTarget(NamedTuple):
+    venue: str
+    scenario: CanaryScenario
+
+
+@dataclass
+class VenueSoakStats:
+    venue: str
+    attempts: int = 0
+    ok: int = 0
+    errors: int = 0
+    timeouts: int = 0
+    reconciliation_failures: int = 0
+    terminal_states: Counter = field(default_factory=Counter)
+    attempt_ns: LatencyHistogram = field(default_factory=LatencyHistogram)
+    error_samples: list[str] = field(default_factory=list)
+
+    def record(self, attempt: CanaryAttempt, max_error_samples: int = 10) -> None:
+        self.attempts += 1
+        self.attempt_ns.record(int(attempt.elapsed_secs * 1e9))
+        state = "TIMEOUT" if attempt.timed_out else (attempt.entry_terminal_state or "OPEN_OR_UNKNOWN")
+        self.terminal_states[state] += 1
+        if attempt.timed_out:
+            self.timeouts += 1
+        if attempt.reconciliation_ok is False:
+            self.reconciliation_failures += 1
+        if attempt.errors:
+            self.errors += 1
+            room = max_error_samples - len(self.error_samples)
+            self.error_samples.extend(
+                f"{attempt.strategy_id}: {e}" for e in attempt.errors[: max(0, room)]
+            )
+        if (
+            state in _OK_TERMINAL_STATES
+            and not attempt.errors
+            and attempt.reconciliation_ok is not False
+        ):
+            self.ok += 1
+
+    def snapshot(self, elapsed_secs: float) -> dict[str, Any]:
+        attempts = max(1, self.attempts)
+        return {
+            "attempts": self.attempts,
+            "ok": self.ok,
+            "errors": self.errors,
+            "timeouts": self.timeouts,
+            "reconciliation_failures": self.reconciliation_failures,
+            "error_rate": round(self.errors / attempts, 4),
+            "timeout_rate": round(self.timeouts / attempts, 4),
+            "attempts_per_min": round(self.attempts * 60.0 / elapsed_secs, 2) if elapsed_secs > 0 else 0.0,
+            "terminal_states": dict(self.terminal_states),
+            "attempt_ns": self.attempt_ns.snapshot(),
+            # Recorded by the venue's execution client in this same process
+            "lifecycle_ns": latency_recorder(self.venue).snapshot(),
+            "error_samples": self.error_samples,
+        }
+
+
+class SoakHarness:
+    """
+    Runs soak targets concurrently on a started ``CanaryEngine``.
+
+    Attempts skip their own reconciliation; the harness reconciles once after
+    all workers finish.
+    """
+
+    def __init__(
+        self,
+        engine: CanaryEngine,
+        budgets: dict[str, VenueBudget],
+        duration_secs: float,
+        attempt_timeout_secs: float | None = None,
+    ) -> None:
+        self._engine = engine
+        self._budgets = budgets
+        self._duration_secs = duration_secs
+        self._attempt_timeout_secs = attempt_timeout_secs
+        self._attempt_numbers = itertools.count(1)
+        self.stats: dict[str, VenueSoakStats] = {}
+
+    def _budget(self, venue: str) -> VenueBudget:
+        budget = self._budgets.get(venue)
+        if budget is None:
+            budget = self._budgets[venue] = VenueBudget()
+        return budget
+
+    async def _worker(self, target: SoakTarget, deadline: float) -> None:
+        loop = asyncio.get_running_loop()
+        budget = self._budget(target.venue)
+        stats = self.stats[target.venue]
+        while loop.time() < deadline:
+            async with budget.slot():
+                if loop.time() >= deadline:
+                    return
+                attempt = await self._engine.run_attempt(
+                    target.scenario,
+                    next(self._attempt_numbers),
+                    timeout_secs=self._attempt_timeout_secs,
+                    reconcile=False,
+                )
+            stats.record(attempt)
+
+    async def run(self, targets: list[SoakTarget]) -> dict[str, Any]:
+        for target in targets:
+            if target.venue not in self.stats:
+                self.stats[target.venue] = VenueSoakStats(target.venue)
+
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        deadline = started + self._duration_secs
+        await asyncio.gather(*(self._worker(target, deadline) for target in targets))
+        elapsed = loop.time() - started
+        reconciliation_ok = await self._engine.reconcile()
+
+        venues = {venue: stats.snapshot(elapsed) for venue, stats in sorted(self.stats.items())}
+        return {
+            "elapsed_secs": round(elapsed, 3),
+            "targets": [f"{t.venue}:{t.scenario.name}" for t in targets],
+            "budgets": {
+                venue: {
+                    "max_in_flight": budget.max_in_flight,
+                    "attempts_per_min": budget.attempts_per_min,
+                }
+                for venue, budget in sorted(self._budgets.items())
+            },
+            "attempts": sum(s["attempts"] for s in venues.values()),
+            "final_reconciliation_ok": reconciliation_ok,
+            "venues": venues,
+        }
@@ -0,0 +1,133 @@
+"""
+Top-of-book tracking for deriving quote ticks from order book updates.
+
+Venues here stream depth but no separate BBO channel. ``BookLevels`` keeps the
+L2 levels per instrument and tracks the best bid/ask incrementally, and
+``QuoteFilter`` decides which of those tops are worth publishing: only real
+changes in best price or size, optionally at most one per interval per
+instrument (the latest state is held back and published once the interval
+expires).
+"""
+from typing import Hashable, Iterable
+
+Top = tuple[float, float, float, float]
+
+
+class BookLevels:
+    """
+    One instrument's L2 book as ``price -> size`` maps.
+
+    A level with size zero is removed. Snapshots replace the side entirely.
+    """
+
+    __slots__ = ("bids", "asks", "_best_bid", "_best_ask")
+
+    def __init__(self) -> None:
+        self.bids: dict[float, float] = {}
+        self.asks: dict[float, float] = {}
+        self._best_bid: float | None = None
+        self._best_ask: float | None = None
+
+    def clear(self) -> None:
+        self.bids.clear()
+        self.asks.clear()
+        self._best_bid = None
+        self._best_ask = None
+
+    def update(
+        self,
+        bids: Iterable[tuple[float, float]],
+        asks: Iterable[tuple[float, float]],
+        snapshot: bool = False,
+    ) -> None:
+        if snapshot:
+            self.clear()
+        for price, size in bids:
+            if size > 0:
+                self.bids[price] = size
+                if self._best_bid is None or price > self._best_bid:
+                    self._best_bid = price
+            elif self.bids.pop(price, None) is not None and price == self._best_bid:
+                self._best_bid = max(self.bids) if self.bids else None
+        for price, size in asks:
+            if size > 0:
+                self.asks[price] = size
+                if self._best_ask is None or price < self._best_ask:
+                    self._best_ask = price
+            elif self.asks.pop(price, None) is not None and price == self._best_ask:
+                self._best_ask = min(self.asks) if self.asks else None
+
+    def top(self) -> Top | None:
+        """
+        Return ``(bid_price, bid_size, ask_price, ask_size)`` or ``None``.
+        """
+        if self._best_bid is None or self._best_ask is None:
+            return None
+        return (
+            self._best_bid,
+            self.bids[self._best_bid],
+            self._best_ask,
+            self.asks[self._best_ask],
+        )
+
+
+class QuoteFilter:
+    """
+    Change suppression with an optional per-key minimum publish interval.
+
+    ``offer`` returns ``True`` when the top should be published now. A changed
+    top arriving inside the interval is kept as pending; ``due_in_ns`` tells
+    the caller when to come back and ``take_pending`` hands it out.
+    """
+
+    def __init__(self, default_interval_ns: int = 0) -> None:
+        self._default_interval_ns = max(0, default_interval_ns)
+        self._intervals: dict[Hashable, int] = {}
+        self._last: dict[Hashable, Top] = {}
+        self._last_ts: dict[Hashable, int] = {}
+        self._pending: dict[Hashable, Top] = {}
+        self.suppressed = 0
+        self.throttled = 0
+
+    def set_interval(self, key: Hashable, interval_ns: int | None) -> None:
+        if interval_ns is None:
+            self._intervals.pop(key, None)
+        else:
+            self._intervals[key] = max(0, interval_ns)
+
+    def interval(self, key: Hashable) -> int:
+        return self._intervals.get(key, self._default_interval_ns)
+
+    def reset(self, key: Hashable) -> None:
+        self._last.pop(key, None)
+        self._last_ts.pop(key, None)
+        self._pending.pop(key, None)
+
+    def offer(self, key: Hashable, top: Top, ts_ns: int) -> bool:
+        if top == self._last.get(key):
+            self._pending.pop(key, None)
+            self.suppressed += 1
+            return False
+        interval = self.interval(key)
+        if interval and ts_ns - self._last_ts.get(key, -interval) < interval:
+            self._pending[key] = top
+            self.throttled += 1
+            return False
+        self._mark(key, top, ts_ns)
+        return True
+
+    def due_in_ns(self, key: Hashable, ts_ns: int) -> int | None:
+        if key not in self._pending:
+            return None
+        return max(0, self._last_ts.get(key, 0) + self.interval(key) - ts_ns)
+
+    def take_pending(self, key: Hashable, ts_ns: int) -> Top | None:
+        top = self._pending.pop(key, None)
+        if top is not None:
+            self._mark(key, top, ts_ns)
+        return top
+
+    def _mark(self, key: Hashable, top: Top, ts_ns: int) -> None:
+        self._pending.pop(key, None)
+        self._last[key] = top
+        self._last_ts[key] = ts_ns
@@ -0,0 +1,54 @@
+"""
+Short-lived lookup cache for order and fill rows.
+
+Venues without an id-filtered endpoint force lookups to download whole order
+or fill lists. Caching every row seen for a few seconds means a burst of
+lookups (e.g. one reconciliation pass) shares those downloads instead of
+repeating them per id.
+"""
+import time
+from collections import OrderedDict
+from typing import Callable, Generic, Hashable, TypeVar
+
+V = TypeVar("V")
+
+
+class TtlCache(Generic[V]):
+    """
+    Bounded map whose entries expire ``ttl_secs`` after insertion.
+
+    The oldest insertion is evicted first once ``max_entries`` is reached.
+    """
+
+    def __init__(
+        self,
+        ttl_secs: float,
+        max_entries: int = 10_000,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._ttl_secs = ttl_secs
+        self._max_entries = max(1, max_entries)
+        self._clock = clock
+        self._entries: OrderedDict[Hashable, tuple[float, V]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: Hashable) -> V | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        inserted, value = entry
+        if self._clock() - inserted >= self._ttl_secs:
+            del self._entries[key]
+            return None
+        return value
+
+    def put(self, key: Hashable, value: V) -> None:
+        self._entries[key] = (self._clock(), value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        self._entries.clear()
@@ -0,0 +1,173 @@
+"""
+Raw WebSocket tape recording and replay.
+
+A tape is gzip-compressed JSON lines, one ``[ts_recv_ns, "stream", payload]``
+per message, where ``payload`` is the venue message exactly as the client
+received it (decoded JSON or raw text). Clients record when configured to, and
+``replay_tape`` feeds a tape back into the same handlers offline, either paced
+by the recorded receive times or as fast as the handlers go.
+"""
+import asyncio
+import gzip
+import inspect
+import json
+import os
+import threading
+import time
+import zlib
+from pathlib import Path
+from typing import Any, Callable, Iterator, NamedTuple
+
+from .instrument_cache import CACHE_DIR_ENV
+
+
+def default_tape_dir() -> Path:
+    root = os.getenv(CACHE_DIR_ENV)
+    if root:
+        return Path(root).expanduser() / "tapes"
+    return Path.home() / ".cache" / "nautilus_adapter" / "tapes"
+
+
+class TapeRecord(NamedTuple):
+    ts_recv_ns: int
+    stream: str
+    payload: Any
+
+
+class WsTapeRecorder:
+    """
+    Append-only tape writer, safe to call from the event loop and backend threads.
+
+    Records are buffered and appended as one gzip member every ``flush_every``
+    records (and on ``close``), so no file handle outlives a write and a crash
+    loses at most that many messages; readers stop cleanly at a torn tail.
+    """
+
+    def __init__(self, path: str | Path, flush_every: int = 256) -> None:
+        self.path = Path(path).expanduser()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._flush_every = max(1, flush_every)
+        self._pending: list[str] = []
+        self._closed = False
+        self._lock = threading.Lock()
+        self.records = 0
+        self.errors = 0
+
+    @classmethod
+    def for_venue(
+        cls,
+        venue: str,
+        environment: str,
+        kind: str,
+        tape_dir: str | Path | None = None,
+    ) -> "WsTapeRecorder":
+        root = Path(tape_dir).expanduser() if tape_dir else default_tape_dir()
+        stamp = time.strftime("%Y%m%dT%H%M%SZ", time.gmtime())
+        name = f"{venue.lower()}-{environment.lower()}-{kind}-{stamp}-{os.getpid()}.jsonl.gz"
+        return cls(root / name)
+
+    def record(self, stream: str, payload: Any, ts_recv_ns: int | None = None) -> None:
+        if ts_recv_ns is None:
+            ts_recv_ns = time.time_ns()
+        if isinstance(payload, (bytes, bytearray)):
+            payload = payload.decode("utf-8", errors="replace")
+        try:
+            line = json.dumps([ts_recv_ns, stream, payload], separators=(",", ":"), default=str)
+        except (TypeError, ValueError):
+            self.errors += 1
+            return
+        with self._lock:
+            if self._closed:
+                return
+            self._pending.append(line + "\n")
+            self.records += 1
+            if len(self._pending) >= self._flush_every:
+                self._flush()
+
+    def _flush(self) -> None:
+        if not self._pending:
+            return
+        with gzip.open(self.path, "at", encoding="utf-8") as f:
+            f.write("".join(self._pending))
+        self._pending.clear()
+
+    def close(self) -> None:
+        with self._lock:
+            if not self._closed:
+                self._closed = True
+                self._flush()
+
+
+def read_tape(path: str | Path) -> Iterator[TapeRecord]:
+    """
+    Yield the records of a tape (gzip or plain JSON lines) in file order.
+
+    Unreadable lines are skipped and a truncated gzip tail ends the iteration.
+    """
+    path = Path(path).expanduser()
+    with path.open("rb") as raw:
+        compressed = raw.read(2) == b"\x1f\x8b"
+    opener = gzip.open if compressed else open
+    with opener(path, "rt", encoding="utf-8") as f:
+        try:
+            for line in f:
+                try:
+                    ts_recv_ns, stream, payload = json.loads(line)
+                    yield TapeRecord(int(ts_recv_ns), str(stream), payload)
+                except (ValueError, TypeError):
+                    continue
+        except (EOFError, zlib.error, gzip.BadGzipFile):
+            return
+
+
+class ReplayStats(NamedTuple):
+    messages: int
+    errors: int
+    elapsed_s: float
+
+    @property
+    def messages_per_second(self) -> float:
+        return self.messages / self.elapsed_s if self.elapsed_s > 0 else 0.0
+
+
+async def replay_tape(
+    records: str | Path | Iterator[TapeRecord] | list[TapeRecord],
+    handlers: dict[str, Callable[[Any], Any]],
+    speed: float | None = None,
+    raise_errors: bool = False,
+) -> ReplayStats:
+    """
+    Feed tape records into ``handlers`` keyed by stream name.
+
+    ``speed=None`` replays as fast as possible; otherwise records are paced by
+    their receive timestamps (``1.0`` = recorded wall-clock rate, ``10.0`` =
+    ten times faster). Handlers may be plain functions or coroutines; records
+    for streams without a handler are ignored.
+    """
+    if isinstance(records, (str, Path)):
+        records = read_tape(records)
+    loop = asyncio.get_running_loop()
+    messages = 0
+    errors = 0
+    first_ts: int | None = None
+    started = loop.time()
+    for record in records:
+        handler = handlers.get(record.stream)
+        if handler is None:
+            continue
+        if speed:
+            if first_ts is None:
+                first_ts = record.ts_recv_ns
+            delay = started + (record.ts_recv_ns - first_ts) / 1e9 / speed - loop.time()
+            if delay > 0:
+                await asyncio.sleep(delay)
+        try:
+            result = handler(record.payload)
+            if inspect.isawaitable(result):
+                await result
+        except Exception:
+            if raise_errors:
+                raise
+            errors += 1
+        messages += 1
+    return ReplayStats(messages, errors, loop.time() - started)
@@ -0,0 +1,202 @@
+"""
+Base class for the simulated venue APIs.
+
+A dialect owns one ``MatchingEngine`` and maps its venue's REST paths and
+WebSocket messages onto it. Every request goes through the same pipeline:
+injected latency, then an injected fault, then (when configured) the
+recording proxy or a recorded response, and only then the venue handler.
+"""
+import asyncio
+import json
+import logging
+import re
+from decimal import Decimal, InvalidOperation
+from typing import Any, Callable
+
+from .faults import FaultInjector
+from .matching import MatchingEngine, SimRejected
+from .replay import ResponseRecorder, ResponseReplay
+from .server import SimHttpError, SimRequest, SimResponse, SimWebSocket
+
+Handler = Callable[[SimRequest, re.Match], Any]
+
+_log = logging.getLogger(__name__)
+
+
+def parse_decimal(value: Any, field: str) -> Decimal:
+    try:
+        return Decimal(str(value))
+    except (InvalidOperation, ValueError) as exc:
+        raise SimHttpError(400, f"Invalid {field}: {value!r}") from exc
+
+
+def parse_int(value: Any, field: str, default: int = 0) -> int:
+    """
+    An integer query parameter; absent or empty means ``default``.
+    """
+    if value is None or value == "":
+        return default
+    try:
+        return int(value)
+    except (TypeError, ValueError) as exc:
+        raise SimHttpError(400, f"Invalid {field}: {value!r}") from exc
+
+
+def paginate(rows: list, cursor: str | None, page_size: int) -> tuple[list, str | None, str | None]:
+    """
+    One page of ``rows`` with its ``next``/``prev`` cursors. A cursor is the
+    offset of the page it points at.
+    """
+    offset = int(cursor) if cursor and cursor.isdigit() else 0
+    end = offset + page_size
+    next_cursor = str(end) if end < len(rows) else None
+    prev_cursor = str(max(0, offset - page_size)) if offset else None
+    return rows[offset:end], next_cursor, prev_cursor
+
+
+class VenueDialect:
+    venue = ""
+    prefix = ""
+    ws_path = "/ws"
+
+    def __init__(
+        self,
+        engine: MatchingEngine,
+        faults: FaultInjector | None = None,
+        replay: ResponseReplay | None = None,
+        recorder: ResponseRecorder | None = None,
+    ) -> None:
+        self.engine = engine
+        self.faults = faults or FaultInjector()
+        self.replay = replay
+        self.recorder = recorder
+        self.sockets: set[SimWebSocket] = set()
+        self.requests = 0
+        self.replayed = 0
+        self._routes: list[tuple[str, re.Pattern, Handler]] = []
+        self.register_routes()
+        engine.listeners.append(self.on_engine_event)
+
+    # -- Hooks for the venue dialects ----------------------------------------
+
+    def register_routes(self) -> None:
+        raise NotImplementedError
+
+    def error_response(self, status: int, message: str, code: str | None = None) -> SimResponse:
+        return SimResponse.json({"error": code or _reason_code(status), "message": message}, status)
+
+    def on_ws_message(self, ws: SimWebSocket, message: Any) -> None:
+        pass
+
+    def on_ws_connect(self, ws: SimWebSocket, request: SimRequest) -> None:
+        pass
+
+    def on_engine_event(self, kind: str, obj: Any) -> None:
+        pass
+
+    # -- Pipeline -------------------------------------------------------------
+
+    def route(self, method: str, pattern: str, handler: Handler) -> None:
+        self._routes.append((method, re.compile(f"^{pattern}$"), handler))
+
+    async def dispatch(self, request: SimRequest) -> SimResponse:
+        self.requests += 1
+        await self.faults.delay()
+        fault = self.faults.fault()
+        if fault is not None:
+            return self.error_response(fault.status, fault.message)
+
+        if self.recorder is not None:
+            recorded = await asyncio.to_thread(
+                self.recorder.forward,
+                request.method,
+                request.path,
+                request.query,
+                request.headers,
+                request.body,
+            )
+            return _recorded_response(recorded.status, recorded.body)
+        if self.replay is not None:
+            recorded = self.replay.get(request.method, request.path, request.query)
+            if recorded is not None:
+                self.replayed += 1
+                return _recorded_response(recorded.status, recorded.body)
+
+        for method, pattern, handler in self._routes:
+            if method != request.method:
+                continue
+            match = pattern.match(request.path)
+            if match is None:
+                continue
+            try:
+                result = handler(request, match)
+            except SimRejected as exc:
+                return self.error_response(400, str(exc))
+            except SimHttpError as exc:
+                return self.error_response(exc.status, exc.message, exc.code)
+            except Exception as exc:
+                # A handler bug must not look like a dropped connection to the client
+                _log.exception("Unhandled error serving %s %s", request.method, request.path)
+                return self.error_response(500, f"{type(exc).__name__}: {exc}")
+            return result if isinstance(result, SimResponse) else SimResponse.json(result)
+        return self.error_response(404, f"No route for {request.method} {request.path}")
+
+    async def serve_ws(self, ws: SimWebSocket, request: SimRequest) -> None:
+        self.sockets.add(ws)
+        try:
+            self.on_ws_connect(ws, request)
+            while True:
+                text = await ws.receive()
+                if text is None:
+                    return
+                try:
+                    message = json.loads(text)
+                except ValueError:
+                    continue
+                await self.faults.delay()
+                self.on_ws_message(ws, message)
+        finally:
+            self.sockets.discard(ws)
+
+    def push(self, ws: SimWebSocket, payload: Any) -> None:
+        if not self.faults.drop_push():
+            ws.send_json(payload)
+
+    def broadcast(self, channel: str, payload: Any) -> None:
+        for ws in self.sockets:
+            if channel in ws.subscriptions:
+                self.push(ws, payload)
+
+    def has_subscribers(self, channel: str) -> bool:
+        return any(channel in ws.subscriptions for ws in self.sockets)
+
+    def set_mid(self, symbol: str, mid: str) -> None:
+        self.engine.set_mid(symbol, parse_decimal(mid, "mid"))
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "requests": self.requests,
+            "replayed": self.replayed,
+            "websockets": len(self.sockets),
+            "orders": len(self.engine.orders),
+            "accounts": len(self.engine.accounts),
+            **self.faults.snapshot(),
+        }
+
+
+def _reason_code(status: int) -> str:
+    if status == 429:
+        return "RATE_LIMIT_EXCEEDED"
+    if status == 401:
+        return "UNAUTHORIZED"
+    if status == 404:
+        return "NOT_FOUND"
+    if status >= 500:
+        return "INTERNAL_ERROR"
+    return "BAD_REQUEST"
+
+
+def _recorded_response(status: int, body: Any) -> SimResponse:
+    if isinstance(body, str):
+        return SimResponse.text(body, status)
+    return SimResponse.json(body, status)
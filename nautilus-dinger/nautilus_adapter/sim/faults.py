@@ -0,0 +1,109 @@
+"""
+Latency, error and rate limit injection for the local venue simulator.
+
+Every HTTP request a dialect serves first waits out the configured latency
+(plus uniform jitter), then may be answered with an injected error or a 429
+instead of reaching the handler. 429s come from two sources: a plain random
+rate, and a token bucket that answers 429 once clients exceed
+``max_requests_per_sec`` the way a venue's limiter would. WebSocket pushes can
+be dropped at random, which leaves a gap in sequenced streams.
+"""
+import asyncio
+import random
+import time
+from dataclasses import dataclass
+from typing import Callable, NamedTuple
+
+
+@dataclass
+class FaultConfig:
+    latency_ms: float = 0.0
+    jitter_ms: float = 0.0
+    error_rate: float = 0.0
+    error_status: int = 500
+    rate_limit_rate: float = 0.0
+    max_requests_per_sec: float = 0.0
+    ws_drop_rate: float = 0.0
+    seed: int | None = None
+
+
+class InjectedFault(NamedTuple):
+    status: int
+    message: str
+
+
+RATE_LIMITED = InjectedFault(429, "Too Many Requests")
+
+
+class FaultInjector:
+    def __init__(
+        self,
+        config: FaultConfig | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.config = config or FaultConfig()
+        self._rng = random.Random(self.config.seed)
+        self._clock = clock
+        rate = self.config.max_requests_per_sec
+        # One second of burst on top of the sustained rate
+        self._bucket_capacity = rate
+        self._tokens = rate
+        self._refilled_at = clock()
+        self.injected_errors = 0
+        self.injected_rate_limits = 0
+        self.dropped_pushes = 0
+
+    def latency_secs(self) -> float:
+        config = self.config
+        latency = config.latency_ms
+        if config.jitter_ms > 0:
+            latency += self._rng.uniform(0.0, config.jitter_ms)
+        return latency / 1000.0
+
+    async def delay(self) -> None:
+        latency = self.latency_secs()
+        if latency > 0:
+            await asyncio.sleep(latency)
+
+    def _take_token(self) -> bool:
+        if self._bucket_capacity <= 0:
+            return True
+        now = self._clock()
+        self._tokens = min(
+            self._bucket_capacity,
+            self._tokens + (now - self._refilled_at) * self.config.max_requests_per_sec,
+        )
+        self._refilled_at = now
+        if self._tokens < 1.0:
+            return False
+        self._tokens -= 1.0
+        return True
+
+    def fault(self) -> InjectedFault | None:
+        """
+        The fault to answer the current request with, if any.
+        """
+        config = self.config
+        if not self._take_token() or (
+            config.rate_limit_rate > 0 and self._rng.random() < config.rate_limit_rate
+        ):
+            self.injected_rate_limits += 1
+            return RATE_LIMITED
+        if config.error_rate > 0 and self._rng.random() < config.error_rate:
+            self.injected_errors += 1
+            return InjectedFault(config.error_status, "Injected venue error")
+        return None
+
+    def drop_push(self) -> bool:
+        rate = self.config.ws_drop_rate
+        if rate > 0 and self._rng.random() < rate:
+            self.dropped_pushes += 1
+            return True
+        return False
+
+    def snapshot(self) -> dict[str, int]:
+        return {
+            "injected_errors": self.injected_errors,
+            "injected_rate_limits": self.injected_rate_limits,
+            "dropped_pushes": self.dropped_pushes,
+        }
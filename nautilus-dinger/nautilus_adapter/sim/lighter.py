@@ -0,0 +1,633 @@
+"""
+Simulated Lighter REST API and public stream.
+
+Serves the ``/api/v1`` endpoints the ``lighter`` SDK calls under ``/lighter``.
+Order entry goes through ``sendTx`` as on the venue: the form carries the
+transaction type and its JSON ``tx_info`` with integer amounts scaled by the
+market's size and price decimals. Transactions are not signature-checked
+and act for their ``AccountIndex``; reads act for the ``account_index``
+query parameter.
+
+``SignerClient.check_client`` compares the public key that ``/apikeys``
+returns with the one it derives from the configured private key, so the
+dialect serves ``api_public_key`` for every account; set it to the public
+key of the key the adapter is configured with for that check to pass.
+
+The stream at ``/lighter/stream`` serves ``order_book/<market_id>`` (a
+snapshot, then changed levels with size ``0`` for removals) and
+``trade/<market_id>``.
+"""
+import hashlib
+import json
+import re
+from collections import defaultdict
+from decimal import Decimal
+from typing import Any
+
+from .dialect import VenueDialect, paginate, parse_int
+from .matching import (
+    CLOSED,
+    GTC,
+    IOC,
+    IOC_REMAINDER,
+    LIMIT,
+    MARKET,
+    NO_LIQUIDITY,
+    POST_ONLY,
+    POST_ONLY_WOULD_CROSS,
+    REDUCE_ONLY_WOULD_INCREASE,
+    SELF_TRADE,
+    SELL,
+    STOP_LIMIT,
+    STOP_MARKET,
+    TAKE_PROFIT_LIMIT,
+    TAKE_PROFIT_MARKET,
+    UNTRIGGERED,
+    MatchingEngine,
+    SimFill,
+    SimMarket,
+    SimOrder,
+    SimTrade,
+)
+from .server import SimHttpError, SimRequest, SimResponse, SimWebSocket
+
+BOOK_DEPTH = 50
+DEFAULT_LIMIT = 100
+
+TX_TYPE_CREATE_ORDER = 14
+TX_TYPE_CANCEL_ORDER = 15
+TX_TYPE_CANCEL_ALL_ORDERS = 16
+TX_TYPE_MODIFY_ORDER = 17
+
+# SignerClient.ORDER_TYPE_* and ORDER_TIME_IN_FORCE_* codes
+_ORDER_TYPES = {
+    0: LIMIT,
+    1: MARKET,
+    2: STOP_MARKET,
+    3: STOP_LIMIT,
+    4: TAKE_PROFIT_MARKET,
+    5: TAKE_PROFIT_LIMIT,
+}
+_TIME_IN_FORCE = {0: IOC, 1: GTC, 2: POST_ONLY}
+
+_TYPE_NAMES = {
+    LIMIT: "limit",
+    MARKET: "market",
+    STOP_MARKET: "stop-loss",
+    STOP_LIMIT: "stop-loss-limit",
+    TAKE_PROFIT_MARKET: "take-profit",
+    TAKE_PROFIT_LIMIT: "take-profit-limit",
+}
+_TIME_IN_FORCE_NAMES = {
+    GTC: "good-till-time",
+    IOC: "immediate-or-cancel",
+    POST_ONLY: "post-only",
+}
+_CANCEL_STATUSES = {
+    NO_LIQUIDITY: "canceled-not-enough-liquidity",
+    IOC_REMAINDER: "canceled",
+    POST_ONLY_WOULD_CROSS: "canceled-post-only",
+    REDUCE_ONLY_WOULD_INCREASE: "canceled-reduce-only",
+    SELF_TRADE: "canceled-self-trade",
+}
+_RESOLUTION_MS = {
+    "1m": 60_000,
+    "5m": 300_000,
+    "15m": 900_000,
+    "1h": 3_600_000,
+    "4h": 14_400_000,
+    "1d": 86_400_000,
+}
+
+
+def _status(order: SimOrder) -> str:
+    if order.status == UNTRIGGERED:
+        return "pending"
+    if order.status != CLOSED:
+        return "open"
+    if order.remaining <= 0:
+        return "filled"
+    return _CANCEL_STATUSES.get(order.cancel_reason or "", "canceled")
+
+
+def _scaled(value: Any, decimals: int, field: str) -> Decimal:
+    try:
+        return Decimal(int(value)).scaleb(-decimals)
+    except (TypeError, ValueError) as exc:
+        raise SimHttpError(400, f"Invalid {field}: {value!r}", "21100") from exc
+
+
+class LighterDialect(VenueDialect):
+    venue = "LIGHTER"
+    prefix = "/lighter"
+    ws_path = "/stream"
+
+    def __init__(
+        self,
+        engine: MatchingEngine,
+        *args: Any,
+        api_public_key: str = "0x" + "00" * 40,
+        **kwargs: Any,
+    ) -> None:
+        self.api_public_key = api_public_key
+        self._nonces: dict[tuple[str, str], int] = defaultdict(int)
+        self._book_levels: dict[str, dict[tuple[str, Decimal], Decimal]] = {}
+        super().__init__(engine, *args, **kwargs)
+
+    def register_routes(self) -> None:
+        self.route("GET", "/api/v1/orderBooks", self._order_books)
+        self.route("GET", "/api/v1/orderBookDetails", self._order_books)
+        self.route("GET", "/api/v1/orderBookOrders", self._order_book_orders)
+        self.route("GET", "/api/v1/trades", self._trades)
+        self.route("GET", "/api/v1/recentTrades", self._trades)
+        self.route("GET", "/api/v1/candlesticks", self._candlesticks)
+        self.route("GET", "/api/v1/account", self._account)
+        self.route("GET", "/api/v1/accountMetadata", self._account_metadata)
+        self.route("GET", "/api/v1/accountLimits", self._account_limits)
+        self.route("GET", "/api/v1/accountActiveOrders", self._active_orders)
+        self.route("GET", "/api/v1/accountInactiveOrders", self._inactive_orders)
+        self.route("GET", "/api/v1/nextNonce", self._next_nonce)
+        self.route("GET", "/api/v1/apikeys", self._api_keys)
+        self.route("POST", "/api/v1/sendTx", self._send_tx)
+
+    def error_response(self, status: int, message: str, code: str | None = None) -> SimResponse:
+        return SimResponse.json({"code": int(code) if code else status, "message": message}, status)
+
+    # -- Rendering ------------------------------------------------------------
+
+    def _market_by_id(self, market_id: Any) -> SimMarket:
+        try:
+            market = self.engine.markets_by_id.get(int(market_id))
+        except (TypeError, ValueError):
+            market = None
+        if market is None:
+            raise SimHttpError(400, f"Unknown market {market_id}", "21101")
+        return market
+
+    def _market_filter(self, params: dict[str, str]) -> str | None:
+        market_id = params.get("market_id")
+        # 255 is the SDK's "all markets" sentinel
+        if market_id in (None, "", "255"):
+            return None
+        return self._market_by_id(market_id).symbol
+
+    def _order_json(self, order: SimOrder) -> dict[str, Any]:
+        market = self.engine.markets[order.symbol]
+        client_index = _client_index(order)
+        return {
+            "order_index": order.order_id,
+            "client_order_index": client_index,
+            "order_id": str(order.order_id),
+            "client_order_id": str(client_index),
+            "market_index": market.market_id,
+            "owner_account_index": _account_id(order.account),
+            "initial_base_amount": market.size_str(order.size),
+            "price": market.price_str(order.price),
+            "nonce": 0,
+            "remaining_base_amount": market.size_str(order.remaining),
+            "is_ask": order.side == SELL,
+            "base_size": int(order.remaining.scaleb(market.size_decimals)),
+            "base_price": int((order.price or Decimal(0)).scaleb(market.price_decimals)),
+            "filled_base_amount": market.size_str(order.filled),
+            "filled_quote_amount": str(order.filled_notional),
+            "side": "sell" if order.side == SELL else "buy",
+            "type": _TYPE_NAMES.get(order.order_type, "limit"),
+            "time_in_force": _TIME_IN_FORCE_NAMES.get(order.time_in_force, "good-till-time"),
+            "reduce_only": order.reduce_only,
+            "trigger_price": market.price_str(order.trigger_price),
+            "order_expiry": 0,
+            "status": _status(order),
+            "trigger_status": "na" if order.trigger_price is None else "ready",
+            "trigger_time": 0,
+            "parent_order_index": 0,
+            "parent_order_id": "0",
+            "block_height": 0,
+            "timestamp": order.created_ms // 1000,
+            "created_at": order.created_ms,
+            "updated_at": order.updated_ms,
+        }
+
+    def _trade_json(self, trade: SimTrade) -> dict[str, Any]:
+        market = self.engine.markets[trade.symbol]
+        ask, bid = (trade.taker, trade.maker) if trade.taker_side == SELL else (trade.maker, trade.taker)
+        return {
+            "trade_id": trade.trade_id,
+            "tx_hash": f"{trade.trade_id:064x}",
+            "type": "trade",
+            "market_id": market.market_id,
+            "size": market.size_str(trade.size),
+            "price": market.price_str(trade.price),
+            "usd_amount": str(trade.price * trade.size),
+            "ask_id": ask.order_id,
+            "bid_id": bid.order_id,
+            "ask_account_id": _account_id(ask.account),
+            "bid_account_id": _account_id(bid.account),
+            "is_maker_ask": trade.maker is ask,
+            "block_height": trade.trade_id,
+            "timestamp": trade.ts_ms // 1000,
+        }
+
+    def _fill_json(self, fill: SimFill) -> dict[str, Any]:
+        """
+        An account's fill in the shape of the trades endpoint, with the
+        account's own order and fee on it.
+        """
+        order = fill.order
+        market = self.engine.markets[order.symbol]
+        is_ask = order.side == SELL
+        own = order.order_id
+        account_id = _account_id(order.account)
+        return {
+            "trade_id": fill.trade_id,
+            "tx_hash": f"{fill.trade_id:064x}",
+            "type": "trade",
+            "market_id": market.market_id,
+            "size": market.size_str(fill.size),
+            "price": market.price_str(fill.price),
+            "usd_amount": str(fill.price * fill.size),
+            "ask_id": own if is_ask else 0,
+            "bid_id": 0 if is_ask else own,
+            "ask_account_id": account_id if is_ask else 0,
+            "bid_account_id": 0 if is_ask else account_id,
+            "is_maker_ask": (fill.liquidity == "MAKER") == is_ask,
+            "is_ask": is_ask,
+            "order_index": own,
+            "client_order_index": _client_index(order),
+            "maker_fee": str(fill.fee) if fill.liquidity == "MAKER" else "0",
+            "taker_fee": str(fill.fee) if fill.liquidity == "TAKER" else "0",
+            "block_height": fill.trade_id,
+            "timestamp": fill.ts_ms // 1000,
+        }
+
+    def _levels(self, symbol: str) -> dict[tuple[str, Decimal], Decimal]:
+        bids, asks = self.engine.depth(symbol, BOOK_DEPTH)
+        levels = {("bids", price): size for price, size in bids}
+        levels.update({("asks", price): size for price, size in asks})
+        return levels
+
+    # -- Public REST ----------------------------------------------------------
+
+    def _order_books(self, request: SimRequest, match: re.Match) -> dict[str, Any]:
+        wanted = request.params.get("market_id")
+        rows = []
+        for market in self.engine.markets.values():
+            if wanted not in (None, "", "255") and str(market.market_id) != wanted:
+                continue
+            rows.append(
+                {
+                    "symbol": market.symbol,
+                    "market_id": market.market_id,
+                    "status": "active",
+                    "taker_fee": str(self.engine.taker_fee),
+                    "maker_fee": str(self.engine.maker_fee),
+                    "liquidation_fee": "0",
+                    "min_base_amount": str(market.size_increment),
+                    "min_quote_amount": "0",
+                    "supported_size_decimals": market.size_decimals,
+                    "supported_price_decimals": market.price_decimals,
+                    "supported_quote_decimals": market.size_decimals + market.price_decimals,
+                },
+            )
+        return {"code": 200, "order_books": rows}
+
+    def _order_book_orders(self, request: SimRequest, match: re.Match) -> dict[str, Any]:
+        market = self._market_by_id(request.params.get("market_id"))
+        limit = parse_int(request.params.get("limit"), "limit", BOOK_DEPTH)
+        book = self.engine.books[market.symbol]
+        sides = {}
+        for name, side in (("bids", book.bids), ("asks", book.asks)):
+            rows = []
+            for price, _size in side.depth(limit):
+                for order in side.levels[price]:
+                    rows.append(
+                        {
+                            "order_index": order.order_id,
+                            "order_id": str(order.order_id),
+                            "owner_account_index": _account_id(order.account),
+                            "initial_base_amount": market.size_str(order.size),
+                            "remaining_base_amount": market.size_str(order.remaining),
+                            "price": market.price_str(order.price),
+                            "size": market.size_str(order.remaining),
+                            "order_expiry": 0,
+                        },
+                    )
+                    if len(rows) >= limit:
+                        break
+                if len(rows) >= limit:
+                    break
+            sides[name] = rows
+        return {
+            "code": 200,
+            "total_bids": len(sides["bids"]),
+            "bids": sides["bids"],
+            "total_asks": len(sides["asks"]),
+            "asks": sides["asks"],
+        }
+
+    def _trades(self, request: SimRequest, match: re.Match) -> dict[str, Any]:
+        params = request.params
+        limit = parse_int(params.get("limit"), "limit", DEFAULT_LIMIT)
+        symbol = self._market_filter(params)
+        since_ms = parse_int(params.get("from") or params.get("var_from"), "from")
+        newest_first = params.get("sort_dir", "desc") != "asc"
+
+        if params.get("account_index"):
+            fills = [
+                f
+                for f in self.engine.fills(params["account_index"], symbol)
+                if f.ts_ms >= since_ms
+            ]
+            if not newest_first:
+                fills.reverse()
+            return {"code": 200, "trades": [self._fill_json(f) for f in fills[:limit]]}
+
+        symbols = [symbol] if symbol is not None else list(self.engine.markets)
+        trades = sorted(
+            (t for s in symbols for t in self.engine.trades[s] if t.ts_ms >= since_ms),
+            key=lambda t: t.trade_id,
+            reverse=newest_first,
+        )
+        return {"code": 200, "trades": [self._trade_json(t) for t in trades[:limit]]}
+
+    def _candlesticks(self, request: SimRequest, match: re.Match) -> dict[str, Any]:
+        params = request.params
+        market = self._market_by_id(params.get("market_id"))
+        resolution = params.get("resolution", "1m")
+        step = _RESOLUTION_MS.get(resolution)
+        if step is None:
+            raise SimHttpError(400, f"Unsupported resolution {resolution}", "21102")
+        start = parse_int(params.get("start_timestamp"), "start_timestamp")
+        end = parse_int(params.get("end_timestamp"), "end_timestamp") or self.engine.clock()
+        count_back = parse_int(params.get("count_back"), "count_back", 500)
+
+        candles: dict[int, dict[str, Any]] = {}
+        for trade in self.engine.trades[market.symbol]:
+            if not start <= trade.ts_ms <= end:
+                continue
+            bucket = trade.ts_ms - trade.ts_ms % step
+            candle = candles.get(bucket)
+            if candle is None:
+                candles[bucket] = {
+                    "timestamp": bucket,
+                    "open": trade.price,
+                    "high": trade.price,
+                    "low": trade.price,
+                    "close": trade.price,
+                    "volume0": trade.size,
+                    "volume1": trade.price * trade.size,
+                    "last_trade_id": trade.trade_id,
+                }
+                continue
+            candle["high"] = max(candle["high"], trade.price)
+            candle["low"] = min(candle["low"], trade.price)
+            candle["close"] = trade.price
+            candle["volume0"] += trade.size
+            candle["volume1"] += trade.price * trade.size
+            candle["last_trade_id"] = trade.trade_id
+
+        rows = [
+            {k: (float(v) if isinstance(v, Decimal) else v) for k, v in candles[bucket].items()}
+            for bucket in sorted(candles)[-count_back:]
+        ]
+        return {"code": 200, "resolution": resolution, "candlesticks": rows}
+
+    # -- Accounts and orders --------------------------------------------------
+
+    def _account(self, request: SimRequest, match: re.Match) -> dict[str, Any]:
+        name = request.params.get("value", "")
+        if not name:
+            raise SimHttpError(400, "Missing account value", "21103")
+        account = self.engine.account(name)
+        collateral = str(account.collateral)
+        positions = []
+        for symbol, position in account.positions.items():
+            market = self.engine.markets[symbol]
+            positions.append(
+                {
+                    "market_id": market.market_id,
+                    "symbol": symbol,
+                    "sign": -1 if position.size < 0 else 1,
+                    "position": market.size_str(abs(position.size)),
+                    "avg_entry_price": market.price_str(position.avg_entry),
+                    "position_value": str(abs(position.size) * market.mid),
+                    "unrealized_pnl": "0",
+                    "realized_pnl": str(position.realized_pnl),
+                    "open_order_count": len(self.engine.open_orders(name, symbol)),
+                    "pending_order_count": 0,
+                    "margin_mode": 0,
+                    "allocated_margin": "0",
+                },
+            )
+        row = {
+            "code": 0,
+            "account_type": 0,
+            "index": _account_id(name),
+            "account_index": _account_id(name),
+            "l1_address": "",
+            "cancel_all_time": 0,
+            "total_order_count": len(self.engine.open_orders(name)),
+            "pending_order_count": 0,
+            "available_balance": collateral,
+            "status": 1,
+            "collateral": collateral,
+            "total_asset_value": collateral,
+            "cross_asset_value": collateral,
+            "positions": positions,
+            "assets": [],
+            "shares": [],
+        }
+        return {"code": 200, "total": 1, "accounts": [row]}
+
+    def _account_metadata(self, request: SimRequest, match: re.Match) -> dict[str, Any]:
+        name = request.params.get("value", "")
+        return {
+            "code": 200,
+            "account_metadatas": [{"account_index": _account_id(name), "name": f"sim-{name}", "description": ""}],
+        }
+
+    def _account_limits(self, request: SimRequest, match: re.Match) -> dict[str, Any]:
+        return {"code": 200, "max_llp_percentage": 100, "user_tier": "std", "can_create_public_pool": False}
+
+    def _active_orders(self, request: SimRequest, match: re.Match) -> dict[str, Any]:
+        params = request.params
+        orders = self.engine.open_orders(params.get("account_index", ""), self._market_filter(params))
+        return {"code": 200, "orders": [self._order_json(o) for o in orders]}
+
+    def _inactive_orders(self, request: SimRequest, match: re.Match) -> dict[str, Any]:
+        params = request.params
+        orders = self.engine.order_history(params.get("account_index", ""), self._market_filter(params))
+        rows, next_cursor, _ = paginate(
+            orders,
+            params.get("cursor"),
+            parse_int(params.get("limit"), "limit", DEFAULT_LIMIT),
+        )
+        return {"code": 200, "orders": [self._order_json(o) for o in rows], "next_cursor": next_cursor}
+
+    def _next_nonce(self, request: SimRequest, match: re.Match) -> dict[str, Any]:
+        params = request.params
+        key = (params.get("account_index", ""), params.get("api_key_index", ""))
+        return {"code": 200, "nonce": self._nonces[key]}
+
+    def _api_keys(self, request: SimRequest, match: re.Match) -> dict[str, Any]:
+        params = request.params
+        account = params.get("account_index", "")
+        api_key = params.get("api_key_index", "0")
+        return {
+            "code": 200,
+            "api_keys": [
+                {
+                    "account_index": _account_id(account),
+                    "api_key_index": int(api_key) if api_key.isdigit() else 0,
+                    "nonce": self._nonces[(account, api_key)],
+                    "public_key": self.api_public_key,
+                },
+            ],
+        }
+
+    def _send_tx(self, request: SimRequest, match: re.Match) -> dict[str, Any]:
+        form = request.form()
+        try:
+            tx_type = int(form.get("tx_type", ""))
+            tx_info = json.loads(form.get("tx_info", ""))
+        except ValueError as exc:
+            raise SimHttpError(400, f"Invalid transaction: {exc}", "21104") from exc
+
+        account = str(tx_info.get("AccountIndex", ""))
+        nonce_key = (account, str(tx_info.get("ApiKeyIndex", 0)))
+        self._nonces[nonce_key] = max(self._nonces[nonce_key], parse_int(tx_info.get("Nonce"), "Nonce") + 1)
+
+        if tx_type == TX_TYPE_CREATE_ORDER:
+            self._create_order(account, tx_info)
+        elif tx_type == TX_TYPE_CANCEL_ORDER:
+            self.engine.cancel(self._tx_order(account, tx_info))
+        elif tx_type == TX_TYPE_CANCEL_ALL_ORDERS:
+            self.engine.cancel_all(account)
+        elif tx_type == TX_TYPE_MODIFY_ORDER:
+            order = self._tx_order(account, tx_info)
+            market = self.engine.markets[order.symbol]
+            trigger = parse_int(tx_info.get("TriggerPrice"), "TriggerPrice")
+            self.engine.modify(
+                order,
+                size=_scaled(tx_info.get("BaseAmount"), market.size_decimals, "BaseAmount"),
+                price=_scaled(tx_info.get("Price"), market.price_decimals, "Price"),
+                trigger_price=_scaled(trigger, market.price_decimals, "TriggerPrice") if trigger else None,
+            )
+        else:
+            raise SimHttpError(400, f"Unsupported tx_type {tx_type}", "21105")
+
+        digest = hashlib.sha256(form.get("tx_info", "").encode()).hexdigest()
+        return {"code": 200, "message": "{}", "tx_hash": digest, "predicted_execution_time_ms": 0}
+
+    def _tx_order(self, account: str, tx_info: dict[str, Any]) -> SimOrder:
+        order = self.engine.get_order(parse_int(tx_info.get("Index"), "Index"))
+        if order is None or order.account != account:
+            raise SimHttpError(400, "Order not found", "21600")
+        if order.status == CLOSED:
+            raise SimHttpError(400, f"Order {order.order_id} is not open", "21601")
+        return order
+
+    def _create_order(self, account: str, tx_info: dict[str, Any]) -> SimOrder:
+        market = self._market_by_id(tx_info.get("MarketIndex"))
+        order_type = _ORDER_TYPES.get(parse_int(tx_info.get("Type"), "Type"))
+        if order_type is None:
+            raise SimHttpError(400, f"Unsupported order type {tx_info.get('Type')}", "21106")
+        trigger = parse_int(tx_info.get("TriggerPrice"), "TriggerPrice")
+        client_index = parse_int(tx_info.get("ClientOrderIndex"), "ClientOrderIndex")
+        return self.engine.submit(
+            account,
+            market.symbol,
+            SELL if tx_info.get("IsAsk") else "BUY",
+            order_type,
+            _scaled(tx_info.get("BaseAmount"), market.size_decimals, "BaseAmount"),
+            price=_scaled(tx_info.get("Price"), market.price_decimals, "Price"),
+            client_id=str(client_index) if client_index else None,
+            time_in_force=_TIME_IN_FORCE.get(parse_int(tx_info.get("TimeInForce"), "TimeInForce") or 1, GTC),
+            trigger_price=_scaled(trigger, market.price_decimals, "TriggerPrice") if trigger else None,
+            reduce_only=bool(tx_info.get("ReduceOnly")),
+        )
+
+    # -- WebSocket ------------------------------------------------------------
+
+    def on_ws_connect(self, ws: SimWebSocket, request: SimRequest) -> None:
+        ws.send_json({"type": "connected", "session_id": str(id(ws))})
+
+    def on_ws_message(self, ws: SimWebSocket, message: Any) -> None:
+        if not isinstance(message, dict):
+            return
+        kind = message.get("type")
+        if kind == "ping":
+            ws.send_json({"type": "pong"})
+            return
+        if kind not in ("subscribe", "unsubscribe"):
+            return
+        channel, _, market_id = str(message.get("channel", "")).partition("/")
+        market = self.engine.markets_by_id.get(int(market_id)) if market_id.isdigit() else None
+        if channel not in ("order_book", "trade") or market is None:
+            ws.send_json({"type": "error", "message": f"Invalid channel {message.get('channel')}"})
+            return
+        name = f"{channel}:{market.market_id}"
+        if kind == "unsubscribe":
+            ws.subscriptions.discard(name)
+            return
+        ws.subscriptions.add(name)
+        if channel == "order_book":
+            levels = self._levels(market.symbol)
+            self._book_levels[market.symbol] = levels
+            ws.send_json(self._book_push("subscribed/order_book", market, levels))
+        else:
+            trades = list(self.engine.trades[market.symbol])[-50:]
+            ws.send_json(
+                {
+                    "type": "subscribed/trade",
+                    "channel": name,
+                    "trades": [self._trade_json(t) for t in trades],
+                },
+            )
+
+    def _book_push(
+        self,
+        kind: str,
+        market: SimMarket,
+        levels: dict[tuple[str, Decimal], Decimal],
+    ) -> dict[str, Any]:
+        book: dict[str, Any] = {"code": 0, "asks": [], "bids": []}
+        for (side, price), size in levels.items():
+            book[side].append({"price": market.price_str(price), "size": market.size_str(size)})
+        return {
+            "type": kind,
+            "channel": f"order_book:{market.market_id}",
+            "order_book": book,
+            "timestamp": self.engine.clock(),
+        }
+
+    def on_engine_event(self, kind: str, obj: Any) -> None:
+        if not self.sockets:
+            return
+        if kind == "book":
+            market = self.engine.markets[obj]
+            channel = f"order_book:{market.market_id}"
+            if not self.has_subscribers(channel):
+                return
+            previous = self._book_levels.get(obj, {})
+            levels = self._levels(obj)
+            self._book_levels[obj] = levels
+            changed = {key: size for key, size in levels.items() if previous.get(key) != size}
+            changed.update({key: Decimal(0) for key in previous if key not in levels})
+            if changed:
+                self.broadcast(channel, self._book_push("update/order_book", market, changed))
+        elif kind == "trade":
+            market = self.engine.markets[obj.symbol]
+            channel = f"trade:{market.market_id}"
+            self.broadcast(
+                channel,
+                {"type": "update/trade", "channel": channel, "trades": [self._trade_json(obj)]},
+            )
+
+
+def _account_id(account: str) -> int:
+    return int(account) if account.isdigit() else 0
+
+
+def _client_index(order: SimOrder) -> int:
+    client_id = order.client_id
+    return int(client_id) if client_id and client_id.isdigit() else 0
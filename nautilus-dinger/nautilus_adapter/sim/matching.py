@@ -0,0 +1,741 @@
+"""
+Price-time priority matching for the local venue simulator.
+
+Each market keeps a limit order book per side, levels in price order and
+orders FIFO within a level. A house account quotes a fixed ladder around a
+reference mid and re-quotes whatever is taken, so market orders always find
+liquidity and a single client can fill thousands of orders with no second
+participant. Trigger orders (stop loss / take profit) rest untriggered until
+the last trade price, or a moved mid, crosses their trigger.
+
+Order states use Paradex's vocabulary (``NEW``/``UNTRIGGERED``/``OPEN``/
+``CLOSED`` plus a cancel reason); the venue dialects translate them.
+"""
+import bisect
+import itertools
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from decimal import Decimal
+from typing import Any, Callable, Iterable, Iterator
+
+BUY = "BUY"
+SELL = "SELL"
+
+NEW = "NEW"
+UNTRIGGERED = "UNTRIGGERED"
+OPEN = "OPEN"
+CLOSED = "CLOSED"
+
+LIMIT = "LIMIT"
+MARKET = "MARKET"
+STOP_MARKET = "STOP_MARKET"
+STOP_LIMIT = "STOP_LIMIT"
+TAKE_PROFIT_MARKET = "TAKE_PROFIT_MARKET"
+TAKE_PROFIT_LIMIT = "TAKE_PROFIT_LIMIT"
+
+GTC = "GTC"
+IOC = "IOC"
+POST_ONLY = "POST_ONLY"
+
+MAKER = "MAKER"
+TAKER = "TAKER"
+
+# Cancel reasons
+USER_CANCELED = "USER_CANCELED"
+NO_LIQUIDITY = "NO_LIQUIDITY"
+IOC_REMAINDER = "IOC_REMAINDER"
+POST_ONLY_WOULD_CROSS = "POST_ONLY_WOULD_CROSS"
+REDUCE_ONLY_WOULD_INCREASE = "REDUCE_ONLY_WOULD_INCREASE"
+SELF_TRADE = "SELF_TRADE"
+
+HOUSE = "house"
+
+_STOP_TYPES = frozenset({STOP_MARKET, STOP_LIMIT})
+_TAKE_PROFIT_TYPES = frozenset({TAKE_PROFIT_MARKET, TAKE_PROFIT_LIMIT})
+TRIGGER_TYPES = _STOP_TYPES | _TAKE_PROFIT_TYPES
+_MARKET_TYPES = frozenset({MARKET, STOP_MARKET, TAKE_PROFIT_MARKET})
+_ZERO = Decimal("0")
+
+
+def _now_ms() -> int:
+    return time.time_ns() // 1_000_000
+
+
+def _decimals(step: Decimal) -> int:
+    return max(0, -step.normalize().as_tuple().exponent)
+
+
+class SimRejected(Exception):
+    """
+    An order request the simulated venue refuses (reported as a 4xx).
+    """
+
+
+@dataclass
+class SimMarket:
+    symbol: str
+    market_id: int
+    tick_size: Decimal
+    size_increment: Decimal
+    mid: Decimal
+
+    @property
+    def price_decimals(self) -> int:
+        return _decimals(self.tick_size)
+
+    @property
+    def size_decimals(self) -> int:
+        return _decimals(self.size_increment)
+
+    def price_str(self, value: Decimal | None) -> str:
+        if value is None:
+            return "0"
+        return f"{value:.{self.price_decimals}f}"
+
+    def size_str(self, value: Decimal) -> str:
+        return f"{value:.{self.size_decimals}f}"
+
+
+@dataclass(eq=False)
+class SimOrder:
+    order_id: int
+    account: str
+    symbol: str
+    side: str
+    order_type: str
+    size: Decimal
+    price: Decimal | None = None
+    client_id: str | None = None
+    time_in_force: str = GTC
+    trigger_price: Decimal | None = None
+    reduce_only: bool = False
+    status: str = NEW
+    remaining: Decimal = _ZERO
+    filled_notional: Decimal = _ZERO
+    cancel_reason: str | None = None
+    created_ms: int = 0
+    updated_ms: int = 0
+
+    @property
+    def filled(self) -> Decimal:
+        return self.size - self.remaining
+
+    @property
+    def avg_fill_price(self) -> Decimal | None:
+        filled = self.filled
+        return self.filled_notional / filled if filled > 0 else None
+
+    @property
+    def is_open(self) -> bool:
+        return self.status != CLOSED
+
+    @property
+    def is_filled(self) -> bool:
+        return self.status == CLOSED and self.remaining <= 0
+
+
+@dataclass(eq=False)
+class SimFill:
+    fill_id: int
+    trade_id: int
+    order: SimOrder
+    price: Decimal
+    size: Decimal
+    liquidity: str
+    fee: Decimal
+    ts_ms: int
+
+
+@dataclass(eq=False)
+class SimTrade:
+    trade_id: int
+    symbol: str
+    price: Decimal
+    size: Decimal
+    taker_side: str
+    ts_ms: int
+    maker: SimOrder
+    taker: SimOrder
+
+
+@dataclass
+class SimPosition:
+    size: Decimal = _ZERO
+    avg_entry: Decimal = _ZERO
+    realized_pnl: Decimal = _ZERO
+
+    def apply(self, side: str, price: Decimal, size: Decimal) -> None:
+        signed = size if side == BUY else -size
+        if self.size == 0 or (self.size > 0) == (signed > 0):
+            total = abs(self.size) + size
+            self.avg_entry = (self.avg_entry * abs(self.size) + price * size) / total
+            self.size += signed
+            return
+        closed = min(abs(self.size), size)
+        direction = 1 if self.size > 0 else -1
+        self.realized_pnl += (price - self.avg_entry) * closed * direction
+        self.size += signed
+        if self.size == 0:
+            self.avg_entry = _ZERO
+        elif (self.size > 0) != (direction > 0):
+            # Flipped through zero: the remainder opened at this price
+            self.avg_entry = price
+
+
+@dataclass
+class SimAccount:
+    name: str
+    balance: Decimal
+    fees_paid: Decimal = _ZERO
+    positions: dict[str, SimPosition] = field(default_factory=dict)
+    fills: deque = field(default_factory=deque)
+
+    def position(self, symbol: str) -> Decimal:
+        position = self.positions.get(symbol)
+        return position.size if position is not None else _ZERO
+
+    @property
+    def realized_pnl(self) -> Decimal:
+        return sum((p.realized_pnl for p in self.positions.values()), _ZERO)
+
+    @property
+    def collateral(self) -> Decimal:
+        return self.balance + self.realized_pnl - self.fees_paid
+
+
+class _BookSide:
+    """
+    One side of a book: price levels kept sorted best first, FIFO per level.
+    """
+
+    __slots__ = ("is_bid", "levels", "_keys")
+
+    def __init__(self, is_bid: bool) -> None:
+        self.is_bid = is_bid
+        self.levels: dict[Decimal, deque[SimOrder]] = {}
+        # Negated for bids so index 0 is always the best price
+        self._keys: list[Decimal] = []
+
+    def _key(self, price: Decimal) -> Decimal:
+        return -price if self.is_bid else price
+
+    def best(self) -> Decimal | None:
+        return self._key(self._keys[0]) if self._keys else None
+
+    def add(self, order: SimOrder) -> None:
+        price = order.price
+        assert price is not None
+        queue = self.levels.get(price)
+        if queue is None:
+            queue = self.levels[price] = deque()
+            bisect.insort(self._keys, self._key(price))
+        queue.append(order)
+
+    def remove(self, order: SimOrder) -> bool:
+        queue = self.levels.get(order.price)
+        if queue is None:
+            return False
+        try:
+            queue.remove(order)
+        except ValueError:
+            return False
+        if not queue:
+            self._drop(order.price)
+        return True
+
+    def pop_front(self, price: Decimal) -> None:
+        queue = self.levels[price]
+        queue.popleft()
+        if not queue:
+            self._drop(price)
+
+    def _drop(self, price: Decimal) -> None:
+        del self.levels[price]
+        key = self._key(price)
+        index = bisect.bisect_left(self._keys, key)
+        if index < len(self._keys) and self._keys[index] == key:
+            del self._keys[index]
+
+    def depth(self, levels: int) -> list[tuple[Decimal, Decimal]]:
+        rows = []
+        for key in self._keys[:levels]:
+            price = self._key(key)
+            rows.append((price, sum((o.remaining for o in self.levels[price]), _ZERO)))
+        return rows
+
+    def orders(self) -> Iterator[SimOrder]:
+        for queue in self.levels.values():
+            yield from queue
+
+
+class OrderBook:
+    __slots__ = ("bids", "asks")
+
+    def __init__(self) -> None:
+        self.bids = _BookSide(is_bid=True)
+        self.asks = _BookSide(is_bid=False)
+
+    def side(self, side: str) -> _BookSide:
+        return self.bids if side == BUY else self.asks
+
+    def opposite(self, side: str) -> _BookSide:
+        return self.asks if side == BUY else self.bids
+
+
+def _crosses(side: str, limit: Decimal | None, level: Decimal) -> bool:
+    if limit is None:
+        return True
+    return level <= limit if side == BUY else level >= limit
+
+
+class MatchingEngine:
+    """
+    Books, accounts and order lifecycle for one simulated venue.
+
+    ``listeners`` are called synchronously as ``listener(kind, obj)`` with
+    kind ``"order"`` (a ``SimOrder`` changed), ``"fill"`` (a ``SimFill`` for a
+    non-house account), ``"trade"`` (a public ``SimTrade``) or ``"book"`` (a
+    market symbol whose book changed, once per request).
+    """
+
+    def __init__(
+        self,
+        markets: Iterable[SimMarket],
+        house_levels: int = 10,
+        house_size: Decimal = Decimal("100"),
+        maker_fee: Decimal = Decimal("0.0002"),
+        taker_fee: Decimal = Decimal("0.0005"),
+        initial_balance: Decimal = Decimal("100000"),
+        history_size: int = 100_000,
+        clock: Callable[[], int] = _now_ms,
+    ) -> None:
+        self.markets: dict[str, SimMarket] = {m.symbol: m for m in markets}
+        self.markets_by_id: dict[int, SimMarket] = {m.market_id: m for m in self.markets.values()}
+        self.house_levels = house_levels
+        self.house_size = house_size
+        self.maker_fee = maker_fee
+        self.taker_fee = taker_fee
+        self.initial_balance = initial_balance
+        self.history_size = history_size
+        self.clock = clock
+        self.listeners: list[Callable[[str, Any], None]] = []
+
+        self.books: dict[str, OrderBook] = {symbol: OrderBook() for symbol in self.markets}
+        self.accounts: dict[str, SimAccount] = {}
+        self.orders: dict[int, SimOrder] = {}
+        self._open: dict[int, SimOrder] = {}
+        self.trades: dict[str, deque[SimTrade]] = {
+            symbol: deque(maxlen=1000) for symbol in self.markets
+        }
+        self.last_price: dict[str, Decimal] = {}
+        self._by_client: dict[tuple[str, str], SimOrder] = {}
+        self._triggers: dict[str, list[SimOrder]] = {symbol: [] for symbol in self.markets}
+        self._closed: deque[SimOrder] = deque()
+        self._order_ids = itertools.count(1)
+        self._trade_ids = itertools.count(1)
+        self._fill_ids = itertools.count(1)
+        self._dirty: set[str] = set()
+
+        for market in self.markets.values():
+            self._quote_house(market)
+        self._dirty.clear()
+
+    # -- Lookups --------------------------------------------------------------
+
+    def market(self, symbol: str) -> SimMarket:
+        market = self.markets.get(symbol)
+        if market is None:
+            raise SimRejected(f"Unknown market {symbol}")
+        return market
+
+    def account(self, name: str) -> SimAccount:
+        account = self.accounts.get(name)
+        if account is None:
+            account = self.accounts[name] = SimAccount(name, self.initial_balance)
+            account.fills = deque(maxlen=self.history_size)
+        return account
+
+    def get_order(self, order_id: int) -> SimOrder | None:
+        return self.orders.get(order_id)
+
+    def get_order_by_client_id(self, account: str, client_id: str) -> SimOrder | None:
+        return self._by_client.get((account, client_id))
+
+    def open_orders(self, account: str, symbol: str | None = None) -> list[SimOrder]:
+        return [
+            o
+            for o in self._open.values()
+            if o.account == account and (symbol is None or o.symbol == symbol)
+        ]
+
+    def order_history(self, account: str, symbol: str | None = None) -> list[SimOrder]:
+        """
+        Closed orders of an account, newest first.
+        """
+        return [
+            o
+            for o in reversed(self._closed)
+            if o.account == account and (symbol is None or o.symbol == symbol)
+        ]
+
+    def fills(self, account: str, symbol: str | None = None) -> list[SimFill]:
+        """
+        Fills of an account, newest first.
+        """
+        return [
+            f
+            for f in reversed(self.account(account).fills)
+            if symbol is None or f.order.symbol == symbol
+        ]
+
+    def depth(self, symbol: str, levels: int = 20) -> tuple[list, list]:
+        book = self.books[self.market(symbol).symbol]
+        return book.bids.depth(levels), book.asks.depth(levels)
+
+    def best_bid_ask(self, symbol: str) -> tuple[Decimal | None, Decimal | None]:
+        book = self.books[symbol]
+        return book.bids.best(), book.asks.best()
+
+    # -- Requests -------------------------------------------------------------
+
+    def submit(
+        self,
+        account: str,
+        symbol: str,
+        side: str,
+        order_type: str,
+        size: Decimal,
+        price: Decimal | None = None,
+        client_id: str | None = None,
+        time_in_force: str = GTC,
+        trigger_price: Decimal | None = None,
+        reduce_only: bool = False,
+    ) -> SimOrder:
+        market = self.market(symbol)
+        side = side.upper()
+        order_type = order_type.upper()
+        if side not in (BUY, SELL):
+            raise SimRejected(f"Invalid side {side}")
+        if order_type not in _MARKET_TYPES and order_type not in (LIMIT, STOP_LIMIT, TAKE_PROFIT_LIMIT):
+            raise SimRejected(f"Unsupported order type {order_type}")
+        if size <= 0 or size % market.size_increment != 0:
+            raise SimRejected(f"Invalid size {size} (increment {market.size_increment})")
+        if order_type in _MARKET_TYPES:
+            price = None
+        elif price is None or price <= 0 or price % market.tick_size != 0:
+            raise SimRejected(f"Invalid price {price} (tick {market.tick_size})")
+        if order_type in TRIGGER_TYPES and (trigger_price is None or trigger_price <= 0):
+            raise SimRejected(f"{order_type} requires a trigger price")
+        if client_id is not None:
+            existing = self._by_client.get((account, client_id))
+            if existing is not None and existing.is_open:
+                raise SimRejected(f"Duplicate client id {client_id}")
+
+        now = self.clock()
+        order = SimOrder(
+            order_id=next(self._order_ids),
+            account=account,
+            symbol=symbol,
+            side=side,
+            order_type=order_type,
+            size=size,
+            price=price,
+            client_id=client_id,
+            time_in_force=time_in_force.upper(),
+            trigger_price=trigger_price if order_type in TRIGGER_TYPES else None,
+            reduce_only=reduce_only,
+            remaining=size,
+            created_ms=now,
+            updated_ms=now,
+        )
+        self.account(account)
+        self.orders[order.order_id] = order
+        self._open[order.order_id] = order
+        if client_id is not None:
+            self._by_client[(account, client_id)] = order
+
+        if order.trigger_price is not None:
+            order.status = UNTRIGGERED
+            self._triggers[symbol].append(order)
+            self._emit("order", order)
+            last = self.last_price.get(symbol)
+            if last is not None:
+                self._check_triggers(symbol, last)
+        else:
+            self._execute(order)
+        self._flush()
+        return order
+
+    def cancel(self, order: SimOrder, reason: str = USER_CANCELED) -> SimOrder:
+        if not order.is_open:
+            raise SimRejected(f"Order {order.order_id} is not open ({order.cancel_reason or 'filled'})")
+        self._unrest(order)
+        self._close(order, reason)
+        self._flush()
+        return order
+
+    def cancel_all(self, account: str, symbol: str | None = None) -> list[SimOrder]:
+        canceled = []
+        for order in self.open_orders(account, symbol):
+            self._unrest(order)
+            self._close(order, USER_CANCELED)
+            canceled.append(order)
+        self._flush()
+        return canceled
+
+    def modify(
+        self,
+        order: SimOrder,
+        size: Decimal | None = None,
+        price: Decimal | None = None,
+        trigger_price: Decimal | None = None,
+    ) -> SimOrder:
+        """
+        Amend an open order in place; it keeps its id and loses queue priority.
+        """
+        if not order.is_open:
+            raise SimRejected(f"Order {order.order_id} is not open")
+        market = self.market(order.symbol)
+        if size is not None:
+            if size <= order.filled or size % market.size_increment != 0:
+                raise SimRejected(f"Invalid size {size}")
+        if price is not None and order.price is not None:
+            if price <= 0 or price % market.tick_size != 0:
+                raise SimRejected(f"Invalid price {price}")
+
+        self._unrest(order)
+        if size is not None:
+            order.remaining = size - order.filled
+            order.size = size
+        if price is not None and order.price is not None:
+            order.price = price
+        if trigger_price is not None and order.trigger_price is not None:
+            order.trigger_price = trigger_price
+        order.updated_ms = self.clock()
+
+        if order.status == UNTRIGGERED:
+            self._triggers[order.symbol].append(order)
+            self._emit("order", order)
+            last = self.last_price.get(order.symbol)
+            if last is not None:
+                self._check_triggers(order.symbol, last)
+        else:
+            self._execute(order)
+        self._flush()
+        return order
+
+    def set_mid(self, symbol: str, mid: Decimal) -> None:
+        """
+        Move the house ladder to a new mid, trading through any resting
+        orders it now crosses, and fire the triggers the move reaches.
+        """
+        market = self.market(symbol)
+        book = self.books[symbol]
+        for side in (book.bids, book.asks):
+            for order in [o for o in side.orders() if o.account == HOUSE]:
+                side.remove(order)
+                self._close(order, USER_CANCELED)
+        market.mid = mid
+        self._quote_house(market)
+        self._check_triggers(symbol, mid)
+        self._flush()
+
+    # -- Internals ------------------------------------------------------------
+
+    def _emit(self, kind: str, obj: Any) -> None:
+        for listener in self.listeners:
+            listener(kind, obj)
+
+    def _flush(self) -> None:
+        if not self._dirty:
+            return
+        dirty, self._dirty = self._dirty, set()
+        for symbol in dirty:
+            self._emit("book", symbol)
+
+    def _quote_house(self, market: SimMarket) -> None:
+        for level in range(1, self.house_levels + 1):
+            offset = market.tick_size * level
+            for side, price in ((BUY, market.mid - offset), (SELL, market.mid + offset)):
+                if price > 0:
+                    self._place_house(market.symbol, side, price)
+
+    def _place_house(self, symbol: str, side: str, price: Decimal) -> None:
+        now = self.clock()
+        order = SimOrder(
+            order_id=next(self._order_ids),
+            account=HOUSE,
+            symbol=symbol,
+            side=side,
+            order_type=LIMIT,
+            size=self.house_size,
+            price=price,
+            remaining=self.house_size,
+            created_ms=now,
+            updated_ms=now,
+        )
+        self._execute(order)
+
+    def _unrest(self, order: SimOrder) -> None:
+        if order.status == UNTRIGGERED:
+            triggers = self._triggers[order.symbol]
+            if order in triggers:
+                triggers.remove(order)
+        elif order.price is not None and self.books[order.symbol].side(order.side).remove(order):
+            self._dirty.add(order.symbol)
+
+    def _close(self, order: SimOrder, reason: str | None) -> None:
+        order.status = CLOSED
+        order.cancel_reason = reason if order.remaining > 0 else None
+        order.updated_ms = self.clock()
+        if order.account == HOUSE:
+            return
+        self._open.pop(order.order_id, None)
+        self._emit("order", order)
+        self._closed.append(order)
+        while len(self._closed) > self.history_size:
+            evicted = self._closed.popleft()
+            self.orders.pop(evicted.order_id, None)
+            if evicted.client_id is not None:
+                key = (evicted.account, evicted.client_id)
+                if self._by_client.get(key) is evicted:
+                    del self._by_client[key]
+
+    def _clamp_reduce_only(self, order: SimOrder) -> bool:
+        position = self.account(order.account).position(order.symbol)
+        reducing = (order.side == SELL and position > 0) or (order.side == BUY and position < 0)
+        allowed = min(order.remaining, abs(position)) if reducing else _ZERO
+        if allowed <= 0:
+            self._close(order, REDUCE_ONLY_WOULD_INCREASE)
+            return False
+        order.remaining = allowed
+        order.size = order.filled + allowed
+        return True
+
+    def _execute(self, order: SimOrder) -> None:
+        """
+        Match an active order against the book, then rest or close the rest.
+        """
+        if order.reduce_only and not self._clamp_reduce_only(order):
+            return
+        book = self.books[order.symbol]
+        opposite = book.opposite(order.side)
+        limit = order.price
+
+        if order.time_in_force == POST_ONLY:
+            best = opposite.best()
+            if best is not None and _crosses(order.side, limit, best):
+                self._close(order, POST_ONLY_WOULD_CROSS)
+                return
+
+        last_trade: Decimal | None = None
+        while order.remaining > 0:
+            level = opposite.best()
+            if level is None or not _crosses(order.side, limit, level):
+                break
+            maker = opposite.levels[level][0]
+            if maker.account == order.account:
+                opposite.pop_front(level)
+                self._close(maker, SELF_TRADE)
+                self._dirty.add(order.symbol)
+                continue
+            # A resting reduce-only order may have outlived the position it was reducing
+            if maker.reduce_only and not self._clamp_reduce_only(maker):
+                opposite.pop_front(level)
+                self._dirty.add(order.symbol)
+                continue
+            quantity = min(order.remaining, maker.remaining)
+            self._trade(maker, order, level, quantity)
+            last_trade = level
+            if maker.remaining <= 0:
+                opposite.pop_front(level)
+                self._close(maker, None)
+                if maker.account == HOUSE:
+                    self._place_house(maker.symbol, maker.side, level)
+
+        if order.remaining <= 0:
+            self._close(order, None)
+        elif order.order_type in _MARKET_TYPES:
+            self._close(order, NO_LIQUIDITY)
+        elif order.time_in_force == IOC:
+            self._close(order, IOC_REMAINDER)
+        else:
+            order.status = OPEN
+            book.side(order.side).add(order)
+            self._dirty.add(order.symbol)
+            if order.account != HOUSE:
+                self._emit("order", order)
+
+        if last_trade is not None:
+            self._check_triggers(order.symbol, last_trade)
+
+    def _trade(self, maker: SimOrder, taker: SimOrder, price: Decimal, quantity: Decimal) -> None:
+        now = self.clock()
+        trade = SimTrade(
+            trade_id=next(self._trade_ids),
+            symbol=taker.symbol,
+            price=price,
+            size=quantity,
+            taker_side=taker.side,
+            ts_ms=now,
+            maker=maker,
+            taker=taker,
+        )
+        self.trades[taker.symbol].append(trade)
+        self.last_price[taker.symbol] = price
+        self._dirty.add(taker.symbol)
+
+        for order, liquidity, rate in ((maker, MAKER, self.maker_fee), (taker, TAKER, self.taker_fee)):
+            order.remaining -= quantity
+            order.filled_notional += price * quantity
+            order.updated_ms = now
+            if order.account == HOUSE:
+                continue
+            fee = price * quantity * rate
+            account = self.account(order.account)
+            account.fees_paid += fee
+            account.positions.setdefault(order.symbol, SimPosition()).apply(
+                order.side,
+                price,
+                quantity,
+            )
+            fill = SimFill(
+                fill_id=next(self._fill_ids),
+                trade_id=trade.trade_id,
+                order=order,
+                price=price,
+                size=quantity,
+                liquidity=liquidity,
+                fee=fee,
+                ts_ms=now,
+            )
+            account.fills.append(fill)
+            self._emit("fill", fill)
+            if order.remaining > 0:
+                self._emit("order", order)
+        self._emit("trade", trade)
+
+    def _check_triggers(self, symbol: str, price: Decimal) -> None:
+        pending = self._triggers[symbol]
+        while pending:
+            fired = [o for o in pending if self._triggered(o, price)]
+            if not fired:
+                return
+            for order in fired:
+                pending.remove(order)
+            for order in fired:
+                order.status = NEW
+                order.updated_ms = self.clock()
+                self._emit("order", order)
+                self._execute(order)
+            price = self.last_price.get(symbol, price)
+
+    @staticmethod
+    def _triggered(order: SimOrder, price: Decimal) -> bool:
+        trigger = order.trigger_price
+        assert trigger is not None
+        rising = order.order_type in _STOP_TYPES
+        if order.side == SELL:
+            rising = not rising
+        return price >= trigger if rising else price <= trigger
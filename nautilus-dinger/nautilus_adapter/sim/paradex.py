@@ -0,0 +1,529 @@
+"""
+Simulated Paradex REST and JSON-RPC WebSocket API.
+
+Serves the endpoints the Paradex client calls under ``/paradex/v1``. Auth
+is accepted without checking the StarkNet signature: ``POST /auth`` issues a
+token naming the account from the ``PARADEX-STARKNET-ACCOUNT`` header, and
+every private request acts for the account its bearer token names.
+
+The WebSocket serves ``trades.<market>``, ``bbo.<market>`` and sequenced
+``order_book.<market>.deltas`` (a snapshot on subscribe, then diffs of the
+top of book), plus ``orders.<market>`` and ``fills.<market>`` (or ``.ALL``)
+for a socket that sent ``auth``.
+"""
+import re
+from decimal import Decimal
+from typing import Any
+
+from .dialect import VenueDialect, paginate, parse_decimal, parse_int
+from .matching import (
+    CLOSED,
+    GTC,
+    HOUSE,
+    IOC,
+    LIMIT,
+    POST_ONLY,
+    SimFill,
+    SimMarket,
+    SimOrder,
+    SimTrade,
+)
+from .server import SimHttpError, SimRequest, SimResponse, SimWebSocket
+
+BOOK_DEPTH = 20
+DEFAULT_PAGE_SIZE = 100
+
+_INSTRUCTIONS = {"GTC": GTC, "IOC": IOC, "POST_ONLY": POST_ONLY}
+_JWT_PREFIX = "sim."
+
+
+class ParadexDialect(VenueDialect):
+    venue = "PARADEX"
+    prefix = "/paradex/v1"
+    ws_path = "/ws"
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        self._book_seq: dict[str, int] = {}
+        self._book_levels: dict[str, dict[tuple[str, Decimal], Decimal]] = {}
+        self._bbo: dict[str, tuple] = {}
+        super().__init__(*args, **kwargs)
+
+    def register_routes(self) -> None:
+        self.route("GET", "/system/time", self._time)
+        self.route("GET", "/timestamp", self._timestamp)
+        self.route("POST", "/auth(?:/[^/]*)?", self._auth)
+        self.route("GET", "/markets", self._markets)
+        self.route("GET", "/orderbook/([^/]+)", self._orderbook)
+        self.route("GET", "/trades", self._trades)
+        self.route("GET", "/account", self._account)
+        self.route("GET", "/accounts/me", self._account)
+        self.route("GET", "/positions", self._positions)
+        self.route("POST", "/orders", self._create_order)
+        self.route("PUT", "/orders/([^/]+)", self._modify_order)
+        self.route("DELETE", "/orders/by_client_id/([^/]+)", self._cancel_by_client_id)
+        self.route("DELETE", "/orders/([^/]+)", self._cancel_order)
+        self.route("DELETE", "/orders", self._cancel_all)
+        self.route("GET", "/orders/by_client_id/([^/]+)", self._get_order_by_client_id)
+        self.route("GET", "/orders/([^/]+)", self._get_order)
+        self.route("GET", "/orders", self._open_orders)
+        self.route("GET", "/orders-history", self._orders_history)
+        self.route("GET", "/fills", self._fills)
+
+    # -- Rendering ------------------------------------------------------------
+
+    def _market(self, symbol: str) -> SimMarket:
+        market = self.engine.markets.get(symbol)
+        if market is None:
+            raise SimHttpError(400, f"Unknown market {symbol}", "MARKET_NOT_FOUND")
+        return market
+
+    def _order_json(self, order: SimOrder) -> dict[str, Any]:
+        market = self.engine.markets[order.symbol]
+        average = order.avg_fill_price
+        return {
+            "id": str(order.order_id),
+            "client_id": order.client_id or "",
+            "account": order.account,
+            "market": order.symbol,
+            "side": order.side,
+            "type": order.order_type,
+            "status": order.status,
+            "instruction": order.time_in_force,
+            "size": market.size_str(order.size),
+            "remaining_size": market.size_str(order.remaining),
+            "price": market.price_str(order.price),
+            "trigger_price": market.price_str(order.trigger_price),
+            "avg_fill_price": market.price_str(average) if average is not None else "",
+            "cancel_reason": order.cancel_reason or "",
+            "created_at": order.created_ms,
+            "last_updated_at": order.updated_ms,
+            "flags": ["REDUCE_ONLY"] if order.reduce_only else [],
+        }
+
+    def _fill_json(self, fill: SimFill) -> dict[str, Any]:
+        order = fill.order
+        market = self.engine.markets[order.symbol]
+        return {
+            "id": str(fill.fill_id),
+            "trade_id": str(fill.trade_id),
+            "order_id": str(order.order_id),
+            "client_id": order.client_id or "",
+            "account": order.account,
+            "market": order.symbol,
+            "side": order.side,
+            "size": market.size_str(fill.size),
+            "price": market.price_str(fill.price),
+            "fee": str(fill.fee),
+            "fee_currency": "USDC",
+            "liquidity": fill.liquidity,
+            "created_at": fill.ts_ms,
+        }
+
+    def _trade_json(self, trade: SimTrade) -> dict[str, Any]:
+        market = self.engine.markets[trade.symbol]
+        return {
+            "id": str(trade.trade_id),
+            "market": trade.symbol,
+            "side": trade.taker_side,
+            "price": market.price_str(trade.price),
+            "size": market.size_str(trade.size),
+            "created_at": trade.ts_ms,
+            "trade_type": "FILL",
+        }
+
+    def _levels(self, symbol: str) -> dict[tuple[str, Decimal], Decimal]:
+        bids, asks = self.engine.depth(symbol, BOOK_DEPTH)
+        levels = {("BUY", price): size for price, size in bids}
+        levels.update({("SELL", price): size for price, size in asks})
+        return levels
+
+    # -- Auth -----------------------------------------------------------------
+
+    def _account_of(self, request: SimRequest) -> str:
+        auth = request.headers.get("authorization", "")
+        token = auth[7:] if auth.lower().startswith("bearer ") else ""
+        if not token.startswith(_JWT_PREFIX):
+            raise SimHttpError(401, "Missing or invalid bearer token", "INVALID_TOKEN")
+        return token[len(_JWT_PREFIX):]
+
+    def _owned(self, request: SimRequest, order: SimOrder | None, code: str) -> SimOrder:
+        if order is None or order.account != self._account_of(request):
+            raise SimHttpError(404, "Order not found", code)
+        return order
+
+    def _order_by_id(self, request: SimRequest, order_id: str) -> SimOrder:
+        order = self.engine.get_order(int(order_id)) if order_id.isdigit() else None
+        return self._owned(request, order, "ORDER_ID_NOT_FOUND")
+
+    def _order_by_client_id(self, request: SimRequest, client_id: str) -> SimOrder:
+        order = self.engine.get_order_by_client_id(self._account_of(request), client_id)
+        return self._owned(request, order, "CLIENT_ORDER_ID_NOT_FOUND")
+
+    # -- Public REST ----------------------------------------------------------
+
+    def _time(self, request: SimRequest, match: re.Match) -> dict[str, Any]:
+        return {"server_time": self.engine.clock()}
+
+    def _timestamp(self, request: SimRequest, match: re.Match) -> SimResponse:
+        return SimResponse.text(str(self.engine.clock()))
+
+    def _auth(self, request: SimRequest, match: re.Match) -> dict[str, Any]:
+        account = request.headers.get("paradex-starknet-account", "")
+        if not account:
+            raise SimHttpError(401, "Missing PARADEX-STARKNET-ACCOUNT header", "INVALID_SIGNATURE")
+        self.engine.account(account)
+        return {"jwt_token": f"{_JWT_PREFIX}{account}"}
+
+    def _markets(self, request: SimRequest, match: re.Match) -> dict[str, Any]:
+        wanted = request.params.get("market")
+        results = []
+        for market in self.engine.markets.values():
+            if wanted and market.symbol != wanted:
+                continue
+            base = market.symbol.split("-", 1)[0]
+            results.append(
+                {
+                    "symbol": market.symbol,
+                    "base_currency": base,
+                    "quote_currency": "USD",
+                    "settlement_currency": "USDC",
+                    "order_size_increment": str(market.size_increment),
+                    "price_tick_size": str(market.tick_size),
+                    "min_notional": "0",
+                    "open_at": 0,
+                    "expiry_at": 0,
+                    "asset_kind": "PERP",
+                    "market_kind": "cross",
+                },
+            )
+        return {"results": results}
+
+    def _orderbook(self, request: SimRequest, match: re.Match) -> dict[str, Any]:
+        market = self._market(match.group(1))
+        depth = parse_int(request.params.get("depth"), "depth", BOOK_DEPTH)
+        bids, asks = self.engine.depth(market.symbol, depth)
+        now = self.engine.clock()
+        return {
+            "market": market.symbol,
+            "bids": [{"price": market.price_str(p), "size": market.size_str(s)} for p, s in bids],
+            "asks": [{"price": market.price_str(p), "size": market.size_str(s)} for p, s in asks],
+            "timestamp": now,
+            "last_updated_at": now,
+            "seq_num": self._book_seq.get(market.symbol, 0),
+        }
+
+    def _trades(self, request: SimRequest, match: re.Match) -> dict[str, Any]:
+        params = request.params
+        market = self._market(params.get("market", ""))
+        start = parse_int(params.get("start_at"), "start_at")
+        end = parse_int(params.get("end_at"), "end_at")
+        page_size = parse_int(params.get("page_size"), "page_size", DEFAULT_PAGE_SIZE)
+        trades = [
+            t
+            for t in reversed(self.engine.trades[market.symbol])
+            if t.ts_ms >= start and (not end or t.ts_ms <= end)
+        ][:page_size]
+        return {
+            "results": [self._trade_json(t) for t in trades],
+            # The shape the adapter's HTTP client decodes
+            "trades": [
+                {
+                    "price": market.price_str(t.price),
+                    "size": market.size_str(t.size),
+                    "side": t.taker_side,
+                    "timestamp": t.ts_ms,
+                }
+                for t in trades
+            ],
+        }
+
+    # -- Private REST ---------------------------------------------------------
+
+    def _account(self, request: SimRequest, match: re.Match) -> dict[str, Any]:
+        name = self._account_of(request)
+        account = self.engine.account(name)
+        collateral = str(account.collateral)
+        return {
+            "account": name,
+            "account_value": collateral,
+            "free_collateral": collateral,
+            "total_collateral": collateral,
+            "initial_margin_requirement": "0",
+            "maintenance_margin_requirement": "0",
+            "margin_cushion": collateral,
+            "settlement_asset": "USDC",
+            "status": "ACTIVE",
+            "updated_at": self.engine.clock(),
+        }
+
+    def _positions(self, request: SimRequest, match: re.Match) -> dict[str, Any]:
+        account = self.engine.account(self._account_of(request))
+        results = []
+        for symbol, position in account.positions.items():
+            market = self.engine.markets[symbol]
+            results.append(
+                {
+                    "market": symbol,
+                    "side": "SHORT" if position.size < 0 else "LONG",
+                    "size": market.size_str(position.size),
+                    "average_entry_price": market.price_str(position.avg_entry),
+                    "realized_positional_pnl": str(position.realized_pnl),
+                    "status": "OPEN" if position.size else "CLOSED",
+                    "last_updated_at": self.engine.clock(),
+                },
+            )
+        return {"results": results}
+
+    def _create_order(self, request: SimRequest, match: re.Match) -> dict[str, Any]:
+        account = self._account_of(request)
+        body = request.json()
+        market = self._market(str(body.get("market", "")))
+        instruction = str(body.get("instruction") or "GTC").upper()
+        trigger = body.get("trigger_price")
+        order = self.engine.submit(
+            account,
+            market.symbol,
+            str(body.get("side", "")),
+            str(body.get("type", LIMIT)),
+            parse_decimal(body.get("size"), "size"),
+            price=parse_decimal(body["price"], "price") if body.get("price") else None,
+            client_id=str(body["client_id"]) if body.get("client_id") else None,
+            time_in_force=_INSTRUCTIONS.get(instruction, GTC),
+            trigger_price=parse_decimal(trigger, "trigger_price") if trigger and trigger != "0" else None,
+            reduce_only="REDUCE_ONLY" in (body.get("flags") or []),
+        )
+        return self._order_json(order)
+
+    def _modify_order(self, request: SimRequest, match: re.Match) -> dict[str, Any]:
+        order = self._order_by_id(request, match.group(1))
+        if order.status == CLOSED:
+            raise SimHttpError(400, f"Order {order.order_id} is not open", "ORDER_IS_NOT_OPEN")
+        body = request.json()
+        trigger = body.get("trigger_price")
+        self.engine.modify(
+            order,
+            size=parse_decimal(body["size"], "size") if body.get("size") else None,
+            price=parse_decimal(body["price"], "price") if body.get("price") else None,
+            trigger_price=parse_decimal(trigger, "trigger_price") if trigger and trigger != "0" else None,
+        )
+        return self._order_json(order)
+
+    def _cancel(self, order: SimOrder) -> SimResponse:
+        if order.status == CLOSED:
+            raise SimHttpError(400, f"Order {order.order_id} is closed", "ORDER_IS_CLOSED")
+        self.engine.cancel(order)
+        return SimResponse(204, b"")
+
+    def _cancel_order(self, request: SimRequest, match: re.Match) -> SimResponse:
+        return self._cancel(self._order_by_id(request, match.group(1)))
+
+    def _cancel_by_client_id(self, request: SimRequest, match: re.Match) -> SimResponse:
+        return self._cancel(self._order_by_client_id(request, match.group(1)))
+
+    def _cancel_all(self, request: SimRequest, match: re.Match) -> SimResponse:
+        self.engine.cancel_all(self._account_of(request), request.params.get("market") or None)
+        return SimResponse(204, b"")
+
+    def _get_order(self, request: SimRequest, match: re.Match) -> dict[str, Any]:
+        return self._order_json(self._order_by_id(request, match.group(1)))
+
+    def _get_order_by_client_id(self, request: SimRequest, match: re.Match) -> dict[str, Any]:
+        return self._order_json(self._order_by_client_id(request, match.group(1)))
+
+    def _open_orders(self, request: SimRequest, match: re.Match) -> dict[str, Any]:
+        orders = self.engine.open_orders(self._account_of(request), request.params.get("market") or None)
+        return {"results": [self._order_json(o) for o in orders]}
+
+    def _orders_history(self, request: SimRequest, match: re.Match) -> dict[str, Any]:
+        params = request.params
+        account = self._account_of(request)
+        symbol = params.get("market") or None
+        client_id = params.get("client_id") or None
+        start = parse_int(params.get("start_at"), "start_at")
+        end = parse_int(params.get("end_at"), "end_at")
+        orders = sorted(
+            self.engine.open_orders(account, symbol) + self.engine.order_history(account, symbol),
+            key=lambda o: o.created_ms,
+            reverse=True,
+        )
+        rows = [
+            o
+            for o in orders
+            if (client_id is None or o.client_id == client_id)
+            and o.created_ms >= start
+            and (not end or o.created_ms <= end)
+        ]
+        return _page(params, [self._order_json(o) for o in rows])
+
+    def _fills(self, request: SimRequest, match: re.Match) -> dict[str, Any]:
+        params = request.params
+        start = parse_int(params.get("start_at"), "start_at")
+        end = parse_int(params.get("end_at"), "end_at")
+        fills = [
+            f
+            for f in self.engine.fills(self._account_of(request), params.get("market") or None)
+            if f.ts_ms >= start and (not end or f.ts_ms <= end)
+        ]
+        return _page(params, [self._fill_json(f) for f in fills])
+
+    # -- WebSocket ------------------------------------------------------------
+
+    def on_ws_message(self, ws: SimWebSocket, message: Any) -> None:
+        if not isinstance(message, dict):
+            return
+        method = message.get("method")
+        request_id = message.get("id")
+        params = message.get("params") or {}
+        if method == "auth":
+            token = str(params.get("bearer", ""))
+            if not token.startswith(_JWT_PREFIX):
+                self._ws_error(ws, request_id, 40110, "Invalid bearer token")
+                return
+            ws.account = token[len(_JWT_PREFIX):]
+            ws.send_json({"jsonrpc": "2.0", "result": {}, "id": request_id})
+        elif method == "subscribe":
+            self._subscribe(ws, str(params.get("channel", "")), request_id)
+        elif method == "unsubscribe":
+            channel = str(params.get("channel", ""))
+            ws.subscriptions.discard(channel)
+            ws.send_json({"jsonrpc": "2.0", "result": {"channel": channel}, "id": request_id})
+        elif method is not None:
+            self._ws_error(ws, request_id, -32601, f"Unknown method {method}")
+
+    def _ws_error(self, ws: SimWebSocket, request_id: Any, code: int, message: str) -> None:
+        ws.send_json({"jsonrpc": "2.0", "error": {"code": code, "message": message}, "id": request_id})
+
+    def _subscribe(self, ws: SimWebSocket, channel: str, request_id: Any) -> None:
+        kind, _, rest = channel.partition(".")
+        symbol = rest.split(".", 1)[0]
+        if kind in ("orders", "fills"):
+            if ws.account is None:
+                self._ws_error(ws, request_id, 40110, f"{channel} requires auth")
+                return
+            if symbol != "ALL" and symbol not in self.engine.markets:
+                self._ws_error(ws, request_id, -32602, f"Unknown market {symbol}")
+                return
+        elif kind not in ("trades", "bbo", "order_book") or symbol not in self.engine.markets:
+            self._ws_error(ws, request_id, -32602, f"Unknown channel {channel}")
+            return
+        ws.subscriptions.add(channel)
+        ws.send_json({"jsonrpc": "2.0", "result": {"channel": channel}, "id": request_id})
+
+        if kind == "order_book":
+            levels = self._levels(symbol)
+            self._book_levels[symbol] = levels
+            market = self.engine.markets[symbol]
+            rows = [_level_row(market, key, size) for key, size in levels.items()]
+            self._push_book(ws, channel, symbol, "s", rows, [])
+        elif kind == "bbo":
+            bbo = self._bbo_data(symbol)
+            if bbo is not None:
+                ws.send_json(_push(channel, bbo))
+
+    def _push_book(
+        self,
+        ws: SimWebSocket | None,
+        channel: str,
+        symbol: str,
+        update_type: str,
+        inserts: list,
+        updates: list,
+        deletes: list | None = None,
+    ) -> None:
+        if update_type == "d":
+            self._book_seq[symbol] = self._book_seq.get(symbol, 0) + 1
+        data = {
+            "seq_no": self._book_seq.setdefault(symbol, 0),
+            "market": symbol,
+            "last_updated_at": self.engine.clock(),
+            "update_type": update_type,
+            "inserts": inserts,
+            "updates": updates,
+            "deletes": deletes or [],
+        }
+        if ws is None:
+            self.broadcast(channel, _push(channel, data))
+        else:
+            # The snapshot answering a subscribe is never dropped
+            ws.send_json(_push(channel, data))
+
+    def _bbo_data(self, symbol: str) -> dict[str, Any] | None:
+        bids, asks = self.engine.depth(symbol, 1)
+        if not bids or not asks:
+            return None
+        market = self.engine.markets[symbol]
+        return {
+            "market": symbol,
+            "bid": market.price_str(bids[0][0]),
+            "bid_size": market.size_str(bids[0][1]),
+            "ask": market.price_str(asks[0][0]),
+            "ask_size": market.size_str(asks[0][1]),
+            "last_updated_at": self.engine.clock(),
+        }
+
+    def on_engine_event(self, kind: str, obj: Any) -> None:
+        if not self.sockets:
+            return
+        if kind == "book":
+            self._publish_book(obj)
+        elif kind == "trade":
+            channel = f"trades.{obj.symbol}"
+            self.broadcast(channel, _push(channel, self._trade_json(obj)))
+        elif kind == "order" and obj.account != HOUSE:
+            self._publish_private("orders", obj.account, obj.symbol, self._order_json(obj))
+        elif kind == "fill":
+            order = obj.order
+            self._publish_private("fills", order.account, order.symbol, self._fill_json(obj))
+
+    def _publish_book(self, symbol: str) -> None:
+        channel = f"order_book.{symbol}.deltas"
+        if self.has_subscribers(channel):
+            previous = self._book_levels.get(symbol, {})
+            levels = self._levels(symbol)
+            self._book_levels[symbol] = levels
+            market = self.engine.markets[symbol]
+            inserts, updates, deletes = [], [], []
+            for key, size in levels.items():
+                old = previous.get(key)
+                if old is None:
+                    inserts.append(_level_row(market, key, size))
+                elif old != size:
+                    updates.append(_level_row(market, key, size))
+            for key, size in previous.items():
+                if key not in levels:
+                    deletes.append(_level_row(market, key, Decimal(0)))
+            if inserts or updates or deletes:
+                self._push_book(None, channel, symbol, "d", inserts, updates, deletes)
+
+        channel = f"bbo.{symbol}"
+        if self.has_subscribers(channel):
+            bbo = self._bbo_data(symbol)
+            if bbo is not None:
+                key = (bbo["bid"], bbo["bid_size"], bbo["ask"], bbo["ask_size"])
+                if self._bbo.get(symbol) != key:
+                    self._bbo[symbol] = key
+                    self.broadcast(channel, _push(channel, bbo))
+
+    def _publish_private(self, kind: str, account: str, symbol: str, data: dict[str, Any]) -> None:
+        channels = (f"{kind}.{symbol}", f"{kind}.ALL")
+        for ws in self.sockets:
+            if ws.account != account:
+                continue
+            for channel in channels:
+                if channel in ws.subscriptions:
+                    self.push(ws, _push(channel, data))
+
+
+def _push(channel: str, data: Any) -> dict[str, Any]:
+    return {"jsonrpc": "2.0", "method": "subscription", "params": {"channel": channel, "data": data}}
+
+
+def _level_row(market: SimMarket, key: tuple[str, Decimal], size: Decimal) -> dict[str, str]:
+    side, price = key
+    return {"side": side, "price": market.price_str(price), "size": market.size_str(size)}
+
+
+def _page(params: dict[str, str], rows: list[dict[str, Any]]) -> dict[str, Any]:
+    page_size = parse_int(params.get("page_size"), "page_size", DEFAULT_PAGE_SIZE)
+    results, next_cursor, prev_cursor = paginate(rows, params.get("cursor"), page_size)
+    return {"results": results, "next": next_cursor, "prev": prev_cursor}
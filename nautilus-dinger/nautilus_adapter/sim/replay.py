@@ -0,0 +1,120 @@
+"""
+Recorded venue responses, replayed by the local simulator.
+
+A recording is JSON lines, one exchange per line::
+
+    {"method": "GET", "path": "/markets", "query": "", "status": 200, "body": {...}}
+
+``path`` is relative to the venue's base URL and ``body`` is the decoded JSON
+response (or its text when it was not JSON). Recordings come from running
+the simulator as a recording proxy in front of the live venue, or are written
+by hand for one-off cases. On replay a request is answered from the entries
+for its method, path and query, falling back to method and path alone;
+several entries for one key are served in recorded order and the last one
+repeats. Requests without a recording fall through to the simulated venue.
+"""
+import json
+import threading
+import time
+import urllib.error
+import urllib.request
+from pathlib import Path
+from typing import Any, Iterable, NamedTuple
+
+
+class RecordedResponse(NamedTuple):
+    status: int
+    body: Any
+
+
+def _decode(raw: bytes) -> Any:
+    text = raw.decode("utf-8", "replace")
+    try:
+        return json.loads(text)
+    except ValueError:
+        return text
+
+
+class ResponseReplay:
+    def __init__(self, entries: Iterable[dict[str, Any]] = ()) -> None:
+        self._responses: dict[tuple[str, ...], list[RecordedResponse]] = {}
+        self._served: dict[tuple[str, ...], int] = {}
+        for entry in entries:
+            self.add(entry)
+
+    @classmethod
+    def from_path(cls, path: str | Path) -> "ResponseReplay":
+        entries = []
+        with Path(path).open() as f:
+            for line in f:
+                line = line.strip()
+                if line:
+                    entries.append(json.loads(line))
+        return cls(entries)
+
+    def __len__(self) -> int:
+        return sum(len(v) for k, v in self._responses.items() if len(k) == 3)
+
+    def add(self, entry: dict[str, Any]) -> None:
+        method = str(entry.get("method", "GET")).upper()
+        response = RecordedResponse(int(entry.get("status", 200)), entry.get("body"))
+        key = (method, entry["path"], entry.get("query") or "")
+        self._responses.setdefault(key, []).append(response)
+        self._responses.setdefault((method, entry["path"]), []).append(response)
+
+    def get(self, method: str, path: str, query: str = "") -> RecordedResponse | None:
+        for key in ((method, path, query), (method, path)):
+            responses = self._responses.get(key)
+            if responses:
+                served = self._served.get(key, 0)
+                self._served[key] = served + 1
+                return responses[min(served, len(responses) - 1)]
+        return None
+
+
+class ResponseRecorder:
+    """
+    Forwards requests to a live venue and appends each exchange to a
+    recording. Blocking; the simulator calls it from a worker thread.
+    """
+
+    def __init__(self, upstream_url: str, path: str | Path, timeout_secs: float = 10.0) -> None:
+        self.upstream_url = upstream_url.rstrip("/")
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._file = self.path.open("a", buffering=1)
+        self._lock = threading.Lock()
+        self._timeout_secs = timeout_secs
+
+    def forward(
+        self,
+        method: str,
+        path: str,
+        query: str,
+        headers: dict[str, str],
+        body: bytes,
+    ) -> RecordedResponse:
+        url = f"{self.upstream_url}{path}" + (f"?{query}" if query else "")
+        forwarded = {k: v for k, v in headers.items() if k not in ("host", "content-length", "connection")}
+        request = urllib.request.Request(url, data=body or None, headers=forwarded, method=method)
+        started = time.time_ns()
+        try:
+            with urllib.request.urlopen(request, timeout=self._timeout_secs) as response:
+                status, raw = response.status, response.read()
+        except urllib.error.HTTPError as exc:
+            status, raw = exc.code, exc.read()
+        recorded = RecordedResponse(status, _decode(raw))
+        entry = {
+            "method": method,
+            "path": path,
+            "query": query,
+            "status": status,
+            "body": recorded.body,
+            "ts_ns": started,
+        }
+        with self._lock:
+            self._file.write(json.dumps(entry, separators=(",", ":")) + "\n")
+        return recorded
+
+    def close(self) -> None:
+        self._file.close()
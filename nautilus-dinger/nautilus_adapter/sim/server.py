@@ -0,0 +1,404 @@
+"""
+HTTP/1.1 and WebSocket transport for the local venue simulator.
+
+One asyncio server hosts every simulated venue under its own path prefix
+(``/paradex/v1``, ``/lighter``, ``/standx``), so an adapter is pointed at the
+simulator purely through ``base_url_http``/``base_url_ws``. Connections are
+kept alive between requests, and a request carrying a WebSocket upgrade on
+the venue's stream path is handed to the venue dialect as a ``SimWebSocket``.
+Only the parts of RFC 6455 the venue clients use are implemented: text
+frames (fragmented or not), ping/pong and close, no extensions.
+
+``/_sim/stats`` reports per-venue request and fault counters and
+``POST /_sim/<venue>/mid`` moves a market's reference mid (which fires the
+trigger orders it reaches), for tests and load scripts.
+"""
+import asyncio
+import base64
+import hashlib
+import json
+import logging
+import struct
+from http import HTTPStatus
+from typing import Any, Iterable, NamedTuple
+from urllib.parse import parse_qsl
+
+_log = logging.getLogger(__name__)
+
+_WS_GUID = b"258EAFA5-E914-47DA-95CA-C5AB0DC85B11"
+
+_OP_CONTINUATION = 0x0
+_OP_TEXT = 0x1
+_OP_BINARY = 0x2
+_OP_CLOSE = 0x8
+_OP_PING = 0x9
+_OP_PONG = 0xA
+
+# Largest request body or WebSocket message accepted
+MAX_PAYLOAD_BYTES = 8 * 1024 * 1024
+
+
+class SimHttpError(Exception):
+    """
+    A request the simulated venue answers with an error status; ``code`` is
+    the venue's error code, when the dialect has one.
+    """
+
+    def __init__(self, status: int, message: str, code: str | None = None) -> None:
+        super().__init__(message)
+        self.status = status
+        self.message = message
+        self.code = code
+
+
+class SimRequest:
+    __slots__ = ("method", "path", "query", "headers", "body")
+
+    def __init__(
+        self,
+        method: str,
+        path: str,
+        query: str,
+        headers: dict[str, str],
+        body: bytes = b"",
+    ) -> None:
+        self.method = method
+        self.path = path
+        self.query = query
+        self.headers = headers
+        self.body = body
+
+    @property
+    def params(self) -> dict[str, str]:
+        return dict(parse_qsl(self.query, keep_blank_values=True))
+
+    def json(self) -> Any:
+        if not self.body:
+            return {}
+        try:
+            return json.loads(self.body)
+        except ValueError as exc:
+            raise SimHttpError(400, f"Invalid JSON body: {exc}") from exc
+
+    def form(self) -> dict[str, str]:
+        """
+        Fields of a urlencoded or multipart form body.
+        """
+        content_type = self.headers.get("content-type", "")
+        if content_type.startswith("multipart/form-data"):
+            from email.parser import BytesParser
+            from email.policy import HTTP
+
+            message = BytesParser(policy=HTTP).parsebytes(
+                f"Content-Type: {content_type}\r\n\r\n".encode() + self.body,
+            )
+            return {
+                part.get_param("name", header="content-disposition"): part.get_content().strip()
+                for part in message.iter_parts()
+            }
+        return dict(parse_qsl(self.body.decode("utf-8", "replace"), keep_blank_values=True))
+
+
+class SimResponse(NamedTuple):
+    status: int
+    body: bytes
+    content_type: str = "application/json"
+
+    @classmethod
+    def json(cls, payload: Any, status: int = 200) -> "SimResponse":
+        return cls(status, json.dumps(payload, separators=(",", ":")).encode())
+
+    @classmethod
+    def text(cls, text: str, status: int = 200) -> "SimResponse":
+        return cls(status, text.encode(), "text/plain")
+
+
+def _reason(status: int) -> str:
+    try:
+        return HTTPStatus(status).phrase
+    except ValueError:
+        return "Unknown"
+
+
+def _unmask(data: bytes, mask: bytes) -> bytes:
+    length = len(data)
+    key = (mask * (length // 4 + 1))[:length]
+    return (int.from_bytes(data, "big") ^ int.from_bytes(key, "big")).to_bytes(length, "big")
+
+
+def _frame(opcode: int, payload: bytes) -> bytes:
+    length = len(payload)
+    if length < 126:
+        header = struct.pack("!BB", 0x80 | opcode, length)
+    elif length < 1 << 16:
+        header = struct.pack("!BBH", 0x80 | opcode, 126, length)
+    else:
+        header = struct.pack("!BBQ", 0x80 | opcode, 127, length)
+    return header + payload
+
+
+class SimWebSocket:
+    """
+    Server side of one WebSocket connection.
+
+    Sends are synchronous writes to the transport so engine callbacks can
+    push without scheduling tasks. ``subscriptions`` and ``account`` are
+    owned by the dialect serving the connection.
+    """
+
+    def __init__(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter, path: str) -> None:
+        self._reader = reader
+        self._writer = writer
+        self.path = path
+        self.subscriptions: set[str] = set()
+        self.account: str | None = None
+        self.closed = False
+        self.sent = 0
+
+    def send(self, text: str) -> None:
+        if self.closed or self._writer.is_closing():
+            return
+        self._writer.write(_frame(_OP_TEXT, text.encode()))
+        self.sent += 1
+
+    def send_json(self, payload: Any) -> None:
+        self.send(json.dumps(payload, separators=(",", ":")))
+
+    def close(self, code: int = 1000) -> None:
+        if self.closed:
+            return
+        self.closed = True
+        if not self._writer.is_closing():
+            self._writer.write(_frame(_OP_CLOSE, struct.pack("!H", code)))
+
+    async def _read_frame(self) -> tuple[bool, int, bytes]:
+        b1, b2 = await self._reader.readexactly(2)
+        length = b2 & 0x7F
+        if length == 126:
+            (length,) = struct.unpack("!H", await self._reader.readexactly(2))
+        elif length == 127:
+            (length,) = struct.unpack("!Q", await self._reader.readexactly(8))
+        if length > MAX_PAYLOAD_BYTES:
+            raise ValueError(f"WebSocket frame too large ({length} bytes)")
+        mask = await self._reader.readexactly(4) if b2 & 0x80 else b""
+        data = await self._reader.readexactly(length)
+        if mask and data:
+            data = _unmask(data, mask)
+        return bool(b1 & 0x80), b1 & 0x0F, data
+
+    async def receive(self) -> str | None:
+        """
+        Next text (or binary) message, or ``None`` once the peer closed.
+        """
+        message = bytearray()
+        opcode = None
+        while not self.closed:
+            try:
+                fin, frame_opcode, data = await self._read_frame()
+            except (asyncio.IncompleteReadError, ConnectionError, ValueError):
+                self.closed = True
+                return None
+            if frame_opcode == _OP_PING:
+                self._writer.write(_frame(_OP_PONG, data))
+                continue
+            if frame_opcode == _OP_PONG:
+                continue
+            if frame_opcode == _OP_CLOSE:
+                self.close()
+                return None
+            if frame_opcode != _OP_CONTINUATION:
+                opcode = frame_opcode
+            message += data
+            if fin and opcode in (_OP_TEXT, _OP_BINARY):
+                return message.decode("utf-8", "replace")
+        return None
+
+
+async def _read_request(reader: asyncio.StreamReader) -> SimRequest | None:
+    try:
+        head = await reader.readuntil(b"\r\n\r\n")
+    except (asyncio.IncompleteReadError, asyncio.LimitOverrunError, ConnectionError):
+        return None
+    lines = head.decode("latin-1").split("\r\n")
+    try:
+        method, target, _version = lines[0].split(" ", 2)
+    except ValueError:
+        return None
+    headers: dict[str, str] = {}
+    for line in lines[1:]:
+        if line:
+            name, _, value = line.partition(":")
+            headers[name.strip().lower()] = value.strip()
+
+    if headers.get("transfer-encoding", "").lower() == "chunked":
+        body = bytearray()
+        while True:
+            size = int((await reader.readuntil(b"\r\n")).split(b";", 1)[0], 16)
+            if size == 0:
+                await reader.readuntil(b"\r\n")
+                break
+            if len(body) + size > MAX_PAYLOAD_BYTES:
+                return None
+            body += await reader.readexactly(size)
+            await reader.readexactly(2)
+        payload = bytes(body)
+    else:
+        length = int(headers.get("content-length") or 0)
+        if length > MAX_PAYLOAD_BYTES:
+            return None
+        payload = await reader.readexactly(length) if length else b""
+
+    path, _, query = target.partition("?")
+    return SimRequest(method.upper(), path, query, headers, payload)
+
+
+class VenueSimServer:
+    """
+    Serves a set of venue dialects on one local address.
+    """
+
+    def __init__(self, dialects: Iterable[Any], host: str = "127.0.0.1", port: int = 0) -> None:
+        self.dialects = {d.venue: d for d in dialects}
+        # Longest prefix first so nested prefixes resolve correctly
+        self._mounts = sorted(self.dialects.values(), key=lambda d: len(d.prefix), reverse=True)
+        self.host = host
+        self.port = port
+        self._server: asyncio.AbstractServer | None = None
+        self._connections: set[asyncio.StreamWriter] = set()
+
+    async def __aenter__(self) -> "VenueSimServer":
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc: object) -> None:
+        await self.stop()
+
+    @property
+    def is_running(self) -> bool:
+        return self._server is not None
+
+    async def start(self) -> None:
+        if self._server is None:
+            self._server = await asyncio.start_server(self._handle, self.host, self.port)
+            if self.port == 0:
+                self.port = self._server.sockets[0].getsockname()[1]
+
+    async def stop(self) -> None:
+        server = self._server
+        self._server = None
+        if server is None:
+            return
+        server.close()
+        for writer in list(self._connections):
+            writer.close()
+        await server.wait_closed()
+
+    def base_url_http(self, venue: str) -> str:
+        return f"http://{self.host}:{self.port}{self.dialects[venue].prefix}"
+
+    def base_url_ws(self, venue: str) -> str:
+        dialect = self.dialects[venue]
+        return f"ws://{self.host}:{self.port}{dialect.prefix}{dialect.ws_path}"
+
+    def _resolve(self, path: str) -> tuple[Any | None, str]:
+        for dialect in self._mounts:
+            prefix = dialect.prefix
+            if path == prefix or path.startswith(prefix + "/"):
+                return dialect, path[len(prefix):] or "/"
+        return None, path
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        self._connections.add(writer)
+        try:
+            while True:
+                request = await _read_request(reader)
+                if request is None:
+                    return
+                if request.headers.get("expect", "").lower() == "100-continue":
+                    writer.write(b"HTTP/1.1 100 Continue\r\n\r\n")
+
+                dialect, path = self._resolve(request.path)
+                if (
+                    dialect is not None
+                    and request.headers.get("upgrade", "").lower() == "websocket"
+                    and path == dialect.ws_path
+                ):
+                    await self._serve_websocket(dialect, request, reader, writer)
+                    return
+
+                try:
+                    if request.path.startswith("/_sim/"):
+                        response = self._admin(request)
+                    elif dialect is None:
+                        response = SimResponse.json({"error": "NOT_FOUND", "message": request.path}, 404)
+                    else:
+                        request.path = path
+                        response = await dialect.dispatch(request)
+                except Exception as exc:
+                    _log.exception("Unhandled error serving %s %s", request.method, request.path)
+                    response = SimResponse.json(
+                        {"error": "INTERNAL_ERROR", "message": f"{type(exc).__name__}: {exc}"},
+                        500,
+                    )
+
+                keep_alive = request.headers.get("connection", "").lower() != "close"
+                writer.write(
+                    (
+                        f"HTTP/1.1 {response.status} {_reason(response.status)}\r\n"
+                        f"Content-Type: {response.content_type}\r\n"
+                        f"Content-Length: {len(response.body)}\r\n"
+                        f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n"
+                    ).encode()
+                    + response.body,
+                )
+                await writer.drain()
+                if not keep_alive:
+                    return
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            self._connections.discard(writer)
+            writer.close()
+
+    async def _serve_websocket(
+        self,
+        dialect: Any,
+        request: SimRequest,
+        reader: asyncio.StreamReader,
+        writer: asyncio.StreamWriter,
+    ) -> None:
+        key = request.headers.get("sec-websocket-key", "").encode()
+        accept = base64.b64encode(hashlib.sha1(key + _WS_GUID).digest()).decode()
+        writer.write(
+            (
+                "HTTP/1.1 101 Switching Protocols\r\n"
+                "Upgrade: websocket\r\nConnection: Upgrade\r\n"
+                f"Sec-WebSocket-Accept: {accept}\r\n\r\n"
+            ).encode(),
+        )
+        await writer.drain()
+        ws = SimWebSocket(reader, writer, request.path)
+        try:
+            await dialect.serve_ws(ws, request)
+        finally:
+            ws.close()
+            try:
+                await writer.drain()
+            except ConnectionError:
+                pass
+
+    def _admin(self, request: SimRequest) -> SimResponse:
+        parts = request.path.strip("/").split("/")
+        if parts == ["_sim", "stats"]:
+            return SimResponse.json({venue: d.stats() for venue, d in self.dialects.items()})
+        if len(parts) == 3 and parts[2] == "mid" and request.method == "POST":
+            dialect = self.dialects.get(parts[1].upper())
+            if dialect is None:
+                return SimResponse.json({"error": "UNKNOWN_VENUE", "message": parts[1]}, 404)
+            try:
+                payload = request.json()
+                dialect.set_mid(str(payload["symbol"]), str(payload["mid"]))
+            except (KeyError, SimHttpError) as exc:
+                return SimResponse.json({"error": "BAD_REQUEST", "message": str(exc)}, 400)
+            return SimResponse.json({"ok": True})
+        return SimResponse.json({"error": "NOT_FOUND", "message": request.path}, 404)
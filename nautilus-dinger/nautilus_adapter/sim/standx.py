@@ -0,0 +1,422 @@
+"""
+Simulated StandX REST and WebSocket API.
+
+Serves the endpoints the StandX client calls under ``/standx``. Requests are
+signed with ed25519 by the client; the simulator does not verify signatures
+and acts for the account named by the ``Authorization: Bearer`` token.
+``/api/new_order`` carrying an ``order_id`` amends that order, as the
+client's modify does.
+
+The stream at ``/standx/ws-stream/v1`` serves public ``trades`` and
+``depth_book`` (full top of book on every change, ``orderbook`` is accepted
+as an alias) after an ``{"op": "subscribe"}``, and the private ``order``,
+``trade``, ``balance`` and ``position`` streams listed in an ``auth``
+message.
+"""
+import re
+from typing import Any
+
+from .dialect import VenueDialect, paginate, parse_decimal, parse_int
+from .matching import (
+    CLOSED,
+    GTC,
+    HOUSE,
+    IOC,
+    LIMIT,
+    POST_ONLY,
+    UNTRIGGERED,
+    SimFill,
+    SimMarket,
+    SimOrder,
+)
+from .server import SimHttpError, SimRequest, SimResponse, SimWebSocket
+
+BOOK_DEPTH = 20
+DEFAULT_LIMIT = 100
+
+_TIME_IN_FORCE = {"gtc": GTC, "ioc": IOC, "alo": POST_ONLY, "post_only": POST_ONLY}
+_PRIVATE_CHANNELS = frozenset({"order", "trade", "balance", "position"})
+
+
+def _status(order: SimOrder) -> str:
+    if order.status == UNTRIGGERED:
+        return "untriggered"
+    if order.status != CLOSED:
+        return "open"
+    if order.remaining <= 0:
+        return "filled"
+    return "canceled"
+
+
+class StandXDialect(VenueDialect):
+    venue = "STANDX"
+    prefix = "/standx"
+    ws_path = "/ws-stream/v1"
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        self._book_seq: dict[str, int] = {}
+        super().__init__(*args, **kwargs)
+
+    def register_routes(self) -> None:
+        self.route("GET", "/api/query_symbol_info", self._symbol_info)
+        self.route("GET", "/market/([0-9]+)/orderbook", self._orderbook)
+        self.route("GET", "/trades", self._trades)
+        self.route("GET", "/timestamp", self._timestamp)
+        self.route("POST", "/action", self._action)
+        self.route("GET", "/api/query_balance", self._balance)
+        self.route("GET", "/api/query_positions", self._positions)
+        self.route("POST", "/api/new_order", self._new_order)
+        self.route("POST", "/api/cancel_order", self._cancel_order)
+        self.route("GET", "/api/query_open_orders", self._open_orders)
+        self.route("GET", "/api/query_order", self._query_order)
+        self.route("GET", "/api/query_orders", self._query_orders)
+        self.route("GET", "/api/query_trades", self._query_trades)
+
+    # -- Rendering ------------------------------------------------------------
+
+    def _market(self, symbol: str) -> SimMarket:
+        market = self.engine.markets.get(symbol)
+        if market is None:
+            raise SimHttpError(400, f"Unknown symbol {symbol}", "INVALID_SYMBOL")
+        return market
+
+    def _order_json(self, order: SimOrder) -> dict[str, Any]:
+        market = self.engine.markets[order.symbol]
+        average = order.avg_fill_price
+        return {
+            "id": str(order.order_id),
+            "order_id": str(order.order_id),
+            "cl_ord_id": order.client_id or "",
+            "symbol": order.symbol,
+            "market_id": market.market_id,
+            "side": order.side.lower(),
+            "order_type": order.order_type.lower(),
+            "time_in_force": order.time_in_force.lower(),
+            "status": _status(order),
+            "price": market.price_str(order.price),
+            "qty": market.size_str(order.size),
+            "size": market.size_str(order.size),
+            "remaining_size": market.size_str(order.remaining),
+            "filled_base_amount": market.size_str(order.filled),
+            "trigger_price": market.price_str(order.trigger_price),
+            "reduce_only": order.reduce_only,
+            "avg_fill_price": market.price_str(average) if average is not None else "0",
+            "created_at": order.created_ms,
+            "updated_at": order.updated_ms,
+        }
+
+    def _fill_json(self, fill: SimFill) -> dict[str, Any]:
+        order = fill.order
+        market = self.engine.markets[order.symbol]
+        return {
+            "id": str(fill.fill_id),
+            "trade_id": str(fill.trade_id),
+            "order_id": str(order.order_id),
+            "cl_ord_id": order.client_id or "",
+            "symbol": order.symbol,
+            "side": order.side.lower(),
+            "liquidity": fill.liquidity.lower(),
+            "price": market.price_str(fill.price),
+            "size": market.size_str(fill.size),
+            "fee": str(fill.fee),
+            "timestamp": fill.ts_ms,
+        }
+
+    def _balance_json(self, name: str) -> dict[str, Any]:
+        account = self.engine.account(name)
+        collateral = str(account.collateral)
+        return {
+            "account_index": name,
+            "available_balance": collateral,
+            "collateral": collateral,
+            "total_asset_value": collateral,
+            "cross_asset_value": collateral,
+            "pending_order_count": len(self.engine.open_orders(name)),
+            "positions": self._position_rows(name),
+            "assets": [],
+        }
+
+    def _position_rows(self, name: str) -> list[dict[str, Any]]:
+        rows = []
+        for symbol, position in self.engine.account(name).positions.items():
+            market = self.engine.markets[symbol]
+            rows.append(
+                {
+                    "symbol": symbol,
+                    "qty": market.size_str(position.size),
+                    "entry_price": market.price_str(position.avg_entry),
+                    "realized_pnl": str(position.realized_pnl),
+                },
+            )
+        return rows
+
+    def _depth_json(self, market: SimMarket, levels: int) -> tuple[list, list]:
+        bids, asks = self.engine.depth(market.symbol, levels)
+        return (
+            [[market.price_str(p), market.size_str(s)] for p, s in bids],
+            [[market.price_str(p), market.size_str(s)] for p, s in asks],
+        )
+
+    # -- Auth -----------------------------------------------------------------
+
+    def _account_of(self, request: SimRequest) -> str:
+        auth = request.headers.get("authorization", "")
+        token = auth[7:].strip() if auth.lower().startswith("bearer ") else ""
+        if not token:
+            raise SimHttpError(401, "Missing bearer token", "UNAUTHORIZED")
+        return token
+
+    def _find_order(self, account: str, order_id: Any = None, client_id: Any = None) -> SimOrder:
+        order = None
+        if order_id not in (None, ""):
+            text = str(order_id)
+            order = self.engine.get_order(int(text)) if text.isdigit() else None
+        elif client_id not in (None, ""):
+            order = self.engine.get_order_by_client_id(account, str(client_id))
+        if order is None or order.account != account:
+            raise SimHttpError(404, "Order not found", "ORDER_NOT_FOUND")
+        return order
+
+    # -- Public REST ----------------------------------------------------------
+
+    def _symbol_info(self, request: SimRequest, match: re.Match) -> list[dict[str, Any]]:
+        return [
+            {
+                "symbol": market.symbol,
+                "market_id": market.market_id,
+                "price_tick_decimals": market.price_decimals,
+                "qty_tick_decimals": market.size_decimals,
+                "base_token_id": 0,
+                "quote_token_id": 0,
+                "imf": 0.1,
+                "mmf": 0.05,
+                "cmf": 0.025,
+            }
+            for market in self.engine.markets.values()
+        ]
+
+    def _market_by_id(self, market_id: str) -> SimMarket:
+        market = self.engine.markets_by_id.get(int(market_id))
+        if market is None:
+            raise SimHttpError(404, f"Unknown market {market_id}", "INVALID_SYMBOL")
+        return market
+
+    def _orderbook(self, request: SimRequest, match: re.Match) -> dict[str, Any]:
+        market = self._market_by_id(match.group(1))
+        bids, asks = self.engine.depth(market.symbol, BOOK_DEPTH)
+        return {
+            "bids": [{"price": market.price_str(p), "size": market.size_str(s)} for p, s in bids],
+            "asks": [{"price": market.price_str(p), "size": market.size_str(s)} for p, s in asks],
+            "timestamp": self.engine.clock(),
+            "seq_num": self._book_seq.get(market.symbol, 0),
+        }
+
+    def _trades(self, request: SimRequest, match: re.Match) -> dict[str, Any]:
+        params = request.params
+        market = self._market_by_id(params.get("market_id") or "0")
+        start = parse_int(params.get("start_at"), "start_at")
+        end = parse_int(params.get("end_at"), "end_at")
+        limit = parse_int(params.get("limit"), "limit", DEFAULT_LIMIT)
+        trades = [
+            t
+            for t in reversed(self.engine.trades[market.symbol])
+            if t.ts_ms >= start and (not end or t.ts_ms <= end)
+        ][:limit]
+        return {
+            "trades": [
+                {
+                    "price": market.price_str(t.price),
+                    "size": market.size_str(t.size),
+                    "side": t.taker_side.lower(),
+                    "timestamp": t.ts_ms,
+                }
+                for t in trades
+            ],
+        }
+
+    def _timestamp(self, request: SimRequest, match: re.Match) -> SimResponse:
+        return SimResponse.text(str(self.engine.clock()))
+
+    def _action(self, request: SimRequest, match: re.Match) -> dict[str, Any]:
+        # Raw signed actions are acknowledged but not interpreted
+        return {"action_id": str(self.requests), "status": "accepted"}
+
+    # -- Private REST ---------------------------------------------------------
+
+    def _balance(self, request: SimRequest, match: re.Match) -> dict[str, Any]:
+        return self._balance_json(self._account_of(request))
+
+    def _positions(self, request: SimRequest, match: re.Match) -> list[dict[str, Any]]:
+        return self._position_rows(self._account_of(request))
+
+    def _new_order(self, request: SimRequest, match: re.Match) -> dict[str, Any]:
+        account = self._account_of(request)
+        body = request.json()
+        trigger = body.get("trigger_price")
+        trigger_price = parse_decimal(trigger, "trigger_price") if trigger not in (None, "", "0") else None
+        price = parse_decimal(body["price"], "price") if body.get("price") not in (None, "", "0") else None
+        if body.get("order_id") not in (None, ""):
+            order = self._find_order(account, order_id=body["order_id"])
+            if order.status == CLOSED:
+                raise SimHttpError(400, f"Order {order.order_id} is not open", "ORDER_NOT_OPEN")
+            self.engine.modify(
+                order,
+                size=parse_decimal(body["qty"], "qty") if body.get("qty") else None,
+                price=price,
+                trigger_price=trigger_price,
+            )
+            return self._order_json(order)
+
+        market = self._market(str(body.get("symbol", "")))
+        time_in_force = str(body.get("time_in_force") or "gtc").lower()
+        order = self.engine.submit(
+            account,
+            market.symbol,
+            str(body.get("side", "")),
+            str(body.get("order_type") or LIMIT),
+            parse_decimal(body.get("qty"), "qty"),
+            price=price,
+            client_id=str(body["cl_ord_id"]) if body.get("cl_ord_id") else None,
+            time_in_force=_TIME_IN_FORCE.get(time_in_force, GTC),
+            trigger_price=trigger_price,
+            reduce_only=bool(body.get("reduce_only")),
+        )
+        return {
+            "id": str(order.order_id),
+            "action_id": str(order.order_id),
+            "status": _status(order),
+            "cl_ord_id": order.client_id or "",
+        }
+
+    def _cancel_order(self, request: SimRequest, match: re.Match) -> dict[str, Any]:
+        account = self._account_of(request)
+        body = request.json()
+        order = self._find_order(account, body.get("order_id"), body.get("cl_ord_id"))
+        if order.status == CLOSED:
+            raise SimHttpError(400, f"Order {order.order_id} is not open", "ORDER_NOT_OPEN")
+        self.engine.cancel(order)
+        return {"code": 0, "message": "success", "order_id": str(order.order_id)}
+
+    def _open_orders(self, request: SimRequest, match: re.Match) -> dict[str, Any]:
+        orders = self.engine.open_orders(self._account_of(request), request.params.get("symbol") or None)
+        return {"result": [self._order_json(o) for o in orders]}
+
+    def _query_order(self, request: SimRequest, match: re.Match) -> dict[str, Any]:
+        params = request.params
+        order = self._find_order(self._account_of(request), params.get("order_id"), params.get("cl_ord_id"))
+        return {"result": self._order_json(order)}
+
+    def _query_orders(self, request: SimRequest, match: re.Match) -> dict[str, Any]:
+        params = request.params
+        account = self._account_of(request)
+        symbol = params.get("symbol") or None
+        client_id = params.get("cl_ord_id") or None
+        orders = sorted(
+            self.engine.open_orders(account, symbol) + self.engine.order_history(account, symbol),
+            key=lambda o: o.created_ms,
+            reverse=True,
+        )
+        rows = [self._order_json(o) for o in orders if client_id is None or o.client_id == client_id]
+        return _page(params, rows)
+
+    def _query_trades(self, request: SimRequest, match: re.Match) -> dict[str, Any]:
+        params = request.params
+        fills = self.engine.fills(self._account_of(request), params.get("symbol") or None)
+        return _page(params, [self._fill_json(f) for f in fills])
+
+    # -- WebSocket ------------------------------------------------------------
+
+    def on_ws_message(self, ws: SimWebSocket, message: Any) -> None:
+        if not isinstance(message, dict):
+            return
+        auth = message.get("auth")
+        if isinstance(auth, dict):
+            token = str(auth.get("token") or "")
+            if not token:
+                ws.send_json({"channel": "auth", "code": 401, "message": "Missing token"})
+                return
+            ws.account = token
+            streams = {
+                str(s.get("channel"))
+                for s in auth.get("streams") or []
+                if isinstance(s, dict) and s.get("channel") in _PRIVATE_CHANNELS
+            }
+            ws.subscriptions = {c for c in ws.subscriptions if c not in _PRIVATE_CHANNELS} | streams
+            ws.send_json({"channel": "auth", "code": 0, "message": "success"})
+            return
+
+        op = message.get("op")
+        if op == "ping":
+            ws.send_json({"op": "pong"})
+            return
+        channel = message.get("channel")
+        symbol = str(message.get("market") or message.get("symbol") or "")
+        if channel == "orderbook":
+            channel = "depth_book"
+        if op not in ("subscribe", "unsubscribe") or channel not in ("trades", "depth_book"):
+            return
+        if symbol not in self.engine.markets:
+            ws.send_json({"channel": channel, "code": 400, "message": f"Unknown symbol {symbol}"})
+            return
+        name = f"{channel}.{symbol}"
+        if op == "unsubscribe":
+            ws.subscriptions.discard(name)
+            return
+        ws.subscriptions.add(name)
+        if channel == "depth_book":
+            ws.send_json(self._depth_push(symbol))
+
+    def _depth_push(self, symbol: str) -> dict[str, Any]:
+        bids, asks = self._depth_json(self.engine.markets[symbol], BOOK_DEPTH)
+        return {
+            "channel": "depth_book",
+            "symbol": symbol,
+            "bids": bids,
+            "asks": asks,
+            "timestamp": self.engine.clock(),
+            "sequence": self._book_seq.get(symbol, 0),
+        }
+
+    def on_engine_event(self, kind: str, obj: Any) -> None:
+        if kind == "book":
+            self._book_seq[obj] = self._book_seq.get(obj, 0) + 1
+            if self.sockets and self.has_subscribers(f"depth_book.{obj}"):
+                self.broadcast(f"depth_book.{obj}", self._depth_push(obj))
+        elif not self.sockets:
+            return
+        elif kind == "trade":
+            market = self.engine.markets[obj.symbol]
+            self.broadcast(
+                f"trades.{obj.symbol}",
+                {
+                    "channel": "trades",
+                    "symbol": obj.symbol,
+                    "trades": [
+                        {
+                            "trade_id": str(obj.trade_id),
+                            "price": market.price_str(obj.price),
+                            "size": market.size_str(obj.size),
+                            "side": obj.taker_side.lower(),
+                            "timestamp": obj.ts_ms,
+                        },
+                    ],
+                },
+            )
+        elif kind == "order" and obj.account != HOUSE:
+            self._publish_private(obj.account, "order", [self._order_json(obj)])
+        elif kind == "fill":
+            account = obj.order.account
+            self._publish_private(account, "trade", [self._fill_json(obj)])
+            self._publish_private(account, "position", self._position_rows(account))
+            self._publish_private(account, "balance", self._balance_json(account))
+
+    def _publish_private(self, account: str, channel: str, data: Any) -> None:
+        for ws in self.sockets:
+            if ws.account == account and channel in ws.subscriptions:
+                self.push(ws, {"channel": channel, "data": data})
+
+
+def _page(params: dict[str, str], rows: list[dict[str, Any]]) -> dict[str, Any]:
+    limit = parse_int(params.get("limit"), "limit", DEFAULT_LIMIT)
+    result, next_cursor, prev_cursor = paginate(rows, params.get("cursor"), limit)
+    return {"result": result, "next": next_cursor, "prev": prev_cursor}
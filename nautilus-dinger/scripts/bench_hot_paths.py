@@ -0,0 +1,624 @@
+import argparse
+import asyncio
+import contextlib
+import functools
+import importlib
+import itertools
+import json
+import sys
+import threading
+from decimal import Decimal
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any
+
+from nautilus_trader.cache.cache import Cache
+from nautilus_trader.common.component import LiveClock, MessageBus
+from nautilus_trader.model.data import QuoteTick, TradeTick
+from nautilus_trader.model.enums import AccountType, AggressorSide, OmsType
+from nautilus_trader.model.identifiers import ClientId, InstrumentId, TradeId, TraderId, Venue
+from nautilus_trader.model.objects import Price, Quantity
+
+import nautilus_adapter.adapters.Paradex.data as paradex_data
+
+from nautilus_adapter.adapters.Lighter.data import LighterDataClient
+from nautilus_adapter.adapters.Lighter.execution import LighterExecutionClient
+from nautilus_adapter.adapters.Lighter.providers import LighterInstrumentProvider
+from nautilus_adapter.adapters.Paradex.data import ParadexDataClient
+from nautilus_adapter.adapters.Paradex.execution import ParadexExecutionClient
+from nautilus_adapter.adapters.Paradex.providers import ParadexInstrumentProvider
+from nautilus_adapter.adapters.StandX.data import StandXDataClient
+from nautilus_adapter.adapters.StandX.execution import StandXExecutionClient
+from nautilus_adapter.adapters.StandX.providers import StandXInstrumentProvider
+from nautilus_adapter.common.bench import (
+    BenchSkipped,
+    BenchSuite,
+    compare,
+    load_baseline,
+    render_table,
+    save_baseline,
+    uncompared,
+)
+from nautilus_adapter.common.ingest_queue import CoalescingIngestQueue
+
+SUITE = BenchSuite()
+
+DEFAULT_STORAGE = Path(__file__).resolve().parent.parent / ".benchmarks"
+
+ACCOUNT_ORDERS = 10_000
+ACCOUNT_FILLS = 10_000
+OPEN_ORDERS = 1_000
+BOOK_LEVELS = 50
+TRADES_PER_MESSAGE = 20
+PROVIDER_MARKETS = 250
+HISTORY_PAGE_SIZE = 100
+SIM_ACCOUNT = "0x1"
+
+# Base time for the synthetic rows, in milliseconds
+T0_MS = 1_760_000_000_000
+
+SYMBOLS = ["BTC", "ETH", "SOL", "XRP"]
+MIDS = {"BTC": Decimal("60000"), "ETH": Decimal("3000"), "SOL": Decimal("150"), "XRP": Decimal("0.6")}
+
+VENUES = {
+    "PARADEX": (ParadexDataClient, ParadexExecutionClient),
+    "LIGHTER": (LighterDataClient, LighterExecutionClient),
+    "STANDX": (StandXDataClient, StandXExecutionClient),
+}
+
+
+# -- Synthetic venue payloads -----------------------------------------------
+
+
+def _paradex_market(base: str) -> dict[str, Any]:
+    return {
+        "symbol": f"{base}-USD-PERP",
+        "base_currency": base,
+        "quote_currency": "USD",
+        "settlement_currency": "USDC",
+        "order_size_increment": "0.001",
+        "price_tick_size": "0.1",
+        "asset_kind": "PERP",
+    }
+
+
+def _lighter_market(market_id: int, base: str) -> dict[str, Any]:
+    return {
+        "market_id": market_id,
+        "symbol": base,
+        "size_decimals": 4,
+        "price_decimals": 2,
+        "min_base_amount": "0.0001",
+    }
+
+
+def _standx_market(market_id: int, base: str) -> dict[str, Any]:
+    return {
+        "market_id": market_id,
+        "symbol": f"{base}-USD",
+        "size_decimals": 3,
+        "price_decimals": 1,
+    }
+
+
+def _venue_symbol(venue: str, base: str) -> str:
+    if venue == "PARADEX":
+        return f"{base}-USD-PERP"
+    if venue == "STANDX":
+        return f"{base}-USD"
+    return base
+
+
+def _order_row(venue: str, i: int, open_: bool) -> dict[str, Any]:
+    base = SYMBOLS[i % len(SYMBOLS)]
+    buy = i % 2 == 0
+    price = MIDS[base] * (Decimal("0.99") if buy else Decimal("1.01"))
+    size = Decimal("0.010") + Decimal(i % 7) / 1000
+    remaining = size if open_ else Decimal("0") if i % 3 else size / 2
+    created_ms = T0_MS + i * 250
+    if venue == "PARADEX":
+        return {
+            "id": str(100_000 + i),
+            "client_id": f"O-BENCH-{i}",
+            "market": _venue_symbol(venue, base),
+            "side": "BUY" if buy else "SELL",
+            "type": "LIMIT",
+            "instruction": "GTC",
+            "status": "OPEN" if open_ else "CLOSED",
+            "size": str(size),
+            "remaining_size": str(remaining),
+            "price": str(price),
+            "avg_fill_price": "" if remaining == size else str(price),
+            "cancel_reason": "" if open_ or remaining == 0 else "USER_CANCELED",
+            "created_at": created_ms,
+            "last_updated_at": created_ms + 100,
+            "flags": [],
+        }
+    if venue == "LIGHTER":
+        return {
+            "order_index": 100_000 + i,
+            "client_order_index": i,
+            "market_index": SYMBOLS.index(base) + 1,
+            "initial_base_amount": str(size),
+            "remaining_base_amount": str(remaining),
+            "price": str(price),
+            "is_ask": not buy,
+            "type": "limit",
+            "time_in_force": "good-till-time",
+            "status": "open" if open_ else "filled" if remaining == 0 else "canceled",
+            "reduce_only": False,
+            "trigger_price": "0",
+            "timestamp": created_ms // 1000,
+        }
+    return {
+        "id": str(100_000 + i),
+        "cl_ord_id": f"O-BENCH-{i}",
+        "symbol": _venue_symbol(venue, base),
+        "side": "buy" if buy else "sell",
+        "order_type": "limit",
+        "time_in_force": "gtc",
+        "status": "open" if open_ else "filled" if remaining == 0 else "canceled",
+        "qty": str(size),
+        "remaining_qty": str(remaining),
+        "price": str(price),
+        "created_at": created_ms,
+        "updated_at": created_ms + 100,
+    }
+
+
+def _fill_row(venue: str, i: int) -> dict[str, Any]:
+    base = SYMBOLS[i % len(SYMBOLS)]
+    buy = i % 2 == 0
+    price = str(MIDS[base])
+    size = str(Decimal("0.010") + Decimal(i % 7) / 1000)
+    ts_ms = T0_MS + i * 250
+    if venue == "PARADEX":
+        return {
+            "id": str(500_000 + i),
+            "order_id": str(100_000 + i),
+            "client_id": f"O-BENCH-{i}",
+            "market": _venue_symbol(venue, base),
+            "side": "BUY" if buy else "SELL",
+            "size": size,
+            "price": price,
+            "fee": "0.012",
+            "fee_currency": "USDC",
+            "liquidity": "MAKER" if i % 3 else "TAKER",
+            "created_at": ts_ms,
+        }
+    if venue == "LIGHTER":
+        return {
+            "trade_id": 500_000 + i,
+            "market_id": SYMBOLS.index(base) + 1,
+            "size": size,
+            "price": price,
+            "is_ask": not buy,
+            "is_maker_ask": i % 3 == 0,
+            "maker_fee": "0",
+            "taker_fee": "0.012",
+            "order_index": 100_000 + i,
+            "client_order_index": i,
+            "timestamp": ts_ms // 1000,
+        }
+    return {
+        "id": str(500_000 + i),
+        "order_id": str(100_000 + i),
+        "cl_ord_id": f"O-BENCH-{i}",
+        "symbol": _venue_symbol(venue, base),
+        "side": "buy" if buy else "sell",
+        "qty": size,
+        "price": price,
+        "fee": "0.012",
+        "liquidity": "maker" if i % 3 else "taker",
+        "timestamp": ts_ms,
+    }
+
+
+def _book_message(venue: str) -> dict[str, Any]:
+    mid = MIDS["BTC"]
+    bids = [(str(mid - Decimal(n) / 10), str(Decimal(n) / 100)) for n in range(1, BOOK_LEVELS + 1)]
+    asks = [(str(mid + Decimal(n) / 10), str(Decimal(n) / 100)) for n in range(1, BOOK_LEVELS + 1)]
+    if venue == "LIGHTER":
+        return {
+            "channel": "orderbook",
+            "market": "BTC",
+            "type": "update/order_book",
+            "order_book": {
+                "bids": [{"price": p, "size": s} for p, s in bids],
+                "asks": [{"price": p, "size": s} for p, s in asks],
+                "timestamp": T0_MS,
+            },
+        }
+    return {
+        "channel": "depth_book",
+        "symbol": "BTC-USD",
+        "bids": [[p, s] for p, s in bids],
+        "asks": [[p, s] for p, s in asks],
+        "sequence": 1,
+        "timestamp": T0_MS,
+    }
+
+
+def _trade_message(venue: str) -> dict[str, Any]:
+    return {
+        "channel": "trades",
+        "symbol": _venue_symbol(venue, "BTC"),
+        "trades": [
+            {
+                "trade_id": str(900_000 + n),
+                "price": str(MIDS["BTC"] + Decimal(n) / 10),
+                "size": "0.010",
+                "side": "BUY" if n % 2 else "SELL",
+                "timestamp": T0_MS + n,
+            }
+            for n in range(TRADES_PER_MESSAGE)
+        ],
+    }
+
+
+def _paradex_ws_batch(shift: int) -> list[Any]:
+    """
+    A batch as the native Paradex client hands it over once decoded: trades
+    interleaved with quotes whose top moves by ``shift`` ticks.
+    """
+    instrument_id = InstrumentId.from_str("BTC-USD-PERP.PARADEX")
+    mid = MIDS["BTC"]
+    batch: list[Any] = []
+    for n in range(TRADES_PER_MESSAGE):
+        ts = (T0_MS + n) * 1_000_000
+        batch.append(
+            TradeTick(
+                instrument_id=instrument_id,
+                price=Price.from_str(str(mid + Decimal(n) / 10)),
+                size=Quantity.from_str("0.010"),
+                aggressor_side=AggressorSide.BUYER if n % 2 else AggressorSide.SELLER,
+                trade_id=TradeId(str(900_000 + n)),
+                ts_event=ts,
+                ts_init=ts,
+            ),
+        )
+        batch.append(
+            QuoteTick(
+                instrument_id=instrument_id,
+                bid_price=Price.from_str(str(mid - Decimal(shift + 1) / 10)),
+                ask_price=Price.from_str(str(mid + Decimal(shift + 1) / 10)),
+                bid_size=Quantity.from_str("1.000"),
+                ask_size=Quantity.from_str("1.000"),
+                ts_event=ts,
+                ts_init=ts,
+            ),
+        )
+    return batch
+
+
+# -- Fixtures -----------------------------------------------------------------
+
+
+def _provider(venue: str, markets: int = len(SYMBOLS)) -> Any:
+    bases = [SYMBOLS[i] if i < len(SYMBOLS) else f"T{i:03d}" for i in range(markets)]
+    if venue == "PARADEX":
+        payload = json.dumps({"results": [_paradex_market(b) for b in bases]})
+        return ParadexInstrumentProvider(client=SimpleNamespace(get_info=lambda: payload))
+
+    if venue == "LIGHTER":
+        rows = {"results": [_lighter_market(i + 1, b) for i, b in enumerate(bases)]}
+
+        async def get_info() -> dict[str, Any]:
+            return rows
+
+        return LighterInstrumentProvider(client=SimpleNamespace(get_info=get_info))
+
+    rows = {"markets": [_standx_market(i + 1, b) for i, b in enumerate(bases)]}
+    return StandXInstrumentProvider(client=SimpleNamespace(get_info=lambda: rows))
+
+
+def _components(loop: asyncio.AbstractEventLoop, venue: str) -> tuple[Any, Cache, LiveClock, MessageBus]:
+    clock = LiveClock()
+    msgbus = MessageBus(TraderId("BENCH-001"), clock)
+    cache = Cache()
+    provider = _provider(venue)
+    loop.run_until_complete(provider.load_all_async())
+    for instrument in provider.get_all().values():
+        cache.add_instrument(instrument)
+    return provider, cache, clock, msgbus
+
+
+def _data_client(loop: asyncio.AbstractEventLoop, venue: str) -> Any:
+    provider, cache, clock, msgbus = _components(loop, venue)
+    client = VENUES[venue][0](
+        loop,
+        object(),
+        ClientId(venue),
+        Venue(venue),
+        msgbus,
+        cache,
+        clock,
+        provider,
+    )
+    # Quote subscribers take the top-of-book path as well as the deltas
+    client._quote_subscriptions.update(provider.get_all())
+    return client
+
+
+class _AccountBackend:
+    """
+    Serves a fixed account the way each adapter's backend hands it over:
+    JSON strings from the Paradex binding, dicts from the Python backends.
+    """
+
+    def __init__(self, venue: str, orders: int, fills: int, open_orders: int) -> None:
+        self.venue = venue
+        self.open_rows = [_order_row(venue, i, True) for i in range(open_orders)]
+        self.history_rows = [_order_row(venue, i, False) for i in range(open_orders, orders)]
+        self.fill_rows = [_fill_row(venue, i) for i in range(fills)]
+        history_key = "results" if venue != "STANDX" else "result"
+        self._history = {history_key: self.history_rows, "next": None, "prev": None}
+        self._fills = {history_key: self.fill_rows, "next": None, "prev": None}
+        if venue == "PARADEX":
+            self._open = json.dumps(self.open_rows)
+            self._history = json.dumps(self._history)
+            self._fills = json.dumps(self._fills)
+        else:
+            self._open = self.open_rows
+
+    def get_open_orders(self, market: str | None = None) -> Any:
+        return self._open
+
+    def get_orders_history(self, *args: Any) -> Any:
+        return self._history
+
+    def get_fills(self, *args: Any) -> Any:
+        return self._fills
+
+
+def _exec_client(loop: asyncio.AbstractEventLoop, venue: str, backend: Any) -> Any:
+    provider, cache, clock, msgbus = _components(loop, venue)
+    client = VENUES[venue][1](
+        loop,
+        backend,
+        ClientId(venue),
+        Venue(venue),
+        OmsType.NETTING,
+        AccountType.MARGIN,
+        None,
+        provider,
+        msgbus,
+        cache,
+        clock,
+    )
+    # Mass status is refused while disconnected; nothing here touches the network
+    client._set_connected(True)
+    return client
+
+
+def _fills_command() -> SimpleNamespace:
+    return SimpleNamespace(instrument_id=None, venue_order_id=None, start=None, end=None)
+
+
+# -- Cases --------------------------------------------------------------------
+
+
+def _register_venue_cases(venue: str) -> None:
+    prefix = venue.lower()
+
+    if venue == "PARADEX":
+        # Paradex frames are parsed natively (see the crate benches); this times
+        # the Python half: queueing a decoded batch and publishing it on the loop
+        @SUITE.case(f"{prefix}.data.on_ws_batch")
+        def _(loop):
+            client = _data_client(loop, venue)
+            client._ws_queue = CoalescingIngestQueue(loop, client._publish_ws_data)
+            # Alternate the top of book so every batch publishes its quote
+            batches = itertools.cycle([_paradex_ws_batch(0), _paradex_ws_batch(1)])
+            decode = paradex_data.capsule_to_data
+            paradex_data.capsule_to_data = lambda data: data
+
+            async def on_ws_batch():
+                client._on_ws_batch(next(batches))
+                await asyncio.sleep(0)
+
+            try:
+                yield on_ws_batch
+            finally:
+                paradex_data.capsule_to_data = decode
+    else:
+        @SUITE.case(f"{prefix}.data.handle_orderbook")
+        def _(loop):
+            client = _data_client(loop, venue)
+            message = _book_message(venue)
+            return lambda: client._handle_orderbook(message)
+
+        @SUITE.case(f"{prefix}.data.handle_trade")
+        def _(loop):
+            client = _data_client(loop, venue)
+            message = _trade_message(venue)
+            return lambda: client._handle_trade(message)
+
+    @SUITE.case(f"{prefix}.exec.build_order_status_report")
+    def _(loop):
+        backend = _AccountBackend(venue, orders=1, fills=0, open_orders=0)
+        client = _exec_client(loop, venue, backend)
+        row = backend.history_rows[0]
+        return lambda: client._build_order_status_report_from_venue(row)
+
+    @SUITE.case(f"{prefix}.exec.generate_fill_reports")
+    def _(loop):
+        client = _exec_client(loop, venue, _AccountBackend(venue, 0, ACCOUNT_FILLS, 0))
+        command = _fills_command()
+        return functools.partial(client.generate_fill_reports, command)
+
+    @SUITE.case(f"{prefix}.exec.generate_mass_status")
+    def _(loop):
+        backend = _AccountBackend(venue, ACCOUNT_ORDERS, ACCOUNT_FILLS, OPEN_ORDERS)
+        client = _exec_client(loop, venue, backend)
+        memo = client._order_report_memo
+
+        async def mass_status():
+            # Cold: every row is converted, as on the first reconcile after a restart
+            memo.clear()
+            return await client.generate_mass_status()
+
+        return mass_status
+
+    @SUITE.case(f"{prefix}.exec.generate_mass_status_warm")
+    def _(loop):
+        backend = _AccountBackend(venue, ACCOUNT_ORDERS, ACCOUNT_FILLS, OPEN_ORDERS)
+        client = _exec_client(loop, venue, backend)
+        return client.generate_mass_status
+
+    @SUITE.case(f"{prefix}.provider.load_all")
+    def _(loop):
+        provider = _provider(venue, PROVIDER_MARKETS)
+        return provider.load_all_async
+
+
+for _venue in VENUES:
+    _register_venue_cases(_venue)
+
+
+def _paradex_binding() -> Any:
+    try:
+        return importlib.import_module("paradex")
+    except ImportError as exc:
+        raise BenchSkipped("paradex native module is not built") from exc
+
+
+@contextlib.contextmanager
+def _paradex_sim(engine: Any):
+    """
+    Serve ``engine`` as Paradex on a loop of its own: the binding blocks its
+    caller, so the simulator cannot share the suite's loop.
+    """
+    from nautilus_adapter.sim.paradex import ParadexDialect
+    from nautilus_adapter.sim.server import VenueSimServer
+
+    server = VenueSimServer([ParadexDialect(engine)], port=0)
+    sim_loop = asyncio.new_event_loop()
+    thread = threading.Thread(target=sim_loop.run_forever, daemon=True)
+    thread.start()
+    asyncio.run_coroutine_threadsafe(server.start(), sim_loop).result()
+    try:
+        yield server.base_url_http("PARADEX")
+    finally:
+        asyncio.run_coroutine_threadsafe(server.stop(), sim_loop).result()
+        sim_loop.call_soon_threadsafe(sim_loop.stop)
+        thread.join()
+        sim_loop.close()
+
+
+def _btc_engine() -> Any:
+    from nautilus_adapter.sim.matching import MatchingEngine, SimMarket
+
+    market = SimMarket("BTC-USD-PERP", 0, Decimal("0.1"), Decimal("0.001"), MIDS["BTC"])
+    return MatchingEngine([market], house_levels=BOOK_LEVELS)
+
+
+@SUITE.case("paradex.binding.get_orders_history_round_trip")
+def _(loop):
+    backend = _paradex_binding()
+    engine = _btc_engine()
+    # One full page of resting orders, well below the house bids so none fill
+    for i in range(HISTORY_PAGE_SIZE):
+        engine.submit(
+            SIM_ACCOUNT,
+            "BTC-USD-PERP",
+            "BUY",
+            "LIMIT",
+            Decimal("0.001"),
+            price=MIDS["BTC"] / 2 - i,
+            client_id=f"O-{i}",
+        )
+    with _paradex_sim(engine) as base_url:
+        # The simulator accepts any signature, so a throwaway key authenticates
+        client = backend.PyParadexHttpClient(base_url, None, SIM_ACCOUNT, "0x1")
+        yield lambda: json.loads(client.get_orders_history("BTC-USD-PERP", None, None, None, HISTORY_PAGE_SIZE))
+
+
+@SUITE.case("paradex.binding.get_orderbook_round_trip")
+def _(loop):
+    backend = _paradex_binding()
+    with _paradex_sim(_btc_engine()) as base_url:
+        client = backend.PyParadexHttpClient(base_url, None, None, None)
+        yield lambda: json.loads(client.get_orderbook("BTC-USD-PERP"))
+
+
+# -- CLI ------------------------------------------------------------------------
+
+
+def _parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Benchmark the adapter hot paths")
+    parser.add_argument("-k", "--filter", action="append", default=[], help="fnmatch pattern on case names")
+    parser.add_argument("--list", action="store_true", help="list the cases and exit")
+    parser.add_argument("--rounds", type=int, default=7)
+    parser.add_argument("--min-round-secs", type=float, default=0.05)
+    parser.add_argument("--storage", default=str(DEFAULT_STORAGE))
+    parser.add_argument("--save", default="", help="store this run as baseline NAME")
+    parser.add_argument("--compare", default="", help="compare against baseline NAME and fail on regressions")
+    parser.add_argument("--max-regression", type=float, default=0.15, help="allowed slowdown, 0.15 = 15%%")
+    parser.add_argument(
+        "--allow-missing",
+        action="store_true",
+        help="do not fail when a baseline case was skipped or is missing from this run",
+    )
+    parser.add_argument("--json", default="", help="also write this run's results to PATH")
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = _parse_args(argv)
+    if args.list:
+        print("\n".join(SUITE.select(args.filter)))
+        return 0
+
+    storage = Path(args.storage)
+    baseline = None
+    if args.compare:
+        baseline_path = storage / f"{args.compare}.json"
+        if not baseline_path.is_file():
+            print(
+                f"No baseline {args.compare!r} at {baseline_path}; run `make bench-save` first",
+                file=sys.stderr,
+            )
+            return 2
+        baseline = load_baseline(baseline_path)
+
+    def progress(name: str, stats: Any, skipped: str | None) -> None:
+        print(f"  {name}: {'skipped' if skipped else 'done'}", file=sys.stderr, flush=True)
+
+    run = SUITE.run(args.filter, rounds=args.rounds, min_round_secs=args.min_round_secs, on_result=progress)
+
+    comparisons = compare(run, baseline) if baseline is not None else None
+    print(render_table(run, comparisons, args.max_regression if baseline is not None else None))
+
+    if args.json:
+        save_baseline(args.json, run)
+    if args.save:
+        path = save_baseline(storage / f"{args.save}.json", run)
+        print(f"Saved baseline {args.save!r} to {path}")
+
+    if baseline is None:
+        return 0
+    if baseline.machine != run.machine:
+        print(f"Warning: baseline {args.compare!r} was recorded on a different machine", file=sys.stderr)
+    missing = uncompared(run, baseline, SUITE.select(args.filter))
+    for name, reason in missing.items():
+        print(f"Not compared: {name} ({reason})", file=sys.stderr)
+    regressions = [c for c in comparisons or [] if c.regressed(args.max_regression)]
+    if regressions:
+        print(
+            f"{len(regressions)} case(s) regressed beyond {args.max_regression:.0%}: "
+            + ", ".join(f"{c.name} ({c.ratio:.2f}x)" for c in regressions),
+            file=sys.stderr,
+        )
+        return 1
+    if missing and not args.allow_missing:
+        print(
+            f"{len(missing)} baseline case(s) were not compared; pass --allow-missing to accept that",
+            file=sys.stderr,
+        )
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -2,8 +2,6 @@ import argparse
 import asyncio
 import json
 import os
-import re
-import subprocess
 import sys
 import time
 from dataclasses import dataclass
@@ -11,6 +9,8 @@ from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
 
+import lighter_strategy_runner as runner
+
 
 def _load_env_file(path: Path) -> None:
     if not path.exists():
@@ -62,18 +62,13 @@ def _parse_args() -> argparse.Namespace:
     parser.add_argument("--testnet", action="store_true", default=False)
     parser.add_argument("--env-file", default="crates/adapters/Lighter/env_lighter")
     parser.add_argument("--report-json", default="")
+    parser.add_argument("--event-log", default="")
     parser.add_argument("--full-soak", action="store_true", default=False)
     return parser.parse_args()
 
 
-def _contains(output: str, text: str) -> bool:
-    return text in output
-
-
-def _build_runner_command(args: argparse.Namespace) -> list[str]:
-    command = [
-        "python3",
-        "scripts/lighter_strategy_runner.py",
+def _build_runner_args(args: argparse.Namespace) -> argparse.Namespace:
+    argv = [
         "--runtime-secs",
         str(args.runtime_secs),
         "--symbol",
@@ -86,40 +81,23 @@ def _build_runner_command(args: argparse.Namespace) -> list[str]:
         str(args.reconciliation_lookback_mins),
         "--reconciliation-page-size",
         str(args.reconciliation_page_size),
+        "--env-file",
+        args.env_file,
     ]
     if args.testnet:
-        command.append("--testnet")
-    return command
+        argv.append("--testnet")
+    return runner._parse_args(argv)
 
 
-def _latest_entry_client_id(output: str) -> str | None:
-    lines = [
-        line
-        for line in output.splitlines()
-        if "BUS_EVENT OrderInitialized " in line and "contingency_type=OTO" in line
-    ]
-    if not lines:
-        lines = [line for line in output.splitlines() if "BUS_EVENT OrderInitialized " in line]
-    if not lines:
-        return None
-    last = lines[-1]
-    token = "client_order_id="
-    start = last.find(token)
-    if start < 0:
-        return None
-    tail = last[start + len(token) :]
-    end = tail.find(",")
-    if end > 0:
-        return tail[:end]
+class _RunnerScenario:
+    name = "runner_default"
+
+    def __init__(self, runner_args: argparse.Namespace) -> None:
+        self.runtime_secs = runner_args.runtime_secs
+        self._runner_args = runner_args
 
-    for pattern in (
-        r"BUS_EVENT OrderSubmitted .*client_order_id=([^,\s\)]+)",
-        r"ORDER_SUBMITTED\s+([^\s]+)",
-    ):
-        matches = re.findall(pattern, output)
-        if matches:
-            return matches[-1]
-    return None
+    def build_strategy(self, attempt: int):
+        return runner._prepare_strategy(self._runner_args)
 
 
 def _map_terminal_from_status(status: str | None) -> str:
@@ -215,70 +193,50 @@ async def _cancel_and_fetch_status(
         await backend.close()
 
 
-def _attempt_once(args: argparse.Namespace, attempt: int) -> AttemptResult:
-    started = time.monotonic()
-    notes: list[str] = []
-    try:
-        proc = subprocess.run(
-            _build_runner_command(args),
-            capture_output=True,
-            text=True,
-            timeout=args.attempt_timeout_secs,
-            check=False,
-        )
-        output = (proc.stdout or "") + (proc.stderr or "")
-    except subprocess.TimeoutExpired:
-        return AttemptResult(
-            attempt=attempt,
-            elapsed_secs=time.monotonic() - started,
-            entry_client_order_id=None,
-            terminal_state="TIMEOUT",
-            reconciliation_ok=False,
-            startup_reconciliation_ok=False,
-            had_errors=True,
-            submitted=False,
-            accepted=False,
-            filled=False,
-            canceled=False,
-            rejected=False,
-            cancel_rejected=False,
-            cancel_action=None,
-            notes=["runner_timeout"],
-        )
-
-    entry_id = _latest_entry_client_id(output)
-    submitted = bool(
-        entry_id and _contains(output, "BUS_EVENT OrderSubmitted ") and _contains(output, entry_id)
-    )
-    accepted = bool(
-        entry_id and _contains(output, "BUS_EVENT OrderAccepted ") and _contains(output, entry_id)
-    )
-    filled = bool(
-        entry_id and _contains(output, "BUS_EVENT OrderFilled ") and _contains(output, entry_id)
-    )
-    canceled = bool(
-        entry_id and _contains(output, "BUS_EVENT OrderCanceled ") and _contains(output, entry_id)
-    )
-    rejected = bool(
-        entry_id and _contains(output, "BUS_EVENT OrderRejected ") and _contains(output, entry_id)
-    )
-    cancel_rejected = bool(
-        entry_id
-        and _contains(output, "BUS_EVENT OrderCancelRejected ")
-        and _contains(output, entry_id)
+def _failed_attempt(attempt: int, elapsed_secs: float, terminal: str, note: str) -> AttemptResult:
+    return AttemptResult(
+        attempt=attempt,
+        elapsed_secs=elapsed_secs,
+        entry_client_order_id=None,
+        terminal_state=terminal,
+        reconciliation_ok=False,
+        startup_reconciliation_ok=False,
+        had_errors=True,
+        submitted=False,
+        accepted=False,
+        filled=False,
+        canceled=False,
+        rejected=False,
+        cancel_rejected=False,
+        cancel_action=None,
+        notes=[note],
     )
 
-    terminal = "OPEN_OR_UNKNOWN"
-    if filled:
-        terminal = "FILLED"
-    elif canceled:
-        terminal = "CANCELED"
-    elif rejected:
-        terminal = "REJECTED"
 
+async def _attempt_once(
+    args: argparse.Namespace,
+    attempt: int,
+    engine: Any,
+    scenario: _RunnerScenario,
+) -> AttemptResult:
+    result = await engine.run_attempt(scenario, attempt, timeout_secs=args.attempt_timeout_secs)
+    if result.timed_out:
+        return _failed_attempt(attempt, result.elapsed_secs, "TIMEOUT", "attempt_timeout")
+
+    notes = list(result.errors)
+    entry_id = result.entry_client_order_id
+    kinds = result.kinds(entry_id) if entry_id else set()
+    submitted = "OrderSubmitted" in kinds
+    accepted = "OrderAccepted" in kinds
+    filled = "OrderFilled" in kinds
+    canceled = "OrderCanceled" in kinds
+    rejected = "OrderRejected" in kinds
+    cancel_rejected = "OrderCancelRejected" in kinds
+
+    terminal = result.entry_terminal_state or "OPEN_OR_UNKNOWN"
     cancel_action = None
     if terminal == "OPEN_OR_UNKNOWN" and accepted and entry_id:
-        probed_terminal, cancel_action = asyncio.run(_cancel_and_fetch_status(args, entry_id))
+        probed_terminal, cancel_action = await _cancel_and_fetch_status(args, entry_id)
         if probed_terminal is None:
             notes.append("entry_not_terminal_after_cancel_probe")
         else:
@@ -287,30 +245,14 @@ def _attempt_once(args: argparse.Namespace, attempt: int) -> AttemptResult:
             canceled = terminal == "CANCELED"
             rejected = terminal == "REJECTED"
 
-    rec_ok = _contains(output, "Reconciliation for LIGHTER succeeded")
-    startup_ok = _contains(output, "Startup reconciliation completed")
-    known_query_rate_limit = "Error on 'query_order" in output and "Too Many Requests" in output
-    error_lines = [line for line in output.splitlines() if "[ERROR]" in line]
-    if known_query_rate_limit:
-        error_lines = [line for line in error_lines if "Error on 'query_order" not in line]
-
-    had_errors = bool(error_lines) or any(
-        x in output
-        for x in [
-            "Failed to generate mass status",
-            "Execution state could not be reconciled",
-            "Traceback",
-        ]
-    )
-
     return AttemptResult(
         attempt=attempt,
-        elapsed_secs=time.monotonic() - started,
+        elapsed_secs=result.elapsed_secs,
         entry_client_order_id=entry_id,
         terminal_state=terminal,
-        reconciliation_ok=rec_ok,
-        startup_reconciliation_ok=startup_ok,
-        had_errors=had_errors,
+        reconciliation_ok=result.reconciliation_ok,
+        startup_reconciliation_ok=True,
+        had_errors=bool(result.errors),
         submitted=submitted,
         accepted=accepted,
         filled=filled,
@@ -322,45 +264,79 @@ def _attempt_once(args: argparse.Namespace, attempt: int) -> AttemptResult:
     )
 
 
+async def _run_attempts(
+    args: argparse.Namespace,
+    engine: Any,
+    started: float,
+) -> list[dict[str, Any]]:
+    attempts: list[dict[str, Any]] = []
+    # One node for every attempt: connection, instrument load and startup
+    # reconciliation are paid once instead of per attempt
+    try:
+        await engine.start()
+    except Exception as exc:
+        attempts.append(
+            _failed_attempt(1, time.monotonic() - started, "OPEN_OR_UNKNOWN", f"startup_failed:{exc}").__dict__,
+        )
+        attempts[-1]["critical_ok"] = False
+        attempts[-1]["terminal_ok"] = False
+        return attempts
+
+    scenario = _RunnerScenario(_build_runner_args(args))
+    try:
+        for i in range(1, args.max_attempts + 1):
+            if time.monotonic() - started > args.max_total_secs:
+                break
+            result = await _attempt_once(args, i, engine, scenario)
+            attempts.append(result.__dict__)
+
+            critical_ok = (
+                result.reconciliation_ok
+                and result.startup_reconciliation_ok
+                and not result.had_errors
+                and result.submitted
+                and result.accepted
+                and not result.rejected
+                and (not result.cancel_rejected or result.terminal_state in {"FILLED", "CANCELED"})
+            )
+            terminal_ok = result.terminal_state in {"FILLED", "CANCELED"}
+            attempts[-1]["critical_ok"] = critical_ok
+            attempts[-1]["terminal_ok"] = terminal_ok
+
+            if critical_ok and terminal_ok and not args.full_soak:
+                break
+    finally:
+        await engine.close()
+    return attempts
+
+
 def main() -> int:
     args = _parse_args()
     repo_root = Path(__file__).resolve().parent.parent
     _load_env_file((repo_root / args.env_file).resolve())
 
+    from nautilus_adapter.common.canary import CanaryEngine
+    from nautilus_adapter.common.event_log import EventLogWriter
+
+    runner_args = _build_runner_args(args)
+    event_log = EventLogWriter(args.event_log) if args.event_log else None
+    engine = CanaryEngine(
+        runner._build_node_config(runner_args),
+        runner._client_factories(),
+        event_log=event_log,
+    )
+
     started = time.monotonic()
-    attempts: list[dict[str, Any]] = []
-    final_terminal = "TIMEOUT"
-    compliance_pass = False
-    total_terminal_success = 0
-    total_critical_ok = 0
-
-    for i in range(1, args.max_attempts + 1):
-        if time.monotonic() - started > args.max_total_secs:
-            break
-        result = _attempt_once(args, i)
-        attempts.append(result.__dict__)
-
-        critical_ok = (
-            result.reconciliation_ok
-            and result.startup_reconciliation_ok
-            and not result.had_errors
-            and result.submitted
-            and result.accepted
-            and not result.rejected
-            and (not result.cancel_rejected or result.terminal_state in {"FILLED", "CANCELED"})
-        )
-        terminal_ok = result.terminal_state in {"FILLED", "CANCELED"}
-        if critical_ok:
-            total_critical_ok += 1
-        if terminal_ok:
-            total_terminal_success += 1
-        attempts[-1]["critical_ok"] = critical_ok
-        attempts[-1]["terminal_ok"] = terminal_ok
-        final_terminal = result.terminal_state
-
-        if critical_ok and terminal_ok and not args.full_soak:
-            compliance_pass = True
-            break
+    try:
+        attempts = asyncio.run(_run_attempts(args, engine, started))
+    finally:
+        engine.dispose()
+        if event_log is not None:
+            event_log.close()
+
+    total_terminal_success = sum(1 for a in attempts if a["terminal_ok"])
+    total_critical_ok = sum(1 for a in attempts if a["critical_ok"])
+    final_terminal = attempts[-1]["terminal_state"] if attempts else "TIMEOUT"
 
     attempts_executed = len(attempts)
     compliance_pass = (
@@ -2,6 +2,7 @@ import argparse
 import re
 import sys
 from pathlib import Path
+from typing import Any
 
 
 def _latest_entry_triplet_ids(text: str) -> tuple[str, str, str] | None:
@@ -72,24 +73,80 @@ def _assert_market_mode(text: str, ids: tuple[str, str, str]) -> tuple[list[str]
     return errors, warnings
 
 
+def _assert_events_common(index: Any, ids: tuple[str, str, str]) -> list[str]:
+    errors: list[str] = []
+    if not any(r.get("ok") for r in index.reconciliations()):
+        errors.append("missing reconciliation success")
+    if not index.reconciliation_ok("startup"):
+        errors.append("missing startup reconciliation completion")
+    if any(not r.get("ok") for r in index.reconciliations()):
+        errors.append("reconciliation error present")
+
+    for cid in ids:
+        if not index.has("OrderSubmitted", cid):
+            errors.append(f"missing submitted event for {cid}")
+        if not index.has("OrderAccepted", cid):
+            errors.append(f"missing accepted event for {cid}")
+    return errors
+
+
+def _assert_events_cancel_mode(index: Any, ids: tuple[str, str, str]) -> list[str]:
+    errors = _assert_events_common(index, ids)
+    for cid in ids:
+        if not index.has("OrderCanceled", cid):
+            errors.append(f"missing canceled event for {cid}")
+    if index.has("OrderCancelRejected"):
+        errors.append("cancel rejected event present")
+    return errors
+
+
+def _assert_events_market_mode(index: Any, ids: tuple[str, str, str]) -> tuple[list[str], list[str]]:
+    errors = _assert_events_common(index, ids)
+    warnings: list[str] = []
+    entry_id = ids[0]
+    has_entry_fill = index.has("OrderFilled", entry_id)
+    has_position_evt = any(
+        index.has(kind) for kind in ("PositionOpened", "PositionChanged", "PositionClosed")
+    )
+    if has_entry_fill and not has_position_evt:
+        errors.append("entry fill present but no position lifecycle event")
+    if not has_entry_fill:
+        warnings.append(f"market entry {entry_id} accepted but no fill observed in runtime window")
+    return errors, warnings
+
+
 def main() -> int:
     parser = argparse.ArgumentParser()
-    parser.add_argument("--log", required=True)
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument("--log")
+    source.add_argument("--events")
     parser.add_argument("--mode", choices=["cancel", "market"], required=True)
     args = parser.parse_args()
 
-    text = Path(args.log).read_text(errors="ignore")
-    ids = _latest_entry_triplet_ids(text)
-    if ids is None:
-        print("ASSERT_FAIL could not find complete latest bracket id triplet")
-        return 2
-
     warnings: list[str] = []
-    if args.mode == "cancel":
-        errors = _assert_cancel_mode(text, ids)
+    if args.events:
+        from nautilus_adapter.common.event_log import EventLogIndex
+
+        # One streaming pass builds the index every assertion queries
+        index = EventLogIndex.from_path(args.events)
+        ids = index.latest_bracket()
+        if ids is None:
+            print("ASSERT_FAIL could not find complete latest bracket id triplet")
+            return 2
+        if args.mode == "cancel":
+            errors = _assert_events_cancel_mode(index, ids)
+        else:
+            errors, warnings = _assert_events_market_mode(index, ids)
     else:
-        errors, warnings = _assert_market_mode(text, ids)
-
+        text = Path(args.log).read_text(errors="ignore")
+        ids = _latest_entry_triplet_ids(text)
+        if ids is None:
+            print("ASSERT_FAIL could not find complete latest bracket id triplet")
+            return 2
+        if args.mode == "cancel":
+            errors = _assert_cancel_mode(text, ids)
+        else:
+            errors, warnings = _assert_market_mode(text, ids)
     if errors:
         print("ASSERT_FAIL")
         for err in errors:
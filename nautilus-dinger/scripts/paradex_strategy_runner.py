@@ -119,7 +119,7 @@ def _get_reference_prices(
     return best_bid, best_ask
 
 
-def _parse_args() -> argparse.Namespace:
+def _parse_args(argv: list[str] | None = None) -> argparse.Namespace:
     parser = argparse.ArgumentParser()
     parser.add_argument("--symbol", default="BTC-USD-PERP")
     parser.add_argument("--side", choices=["BUY", "SELL"], default="BUY")
@@ -141,7 +141,8 @@ def _parse_args() -> argparse.Namespace:
         "--env-file",
         default="crates/adapters/Paradex/env_paradex",
     )
-    return parser.parse_args()
+    parser.add_argument("--event-log", default="")
+    return parser.parse_args(argv)
 
 
 def _build_strategy_classes():
@@ -330,30 +331,65 @@ def _build_strategy_classes():
     return ParadexSignalStrategyConfig, ParadexSignalStrategy
 
 
-def _run(args: argparse.Namespace) -> None:
+def _load_runtime(args: argparse.Namespace) -> None:
     repo_root = Path(__file__).resolve().parent.parent
     _load_env_file((repo_root / args.env_file).resolve())
     _ensure_paradex_extension(repo_root)
 
+
+def _client_factories() -> dict[str, tuple[Any, Any]]:
+    from nautilus_adapter.adapters.Paradex.factories import (
+        ParadexLiveDataClientFactory,
+        ParadexLiveExecClientFactory,
+    )
+
+    return {"PARADEX": (ParadexLiveDataClientFactory, ParadexLiveExecClientFactory)}
+
+
+def _build_node_config(args: argparse.Namespace):
     from nautilus_trader.config import (
         InstrumentProviderConfig,
         LiveExecEngineConfig,
         TradingNodeConfig,
     )
-    from nautilus_trader.live.node import TradingNode
-    from nautilus_trader.model.identifiers import InstrumentId
     from nautilus_adapter.adapters.Paradex.config import (
         ParadexDataClientConfig,
         ParadexExecClientConfig,
     )
-    from nautilus_adapter.adapters.Paradex.factories import (
-        ParadexLiveDataClientFactory,
-        ParadexLiveExecClientFactory,
-        _build_paradex_http_client,
+
+    data_cfg = ParadexDataClientConfig(
+        is_testnet=args.testnet,
+        instrument_provider=InstrumentProviderConfig(load_all=True),
+    )
+    exec_cfg = ParadexExecClientConfig(
+        is_testnet=args.testnet,
+        instrument_provider=InstrumentProviderConfig(load_all=True),
+        reconciliation_lookback_mins=args.reconciliation_lookback_mins,
+        reconciliation_page_size=args.reconciliation_page_size,
+    )
+
+    return TradingNodeConfig(
+        trader_id=args.trader_id,
+        exec_engine=LiveExecEngineConfig(
+            reconciliation=True,
+            reconciliation_lookback_mins=args.reconciliation_lookback_mins,
+        ),
+        data_clients={"PARADEX": data_cfg},
+        exec_clients={"PARADEX": exec_cfg},
     )
 
-    backend_cfg = ParadexExecClientConfig(is_testnet=args.testnet)
-    backend_client = _build_paradex_http_client(backend_cfg)
+
+def _prepare_strategy(args: argparse.Namespace, backend_client: Any = None):
+    """
+    Resolve the symbol, price the bracket off the live book and build the strategy.
+    """
+    from nautilus_trader.model.identifiers import InstrumentId
+    from nautilus_adapter.adapters.Paradex.config import ParadexExecClientConfig
+    from nautilus_adapter.adapters.Paradex.factories import _build_paradex_http_client
+
+    if backend_client is None:
+        backend_cfg = ParadexExecClientConfig(is_testnet=args.testnet)
+        backend_client = _build_paradex_http_client(backend_cfg)
     if backend_client is None:
         raise RuntimeError("Failed to build Paradex backend client from env/config")
     if not hasattr(backend_client, "get_orderbook"):
@@ -425,29 +461,8 @@ def _run(args: argparse.Namespace) -> None:
         },
     )
 
-    data_cfg = ParadexDataClientConfig(
-        is_testnet=args.testnet,
-        instrument_provider=InstrumentProviderConfig(load_all=True),
-    )
-    exec_cfg = ParadexExecClientConfig(
-        is_testnet=args.testnet,
-        instrument_provider=InstrumentProviderConfig(load_all=True),
-        reconciliation_lookback_mins=args.reconciliation_lookback_mins,
-        reconciliation_page_size=args.reconciliation_page_size,
-    )
-
-    node_cfg = TradingNodeConfig(
-        trader_id=args.trader_id,
-        exec_engine=LiveExecEngineConfig(
-            reconciliation=True,
-            reconciliation_lookback_mins=args.reconciliation_lookback_mins,
-        ),
-        data_clients={"PARADEX": data_cfg},
-        exec_clients={"PARADEX": exec_cfg},
-    )
-
     strategy_config_cls, strategy_cls = _build_strategy_classes()
-    strategy = strategy_cls(
+    return strategy_cls(
         strategy_config_cls(
             instrument_id=InstrumentId.from_str(f"{resolved_symbol}.PARADEX"),
             side=args.side,
@@ -461,9 +476,17 @@ def _run(args: argparse.Namespace) -> None:
         ),
     )
 
-    node = TradingNode(config=node_cfg)
-    node.add_data_client_factory("PARADEX", ParadexLiveDataClientFactory)
-    node.add_exec_client_factory("PARADEX", ParadexLiveExecClientFactory)
+
+def _run(args: argparse.Namespace) -> None:
+    _load_runtime(args)
+
+    from nautilus_trader.live.node import TradingNode
+
+    strategy = _prepare_strategy(args)
+    node = TradingNode(config=_build_node_config(args))
+    for name, (data_factory, exec_factory) in _client_factories().items():
+        node.add_data_client_factory(name, data_factory)
+        node.add_exec_client_factory(name, exec_factory)
     node.trader.add_strategy(strategy)
     node.build()
 
@@ -473,6 +496,13 @@ def _run(args: argparse.Namespace) -> None:
     node.kernel.msgbus.subscribe("events.order*", _bus_log)
     node.kernel.msgbus.subscribe("events.position*", _bus_log)
 
+    event_log = None
+    if args.event_log:
+        from nautilus_adapter.common.event_log import EventLogWriter
+
+        event_log = EventLogWriter(args.event_log)
+        event_log.attach(node)
+
     stop_timer: threading.Timer | None = None
     try:
         stop_timer = threading.Timer(args.runtime_secs, node.stop)
@@ -483,6 +513,8 @@ def _run(args: argparse.Namespace) -> None:
         if stop_timer is not None:
             stop_timer.cancel()
         node.dispose()
+        if event_log is not None:
+            event_log.close()
 
 
 def main() -> None:
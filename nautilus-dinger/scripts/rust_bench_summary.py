@@ -0,0 +1,165 @@
+import argparse
+import re
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+from nautilus_adapter.common.bench import (
+    BenchRun,
+    compare,
+    load_baseline,
+    load_criterion,
+    machine_info,
+    render_table,
+    save_baseline,
+    uncompared,
+)
+
+ROOT = Path(__file__).resolve().parent.parent
+ADAPTERS = ROOT / "crates" / "adapters"
+CRITERION = ROOT / "target" / "criterion"
+DEFAULT_STORAGE = ROOT / ".benchmarks" / "rust"
+BENCH = "hot_paths"
+
+_PACKAGE_NAME = re.compile(r'^\[package\][^\[]*?^name\s*=\s*"([^"]+)"', re.MULTILINE | re.DOTALL)
+
+
+def _bench_crates() -> dict[str, Path]:
+    """
+    Package name -> crate dir for every adapter crate with a hot-path bench.
+    """
+    crates = {}
+    for bench in sorted(ADAPTERS.glob(f"*/benches/{BENCH}.rs")):
+        crate_dir = bench.parent.parent
+        match = _PACKAGE_NAME.search((crate_dir / "Cargo.toml").read_text())
+        if match is not None:
+            crates[match.group(1)] = crate_dir
+    return crates
+
+
+def _rustc_version() -> str:
+    try:
+        return subprocess.run(["rustc", "-V"], capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return ""
+
+
+def _run_cargo_bench(package: str, args: argparse.Namespace) -> None:
+    command = ["cargo", "bench", "-p", package, "--bench", BENCH, "--", "--noplot"]
+    if args.measurement_time:
+        command += ["--measurement-time", str(args.measurement_time)]
+    if args.filter:
+        command.append(args.filter)
+    print(f"$ {' '.join(command)}", file=sys.stderr, flush=True)
+    subprocess.run(command, cwd=ROOT, check=True)
+
+
+def _print_core_share(run: BenchRun, rate: float) -> None:
+    print(f"\nCPU at {rate:g} orders/s (share of one core, per element):")
+    for name, stats in run.results.items():
+        print(f"  {name:<48} {stats.median_ns * rate / 1e9:>8.3%}")
+
+
+def _parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Run the Rust adapter criterion benches and summarize them")
+    parser.add_argument("-p", "--crate", action="append", default=[], help="package to bench (default: all)")
+    parser.add_argument("-k", "--filter", default="", help="criterion filter regex on bench ids")
+    parser.add_argument("--list", action="store_true", help="list the crates with benches and exit")
+    parser.add_argument("--collect-only", action="store_true", help="summarize existing results without running cargo")
+    parser.add_argument("--measurement-time", type=float, default=0.0, help="seconds per bench passed to criterion")
+    parser.add_argument("--rate", type=float, default=0.0, help="also print the core share at this many orders/s")
+    parser.add_argument("--storage", default=str(DEFAULT_STORAGE))
+    parser.add_argument("--save", default="", help="store this run as baseline NAME")
+    parser.add_argument("--compare", default="", help="compare against baseline NAME and fail on regressions")
+    parser.add_argument("--max-regression", type=float, default=0.15, help="allowed slowdown, 0.15 = 15%%")
+    parser.add_argument(
+        "--allow-missing",
+        action="store_true",
+        help="do not fail when a baseline case was skipped or is missing from this run",
+    )
+    parser.add_argument("--json", default="", help="also write this run's results to PATH")
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = _parse_args(argv)
+    crates = _bench_crates()
+    if args.list:
+        print("\n".join(f"{package}  {path.relative_to(ROOT)}" for package, path in crates.items()))
+        return 0
+    unknown = sorted(set(args.crate) - set(crates))
+    if unknown:
+        print(f"No {BENCH} bench in: {', '.join(unknown)}", file=sys.stderr)
+        return 2
+    packages = args.crate or list(crates)
+
+    storage = Path(args.storage)
+    baseline = None
+    if args.compare:
+        baseline_path = storage / f"{args.compare}.json"
+        if not baseline_path.is_file():
+            print(
+                f"No baseline {args.compare!r} at {baseline_path}; run `make bench-rust-save` first",
+                file=sys.stderr,
+            )
+            return 2
+        baseline = load_baseline(baseline_path)
+
+    since = None
+    if not args.collect_only:
+        since = time.time()
+        for package in packages:
+            _run_cargo_bench(package, args)
+
+    # Bench groups are named `<package>.<area>`, so the package prefix selects a crate
+    prefixes = tuple(f"{package}." for package in packages)
+    run = load_criterion(CRITERION, prefixes=prefixes, since=since)
+    run.machine = {**machine_info(), "rustc": _rustc_version()}
+    if not run.results:
+        print(f"No criterion results under {CRITERION}", file=sys.stderr)
+        return 1
+
+    comparisons = compare(run, baseline) if baseline is not None else None
+    print(render_table(run, comparisons, args.max_regression if baseline is not None else None))
+    if args.rate:
+        _print_core_share(run, args.rate)
+
+    if args.json:
+        save_baseline(args.json, run)
+    if args.save:
+        path = save_baseline(storage / f"{args.save}.json", run)
+        print(f"Saved baseline {args.save!r} to {path}")
+
+    if baseline is None:
+        return 0
+    if baseline.machine != run.machine:
+        print(f"Warning: baseline {args.compare!r} was recorded on a different machine", file=sys.stderr)
+    # Only the baseline cases this invocation asked cargo for can be missing
+    selected = [
+        name
+        for name in baseline.results
+        if name.startswith(prefixes) and (not args.filter or re.search(args.filter, name))
+    ]
+    missing = uncompared(run, baseline, selected)
+    for name, reason in missing.items():
+        print(f"Not compared: {name} ({reason})", file=sys.stderr)
+    regressions = [c for c in comparisons or [] if c.regressed(args.max_regression)]
+    if regressions:
+        print(
+            f"{len(regressions)} case(s) regressed beyond {args.max_regression:.0%}: "
+            + ", ".join(f"{c.name} ({c.ratio:.2f}x)" for c in regressions),
+            file=sys.stderr,
+        )
+        return 1
+    if missing and not args.allow_missing:
+        print(
+            f"{len(missing)} baseline case(s) were not compared; pass --allow-missing to accept that",
+            file=sys.stderr,
+        )
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,158 @@
+import argparse
+import asyncio
+import json
+import sys
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any
+
+import lighter_strategy_runner
+import paradex_strategy_runner
+import standx_strategy_runner
+
+RUNNERS = {
+    "PARADEX": paradex_strategy_runner,
+    "LIGHTER": lighter_strategy_runner,
+    "STANDX": standx_strategy_runner,
+}
+
+# Runner flags the single-venue canaries pass for a market attempt
+VENUE_RUNNER_ARGS = {
+    "PARADEX": ["--entry-order-type", "MARKET"],
+    "LIGHTER": [],
+    "STANDX": [],
+}
+
+
+def _parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--paradex-symbols", default="")
+    parser.add_argument("--lighter-symbols", default="")
+    parser.add_argument("--standx-symbols", default="")
+    parser.add_argument("--duration-secs", type=int, default=600)
+    parser.add_argument("--runtime-secs", type=int, default=30)
+    parser.add_argument("--attempt-timeout-secs", type=int, default=120)
+    parser.add_argument("--max-in-flight", type=int, default=2)
+    parser.add_argument("--attempts-per-min", type=float, default=6.0)
+    parser.add_argument("--report-json", default="")
+    parser.add_argument("--event-log", default="")
+    return parser.parse_args()
+
+
+def _symbol_specs(value: str) -> list[tuple[str, str | None]]:
+    """
+    ``BTC-USD-PERP,ETH-USD-PERP:0.05`` -> ``[("BTC-USD-PERP", None), ("ETH-USD-PERP", "0.05")]``.
+    """
+    specs = []
+    for item in value.split(","):
+        item = item.strip()
+        if not item:
+            continue
+        symbol, _, quantity = item.partition(":")
+        specs.append((symbol, quantity or None))
+    return specs
+
+
+def _runner_args(venue: str, args: argparse.Namespace, symbol: str, quantity: str | None):
+    argv = ["--symbol", symbol, "--runtime-secs", str(args.runtime_secs), *VENUE_RUNNER_ARGS[venue]]
+    if quantity is not None:
+        argv += ["--quantity", quantity]
+    return RUNNERS[venue]._parse_args(argv)
+
+
+class _SymbolScenario:
+    def __init__(self, venue: str, runner_args: argparse.Namespace) -> None:
+        self.name = runner_args.symbol
+        self.runtime_secs = runner_args.runtime_secs
+        self._runner = RUNNERS[venue]
+        self._runner_args = runner_args
+
+    def build_strategy(self, attempt: int):
+        return self._runner._prepare_strategy(self._runner_args)
+
+
+def _build_node_config(venue_args: dict[str, argparse.Namespace]):
+    import msgspec
+
+    configs = [RUNNERS[venue]._build_node_config(a) for venue, a in venue_args.items()]
+    return msgspec.structs.replace(
+        configs[0],
+        data_clients={k: v for c in configs for k, v in c.data_clients.items()},
+        exec_clients={k: v for c in configs for k, v in c.exec_clients.items()},
+    )
+
+
+def main() -> int:
+    args = _parse_args()
+    specs = {
+        "PARADEX": _symbol_specs(args.paradex_symbols),
+        "LIGHTER": _symbol_specs(args.lighter_symbols),
+        "STANDX": _symbol_specs(args.standx_symbols),
+    }
+    specs = {venue: s for venue, s in specs.items() if s}
+    if not specs:
+        print("No symbols given (--paradex-symbols/--lighter-symbols/--standx-symbols)")
+        return 2
+
+    from nautilus_adapter.common.canary import CanaryEngine
+    from nautilus_adapter.common.event_log import EventLogWriter
+    from nautilus_adapter.common.soak import SoakHarness, SoakTarget, VenueBudget
+
+    targets: list[SoakTarget] = []
+    venue_args: dict[str, argparse.Namespace] = {}
+    for venue, venue_specs in specs.items():
+        for symbol, quantity in venue_specs:
+            runner_args = _runner_args(venue, args, symbol, quantity)
+            venue_args.setdefault(venue, runner_args)
+            targets.append(SoakTarget(venue, _SymbolScenario(venue, runner_args)))
+        RUNNERS[venue]._load_runtime(venue_args[venue])
+
+    factories: dict[str, tuple[Any, Any]] = {}
+    for venue in venue_args:
+        factories.update(RUNNERS[venue]._client_factories())
+
+    event_log = EventLogWriter(args.event_log) if args.event_log else None
+    engine = CanaryEngine(_build_node_config(venue_args), factories, event_log=event_log)
+    budgets = {venue: VenueBudget(args.max_in_flight, args.attempts_per_min) for venue in specs}
+
+    async def run() -> dict[str, Any]:
+        await engine.start()
+        try:
+            harness = SoakHarness(
+                engine,
+                budgets,
+                duration_secs=args.duration_secs,
+                attempt_timeout_secs=args.attempt_timeout_secs,
+            )
+            return await harness.run(targets)
+        finally:
+            await engine.close()
+
+    try:
+        report = asyncio.run(run())
+    finally:
+        engine.dispose()
+        if event_log is not None:
+            event_log.close()
+
+    report = {
+        "timestamp_utc": datetime.now(timezone.utc).isoformat(),
+        "mode": "MULTI_VENUE_SOAK",
+        "duration_secs": args.duration_secs,
+        "runtime_secs": args.runtime_secs,
+        "startup_secs": engine.startup_secs,
+        **report,
+    }
+
+    if args.report_json:
+        Path(args.report_json).write_text(json.dumps(report, indent=2, sort_keys=True))
+
+    print(json.dumps(report, indent=2, sort_keys=True))
+    clean = report["final_reconciliation_ok"] and all(
+        v["errors"] == 0 and v["timeouts"] == 0 for v in report["venues"].values()
+    )
+    return 0 if clean else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -6,7 +6,7 @@ import threading
 from dataclasses import dataclass
 from decimal import Decimal
 from pathlib import Path
-from typing import Protocol
+from typing import Any, Protocol
 
 from strategy_common import compute_quantity_from_risk
 from strategy_common import resolve_canonical_symbol
@@ -71,7 +71,7 @@ def _build_runtime_plan(
     return RuntimePlan(entry_price=entry, tp_price=tp, sl_trigger_price=sl)
 
 
-def _parse_args() -> argparse.Namespace:
+def _parse_args(argv: list[str] | None = None) -> argparse.Namespace:
     parser = argparse.ArgumentParser()
     parser.add_argument("--symbol", default="BTC-USD-PERP")
     parser.add_argument("--side", choices=["BUY", "SELL"], default="BUY")
@@ -93,7 +93,8 @@ def _parse_args() -> argparse.Namespace:
     parser.add_argument("--testnet", action="store_true", default=False)
     parser.add_argument("--trader-id", default="TRADER-001")
     parser.add_argument("--env-file", default="crates/adapters/StandX/env_standx")
-    return parser.parse_args()
+    parser.add_argument("--event-log", default="")
+    return parser.parse_args(argv)
 
 
 def _build_strategy():
@@ -234,31 +235,66 @@ def _build_strategy():
     return StandXSignalStrategyConfig, StandXSignalStrategy
 
 
-def _run(args: argparse.Namespace) -> None:
+def _load_runtime(args: argparse.Namespace) -> None:
     repo_root = Path(__file__).resolve().parent.parent
     _load_env_file((repo_root / args.env_file).resolve())
     _ensure_standx_extension(repo_root)
 
+
+def _client_factories() -> dict[str, tuple[Any, Any]]:
+    from nautilus_adapter.adapters.StandX.factories import (
+        StandXLiveDataClientFactory,
+        StandXLiveExecClientFactory,
+    )
+
+    return {"STANDX": (StandXLiveDataClientFactory, StandXLiveExecClientFactory)}
+
+
+def _build_node_config(args: argparse.Namespace):
     from nautilus_trader.config import (
         InstrumentProviderConfig,
         LiveExecEngineConfig,
         TradingNodeConfig,
     )
-    from nautilus_trader.live.node import TradingNode
-    from nautilus_trader.model.identifiers import InstrumentId
     from nautilus_adapter.adapters.StandX.config import (
         StandXDataClientConfig,
         StandXExecClientConfig,
     )
-    from nautilus_adapter.adapters.StandX.factories import (
-        StandXLiveDataClientFactory,
-        StandXLiveExecClientFactory,
-        _build_standx_http_client,
+
+    data_cfg = StandXDataClientConfig(
+        is_testnet=args.testnet,
+        instrument_provider=InstrumentProviderConfig(load_all=True),
+    )
+    exec_cfg = StandXExecClientConfig(
+        is_testnet=args.testnet,
+        instrument_provider=InstrumentProviderConfig(load_all=True),
+        reconciliation_lookback_mins=args.reconciliation_lookback_mins,
+        reconciliation_page_size=args.reconciliation_page_size,
+    )
+
+    return TradingNodeConfig(
+        trader_id=args.trader_id,
+        exec_engine=LiveExecEngineConfig(
+            reconciliation=True,
+            reconciliation_lookback_mins=args.reconciliation_lookback_mins,
+        ),
+        data_clients={"STANDX": data_cfg},
+        exec_clients={"STANDX": exec_cfg},
     )
+
+
+def _prepare_strategy(args: argparse.Namespace, backend_client: Any = None):
+    """
+    Resolve the symbol, size the order and build the strategy.
+    """
+    from nautilus_trader.model.identifiers import InstrumentId
+    from nautilus_adapter.adapters.StandX.config import StandXExecClientConfig
+    from nautilus_adapter.adapters.StandX.factories import _build_standx_http_client
     from nautilus_adapter.adapters.StandX.providers import StandXInstrumentProvider
 
-    backend_cfg = StandXExecClientConfig(is_testnet=args.testnet)
-    backend_client = _build_standx_http_client(backend_cfg)
+    if backend_client is None:
+        backend_cfg = StandXExecClientConfig(is_testnet=args.testnet)
+        backend_client = _build_standx_http_client(backend_cfg)
     if backend_client is None:
         raise RuntimeError("Failed to build StandX HTTP client from env/config")
 
@@ -314,29 +350,8 @@ def _run(args: argparse.Namespace) -> None:
         },
     )
 
-    data_cfg = StandXDataClientConfig(
-        is_testnet=args.testnet,
-        instrument_provider=InstrumentProviderConfig(load_all=True),
-    )
-    exec_cfg = StandXExecClientConfig(
-        is_testnet=args.testnet,
-        instrument_provider=InstrumentProviderConfig(load_all=True),
-        reconciliation_lookback_mins=args.reconciliation_lookback_mins,
-        reconciliation_page_size=args.reconciliation_page_size,
-    )
-
-    node_cfg = TradingNodeConfig(
-        trader_id=args.trader_id,
-        exec_engine=LiveExecEngineConfig(
-            reconciliation=True,
-            reconciliation_lookback_mins=args.reconciliation_lookback_mins,
-        ),
-        data_clients={"STANDX": data_cfg},
-        exec_clients={"STANDX": exec_cfg},
-    )
-
     strategy_config_cls, strategy_cls = _build_strategy()
-    strategy = strategy_cls(
+    return strategy_cls(
         strategy_config_cls(
             instrument_id=InstrumentId.from_str(f"{resolved_instrument_symbol}.STANDX"),
             side=args.side,
@@ -352,9 +367,17 @@ def _run(args: argparse.Namespace) -> None:
         ),
     )
 
-    node = TradingNode(config=node_cfg)
-    node.add_data_client_factory("STANDX", StandXLiveDataClientFactory)
-    node.add_exec_client_factory("STANDX", StandXLiveExecClientFactory)
+
+def _run(args: argparse.Namespace) -> None:
+    _load_runtime(args)
+
+    from nautilus_trader.live.node import TradingNode
+
+    strategy = _prepare_strategy(args)
+    node = TradingNode(config=_build_node_config(args))
+    for name, (data_factory, exec_factory) in _client_factories().items():
+        node.add_data_client_factory(name, data_factory)
+        node.add_exec_client_factory(name, exec_factory)
     node.trader.add_strategy(strategy)
     node.build()
 
@@ -364,6 +387,13 @@ def _run(args: argparse.Namespace) -> None:
     node.kernel.msgbus.subscribe("events.order*", _bus_log)
     node.kernel.msgbus.subscribe("events.position*", _bus_log)
 
+    event_log = None
+    if args.event_log:
+        from nautilus_adapter.common.event_log import EventLogWriter
+
+        event_log = EventLogWriter(args.event_log)
+        event_log.attach(node)
+
     stop_timer: threading.Timer | None = None
     try:
         stop_timer = threading.Timer(args.runtime_secs, node.stop)
@@ -374,6 +404,8 @@ def _run(args: argparse.Namespace) -> None:
         if stop_timer is not None:
             stop_timer.cancel()
         node.dispose()
+        if event_log is not None:
+            event_log.close()
 
 
 def main() -> None:
@@ -0,0 +1,179 @@
+import argparse
+import asyncio
+import json
+import sys
+from decimal import Decimal
+from pathlib import Path
+
+from nautilus_adapter.sim.faults import FaultConfig, FaultInjector
+from nautilus_adapter.sim.lighter import LighterDialect
+from nautilus_adapter.sim.matching import MatchingEngine, SimMarket
+from nautilus_adapter.sim.paradex import ParadexDialect
+from nautilus_adapter.sim.replay import ResponseRecorder, ResponseReplay
+from nautilus_adapter.sim.server import VenueSimServer
+from nautilus_adapter.sim.standx import StandXDialect
+
+DIALECTS = {
+    "PARADEX": ParadexDialect,
+    "LIGHTER": LighterDialect,
+    "STANDX": StandXDialect,
+}
+
+# symbol, market id, tick size, size increment, starting mid
+DEFAULT_MARKETS = {
+    "PARADEX": [
+        ("BTC-USD-PERP", 0, "0.1", "0.001", "60000"),
+        ("ETH-USD-PERP", 1, "0.01", "0.01", "3000"),
+    ],
+    "LIGHTER": [
+        ("ETH", 0, "0.01", "0.0001", "3000"),
+        ("BTC", 1, "0.1", "0.00001", "60000"),
+    ],
+    "STANDX": [
+        ("BTC-USD", 1, "0.1", "0.001", "60000"),
+        ("ETH-USD", 2, "0.01", "0.01", "3000"),
+    ],
+}
+
+
+def _parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Local Lighter/Paradex/StandX venue simulator")
+    parser.add_argument("--venues", default="PARADEX,LIGHTER,STANDX")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument(
+        "--market",
+        action="append",
+        default=[],
+        help="VENUE:SYMBOL:MARKET_ID:TICK:SIZE_INCREMENT:MID, replaces the venue's default markets",
+    )
+    parser.add_argument("--house-levels", type=int, default=10)
+    parser.add_argument("--house-size", default="100")
+    parser.add_argument("--initial-balance", default="100000")
+    parser.add_argument("--latency-ms", type=float, default=0.0)
+    parser.add_argument("--jitter-ms", type=float, default=0.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--error-status", type=int, default=500)
+    parser.add_argument("--rate-limit-rate", type=float, default=0.0)
+    parser.add_argument("--max-rps", type=float, default=0.0)
+    parser.add_argument("--ws-drop-rate", type=float, default=0.0)
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--replay", action="append", default=[], help="VENUE=PATH of a JSONL recording")
+    parser.add_argument(
+        "--record",
+        action="append",
+        default=[],
+        help="VENUE=UPSTREAM_URL; proxy that venue to the live API and record its responses",
+    )
+    parser.add_argument("--record-dir", default="sim_recordings")
+    parser.add_argument("--lighter-public-key", default=None)
+    return parser.parse_args(argv)
+
+
+def _venue_pairs(items: list[str], flag: str) -> dict[str, str]:
+    pairs = {}
+    for item in items:
+        venue, sep, value = item.partition("=")
+        if not sep or not value:
+            raise SystemExit(f"{flag} expects VENUE=VALUE, got {item!r}")
+        pairs[venue.strip().upper()] = value.strip()
+    return pairs
+
+
+def _markets(args: argparse.Namespace) -> dict[str, list[SimMarket]]:
+    specs: dict[str, list[tuple]] = {}
+    for item in args.market:
+        parts = item.split(":")
+        if len(parts) != 6:
+            raise SystemExit(f"--market expects VENUE:SYMBOL:MARKET_ID:TICK:SIZE_INCREMENT:MID, got {item!r}")
+        venue, symbol, market_id, tick, increment, mid = parts
+        specs.setdefault(venue.upper(), []).append((symbol, int(market_id), tick, increment, mid))
+    return {
+        venue: [
+            SimMarket(symbol, market_id, Decimal(tick), Decimal(increment), Decimal(mid))
+            for symbol, market_id, tick, increment, mid in specs.get(venue, DEFAULT_MARKETS[venue])
+        ]
+        for venue in DIALECTS
+    }
+
+
+def build_server(args: argparse.Namespace) -> tuple[VenueSimServer, list[ResponseRecorder]]:
+    venues = [v.strip().upper() for v in args.venues.split(",") if v.strip()]
+    unknown = [v for v in venues if v not in DIALECTS]
+    if unknown:
+        raise SystemExit(f"Unknown venue(s) {unknown}; expected {sorted(DIALECTS)}")
+    replays = _venue_pairs(args.replay, "--replay")
+    upstreams = _venue_pairs(args.record, "--record")
+    markets = _markets(args)
+    fault_config = FaultConfig(
+        latency_ms=args.latency_ms,
+        jitter_ms=args.jitter_ms,
+        error_rate=args.error_rate,
+        error_status=args.error_status,
+        rate_limit_rate=args.rate_limit_rate,
+        max_requests_per_sec=args.max_rps,
+        ws_drop_rate=args.ws_drop_rate,
+        seed=args.seed,
+    )
+
+    dialects = []
+    recorders = []
+    for venue in venues:
+        engine = MatchingEngine(
+            markets[venue],
+            house_levels=args.house_levels,
+            house_size=Decimal(args.house_size),
+            initial_balance=Decimal(args.initial_balance),
+        )
+        recorder = None
+        if venue in upstreams:
+            path = Path(args.record_dir) / f"{venue.lower()}.jsonl"
+            recorder = ResponseRecorder(upstreams[venue], path)
+            recorders.append(recorder)
+        replay = ResponseReplay.from_path(replays[venue]) if venue in replays else None
+        kwargs = {}
+        if venue == "LIGHTER" and args.lighter_public_key:
+            kwargs["api_public_key"] = args.lighter_public_key
+        dialects.append(
+            DIALECTS[venue](
+                engine,
+                faults=FaultInjector(fault_config),
+                replay=replay,
+                recorder=recorder,
+                **kwargs,
+            ),
+        )
+    return VenueSimServer(dialects, host=args.host, port=args.port), recorders
+
+
+def main() -> int:
+    args = _parse_args()
+    server, recorders = build_server(args)
+
+    async def run() -> None:
+        await server.start()
+        urls = {
+            venue: {
+                "base_url_http": server.base_url_http(venue),
+                "base_url_ws": server.base_url_ws(venue),
+            }
+            for venue in server.dialects
+        }
+        print(json.dumps(urls, indent=2), flush=True)
+        try:
+            await asyncio.Event().wait()
+        finally:
+            await server.stop()
+
+    try:
+        asyncio.run(run())
+    except KeyboardInterrupt:
+        pass
+    finally:
+        for recorder in recorders:
+            recorder.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
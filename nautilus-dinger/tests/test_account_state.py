@@ -0,0 +1,42 @@
+"""
+Account state change suppression.
+"""
+import os
+import sys
+from decimal import Decimal
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from nautilus_adapter.common.account_state import AccountSnapshot, AccountStateFilter
+
+
+def _snapshot(total: str, free: str, margin: str = "0") -> AccountSnapshot:
+    total_d, free_d = Decimal(total), Decimal(free)
+    return AccountSnapshot(
+        total=total_d,
+        free=free_d,
+        locked=total_d - free_d,
+        initial_margin=Decimal(margin),
+    )
+
+
+def test_only_changes_beyond_threshold_are_published():
+    account_filter = AccountStateFilter(min_change=Decimal("0.01"))
+
+    assert account_filter.should_publish(_snapshot("1000", "900"))
+    assert not account_filter.should_publish(_snapshot("1000", "900"))
+    assert not account_filter.should_publish(_snapshot("1000.005", "900"))
+    assert account_filter.should_publish(_snapshot("1000", "900", margin="5"))
+    assert account_filter.suppressed == 2
+
+    # Small drifts are measured against the last *published* snapshot
+    for _ in range(5):
+        assert not account_filter.should_publish(_snapshot("1000.004", "900", margin="5"))
+    assert account_filter.should_publish(_snapshot("1000.02", "900", margin="5"))
+
+
+def test_reset_forces_next_publish():
+    account_filter = AccountStateFilter()
+    account_filter.should_publish(_snapshot("10", "10"))
+    account_filter.reset()
+    assert account_filter.should_publish(_snapshot("10", "10"))
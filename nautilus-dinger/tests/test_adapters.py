@@ -199,3 +199,101 @@ def test_provider_module_has_instrument_provider(exchange):
         if "InstrumentProvider" in name and isinstance(getattr(prov_mod, name), type)
     ]
     assert len(provider_classes) > 0, f"{exchange['module_name']} missing InstrumentProvider class"
+
+
+@pytest.mark.parametrize("is_testnet", [False, True])
+def test_standx_http_client_private_stream_follows_config(monkeypatch, is_testnet):
+    """The backend client gets the configured WS URL and environment for its private stream."""
+    from types import SimpleNamespace
+
+    factories = importlib.import_module("nautilus_adapter.adapters.StandX.factories")
+    calls = []
+    backend = SimpleNamespace(PyStandXHttpClient=lambda *args: calls.append(args))
+    monkeypatch.setattr(factories, "_import_standx_backend", lambda: backend)
+    config = factories.StandXExecClientConfig(
+        api_key="token",
+        api_secret="secret",
+        base_url_ws="ws://127.0.0.1:9000/standx/ws-stream/v1",
+        is_testnet=is_testnet,
+    )
+
+    factories._build_standx_http_client(config)
+
+    assert calls[0][3:] == ("ws://127.0.0.1:9000/standx/ws-stream/v1", is_testnet)
+
+
+def test_standx_private_stream_batch_splits_into_order_fill_and_account_items():
+    """One native batch becomes queue items keyed so order updates coalesce per order."""
+    import json
+
+    from nautilus_adapter.adapters.StandX.execution import StandXExecutionClient
+
+    batch = json.dumps(
+        [
+            {"channel": "order", "data": {"id": 7, "status": "open"}},
+            {"channel": "trade", "data": [{"id": 1, "order_id": 7}]},
+            {"channel": "balance", "data": {"collateral": "100"}},
+            "not-a-message",
+        ],
+    )
+
+    items = StandXExecutionClient._split_private_payload(batch)
+
+    assert [(kind, key) for kind, key, _ in items] == [
+        ("order", "7"),
+        ("fill", None),
+        ("account", "account"),
+    ]
+
+
+def test_standx_private_stream_tolerates_an_empty_balance_batch():
+    from nautilus_adapter.adapters.StandX.execution import StandXExecutionClient
+
+    items = StandXExecutionClient._split_private_payload({"channel": "balance", "data": []})
+
+    assert items == [("account", "account", {})]
+
+
+def test_standx_disconnect_cancels_a_pending_account_refresh():
+    import asyncio
+    from types import SimpleNamespace
+
+    from nautilus_adapter.adapters.StandX.execution import StandXExecutionClient
+
+    async def run():
+        refreshes = []
+
+        async def update_account_state():
+            refreshes.append(True)
+
+        client = SimpleNamespace(
+            _log=SimpleNamespace(info=lambda msg, color=None: None, warning=lambda msg: None),
+            _account_refresh_debounce_secs=3600,
+            _account_refresh_pending=False,
+            _account_refresh_task=None,
+            _account_poll_task=None,
+            _latency_log_task=None,
+            _revalidate_task=None,
+            _private_queue=None,
+            _private_sync_task=None,
+            _ws_tape=None,
+            _client=None,
+            create_task=asyncio.ensure_future,
+            _update_account_state=update_account_state,
+        )
+        client._debounced_account_refresh = lambda: StandXExecutionClient._debounced_account_refresh(client)
+
+        StandXExecutionClient._request_account_refresh(client)
+        StandXExecutionClient._request_account_refresh(client)
+        task = client._account_refresh_task
+        assert task is not None
+
+        await StandXExecutionClient._disconnect(client)
+        await asyncio.sleep(0)
+
+        assert task.cancelled()
+        assert client._account_refresh_task is None
+        assert not client._account_refresh_pending
+        assert refreshes == []
+
+    asyncio.run(run())
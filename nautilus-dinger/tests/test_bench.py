@@ -0,0 +1,137 @@
+"""
+Benchmark runner: calibration, case kinds, baselines and regression checks.
+"""
+import json
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from nautilus_adapter.common.bench import (
+    BenchRun,
+    BenchSkipped,
+    BenchStats,
+    BenchSuite,
+    compare,
+    load_baseline,
+    load_criterion,
+    measure,
+    render_table,
+    save_baseline,
+    uncompared,
+)
+
+
+class _FakeClock:
+    def __init__(self) -> None:
+        self.now = 0
+
+    def __call__(self) -> int:
+        return self.now
+
+
+def _stats(name: str, median_ns: float) -> BenchStats:
+    return BenchStats(name, 5, 10, median_ns, median_ns, median_ns, 0.0)
+
+
+def test_measure_calibrates_iterations_to_the_round_length():
+    clock = _FakeClock()
+
+    def call():
+        clock.now += 1_000
+
+    stats = measure("case", call, rounds=3, min_round_secs=0.001, clock=clock)
+    assert stats.iterations >= 1_000
+    assert stats.rounds == 3
+    assert stats.median_ns == stats.min_ns == 1_000
+
+
+def test_suite_runs_sync_async_and_generator_cases():
+    suite = BenchSuite()
+    calls = []
+    torn_down = []
+
+    @suite.case("sync")
+    def _(loop):
+        return lambda: calls.append("sync")
+
+    @suite.case("async")
+    def _(loop):
+        async def call():
+            calls.append("async")
+
+        return call
+
+    @suite.case("generator")
+    def _(loop):
+        try:
+            yield lambda: calls.append("generator")
+        finally:
+            torn_down.append(True)
+
+    @suite.case("native")
+    def _(loop):
+        raise BenchSkipped("module not built")
+
+    run = suite.run(rounds=1, min_round_secs=0)
+    assert list(run.results) == ["sync", "async", "generator"]
+    assert run.skipped == {"native": "module not built"}
+    assert set(calls) == {"sync", "async", "generator"}
+    assert torn_down == [True]
+    assert suite.select(["*sync"]) == ["sync", "async"]
+
+
+def test_baseline_round_trip_and_regression_check(tmp_path):
+    baseline = BenchRun(results={"fast": _stats("fast", 100.0), "slow": _stats("slow", 100.0)})
+    path = save_baseline(tmp_path / "main.json", baseline)
+    loaded = load_baseline(path)
+    assert loaded.results == baseline.results
+
+    current = BenchRun(results={"fast": _stats("fast", 90.0), "slow": _stats("slow", 130.0), "new": _stats("new", 1.0)})
+    comparisons = compare(current, loaded)
+    assert [c.name for c in comparisons] == ["fast", "slow"]
+    assert [c.name for c in comparisons if c.regressed(0.15)] == ["slow"]
+    assert not any(c.regressed(0.5) for c in comparisons)
+    assert "REGRESSED" in render_table(current, comparisons, 0.15)
+
+
+def test_uncompared_names_the_baseline_cases_a_run_skipped_or_lost():
+    baseline = BenchRun(results={n: _stats(n, 100.0) for n in ("kept", "skipped", "gone", "filtered")})
+    current = BenchRun(results={"kept": _stats("kept", 100.0)}, skipped={"skipped": "binding not built"})
+
+    assert uncompared(current, baseline) == {
+        "skipped": "skipped: binding not built",
+        "gone": "missing from this run",
+        "filtered": "missing from this run",
+    }
+    # A filtered run only answers for the cases it selected
+    assert uncompared(current, baseline, ["kept", "skipped", "gone"]) == {
+        "skipped": "skipped: binding not built",
+        "gone": "missing from this run",
+    }
+
+
+def _criterion_result(root, full_id, elements, median_ns):
+    new = root.joinpath(*full_id.split("/"), "new")
+    new.mkdir(parents=True)
+    throughput = {"Elements": elements} if elements else None
+    new.joinpath("benchmark.json").write_text(json.dumps({"full_id": full_id, "throughput": throughput}))
+    estimate = lambda v: {"point_estimate": v}
+    new.joinpath("estimates.json").write_text(
+        json.dumps({"median": estimate(median_ns), "mean": estimate(median_ns), "std_dev": estimate(0.0)})
+    )
+    new.joinpath("sample.json").write_text(json.dumps({"iters": [10, 20], "times": [10 * median_ns, 18 * median_ns]}))
+
+
+def test_load_criterion_reports_per_element_times(tmp_path):
+    _criterion_result(tmp_path, "paradex.signing/sign_order", 1, 120_000.0)
+    _criterion_result(tmp_path, "paradex.rest/decode_orders_history", 50, 50_000.0)
+    _criterion_result(tmp_path, "standx.ws/depth_book", None, 900.0)
+
+    run = load_criterion(tmp_path, prefixes=["paradex."])
+    assert sorted(run.results) == ["paradex.rest.decode_orders_history", "paradex.signing.sign_order"]
+    page = run.results["paradex.rest.decode_orders_history"]
+    assert page.median_ns == 1_000.0 and page.min_ns == 900.0
+    assert page.rounds == 2 and page.iterations == 30
+    assert load_criterion(tmp_path).results["standx.ws.depth_book"].median_ns == 900.0
+    assert load_criterion(tmp_path, since=2**40).results == {}
@@ -0,0 +1,110 @@
+"""
+In-process canary engine: attempt summaries and strategy lifecycle on one node.
+"""
+import asyncio
+import os
+import sys
+from types import SimpleNamespace
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from nautilus_trader.config import LoggingConfig, TradingNodeConfig
+from nautilus_trader.model.enums import ContingencyType
+from nautilus_trader.trading.strategy import Strategy
+
+from nautilus_adapter.common.canary import CanaryAttempt, CanaryEngine, CanaryEventLog
+
+
+def _event(kind: str, client_order_id: str, strategy_id: str = "S-001", **fields):
+    # Only the class name and attributes matter to the event log
+    return type(kind, (SimpleNamespace,), {})(
+        strategy_id=strategy_id,
+        client_order_id=client_order_id,
+        **fields,
+    )
+
+
+def test_attempt_summary_follows_the_bracket_entry():
+    log = CanaryEventLog()
+    log(_event("OrderInitialized", "O-0", strategy_id="S-000"))
+    mark = len(log)
+    for event in [
+        _event("OrderInitialized", "O-1", contingency_type=ContingencyType.OTO),
+        _event("OrderInitialized", "O-2", contingency_type=ContingencyType.OUO),
+        _event("OrderSubmitted", "O-1"),
+        _event("OrderAccepted", "O-1"),
+        _event("OrderFilled", "O-1"),
+        _event("OrderCanceled", "O-2"),
+    ]:
+        log(event)
+
+    attempt = CanaryAttempt(
+        attempt=1,
+        scenario="bracket",
+        strategy_id="S-001",
+        elapsed_secs=0.0,
+        events=log.since(mark, "S-001"),
+        reconciliation_ok=True,
+    )
+    assert attempt.entry_client_order_id == "O-1"
+    assert attempt.kinds("O-1") == {"OrderInitialized", "OrderSubmitted", "OrderAccepted", "OrderFilled"}
+    assert attempt.entry_terminal_state == "FILLED"
+    assert log.since(0, "S-000")[0].client_order_id == "O-0"
+
+
+def test_attempt_summary_without_bracket_uses_last_order():
+    events = CanaryEventLog()
+    events(_event("OrderInitialized", "O-1", contingency_type=ContingencyType.NO_CONTINGENCY))
+    events(_event("OrderExpired", "O-1"))
+    attempt = CanaryAttempt(1, "market", "S-001", 0.0, events.events, reconciliation_ok=True)
+    assert attempt.entry_client_order_id == "O-1"
+    assert attempt.entry_terminal_state == "CANCELED"
+
+
+class _IdleScenario:
+    name = "idle"
+    runtime_secs = 0.05
+
+    def build_strategy(self, attempt: int) -> Strategy:
+        return Strategy()
+
+
+class _BrokenScenario:
+    name = "broken"
+    runtime_secs = 0.05
+
+    def build_strategy(self, attempt: int) -> Strategy:
+        raise RuntimeError("no reference prices")
+
+
+def test_engine_runs_each_attempt_as_a_fresh_strategy_on_one_node():
+    config = TradingNodeConfig(
+        logging=LoggingConfig(log_level="ERROR"),
+        timeout_post_stop=0.0,
+        timeout_disconnection=0.1,
+    )
+    engine = CanaryEngine(config, {}, poll_interval_secs=0.01)
+
+    async def run():
+        await engine.start()
+        node = engine.node
+        try:
+            attempts = [await engine.run_attempt(_IdleScenario(), i) for i in (1, 2)]
+            broken = await engine.run_attempt(_BrokenScenario(), 3)
+            # Every attempt reused the node and left no strategy behind
+            assert engine.node is node
+            assert node.trader.strategy_ids() == []
+        finally:
+            await engine.close()
+        return attempts, broken
+
+    try:
+        attempts, broken = asyncio.run(run())
+    finally:
+        engine.dispose()
+
+    assert [a.strategy_id for a in attempts] == ["Strategy-001", "Strategy-002"]
+    assert all(a.reconciliation_ok and not a.errors and not a.timed_out for a in attempts)
+    assert attempts[0].entry_client_order_id is None
+    assert broken.strategy_id is None
+    assert broken.errors == ["RuntimeError: no reference prices"]
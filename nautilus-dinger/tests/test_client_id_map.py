@@ -0,0 +1,70 @@
+"""
+Persistent client order id <-> Lighter client_order_index mapping.
+"""
+import os
+import sys
+from types import SimpleNamespace
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from nautilus_trader.model.identifiers import ClientOrderId
+
+from nautilus_adapter.adapters.Lighter.backend import LighterSdkBackend
+from nautilus_adapter.adapters.Lighter.execution import LighterExecutionClient
+from nautilus_adapter.common.client_id_map import ClientOrderIdStore
+
+
+def test_mapping_survives_reload_and_skips_torn_lines(tmp_path):
+    path = tmp_path / "lighter.log"
+    store = ClientOrderIdStore(path)
+    index = LighterSdkBackend._client_order_index("O-20260101-001")
+    store.put("O-20260101-001", index)
+    store.put("O-20260101-002", 42)
+    store.close()
+
+    with path.open("a") as f:
+        f.write('[7, "O-torn')
+
+    reloaded = ClientOrderIdStore(path)
+    assert reloaded.client_order_id_for(index) == "O-20260101-001"
+    assert reloaded.index_for("O-20260101-002") == 42
+    assert reloaded.client_order_id_for(7) is None
+
+
+def test_store_is_bounded_and_compacts_its_log(tmp_path):
+    path = tmp_path / "lighter.log"
+    store = ClientOrderIdStore(path, max_entries=3, compact_min_lines=4)
+    for i in range(10):
+        store.put(f"O-{i}", 1_000 + i)
+
+    assert len(store) == 3
+    assert store.client_order_id_for(1_000) is None
+    assert store.client_order_id_for(1_009) == "O-9"
+    # Compaction keeps the log within twice the live entries
+    assert len(path.read_text().splitlines()) <= 2 * len(store)
+
+    store.close()
+    assert len(path.read_text().splitlines()) == 3
+    assert ClientOrderIdStore(path).index_for("O-8") == 1_008
+
+
+def test_repeated_put_does_not_grow_log(tmp_path):
+    path = tmp_path / "lighter.log"
+    store = ClientOrderIdStore(path)
+    for _ in range(5):
+        store.put("O-1", 11)
+    store.close()
+    assert path.read_text().splitlines() == ['[11, "O-1"]']
+
+
+def test_execution_client_resolves_hashed_index_to_original_id():
+    store = ClientOrderIdStore(None)
+    index = LighterSdkBackend._client_order_index("O-20260101-001")
+    store.put("O-20260101-001", index)
+    client = SimpleNamespace(_client_id_store=store)
+
+    resolve = LighterExecutionClient._client_order_id_from_venue
+    assert resolve(client, index) == ClientOrderId("O-20260101-001")
+    assert resolve(client, str(index)) == ClientOrderId("O-20260101-001")
+    assert resolve(client, 5) == ClientOrderId("5")
+    assert resolve(client, None) is None
@@ -0,0 +1,93 @@
+"""
+JSONL event log: writing real order events, reconciliation records and the
+indexed read-back used by assertions.
+"""
+import asyncio
+import os
+import sys
+from types import SimpleNamespace
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from nautilus_trader.common.component import TestClock
+from nautilus_trader.common.factories import OrderFactory
+from nautilus_trader.model.enums import OrderSide, OrderType
+from nautilus_trader.model.identifiers import InstrumentId, StrategyId, TraderId
+from nautilus_trader.model.objects import Price, Quantity
+from nautilus_trader.test_kit.stubs.events import TestEventStubs
+
+from nautilus_adapter.common.event_log import EventLogIndex, EventLogWriter
+
+ETH = InstrumentId.from_str("ETH-USD-PERP.PARADEX")
+
+
+def _bracket():
+    factory = OrderFactory(TraderId("TRADER-001"), StrategyId("S-001"), TestClock())
+    return factory.bracket(
+        instrument_id=ETH,
+        order_side=OrderSide.BUY,
+        quantity=Quantity.from_str("0.01"),
+        entry_order_type=OrderType.MARKET,
+        tp_price=Price.from_str("2000.00"),
+        sl_trigger_price=Price.from_str("1800.00"),
+    )
+
+
+def test_bracket_events_round_trip_through_the_index(tmp_path):
+    path = tmp_path / "events.jsonl"
+    first, second = _bracket(), _bracket()
+    with EventLogWriter(path, clock=lambda: 7) as writer:
+        for order in first.orders + second.orders:
+            writer(order.init_event)
+        entry = second.orders[0]
+        writer(TestEventStubs.order_submitted(entry))
+        writer(TestEventStubs.order_accepted(entry))
+    # A runner killed mid-write leaves a partial last line
+    with path.open("a") as f:
+        f.write('{"kind":"OrderFill')
+
+    index = EventLogIndex.from_path(path)
+    assert len(index) == 8
+    ids = index.latest_bracket()
+    assert ids == tuple(o.client_order_id.value for o in second.orders)
+    assert index.kinds(ids[0]) == {"OrderInitialized", "OrderSubmitted", "OrderAccepted"}
+    assert not index.has("OrderAccepted", ids[1])
+
+    record = index.events("OrderAccepted", ids[0])[0]
+    assert record["category"] == "order"
+    assert record["ts_recv"] == 7
+    assert isinstance(record["ts_event"], int)
+
+
+def test_attach_records_startup_then_runtime_reconciliation(tmp_path):
+    subscriptions = []
+    outcomes = iter([True, False])
+
+    async def reconcile_execution_state(timeout_secs: float = 10.0) -> bool:
+        return next(outcomes)
+
+    now = iter(range(100, 1000, 10))
+    node = SimpleNamespace(
+        trader=SimpleNamespace(is_running=False),
+        kernel=SimpleNamespace(
+            msgbus=SimpleNamespace(subscribe=lambda topic, handler: subscriptions.append(topic)),
+            exec_engine=SimpleNamespace(reconcile_execution_state=reconcile_execution_state),
+            clock=SimpleNamespace(timestamp_ns=lambda: next(now)),
+        ),
+    )
+    path = tmp_path / "events.jsonl"
+    with EventLogWriter(path) as writer:
+        writer.attach(node)
+        assert asyncio.run(node.kernel.exec_engine.reconcile_execution_state(timeout_secs=1.0))
+        node.trader.is_running = True
+        assert not asyncio.run(node.kernel.exec_engine.reconcile_execution_state())
+
+    index = EventLogIndex.from_path(path)
+    assert subscriptions == ["events.order*", "events.position*"]
+    assert [(r["phase"], r["ok"]) for r in index.reconciliations()] == [
+        ("startup", True),
+        ("runtime", False),
+    ]
+    assert index.reconciliations()[0]["duration_ns"] == 10
+    assert index.reconciliation_ok("startup")
+    assert not index.reconciliation_ok()
@@ -0,0 +1,235 @@
+"""
+Historical fetch helpers: range splitting, paging, rate budget and catalog cache.
+"""
+import asyncio
+import json
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from nautilus_trader.model.data import BarType, TradeTick
+from nautilus_trader.model.enums import AggressorSide
+from nautilus_trader.model.identifiers import InstrumentId, TradeId
+from nautilus_trader.model.objects import Price, Quantity
+
+from nautilus_adapter.common.historical import (
+    HistoricalDataCache,
+    RequestBudget,
+    aggregate_trade_bars,
+    fetch_range,
+    load_cached_range,
+    split_range,
+)
+
+INSTRUMENT_ID = InstrumentId.from_str("BTC-USD-PERP.STANDX")
+
+
+def _tick(ts_ms: int, price: str = "100.0", size: str = "1.0") -> TradeTick:
+    return TradeTick(
+        instrument_id=INSTRUMENT_ID,
+        price=Price.from_str(price),
+        size=Quantity.from_str(size),
+        aggressor_side=AggressorSide.BUYER,
+        trade_id=TradeId(str(ts_ms)),
+        ts_event=ts_ms * 1_000_000,
+        ts_init=ts_ms * 1_000_000,
+    )
+
+
+def test_split_range_covers_range_without_overlap():
+    assert split_range(0, 249, 100) == [(0, 99), (100, 199), (200, 249)]
+    assert split_range(5, 5, 100) == [(5, 5)]
+    assert split_range(10, 5, 100) == []
+
+
+def test_fetch_range_pages_each_window_and_merges_in_order():
+    venue = [{"timestamp": ts, "id": ts} for ts in range(0, 1_000, 5)]
+    calls = []
+
+    async def fetch_page(cursor_ms, end_ms):
+        calls.append(cursor_ms)
+        return [r for r in venue if cursor_ms <= r["timestamp"] <= end_ms][:7]
+
+    async def run():
+        budget = RequestBudget(max_requests_per_second=1_000, max_concurrency=3)
+        return await fetch_range(
+            fetch_page,
+            0,
+            999,
+            lambda r: r["timestamp"],
+            budget,
+            page_size=7,
+            span_ms=250,
+        ), budget
+
+    rows, budget = asyncio.run(run())
+
+    assert [r["timestamp"] for r in rows] == list(range(0, 1_000, 5))
+    assert budget.requests == len(calls) > 4
+
+
+def _newest_first_venue(timestamps, page_size, calls=None):
+    venue = [{"timestamp": ts, "price": "100.0", "size": "1.0", "side": "BUY"} for ts in timestamps]
+
+    def page(start_ms, end_ms):
+        if calls is not None:
+            calls.append((start_ms, end_ms))
+        rows = [r for r in venue if start_ms <= r["timestamp"] <= end_ms]
+        return list(reversed(rows))[:page_size]
+
+    return page
+
+
+def test_fetch_range_pages_newest_first_venue_backward():
+    calls = []
+    page = _newest_first_venue(range(0, 100, 10), 3, calls)
+
+    async def fetch_page(start_ms, end_ms):
+        return page(start_ms, end_ms)
+
+    async def run():
+        budget = RequestBudget(max_requests_per_second=1_000)
+        return await fetch_range(
+            fetch_page, 0, 99, lambda r: r["timestamp"], budget, page_size=3, newest_first=True,
+        )
+
+    rows = asyncio.run(run())
+
+    assert [r["timestamp"] for r in rows] == list(range(0, 100, 10))
+    # The lower bound stays put while the upper bound walks back to the oldest row seen
+    assert calls[:2] == [(0, 99), (0, 70)]
+
+
+def test_paradex_trade_history_pages_newest_first_backend():
+    from types import SimpleNamespace
+
+    from nautilus_trader.cache.cache import Cache
+    from nautilus_trader.common.component import LiveClock, MessageBus
+    from nautilus_trader.model.identifiers import ClientId, TraderId, Venue
+
+    from nautilus_adapter.adapters.Paradex.data import ParadexDataClient
+    from nautilus_adapter.adapters.Paradex.providers import ParadexInstrumentProvider
+
+    market = {
+        "symbol": "BTC-USD-PERP",
+        "base_currency": "BTC",
+        "quote_currency": "USD",
+        "settlement_currency": "USDC",
+        "order_size_increment": "0.001",
+        "price_tick_size": "0.1",
+        "asset_kind": "PERP",
+    }
+    page = _newest_first_venue(range(1_000, 1_100, 10), 3)
+    backend = SimpleNamespace(
+        get_info=lambda: json.dumps({"results": [market]}),
+        get_trades=lambda market, start_ms, end_ms, page_size: json.dumps({"trades": page(start_ms, end_ms)}),
+    )
+
+    loop = asyncio.new_event_loop()
+    try:
+        provider = ParadexInstrumentProvider(client=backend)
+        loop.run_until_complete(provider.load_all_async())
+        clock = LiveClock()
+        client = ParadexDataClient(
+            loop, backend, ClientId("PARADEX"), Venue("PARADEX"),
+            MessageBus(TraderId("TEST-001"), clock), Cache(), clock, provider,
+        )
+        client._TRADES_PAGE_SIZE = 3
+        instrument_id = InstrumentId.from_str("BTC-USD-PERP.PARADEX")
+        ticks = loop.run_until_complete(
+            client._fetch_trade_ticks(instrument_id, 1_000 * 1_000_000, 1_099 * 1_000_000),
+        )
+    finally:
+        loop.close()
+
+    assert [t.ts_event // 1_000_000 for t in ticks] == list(range(1_000, 1_100, 10))
+
+
+def test_request_budget_spaces_request_starts():
+    async def run():
+        budget = RequestBudget(max_requests_per_second=50, max_concurrency=10)
+        loop = asyncio.get_running_loop()
+        starts = []
+
+        async def one():
+            async with budget:
+                starts.append(loop.time())
+
+        await asyncio.gather(*(one() for _ in range(5)))
+        return starts
+
+    starts = sorted(asyncio.run(run()))
+    assert starts[-1] - starts[0] >= 4 * 0.02 * 0.9
+
+
+def test_cached_range_only_fetches_gaps(tmp_path):
+    cache = HistoricalDataCache(tmp_path / "catalog")
+    assert cache.enabled
+    fetched = []
+
+    async def fetch(start_ns, end_ns):
+        fetched.append((start_ns, end_ns))
+        first = start_ns // 1_000_000
+        return [_tick(ts) for ts in range(first - first % 10, end_ns // 1_000_000 + 1, 10)]
+
+    def load(start_ms, end_ms, settled_ms):
+        return asyncio.run(
+            load_cached_range(
+                cache,
+                TradeTick,
+                str(INSTRUMENT_ID),
+                start_ms * 1_000_000,
+                end_ms * 1_000_000,
+                settled_ms * 1_000_000,
+                fetch,
+            ),
+        )
+
+    first = load(1_000, 2_000, settled_ms=10_000)
+    assert [t.ts_event // 1_000_000 for t in first] == list(range(1_000, 2_001, 10))
+
+    fetched.clear()
+    again = load(1_000, 2_000, settled_ms=10_000)
+    assert fetched == []
+    assert [repr(t) for t in again] == [repr(t) for t in first]
+    assert type(again[0]) is type(first[0])
+
+    # Only the uncovered tail is fetched; data after the settle horizon is
+    # returned but not persisted.
+    extended = load(1_500, 3_000, settled_ms=2_500)
+    assert fetched == [(2_000_000_001, 3_000_000_000)]
+    assert [t.ts_event // 1_000_000 for t in extended] == list(range(1_500, 3_001, 10))
+    assert cache.missing(TradeTick, str(INSTRUMENT_ID), 1_000_000_000, 3_000_000_000) == [
+        (2_500_000_001, 3_000_000_000),
+    ]
+
+
+def test_cached_range_without_cache_fetches_everything():
+    async def fetch(start_ns, end_ns):
+        return [_tick(2), _tick(1)]
+
+    ticks = asyncio.run(load_cached_range(None, TradeTick, "x", 0, 10, 10, fetch))
+    assert [t.ts_event for t in ticks] == [1_000_000, 2_000_000]
+
+
+def test_aggregate_trade_bars_stamps_bars_at_close():
+    bar_type = BarType.from_str("BTC-USD-PERP.STANDX-1-MINUTE-LAST-EXTERNAL")
+    trades = [
+        _tick(60_000, "10.0", "1.0"),
+        _tick(61_000, "12.0", "2.0"),
+        _tick(119_999, "9.0", "0.5"),
+        _tick(185_000, "11.0", "1.0"),
+    ]
+
+    bars = aggregate_trade_bars(bar_type, trades, 60_000_000_000)
+
+    assert [b.ts_event for b in bars] == [120_000_000_000, 240_000_000_000]
+    first = bars[0]
+    assert (first.open, first.high, first.low, first.close) == (
+        Price.from_str("10.0"),
+        Price.from_str("12.0"),
+        Price.from_str("9.0"),
+        Price.from_str("9.0"),
+    )
+    assert first.volume == Quantity.from_str("3.5")
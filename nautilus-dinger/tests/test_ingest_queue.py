@@ -0,0 +1,121 @@
+"""
+Cross-thread batched ingestion queue.
+"""
+import asyncio
+import os
+import sys
+import threading
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from nautilus_adapter.common.ingest_queue import CoalescingIngestQueue
+
+
+def test_producer_thread_burst_is_drained_in_batches_with_coalescing():
+    async def run() -> tuple[list[list], CoalescingIngestQueue]:
+        loop = asyncio.get_running_loop()
+        batches: list[list] = []
+        queue = CoalescingIngestQueue(loop, batches.append)
+
+        def produce() -> None:
+            for i in range(100):
+                queue.put(("order", i), key="order-1")
+                queue.put(("fill", i))
+
+        thread = threading.Thread(target=produce)
+        thread.start()
+        await loop.run_in_executor(None, thread.join)
+        await asyncio.sleep(0)
+        queue.flush()
+        return batches, queue
+
+    batches, queue = asyncio.run(run())
+    items = [item for batch in batches for item in batch]
+
+    assert [i for i in items if i[0] == "fill"] == [("fill", i) for i in range(100)]
+    # Superseded order updates collapse; the latest state always survives
+    assert items.count(("order", 99)) == 1
+    assert len(batches) < 200
+    assert queue.coalesced > 0
+
+
+def test_overflow_drops_oldest_when_loop_does_not_catch_up():
+    async def run() -> tuple[list, CoalescingIngestQueue]:
+        loop = asyncio.get_running_loop()
+        seen: list = []
+        queue = CoalescingIngestQueue(
+            loop,
+            seen.extend,
+            max_pending=3,
+            put_timeout_secs=0.01,
+        )
+
+        def produce() -> None:
+            for i in range(5):
+                queue.put(i)
+
+        # The loop is blocked on join, so the producer cannot be drained.
+        thread = threading.Thread(target=produce)
+        thread.start()
+        thread.join()
+        queue.flush()
+        return seen, queue
+
+    seen, queue = asyncio.run(run())
+    assert seen == [2, 3, 4]
+    assert queue.dropped == 2
+
+
+def test_lossless_items_wait_for_room_instead_of_being_dropped():
+    async def run() -> tuple[list, CoalescingIngestQueue]:
+        loop = asyncio.get_running_loop()
+        seen: list = []
+        queue = CoalescingIngestQueue(loop, seen.extend, max_pending=2, put_timeout_secs=0.01)
+
+        def produce() -> None:
+            for i in range(20):
+                queue.put(("delta", i), lossless=True)
+
+        thread = threading.Thread(target=produce)
+        thread.start()
+        # Joining off the loop lets it drain while the producer waits for room
+        await loop.run_in_executor(None, thread.join)
+        queue.flush()
+        return seen, queue
+
+    seen, queue = asyncio.run(run())
+    assert seen == [("delta", i) for i in range(20)]
+    assert queue.dropped == 0
+
+
+def test_overflow_evicts_lossy_items_only():
+    async def run() -> tuple[list, CoalescingIngestQueue]:
+        loop = asyncio.get_running_loop()
+        seen: list = []
+        queue = CoalescingIngestQueue(loop, seen.extend, max_pending=2)
+        queue.put("delta-1", lossless=True)
+        queue.put("quote-1", key="ETH")
+        queue.put("delta-2", lossless=True)
+        # Nothing lossy is left to evict, so the incoming quote is dropped
+        queue.put("quote-2", key="BTC")
+        queue.flush()
+        return seen, queue
+
+    seen, queue = asyncio.run(run())
+    assert seen == ["delta-1", "delta-2"]
+    assert queue.dropped == 2
+
+
+def test_move_to_end_puts_the_replacement_behind_earlier_arrivals():
+    async def run() -> list:
+        loop = asyncio.get_running_loop()
+        seen: list = []
+        queue = CoalescingIngestQueue(loop, seen.extend)
+        queue.put("quote-1", key="ETH")
+        queue.put("trade")
+        queue.put("quote-2", key="ETH", move_to_end=True)
+        queue.flush()
+        return seen
+
+    assert asyncio.run(run()) == ["trade", "quote-2"]
+
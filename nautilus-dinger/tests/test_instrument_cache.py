@@ -0,0 +1,91 @@
+"""
+On-disk market metadata cache and provider warm starts.
+"""
+import asyncio
+import json
+import os
+import sys
+from types import SimpleNamespace
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from nautilus_adapter.adapters.StandX.config import StandXDataClientConfig
+from nautilus_adapter.adapters.StandX.data import StandXDataClient
+from nautilus_adapter.adapters.StandX.factories import _build_standx_metadata_cache
+from nautilus_adapter.adapters.StandX.providers import StandXInstrumentProvider
+from nautilus_adapter.common.instrument_cache import MarketMetadataCache
+
+
+MARKETS = [
+    {"symbol": "BTC-USD", "size_decimals": 4, "price_decimals": 2},
+    {"symbol": "ETH-USD", "size_decimals": 3, "price_decimals": 2},
+]
+
+
+class _InfoClient:
+    def __init__(self, markets: list[dict]):
+        self.markets = markets
+        self.calls = 0
+
+    def get_info(self) -> dict:
+        self.calls += 1
+        return {"markets": [dict(m) for m in self.markets]}
+
+
+def test_cache_round_trip_is_scoped_and_versioned(tmp_path):
+    cache = MarketMetadataCache("STANDX", "mainnet", tmp_path)
+    assert cache.load() is None
+
+    cache.save(MARKETS)
+    assert cache.load() == MARKETS
+    assert MarketMetadataCache("STANDX", "testnet", tmp_path).load() is None
+
+    payload = json.loads(cache.path.read_text())
+    payload["version"] = -1
+    cache.path.write_text(json.dumps(payload))
+    assert cache.load() is None
+
+
+def test_provider_warm_starts_from_cache_then_revalidates(tmp_path):
+    cache = MarketMetadataCache("STANDX", "mainnet", tmp_path)
+    cold = StandXInstrumentProvider(client=_InfoClient(MARKETS), metadata_cache=cache)
+    assert cold.load_cached() is False
+    asyncio.run(cold.load_all_async())
+
+    changed = [dict(MARKETS[0], price_decimals=1), MARKETS[1]]
+    client = _InfoClient(changed)
+    warm = StandXInstrumentProvider(client=client, metadata_cache=cache)
+
+    assert warm.load_cached() is True
+    assert warm.count == 2
+    assert client.calls == 0
+
+    updated = asyncio.run(warm.refresh_async())
+    assert [i.raw_symbol.value for i in updated] == ["BTC-USD"]
+    assert updated[0].price_precision == 1
+    assert cache.load() == changed
+
+
+def test_cache_is_opt_in():
+    assert _build_standx_metadata_cache(StandXDataClientConfig()) is None
+
+
+def test_disconnect_cancels_a_pending_revalidation():
+    async def run():
+        revalidate = asyncio.ensure_future(asyncio.sleep(3600))
+        client = SimpleNamespace(
+            _log=SimpleNamespace(debug=lambda msg: None, info=lambda msg, color=None: None),
+            _update_instruments_task=None,
+            _revalidate_task=revalidate,
+            _quote_flush_handles={},
+            _books={},
+            _ws_tape=None,
+            _ws=None,
+            _client=None,
+        )
+        await StandXDataClient._disconnect(client)
+        await asyncio.sleep(0)
+        assert revalidate.cancelled()
+        assert client._revalidate_task is None
+
+    asyncio.run(run())
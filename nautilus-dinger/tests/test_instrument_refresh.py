@@ -0,0 +1,86 @@
+"""
+Diff-based instrument refresh for the Lighter, StandX and Paradex providers.
+
+Uses an in-memory ``get_info`` stand-in; no network calls.
+"""
+import asyncio
+import copy
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from nautilus_adapter.adapters.Lighter.providers import LighterInstrumentProvider
+from nautilus_adapter.adapters.Paradex.providers import ParadexInstrumentProvider
+from nautilus_adapter.adapters.StandX.providers import StandXInstrumentProvider
+
+
+class _InfoClient:
+    def __init__(self, payload: dict):
+        self.payload = payload
+
+    def get_info(self) -> dict:
+        return copy.deepcopy(self.payload)
+
+
+CASES = [
+    (
+        LighterInstrumentProvider,
+        "results",
+        [
+            {"symbol": "BTC", "market_id": 1, "size_decimals": 5, "price_decimals": 1},
+            {"symbol": "ETH", "market_id": 0, "size_decimals": 4, "price_decimals": 2},
+        ],
+        "price_decimals",
+        3,
+    ),
+    (
+        StandXInstrumentProvider,
+        "markets",
+        [
+            {"symbol": "BTC-USD", "size_decimals": 4, "price_decimals": 2},
+            {"symbol": "ETH-USD", "size_decimals": 3, "price_decimals": 2},
+        ],
+        "size_decimals",
+        5,
+    ),
+    (
+        ParadexInstrumentProvider,
+        "results",
+        [
+            {"symbol": "BTC-USD-PERP", "base_currency": "BTC", "price_tick_size": "0.1"},
+            {"symbol": "ETH-USD-PERP", "base_currency": "ETH", "price_tick_size": "0.01"},
+        ],
+        "price_tick_size",
+        "0.5",
+    ),
+]
+
+
+@pytest.mark.parametrize("provider_cls,key,markets,field,new_value", CASES)
+def test_refresh_publishes_only_added_or_changed(provider_cls, key, markets, field, new_value):
+    client = _InfoClient({key: markets})
+    provider = provider_cls(client=client)
+    asyncio.run(provider.load_all_async())
+    assert provider.count == 2
+
+    # Volatile stats alone are not a change
+    client.payload[key][0]["open_interest"] = "123"
+    assert asyncio.run(provider.refresh_async()) == []
+
+    client.payload[key][0][field] = new_value
+    added = dict(markets[1], symbol="SOL" + markets[1]["symbol"][3:])
+    added.pop("market_id", None)
+    if "base_currency" in added:
+        added["base_currency"] = "SOL"
+    client.payload[key].append(added)
+
+    updated = asyncio.run(provider.refresh_async())
+
+    assert sorted(i.raw_symbol.value for i in updated) == sorted(
+        [markets[0]["symbol"], added["symbol"]],
+    )
+    assert provider.count == 3
+    assert asyncio.run(provider.refresh_async()) == []
@@ -0,0 +1,167 @@
+"""
+Order lifecycle latency histograms, export formats and the metrics endpoint.
+"""
+import asyncio
+import json
+import os
+import random
+import sys
+from types import SimpleNamespace
+
+from nautilus_trader.cache.cache import Cache
+from nautilus_trader.common.component import LiveClock, MessageBus
+from nautilus_trader.model.enums import AccountType, OmsType
+from nautilus_trader.model.identifiers import ClientId, TraderId, Venue
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from nautilus_adapter.adapters.Lighter.execution import LighterExecutionClient
+from nautilus_adapter.adapters.Lighter.providers import LighterInstrumentProvider
+from nautilus_adapter.common.client_id_map import ClientOrderIdStore
+from nautilus_adapter.common.latency import (
+    ACK_TO_FILL,
+    CANCEL_TO_CONFIRMED,
+    SUBMIT_TO_ACK,
+    LatencyHistogram,
+    LatencyRecorder,
+    MetricsServer,
+    render_json,
+    render_prometheus,
+)
+
+
+def test_histogram_quantiles_within_bucket_precision():
+    rng = random.Random(7)
+    values = [int(rng.lognormvariate(15, 1.5)) for _ in range(20_000)]
+    hist = LatencyHistogram()
+    for v in values:
+        hist.record(v)
+
+    values.sort()
+    for q in (0.5, 0.9, 0.99, 0.999):
+        exact = values[int(q * len(values)) - 1]
+        assert abs(hist.quantile(q) - exact) <= exact * 0.035
+    assert (hist.count, hist.min, hist.max) == (len(values), values[0], values[-1])
+    assert len(hist._counts) < 600
+
+    merged = LatencyHistogram()
+    merged.merge(hist)
+    merged.merge(hist)
+    assert merged.count == 2 * hist.count
+    assert merged.quantile(0.5) == hist.quantile(0.5)
+
+
+def test_recorder_pairs_lifecycle_events_by_client_order_id():
+    latency = LatencyRecorder("TEST", max_pending=2)
+
+    latency.order_submitted("O-1", 1_000)
+    latency.order_accepted("O-1", 4_000)
+    latency.order_filled("O-1", 10_000)
+    latency.order_filled("O-1", 20_000)  # Only the first fill is timed
+    latency.cancel_requested("O-2", 0)
+    latency.order_canceled("O-2", 500)
+    latency.order_canceled("O-3", 900)  # No matching request
+
+    for i in range(3):
+        latency.order_submitted(f"O-{10 + i}", i)
+    latency.order_accepted("O-10", 100)  # Evicted from the bounded map
+
+    snapshot = latency.snapshot()
+    assert snapshot[SUBMIT_TO_ACK]["count"] == 1
+    assert snapshot[SUBMIT_TO_ACK]["max"] == 3_000
+    assert snapshot[ACK_TO_FILL]["max"] == 6_000
+    assert snapshot[CANCEL_TO_CONFIRMED]["count"] == 1
+
+    assert latency.summary().startswith("TEST latency: ack_to_fill n=1")
+    assert latency.summary() is None
+
+
+def test_exports_render_every_metric():
+    latency = LatencyRecorder("LIGHTER")
+    latency.record("call.submit_order", 2_500_000)
+
+    text = render_prometheus([latency])
+    assert (
+        'nautilus_adapter_latency_seconds{venue="LIGHTER",metric="call.submit_order",'
+        'quantile="0.99"} 0.002'
+    ) in text
+    labels = 'venue="LIGHTER",metric="call.submit_order"'
+    assert f"nautilus_adapter_latency_seconds_count{{{labels}}} 1" in text
+    assert json.loads(render_json([latency]))["LIGHTER"]["call.submit_order"]["count"] == 1
+
+
+def test_metrics_endpoint_serves_prometheus_text():
+    async def run():
+        server = MetricsServer("127.0.0.1", 0)
+        await server.start()
+        try:
+            reader, writer = await asyncio.open_connection("127.0.0.1", server.port)
+            writer.write(b"GET /metrics HTTP/1.1\r\nHost: localhost\r\n\r\n")
+            await writer.drain()
+            response = await reader.read()
+            writer.close()
+            return response
+        finally:
+            await server.stop()
+
+    response = asyncio.run(run()).decode()
+    assert response.startswith("HTTP/1.1 200 OK")
+    assert "# TYPE nautilus_adapter_latency_seconds summary" in response
+
+
+def test_backend_calls_are_timed_per_method():
+    latency = LatencyRecorder("LIGHTER")
+
+    async def cancel_order(order_id):
+        await asyncio.sleep(0.01)
+        return {"ok": True}
+
+    client = SimpleNamespace(
+        _require_client=lambda: SimpleNamespace(cancel_order=cancel_order),
+        _latency=latency,
+    )
+    result = asyncio.run(LighterExecutionClient._call_client(client, "cancel_order", "1"))
+
+    assert result == {"ok": True}
+    assert latency.histograms["call.cancel_order"].min >= 9_000_000
+
+
+def test_ack_to_fill_uses_local_receive_times_not_the_venue_clock():
+    async def get_info():
+        return {"results": [{"market_id": 1, "symbol": "BTC", "size_decimals": 4, "price_decimals": 2}]}
+
+    async def get_fills(*args):
+        # Stamped by the venue a year before the local ack
+        return {"results": [{
+            "trade_id": "T-1", "order_index": 100, "client_order_index": 7, "market_id": 1,
+            "size": "0.5", "price": "60000", "is_ask": False, "timestamp": 1_700_000_000,
+        }]}
+
+    async def run():
+        provider = LighterInstrumentProvider(client=SimpleNamespace(get_info=get_info))
+        await provider.load_all_async()
+        clock = LiveClock()
+        store = ClientOrderIdStore(None)
+        store.put("O-1", 7)
+        client = LighterExecutionClient(
+            asyncio.get_running_loop(),
+            SimpleNamespace(client_id_store=store, get_fills=get_fills),
+            ClientId("LIGHTER"),
+            Venue("LIGHTER"),
+            OmsType.NETTING,
+            AccountType.MARGIN,
+            None,
+            provider,
+            MessageBus(TraderId("TEST-001"), clock),
+            Cache(),
+            clock,
+        )
+        client._latency = LatencyRecorder("LIGHTER")
+        client._latency.order_accepted("O-1", clock.timestamp_ns())
+        [report] = await client.generate_fill_reports(SimpleNamespace())
+        assert report.client_order_id.value == "O-1"
+        return client._latency.histograms[ACK_TO_FILL]
+
+    hist = asyncio.run(run())
+    assert hist.count == 1
+    assert 0 < hist.max < 1_000_000_000
@@ -0,0 +1,99 @@
+"""
+Cached, early-exit order lookups on the Lighter SDK backend.
+"""
+import asyncio
+import os
+import sys
+from types import SimpleNamespace
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from nautilus_adapter.adapters.Lighter.backend import LighterSdkBackend
+from nautilus_adapter.common.ttl_cache import TtlCache
+
+
+def test_ttl_cache_expires_and_evicts_oldest():
+    now = [0.0]
+    cache = TtlCache(ttl_secs=5, max_entries=2, clock=lambda: now[0])
+    cache.put("a", 1)
+    cache.put("b", 2)
+    cache.put("c", 3)
+    assert (cache.get("a"), cache.get("c"), len(cache)) == (None, 3, 2)
+
+    now[0] = 5.0
+    assert cache.get("b") is None
+    assert len(cache) == 1
+
+
+class _FakeOrderApi:
+    def __init__(self, active, inactive_pages):
+        self.active = active
+        self.inactive_pages = inactive_pages
+        self.calls = []
+
+    async def account_active_orders(self, account_index, market_id, auth):
+        self.calls.append(("active", market_id))
+        return SimpleNamespace(model_dump=lambda: {"orders": self.active.get(market_id, [])})
+
+    async def account_inactive_orders(self, account_index, limit, auth, cursor=None):
+        page = int(cursor or 0)
+        self.calls.append(("inactive", page))
+        has_next = page + 1 < len(self.inactive_pages)
+        payload = {
+            "orders": self.inactive_pages[page],
+            "next_cursor": str(page + 1) if has_next else None,
+        }
+        return SimpleNamespace(model_dump=lambda: payload)
+
+
+def _backend(order_api):
+    backend = LighterSdkBackend("https://example.invalid", 1, 0, "key")
+    backend._order_api = order_api
+    backend._market_by_id = {0: object(), 1: object(), 2: object()}
+
+    async def noop():
+        return None
+
+    async def token():
+        return "auth"
+
+    backend._ensure_clients = noop
+    backend._ensure_markets = noop
+    backend._auth_token = token
+    return backend
+
+
+def test_lookup_uses_market_hint_and_caches_only_terminal_rows():
+    live = {"order_index": 11, "client_order_index": 5, "market_index": 0, "status": "open"}
+    api = _FakeOrderApi(active={0: [live]}, inactive_pages=[[]])
+    backend = _backend(api)
+    backend._remember_order_market(("client", "5"), 0)
+
+    assert asyncio.run(backend.get_order_by_client_id("5")) == live
+    assert api.calls == [("active", 0)]
+
+    # Live rows may change, so the next lookup refetches (still only market 0)
+    assert asyncio.run(backend.get_order_by_id("11")) == live
+    assert api.calls == [("active", 0)] * 2
+
+
+def test_lookup_pages_inactive_orders_and_stops_at_match():
+    filled = {"order_index": 42, "client_order_index": 9, "market_index": 2, "status": "filled"}
+    other = {"order_index": 43, "client_order_index": 10, "market_index": 2, "status": "canceled"}
+    api = _FakeOrderApi(active={}, inactive_pages=[[other], [filled], [{"order_index": 99}]])
+    backend = _backend(api)
+
+    assert asyncio.run(backend.get_order_by_id("42")) == filled
+    assert api.calls == [
+        ("active", 0),
+        ("active", 1),
+        ("active", 2),
+        ("inactive", 0),
+        ("inactive", 1),
+    ]
+
+    # Both terminal rows seen on the way are now served from the cache
+    api.calls.clear()
+    assert asyncio.run(backend.get_order_by_client_id("10")) == other
+    assert asyncio.run(backend.get_order_by_id("42")) == filled
+    assert api.calls == []
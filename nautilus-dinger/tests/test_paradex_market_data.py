@@ -0,0 +1,174 @@
+"""
+Paradex live market data handed over by the native WebSocket client.
+"""
+import asyncio
+import functools
+import os
+import sys
+from types import SimpleNamespace
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+import nautilus_trader
+from nautilus_trader.model.data import QuoteTick, TradeTick
+from nautilus_trader.model.enums import AggressorSide
+from nautilus_trader.model.identifiers import InstrumentId, TradeId
+from nautilus_trader.model.objects import Price, Quantity
+
+import nautilus_adapter.adapters.Paradex.data as paradex_data
+from nautilus_adapter.adapters.Paradex import factories as paradex_factories
+from nautilus_adapter.adapters.Paradex.data import ParadexDataClient
+from nautilus_adapter.common.ingest_queue import CoalescingIngestQueue
+from nautilus_adapter.common.top_of_book import QuoteFilter
+from nautilus_adapter.common.ws_tape import WsTapeRecorder, read_tape
+
+ETH = InstrumentId.from_str("ETH-USD-PERP.PARADEX")
+
+
+def _quote(bid: str, ts: int) -> QuoteTick:
+    return QuoteTick(
+        instrument_id=ETH,
+        bid_price=Price.from_str(bid),
+        ask_price=Price.from_str("1900.50"),
+        bid_size=Quantity.from_str("1.000"),
+        ask_size=Quantity.from_str("2.000"),
+        ts_event=ts,
+        ts_init=ts,
+    )
+
+
+def _trade(ts: int) -> TradeTick:
+    return TradeTick(
+        instrument_id=ETH,
+        price=Price.from_str("1900.25"),
+        size=Quantity.from_str("0.500"),
+        aggressor_side=AggressorSide.BUYER,
+        trade_id=TradeId("1"),
+        ts_event=ts,
+        ts_init=ts,
+    )
+
+
+def test_batches_publish_in_arrival_order_keeping_only_latest_pending_quote(monkeypatch):
+    # The native client hands over capsules; plain objects stand in for them here
+    monkeypatch.setattr(paradex_data, "capsule_to_data", lambda capsule: capsule)
+    published = []
+
+    async def run():
+        loop = asyncio.get_running_loop()
+        client = SimpleNamespace(
+            _loop=loop,
+            _clock=SimpleNamespace(timestamp_ns=lambda: 10),
+            _quote_filter=QuoteFilter(),
+            _quote_flush_handles={},
+            _book_ts_event={},
+            _handle_data=published.append,
+        )
+        client._publish_top_of_book = functools.partial(
+            ParadexDataClient._publish_top_of_book,
+            client,
+        )
+        client._ws_queue = CoalescingIngestQueue(
+            loop,
+            functools.partial(ParadexDataClient._publish_ws_data, client),
+        )
+
+        first, trade, latest = _quote("1900.00", 1), _trade(2), _quote("1900.10", 3)
+        ParadexDataClient._on_ws_batch(client, [first, trade, latest])
+        await asyncio.sleep(0)
+        # The merged quote is published where the latest one arrived, after the trade
+        assert published == [trade, latest]
+        assert client._book_ts_event[ETH] == 3
+
+        # An unchanged top of book is not republished
+        ParadexDataClient._on_ws_batch(client, [_quote("1900.10", 4)])
+        await asyncio.sleep(0)
+        assert published == [trade, latest]
+
+    asyncio.run(run())
+
+
+def test_subscriptions_are_routed_to_the_native_client():
+    calls = []
+    ws = SimpleNamespace(
+        add_instrument=lambda *args: calls.append(("add_instrument", *args)),
+        subscribe_bbo=lambda symbol: calls.append(("subscribe_bbo", symbol)),
+    )
+
+    async def run():
+        client = SimpleNamespace(
+            _loop=asyncio.get_running_loop(),
+            _ws_client=ws,
+            _ws=ws,
+            _log=SimpleNamespace(info=lambda *args: None),
+            _quote_filter=QuoteFilter(),
+            _quote_subscriptions=set(),
+        )
+        client._ws_call = functools.partial(ParadexDataClient._ws_call, client)
+        instrument = SimpleNamespace(
+            id=ETH,
+            price_precision=2,
+            size_precision=3,
+        )
+        ParadexDataClient._register_ws_instruments(client, [instrument])
+        command = SimpleNamespace(instrument_id=ETH, params=None)
+        await ParadexDataClient._subscribe_quote_ticks(client, command)
+        return client
+
+    client = asyncio.run(run())
+    assert calls == [
+        ("add_instrument", "ETH-USD-PERP", 2, 3),
+        ("subscribe_bbo", "ETH-USD-PERP"),
+    ]
+    assert client._quote_subscriptions == {ETH}
+
+
+def test_reconnect_replays_the_subscribed_channels():
+    calls = []
+    ws = SimpleNamespace(**{
+        method: functools.partial(lambda method, symbol: calls.append((method, symbol)), method)
+        for method in ("subscribe_trades", "subscribe_bbo", "subscribe_orderbook")
+    })
+
+    async def run():
+        client = SimpleNamespace(
+            _loop=asyncio.get_running_loop(),
+            _ws=ws,
+            _trade_subscriptions={ETH},
+            _quote_subscriptions={ETH},
+            _book_subscriptions=set(),
+        )
+        client._ws_call = functools.partial(ParadexDataClient._ws_call, client)
+        await ParadexDataClient._resubscribe(client)
+
+    asyncio.run(run())
+    assert calls == [("subscribe_trades", "ETH-USD-PERP"), ("subscribe_bbo", "ETH-USD-PERP")]
+
+
+def test_raw_frames_from_the_native_client_are_recorded_to_the_tape(tmp_path):
+    tape = WsTapeRecorder(tmp_path / "paradex.jsonl.gz")
+    client = SimpleNamespace(_ws_tape=tape)
+    frame = '{"jsonrpc":"2.0","method":"subscription","params":{"channel":"bbo.ETH-USD-PERP"}}'
+
+    ParadexDataClient._record_ws_frame(client, 123, frame)
+    tape.close()
+    client._ws_tape = None
+    # Frames arriving after disconnect are ignored
+    ParadexDataClient._record_ws_frame(client, 124, frame)
+
+    assert [tuple(r) for r in read_tape(tape.path)] == [(123, "public", frame)]
+
+
+def test_native_client_requires_the_nautilus_release_it_was_built_against(monkeypatch):
+    def backend(version):
+        return SimpleNamespace(NAUTILUS_TRADER_VERSION=version, PyParadexWebSocketClient=lambda url: url)
+
+    config = SimpleNamespace(base_url_ws="ws://127.0.0.1:9000/paradex/v1")
+    monkeypatch.setitem(sys.modules, "paradex", backend(nautilus_trader.__version__))
+    assert paradex_factories._build_paradex_ws_client(config) == config.base_url_ws
+
+    monkeypatch.setitem(sys.modules, "paradex", backend("0.0.0"))
+    with pytest.raises(RuntimeError, match="built against nautilus_trader 0.0.0"):
+        paradex_factories._build_paradex_ws_client(config)
@@ -0,0 +1,122 @@
+"""
+Report fast-path helpers: accessors, precision cache and row memo.
+"""
+import asyncio
+import os
+import sys
+from types import SimpleNamespace
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from nautilus_trader.cache.cache import Cache
+from nautilus_trader.common.component import LiveClock, MessageBus
+from nautilus_trader.model.enums import AccountType, OmsType
+from nautilus_trader.model.identifiers import ClientId, ClientOrderId, InstrumentId, TraderId, Venue
+from nautilus_trader.model.objects import Price, Quantity
+
+from nautilus_adapter.adapters.Lighter.execution import LighterExecutionClient
+from nautilus_adapter.adapters.Lighter.providers import LighterInstrumentProvider
+from nautilus_adapter.adapters.StandX.providers import StandXInstrumentProvider
+from nautilus_adapter.common.client_id_map import ClientOrderIdStore
+from nautilus_adapter.common.report_fastpath import InstrumentPrecisions, ReportMemo, first_of
+
+
+class _Cache:
+    def __init__(self, instruments):
+        self._instruments = {i.id: i for i in instruments}
+        self.lookups = 0
+
+    def instrument(self, instrument_id):
+        self.lookups += 1
+        return self._instruments.get(instrument_id)
+
+
+def test_first_of_mirrors_or_chain():
+    get = first_of("order_index", "order_id", "id")
+    assert get({"order_id": "7", "id": "9"}) == "7"
+    assert get({"order_index": 0, "id": "9"}) == "9"
+    assert get({"order_index": 0}) is None
+
+
+def test_precisions_use_instrument_and_fall_back_to_strings():
+    instrument = StandXInstrumentProvider._build_instrument(
+        {"symbol": "BTC-USD", "size_decimals": 4, "price_decimals": 2},
+    )
+    cache = _Cache([instrument])
+    precisions = InstrumentPrecisions(cache)
+
+    assert precisions.quantity(instrument.id, "0.5") == Quantity.from_str("0.5000")
+    assert precisions.price(instrument.id, "65000.1") == Price.from_str("65000.10")
+    precisions.price(instrument.id, "1")
+    assert cache.lookups == 1
+
+    unknown = InstrumentId.from_str("ETH-USD-PERP.STANDX")
+    assert precisions.quantity(unknown, "0.123") == Quantity.from_str("0.123")
+
+
+def test_memo_reuses_report_only_for_unchanged_rows():
+    memo = ReportMemo(max_entries=2)
+    row = {"id": "1", "status": "OPEN", "remaining_size": "1"}
+    memo.put("1", row, "report-1")
+
+    assert memo.get("1", dict(row)) == "report-1"
+    assert memo.get("1", dict(row, remaining_size="0.5")) is None
+
+    memo.put("2", row, "report-2")
+    memo.put("3", row, "report-3")
+    assert len(memo) == 2
+    assert memo.get("1", row) is None
+
+
+def test_unchanged_rows_reuse_parsing_but_resolve_ids_on_every_reconcile():
+    async def get_info():
+        return {"results": [{"market_id": 1, "symbol": "BTC", "size_decimals": 4, "price_decimals": 2}]}
+
+    loop = asyncio.new_event_loop()
+    try:
+        provider = LighterInstrumentProvider(client=SimpleNamespace(get_info=get_info))
+        loop.run_until_complete(provider.load_all_async())
+        clock = LiveClock()
+        cache = Cache()
+        for instrument in provider.get_all().values():
+            cache.add_instrument(instrument)
+        store = ClientOrderIdStore(None)
+        client = LighterExecutionClient(
+            loop,
+            SimpleNamespace(client_id_store=store),
+            ClientId("LIGHTER"),
+            Venue("LIGHTER"),
+            OmsType.NETTING,
+            AccountType.MARGIN,
+            None,
+            provider,
+            MessageBus(TraderId("TEST-001"), clock),
+            cache,
+            clock,
+        )
+    finally:
+        loop.close()
+    row = {
+        "order_index": 100,
+        "client_order_index": 7,
+        "market_index": 1,
+        "initial_base_amount": "0.5",
+        "remaining_base_amount": "0.5",
+        "price": "60000",
+        "is_ask": False,
+        "type": "limit",
+        "status": "open",
+        "timestamp": 1_760_000_000,
+    }
+
+    [first] = client._build_order_status_reports({"100": row})
+    # The order is submitted (and its hashed index mapped) between reconciles
+    store.put("O-1", 7)
+    [second] = client._build_order_status_reports({"100": dict(row)})
+
+    assert client._order_report_memo.hits == 1
+    assert first.client_order_id == ClientOrderId("7")
+    assert second.client_order_id == ClientOrderId("O-1")
+    assert second.id != first.id
+    assert second.ts_init >= first.ts_init
+    assert second.quantity == first.quantity
@@ -0,0 +1,103 @@
+"""
+Multi-venue soak harness: per-venue budgets and aggregation.
+"""
+import asyncio
+import os
+import sys
+import time
+from collections import Counter
+from types import SimpleNamespace
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from nautilus_adapter.common.canary import CanaryAttempt, CanaryEvent
+from nautilus_adapter.common.soak import SoakHarness, SoakTarget, VenueBudget
+
+
+class _FakeEngine:
+    """
+    Stands in for a started CanaryEngine; scenario names pick the outcome.
+    """
+
+    def __init__(self) -> None:
+        self.in_flight: Counter = Counter()
+        self.max_in_flight: Counter = Counter()
+        self.attempt_numbers: list[int] = []
+
+    async def run_attempt(self, scenario, attempt, timeout_secs=None, reconcile=True):
+        assert reconcile is False
+        venue = scenario.venue
+        self.attempt_numbers.append(attempt)
+        self.in_flight[venue] += 1
+        self.max_in_flight[venue] = max(self.max_in_flight[venue], self.in_flight[venue])
+        await asyncio.sleep(0.02)
+        self.in_flight[venue] -= 1
+
+        coid = f"O-{attempt}"
+        kinds = ["OrderInitialized", "OrderSubmitted"]
+        kinds.append("OrderRejected" if scenario.name == "rejects" else "OrderFilled")
+        return CanaryAttempt(
+            attempt=attempt,
+            scenario=scenario.name,
+            strategy_id=f"S-{attempt:03d}",
+            elapsed_secs=0.02,
+            events=[CanaryEvent(kind, f"S-{attempt:03d}", coid, None) for kind in kinds],
+            reconciliation_ok=None,
+            errors=["OrderDenied O-1: limit"] if scenario.name == "rejects" else [],
+        )
+
+    async def reconcile(self) -> bool:
+        return True
+
+
+def _target(venue: str, name: str) -> SoakTarget:
+    return SoakTarget(venue, SimpleNamespace(venue=venue, name=name, runtime_secs=0.0))
+
+
+def test_venues_run_concurrently_within_their_own_budgets():
+    engine = _FakeEngine()
+    budgets = {
+        "PARADEX": VenueBudget(max_in_flight=1),
+        "LIGHTER": VenueBudget(max_in_flight=2),
+    }
+    harness = SoakHarness(engine, budgets, duration_secs=0.15)
+    targets = [
+        _target("PARADEX", "BTC-USD-PERP"),
+        _target("PARADEX", "ETH-USD-PERP"),
+        _target("LIGHTER", "BTC-USD-PERP"),
+        _target("LIGHTER", "rejects"),
+        _target("LIGHTER", "SOL-USD-PERP"),
+    ]
+    report = asyncio.run(harness.run(targets))
+
+    assert engine.max_in_flight == {"PARADEX": 1, "LIGHTER": 2}
+    # Attempt numbers are unique across venues (they seed strategy ids and order tags)
+    assert len(set(engine.attempt_numbers)) == len(engine.attempt_numbers)
+    assert report["final_reconciliation_ok"] is True
+    assert report["attempts"] == len(engine.attempt_numbers)
+
+    paradex, lighter = report["venues"]["PARADEX"], report["venues"]["LIGHTER"]
+    assert paradex["errors"] == 0 and paradex["ok"] == paradex["attempts"]
+    assert paradex["terminal_states"] == {"FILLED": paradex["attempts"]}
+    assert paradex["attempt_ns"]["count"] == paradex["attempts"]
+    assert lighter["errors"] > 0 and lighter["terminal_states"]["REJECTED"] == lighter["errors"]
+    assert lighter["error_rate"] == round(lighter["errors"] / lighter["attempts"], 4)
+    assert lighter["error_samples"][0].endswith("OrderDenied O-1: limit")
+
+
+def test_budget_paces_attempt_starts():
+    starts = []
+
+    async def run():
+        budget = VenueBudget(max_in_flight=4, attempts_per_min=600)
+
+        async def attempt():
+            async with budget.slot():
+                starts.append(time.monotonic())
+
+        await asyncio.gather(*(attempt() for _ in range(3)))
+
+    asyncio.run(run())
+    # 600/min -> one start every 0.1s even with free slots
+    gaps = [b - a for a, b in zip(starts, starts[1:])]
+    assert len(gaps) == 2 and all(gap >= 0.09 for gap in gaps)
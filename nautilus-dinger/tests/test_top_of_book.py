@@ -0,0 +1,68 @@
+"""
+Top-of-book tracking and quote change suppression / throttling.
+"""
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from nautilus_adapter.common.top_of_book import BookLevels, QuoteFilter
+
+
+def test_book_tracks_best_levels_through_updates_and_deletes():
+    book = BookLevels()
+    assert book.top() is None
+
+    book.update([(100.0, 1.0), (99.0, 2.0)], [(101.0, 3.0), (102.0, 1.0)], snapshot=True)
+    assert book.top() == (100.0, 1.0, 101.0, 3.0)
+
+    book.update([(100.5, 0.5)], [])
+    assert book.top() == (100.5, 0.5, 101.0, 3.0)
+
+    book.update([(100.5, 0.0)], [(101.0, 0.0)])
+    assert book.top() == (100.0, 1.0, 102.0, 1.0)
+
+    book.update([(100.0, 4.0)], [])
+    assert book.top() == (100.0, 4.0, 102.0, 1.0)
+
+    book.update([(98.0, 1.0)], [(103.0, 1.0)], snapshot=True)
+    assert book.top() == (98.0, 1.0, 103.0, 1.0)
+    assert 100.0 not in book.bids
+
+
+def test_filter_suppresses_unchanged_tops():
+    quotes = QuoteFilter()
+    top = (100.0, 1.0, 101.0, 1.0)
+
+    assert quotes.offer("BTC", top, 0)
+    assert not quotes.offer("BTC", top, 1)
+    assert quotes.offer("BTC", (100.0, 2.0, 101.0, 1.0), 2)
+    assert quotes.offer("ETH", top, 3)
+    assert quotes.suppressed == 1
+
+
+def test_throttle_holds_latest_change_until_interval_expires():
+    quotes = QuoteFilter(default_interval_ns=100)
+    quotes.set_interval("ETH", 0)
+
+    assert quotes.offer("BTC", (1.0, 1.0, 2.0, 1.0), 1_000)
+    assert not quotes.offer("BTC", (1.0, 2.0, 2.0, 1.0), 1_010)
+    assert not quotes.offer("BTC", (1.0, 3.0, 2.0, 1.0), 1_020)
+    assert quotes.due_in_ns("BTC", 1_020) == 80
+    assert quotes.take_pending("BTC", 1_100) == (1.0, 3.0, 2.0, 1.0)
+    assert quotes.take_pending("BTC", 1_100) is None
+    assert quotes.throttled == 2
+
+    # Per-instrument override disables throttling for ETH only
+    assert quotes.offer("ETH", (1.0, 1.0, 2.0, 1.0), 1_000)
+    assert quotes.offer("ETH", (1.0, 2.0, 2.0, 1.0), 1_001)
+
+
+def test_pending_change_reverted_before_flush_is_dropped():
+    quotes = QuoteFilter(default_interval_ns=100)
+    original = (1.0, 1.0, 2.0, 1.0)
+
+    assert quotes.offer("BTC", original, 0)
+    assert not quotes.offer("BTC", (1.0, 2.0, 2.0, 1.0), 10)
+    assert not quotes.offer("BTC", original, 20)
+    assert quotes.due_in_ns("BTC", 20) is None
@@ -0,0 +1,171 @@
+"""
+Local venue simulator: matching, fault injection, replay and the HTTP dialects.
+"""
+import asyncio
+import json
+import os
+import sys
+from decimal import Decimal
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from nautilus_adapter.sim.faults import FaultConfig, FaultInjector
+from nautilus_adapter.sim.lighter import LighterDialect
+from nautilus_adapter.sim.matching import (
+    BUY,
+    CLOSED,
+    LIMIT,
+    MARKET,
+    OPEN,
+    SELL,
+    STOP_MARKET,
+    UNTRIGGERED,
+    MatchingEngine,
+    SimMarket,
+)
+from nautilus_adapter.sim.paradex import ParadexDialect
+from nautilus_adapter.sim.replay import ResponseReplay
+from nautilus_adapter.sim.server import VenueSimServer
+
+
+def _engine(**kwargs):
+    market = SimMarket("BTC-USD-PERP", 0, Decimal("0.1"), Decimal("0.001"), Decimal("60000"))
+    return MatchingEngine([market], house_levels=5, house_size=Decimal("1"), **kwargs)
+
+
+async def _http(port, method, path, body=None, headers=None, content_type="application/json"):
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    data = b"" if body is None else body if isinstance(body, bytes) else json.dumps(body).encode()
+    lines = [f"{method} {path} HTTP/1.1", "Host: localhost", "Connection: close", f"Content-Length: {len(data)}"]
+    if data:
+        lines.append(f"Content-Type: {content_type}")
+    lines += [f"{k}: {v}" for k, v in (headers or {}).items()]
+    writer.write(("\r\n".join(lines) + "\r\n\r\n").encode() + data)
+    await writer.drain()
+    response = await reader.read()
+    writer.close()
+    head, _, payload = response.partition(b"\r\n\r\n")
+    status = int(head.split()[1])
+    return status, json.loads(payload) if payload else None
+
+
+def test_engine_matches_against_house_book_and_triggers_stops():
+    engine = _engine()
+    entry = engine.submit("alice", "BTC-USD-PERP", BUY, MARKET, Decimal("0.5"))
+    assert entry.status == CLOSED and entry.is_filled
+    assert entry.avg_fill_price == Decimal("60000.1")
+    assert engine.accounts["alice"].position("BTC-USD-PERP") == Decimal("0.5")
+
+    stop = engine.submit(
+        "alice", "BTC-USD-PERP", SELL, STOP_MARKET, Decimal("0.5"),
+        trigger_price=Decimal("59000"), reduce_only=True,
+    )
+    take_profit = engine.submit(
+        "alice", "BTC-USD-PERP", SELL, LIMIT, Decimal("0.5"), price=Decimal("61000"), reduce_only=True,
+    )
+    assert stop.status == UNTRIGGERED and take_profit.status == OPEN
+
+    engine.set_mid("BTC-USD-PERP", Decimal("58000"))
+    assert stop.is_filled
+    assert engine.accounts["alice"].position("BTC-USD-PERP") == 0
+    # Nothing left to reduce, so the resting take-profit is cancelled when it is next touched
+    engine.set_mid("BTC-USD-PERP", Decimal("62000"))
+    assert not take_profit.is_open and take_profit.filled == 0
+
+
+def test_paradex_dialect_order_round_trip_over_http():
+    async def run():
+        engine = _engine()
+        server = VenueSimServer([ParadexDialect(engine)], port=0)
+        async with server:
+            port = server.port
+            status, auth = await _http(port, "POST", "/paradex/v1/auth", headers={"PARADEX-STARKNET-ACCOUNT": "0xabc"})
+            assert status == 200
+            headers = {"Authorization": f"Bearer {auth['jwt_token']}"}
+
+            order = {
+                "market": "BTC-USD-PERP", "side": "BUY", "type": "LIMIT", "size": "0.01",
+                "price": "59000", "client_id": "c-1", "instruction": "GTC",
+            }
+            status, placed = await _http(port, "POST", "/paradex/v1/orders", order, headers)
+            assert status == 200 and placed["status"] == "OPEN"
+
+            status, fetched = await _http(port, "GET", "/paradex/v1/orders/by_client_id/c-1", headers=headers)
+            assert fetched["id"] == placed["id"] and fetched["price"] == "59000.0"
+
+            status, _ = await _http(port, "DELETE", f"/paradex/v1/orders/{placed['id']}", headers=headers)
+            assert status == 204
+            status, error = await _http(port, "DELETE", f"/paradex/v1/orders/{placed['id']}", headers=headers)
+            assert status == 400 and error["error"] == "ORDER_IS_CLOSED"
+
+            status, history = await _http(port, "GET", "/paradex/v1/orders-history", headers=headers)
+            assert [o["cancel_reason"] for o in history["results"]] == ["USER_CANCELED"]
+            status, _ = await _http(port, "GET", "/paradex/v1/orders")
+            assert status == 401
+
+    asyncio.run(run())
+
+
+def test_lighter_send_tx_scales_integer_amounts():
+    async def run():
+        market = SimMarket("BTC", 1, Decimal("0.1"), Decimal("0.00001"), Decimal("60000"))
+        engine = MatchingEngine([market], house_levels=5, house_size=Decimal("1"))
+        server = VenueSimServer([LighterDialect(engine)], port=0)
+        async with server:
+            tx_info = {
+                "AccountIndex": 7, "ApiKeyIndex": 2, "MarketIndex": 1, "ClientOrderIndex": 55,
+                "BaseAmount": 1000, "Price": 590000, "IsAsk": 0, "Type": 0, "TimeInForce": 1,
+                "ReduceOnly": 0, "TriggerPrice": 0, "OrderExpiry": -1, "Nonce": 0,
+            }
+            form = f"tx_type=14&tx_info={json.dumps(tx_info)}".encode()
+            status, result = await _http(
+                server.port, "POST", "/lighter/api/v1/sendTx", form,
+                content_type="application/x-www-form-urlencoded",
+            )
+            assert status == 200 and result["code"] == 200
+            status, active = await _http(
+                server.port, "GET", "/lighter/api/v1/accountActiveOrders?account_index=7&market_id=1",
+            )
+            (order,) = active["orders"]
+            assert order["price"] == "59000.0" and order["initial_base_amount"] == "0.01000"
+            status, nonce = await _http(server.port, "GET", "/lighter/api/v1/nextNonce?account_index=7&api_key_index=2")
+            assert nonce["nonce"] == 1
+
+    asyncio.run(run())
+
+
+def test_faults_and_replay_short_circuit_the_venue_handlers():
+    async def run():
+        limited = ParadexDialect(_engine(), faults=FaultInjector(FaultConfig(rate_limit_rate=1.0, seed=1)))
+        async with VenueSimServer([limited], port=0) as server:
+            status, body = await _http(server.port, "GET", "/paradex/v1/markets")
+            assert status == 429 and body["error"] == "RATE_LIMIT_EXCEEDED"
+        assert limited.faults.snapshot()["injected_rate_limits"] == 1
+
+        replay = ResponseReplay([
+            {"method": "GET", "path": "/markets", "status": 200, "body": {"results": ["first"]}},
+            {"method": "GET", "path": "/markets", "status": 200, "body": {"results": ["second"]}},
+        ])
+        replayed = ParadexDialect(_engine(), replay=replay)
+        async with VenueSimServer([replayed], port=0) as server:
+            bodies = [(await _http(server.port, "GET", "/paradex/v1/markets"))[1] for _ in range(3)]
+        assert [b["results"] for b in bodies] == [["first"], ["second"], ["second"]]
+        assert len(replay) == 2 and replayed.replayed == 3
+
+    asyncio.run(run())
+
+
+def test_bad_parameters_are_400s_and_handler_bugs_are_500s():
+    async def run():
+        lighter = LighterDialect(_engine())
+        lighter.route("GET", "/api/v1/boom", lambda request, match: 1 / 0)
+        async with VenueSimServer([lighter], port=0) as server:
+            status, body = await _http(server.port, "GET", "/lighter/api/v1/recentTrades?limit=abc")
+            assert status == 400 and "limit" in body["message"]
+            status, body = await _http(server.port, "GET", "/lighter/api/v1/boom")
+            assert status == 500 and "ZeroDivisionError" in body["message"]
+            # The server keeps answering after a handler blew up
+            status, _ = await _http(server.port, "GET", "/lighter/api/v1/recentTrades?limit=5")
+            assert status == 200
+
+    asyncio.run(run())